@@ -0,0 +1 @@
+"""Benchmarks for statuskit against generated fixture repositories."""
@@ -0,0 +1,5 @@
+"""Local stand-ins for external services used by statuskit."""
+
+from .usage_api import FakeUsageApi, Reply
+
+__all__ = ["FakeUsageApi", "Reply"]
@@ -0,0 +1,147 @@
+"""Local HTTP server mimicking the usage API endpoint.
+
+Usage:
+    with FakeUsageApi() as api:
+        api.set_reply(Reply(status=429, headers={"Retry-After": "60"}))
+        os.environ["STATUSKIT_USAGE_API_URL"] = api.url
+        ...
+        assert api.request_count == 1
+"""
+
+import json
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+USAGE_PATH = "/api/oauth/usage"
+# Answer to requests without an explicit body
+DEFAULT_BODY = {
+    "five_hour": {"utilization": 45.0, "resets_at": "2026-01-27T18:00:00+00:00"},
+    "seven_day": {"utilization": 32.0, "resets_at": "2026-01-30T17:00:00+00:00"},
+    "seven_day_sonnet": {"utilization": 15.0, "resets_at": "2026-01-30T17:00:00+00:00"},
+}
+# Hung requests are released after this long, or when the server stops
+_MAX_HANG = 30.0
+
+
+@dataclass
+class Reply:
+    """How the fake API answers a request."""
+
+    status: int = 200
+    body: dict | bytes | None = None  # None: DEFAULT_BODY; bytes are sent as is
+    headers: dict[str, str] = field(default_factory=dict)
+    latency: float = 0.0  # seconds before answering
+    hang: bool = False  # never answer (until the server stops)
+    disconnect: bool = False  # close the connection without answering
+    truncate: bool = False  # announce the full body but send only half of it
+
+
+class FakeUsageApi:
+    """Usage API stand-in running on a loopback port in a background thread.
+
+    Each request takes the next queued reply, or the default one when the
+    queue is empty. Requests are recorded for assertions.
+    """
+
+    def __init__(self, default: Reply | None = None):
+        """Initialize server (not started until ``start`` or ``with``).
+
+        Args:
+            default: Reply used when none is queued (default: 200 with
+                DEFAULT_BODY)
+        """
+        self.default = default or Reply()
+        self.requests: list[dict[str, str]] = []
+        self._queue: deque[Reply] = deque()
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        """Endpoint URL to pass as api_url or STATUSKIT_USAGE_API_URL."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}{USAGE_PATH}"
+
+    @property
+    def request_count(self) -> int:
+        """Number of requests received so far."""
+        with self._lock:
+            return len(self.requests)
+
+    def set_reply(self, reply: Reply) -> None:
+        """Answer all following requests with ``reply``."""
+        with self._lock:
+            self.default = reply
+            self._queue.clear()
+
+    def queue(self, *replies: Reply) -> None:
+        """Answer the next requests with ``replies``, in order."""
+        with self._lock:
+            self._queue.extend(replies)
+
+    def _next_reply(self, headers: dict[str, str]) -> Reply:
+        """Record a request and pick its reply."""
+        with self._lock:
+            self.requests.append(headers)
+            return self._queue.popleft() if self._queue else self.default
+
+    def _handler(self) -> type[BaseHTTPRequestHandler]:
+        """Build the request handler class bound to this server."""
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path != USAGE_PATH:
+                    self.send_error(404)
+                    return
+                reply = api._next_reply(dict(self.headers))
+                if reply.hang:
+                    api._stopped.wait(_MAX_HANG)
+                    return
+                if reply.disconnect:
+                    self.close_connection = True
+                    return
+                if reply.latency:
+                    time.sleep(reply.latency)
+                body = reply.body if reply.body is not None else DEFAULT_BODY
+                payload = body if isinstance(body, bytes) else json.dumps(body).encode()
+                self.send_response(reply.status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                for name, value in reply.headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(payload[: len(payload) // 2] if reply.truncate else payload)
+                if reply.truncate:
+                    self.close_connection = True
+
+            def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+                pass  # keep test and benchmark output clean
+
+        return Handler
+
+    def start(self) -> "FakeUsageApi":
+        """Start serving in a background thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and release hung requests."""
+        self._stopped.set()
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self) -> "FakeUsageApi":
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
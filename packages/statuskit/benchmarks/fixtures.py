@@ -0,0 +1,274 @@
+"""Generate local git fixture repositories for benchmarks.
+
+Repositories are built with ``git fast-import``, so even a million
+tracked files take minutes rather than hours, and no network access is
+needed. Each fixture is built once into the fixtures directory and reused
+by later runs.
+"""
+
+import os
+import shutil
+import subprocess
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+
+_IDENTITY = {
+    "GIT_AUTHOR_NAME": "Bench",
+    "GIT_AUTHOR_EMAIL": "bench@example.com",
+    "GIT_COMMITTER_NAME": "Bench",
+    "GIT_COMMITTER_EMAIL": "bench@example.com",
+}
+_TIMESTAMP = 1_700_000_000  # fixed commit time, so fixtures are reproducible
+_FILES_PER_DIR = 100
+_DISTINCT_BLOBS = 16
+_READY_MARKER = ".bench-ready"
+
+
+@dataclass
+class Scenario:
+    """A fixture repository shape to benchmark."""
+
+    name: str
+    description: str
+    build: Callable[[Path], None]
+    config: dict
+
+
+def git(repo: Path, *args: str) -> str:
+    """Run a git command in ``repo`` with a fixed identity.
+
+    Args:
+        repo: Repository path
+        *args: Git command arguments (without 'git' prefix)
+
+    Returns:
+        Command output stripped
+    """
+    result = subprocess.run(
+        ["git", "-C", str(repo), *args],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, **_IDENTITY},
+    )
+    return result.stdout.strip()
+
+
+def _tracked_path(index: int) -> str:
+    """Spread files over two directory levels, ``_FILES_PER_DIR`` per directory."""
+    directory, file_number = divmod(index, _FILES_PER_DIR)
+    outer, inner = divmod(directory, _FILES_PER_DIR)
+    return f"d{outer:04d}/d{inner:02d}/f{file_number:02d}.txt"
+
+
+def _commit_header(ref: str, mark: int, message: str, offset: int) -> bytes:
+    """Build a fast-import commit header."""
+    when = f"{_TIMESTAMP + offset} +0000"
+    return (
+        f"commit {ref}\nmark :{mark}\n"
+        f"author Bench <bench@example.com> {when}\n"
+        f"committer Bench <bench@example.com> {when}\n"
+        f"data {len(message)}\n{message}\n"
+    ).encode()
+
+
+def _blobs() -> Iterator[bytes]:
+    """Emit the shared file contents as marks 1..``_DISTINCT_BLOBS``."""
+    for mark in range(1, _DISTINCT_BLOBS + 1):
+        content = f"content {mark}\n".encode()
+        yield f"blob\nmark :{mark}\ndata {len(content)}\n".encode() + content + b"\n"
+
+
+def _tree_stream(files: int) -> Iterator[bytes]:
+    """Emit an initial commit on main with ``files`` tracked files."""
+    yield from _blobs()
+    yield _commit_header("refs/heads/main", _DISTINCT_BLOBS + 1, "initial", 0)
+    for index in range(files):
+        yield f"M 100644 :{index % _DISTINCT_BLOBS + 1} {_tracked_path(index)}\n".encode()
+    yield b"\n"
+
+
+def _history_stream(ref: str, start_mark: int, commits: int, parent: int | None = None) -> Iterator[bytes]:
+    """Emit a linear chain of ``commits`` commits, each touching one file."""
+    for offset in range(commits):
+        mark = start_mark + offset
+        yield _commit_header(ref, mark, f"{ref} {offset}", offset + 1)
+        if offset == 0 and parent is not None:
+            yield f"from :{parent}\n".encode()
+        yield f"M 100644 :{offset % _DISTINCT_BLOBS + 1} history/{ref.rsplit('/', 1)[-1]}.txt\n\n".encode()
+
+
+def fast_import(repo: Path, stream: Iterator[bytes]) -> None:
+    """Create ``repo`` and feed it a fast-import stream.
+
+    Args:
+        repo: Repository path to create
+        stream: fast-import commands
+    """
+    subprocess.run(["git", "init", "-q", "-b", "main", str(repo)], check=True)
+    proc = subprocess.Popen(
+        ["git", "-C", str(repo), "fast-import", "--quiet"],
+        stdin=subprocess.PIPE,
+        env={**os.environ, **_IDENTITY},
+    )
+    stdin = proc.stdin
+    if stdin is None:
+        msg = "fast-import stdin is not available"
+        raise RuntimeError(msg)
+    for chunk in stream:
+        stdin.write(chunk)
+    stdin.close()
+    if proc.wait() != 0:
+        msg = f"git fast-import failed for {repo}"
+        raise RuntimeError(msg)
+
+
+def _checkout(repo: Path) -> None:
+    """Populate the worktree and index, and write a commit-graph."""
+    git(repo, "reset", "-q", "--hard", "main")
+    git(repo, "commit-graph", "write", "--reachable")
+
+
+def build_tracked(repo: Path, files: int) -> None:
+    """Build a repository with ``files`` tracked files in one commit."""
+    fast_import(repo, _tree_stream(files))
+    _checkout(repo)
+
+
+def build_untracked(repo: Path, tracked: int, untracked: int) -> None:
+    """Build a repository with tracked files plus many untracked ones."""
+    build_tracked(repo, tracked)
+    for index in range(untracked):
+        path = repo / "untracked" / _tracked_path(index)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.touch()
+
+
+def build_history(repo: Path, files: int, commits: int) -> None:
+    """Build a repository with a long linear history on main."""
+
+    def stream() -> Iterator[bytes]:
+        yield from _tree_stream(files)
+        yield from _history_stream("refs/heads/main", _DISTINCT_BLOBS + 2, commits, parent=_DISTINCT_BLOBS + 1)
+
+    fast_import(repo, stream())
+    _checkout(repo)
+
+
+def build_diverged(repo: Path, files: int, shared: int, diverged: int) -> None:
+    """Build a repository whose main and upstream differ by ``diverged`` commits each.
+
+    ``refs/remotes/origin/main`` is the upstream of main and the target
+    of ``origin/HEAD``, so both remote indicators have work to do.
+    """
+    base = _DISTINCT_BLOBS + 1
+    fork = base + shared
+    local_start = fork + 1
+    upstream_start = local_start + diverged
+
+    def stream() -> Iterator[bytes]:
+        yield from _tree_stream(files)
+        yield from _history_stream("refs/heads/main", base + 1, shared, parent=base)
+        yield from _history_stream("refs/heads/main", local_start, diverged, parent=fork)
+        yield from _history_stream("refs/remotes/origin/main", upstream_start, diverged, parent=fork)
+
+    fast_import(repo, stream())
+    git(repo, "config", "remote.origin.url", str(repo.parent / "origin.git"))
+    git(repo, "config", "remote.origin.fetch", "+refs/heads/*:refs/remotes/origin/*")
+    git(repo, "config", "branch.main.remote", "origin")
+    git(repo, "config", "branch.main.merge", "refs/heads/main")
+    git(repo, "symbolic-ref", "refs/remotes/origin/HEAD", "refs/remotes/origin/main")
+    _checkout(repo)
+
+
+def build_worktrees(repo: Path, files: int, worktrees: int) -> None:
+    """Build a repository with linked worktrees under ``.worktrees/``."""
+    build_tracked(repo, files)
+    (repo / ".git" / "info").mkdir(exist_ok=True)
+    (repo / ".git" / "info" / "exclude").write_text(".worktrees/\n")
+    for index in range(worktrees):
+        git(repo, "worktree", "add", "-q", "-b", f"wt{index}", str(repo / ".worktrees" / f"wt{index}"))
+        # Leave every other worktree dirty
+        if index % 2:
+            (repo / ".worktrees" / f"wt{index}" / "dirty.txt").touch()
+
+
+def build_submodules(repo: Path, files: int, submodules: int) -> None:
+    """Build a superproject with ``submodules`` submodules of ``files`` files each."""
+    sources = repo.parent / f"{repo.name}-sources"
+    sources.mkdir()
+    build_tracked(repo, files)
+    for index in range(submodules):
+        source = sources / f"sub{index}"
+        build_tracked(source, files)
+        git(repo, "-c", "protocol.file.allow=always", "submodule", "add", "-q", str(source), f"sub{index}")
+    git(repo, "commit", "-q", "-m", "add submodules")
+    # Leave every other submodule dirty
+    for index in range(1, submodules, 2):
+        (repo / f"sub{index}" / "dirty.txt").touch()
+
+
+SCENARIOS = {
+    scenario.name: scenario
+    for scenario in [
+        Scenario("tracked-10k", "10k tracked files", lambda repo: build_tracked(repo, 10_000), {}),
+        Scenario("tracked-100k", "100k tracked files", lambda repo: build_tracked(repo, 100_000), {}),
+        Scenario("tracked-1m", "1M tracked files", lambda repo: build_tracked(repo, 1_000_000), {}),
+        Scenario(
+            "untracked-100k",
+            "10k tracked and 100k untracked files",
+            lambda repo: build_untracked(repo, 10_000, 100_000),
+            {},
+        ),
+        Scenario(
+            "history-100k",
+            "100k commits of linear history",
+            lambda repo: build_history(repo, 1_000, 100_000),
+            {},
+        ),
+        Scenario(
+            "diverged",
+            "main and upstream 20k commits apart each way",
+            lambda repo: build_diverged(repo, 1_000, 10_000, 20_000),
+            {"show_default_branch": True},
+        ),
+        Scenario(
+            "worktrees",
+            "10k tracked files and 16 linked worktrees",
+            lambda repo: build_worktrees(repo, 10_000, 16),
+            {"show_worktrees": True},
+        ),
+        Scenario(
+            "submodules",
+            "superproject with 32 submodules of 1k files",
+            lambda repo: build_submodules(repo, 1_000, 32),
+            {"submodules": "full"},
+        ),
+    ]
+}
+
+# tracked-1m needs several GB of disk and minutes to build, so it is opt-in
+DEFAULT_SCENARIOS = [name for name in SCENARIOS if name != "tracked-1m"]
+
+
+def ensure_fixture(scenario: Scenario, fixtures_dir: Path) -> Path:
+    """Build a scenario's repository unless a complete one already exists.
+
+    Args:
+        scenario: Scenario to build
+        fixtures_dir: Directory holding all fixtures
+
+    Returns:
+        Path of the fixture repository
+    """
+    root = fixtures_dir / scenario.name
+    repo = root / "repo"
+    if (root / _READY_MARKER).exists():
+        return repo
+    if root.exists():
+        shutil.rmtree(root)  # left over from an interrupted build
+    root.mkdir(parents=True)
+    scenario.build(repo)
+    (root / _READY_MARKER).touch()
+    return repo
@@ -0,0 +1,170 @@
+"""Time GitModule against generated fixture repositories.
+
+Run from ``packages/statuskit``::
+
+    python -m benchmarks.git_module --output results.json
+    python -m benchmarks.git_module --scenario tracked-1m --repeat 3
+
+Every measurement uses a fresh GitModule, as each statusline refresh
+does. "cold" runs start with an empty statuskit cache directory; "warm"
+runs reuse one primed by a previous render. The git object store and the
+OS page cache are warm in both.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from contextlib import chdir
+from pathlib import Path
+from typing import Any
+
+from statuskit.core.models import RenderContext, StatusInput
+from statuskit.modules.git import GitModule
+
+from .fixtures import DEFAULT_SCENARIOS, SCENARIOS, Scenario, ensure_fixture
+
+DEFAULT_FIXTURES_DIR = Path.home() / ".cache" / "statuskit-bench"
+DEFAULT_REPEAT = 5
+
+# GitModule helpers timed individually, in render order
+HELPERS = (
+    "_get_branch",
+    "_get_location",
+    "_get_remote_status",
+    "_get_default_branch_status",
+    "_get_changes",
+    "_get_last_commit",
+    "_get_operation",
+    "_get_stash_count",
+    "_get_worktrees",
+    "_get_submodule_changes",
+)
+
+
+def _make_module(repo: Path, cache_dir: Path, config: dict) -> GitModule:
+    """Create a GitModule as a render in ``repo`` would."""
+    data = StatusInput.from_dict({"workspace": {"current_dir": str(repo), "project_dir": str(repo)}})
+    return GitModule(RenderContext(debug=False, data=data, cache_dir=cache_dir), config)
+
+
+def _stats(samples: list[float]) -> dict[str, Any]:
+    """Summarize timing samples in milliseconds."""
+    return {
+        "runs": len(samples),
+        "min_ms": round(min(samples), 3),
+        "median_ms": round(statistics.median(samples), 3),
+        "mean_ms": round(statistics.fmean(samples), 3),
+        "max_ms": round(max(samples), 3),
+    }
+
+
+def _time_call(call: Callable[[GitModule], Any], make: Callable[[], GitModule]) -> float:
+    """Time one call on a fresh module, in milliseconds."""
+    module = make()
+    start = time.perf_counter_ns()
+    call(module)
+    return (time.perf_counter_ns() - start) / 1e6
+
+
+def _measure(repo: Path, config: dict, call: Callable[[GitModule], Any], repeat: int) -> dict[str, Any]:
+    """Time a call cold and warm.
+
+    Args:
+        repo: Fixture repository (the current directory)
+        config: GitModule config
+        call: Function invoking the code under test
+        repeat: Number of timed runs per mode
+
+    Returns:
+        Dict with cold and warm statistics
+    """
+    cold = []
+    for _ in range(repeat):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cold.append(_time_call(call, lambda cache_dir=cache_dir: _make_module(repo, Path(cache_dir), config)))
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        _make_module(repo, Path(cache_dir), config).render()  # prime the cache
+        warm = [_time_call(call, lambda: _make_module(repo, Path(cache_dir), config)) for _ in range(repeat)]
+
+    return {"cold": _stats(cold), "warm": _stats(warm)}
+
+
+def run_scenario(scenario: Scenario, repo: Path, repeat: int) -> dict[str, Any]:
+    """Benchmark render() and each helper in one fixture repository.
+
+    Args:
+        scenario: Scenario the fixture was built from
+        repo: Fixture repository
+        repeat: Number of timed runs per measurement
+
+    Returns:
+        Dict with description, render, and per-helper timings
+    """
+    with chdir(repo):
+        return {
+            "description": scenario.description,
+            "config": scenario.config,
+            "render": _measure(repo, scenario.config, lambda module: module.render(), repeat),
+            "helpers": {
+                helper: _measure(repo, scenario.config, lambda module, helper=helper: getattr(module, helper)(), repeat)
+                for helper in HELPERS
+            },
+        }
+
+
+def _environment() -> dict[str, Any]:
+    """Describe the machine and tool versions the results came from."""
+    git_version = subprocess.run(["git", "--version"], capture_output=True, text=True, check=False).stdout.strip()
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "git": git_version,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Build fixtures as needed, run the benchmarks, and write JSON results."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.git_module", description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=[*SCENARIOS, "all"],
+        help=f"scenario to run, repeatable (default: {', '.join(DEFAULT_SCENARIOS)})",
+    )
+    parser.add_argument("--fixtures-dir", type=Path, default=DEFAULT_FIXTURES_DIR, help="where fixtures are built")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="timed runs per measurement")
+    parser.add_argument("--output", type=Path, help="write JSON results here instead of stdout")
+    args = parser.parse_args(argv)
+
+    names = args.scenario or DEFAULT_SCENARIOS
+    if "all" in names:
+        names = list(SCENARIOS)
+
+    results: dict[str, Any] = {"environment": _environment(), "repeat": args.repeat, "scenarios": {}}
+    for name in names:
+        scenario = SCENARIOS[name]
+        print(f"{name}: preparing fixture", file=sys.stderr)
+        repo = ensure_fixture(scenario, args.fixtures_dir)
+        print(f"{name}: timing", file=sys.stderr)
+        results["scenarios"][name] = run_scenario(scenario, repo, args.repeat)
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        args.output.write_text(output + "\n")
+    else:
+        print(output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
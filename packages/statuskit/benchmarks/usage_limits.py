@@ -0,0 +1,155 @@
+"""Time UsageLimitsModule and usage API refreshes against a local stand-in API.
+
+Run from ``packages/statuskit``::
+
+    python -m benchmarks.usage_limits --output results.json
+    python -m benchmarks.usage_limits --scenario hang --sessions 32
+
+Every scenario starts the fake API from ``benchmarks.fakes`` with one reply
+behaviour. ``render`` times UsageLimitsModule.render() with a stale cache
+(including starting the background refresh). ``sessions`` starts that
+many ``statuskit refresh-usage`` processes at once, as concurrent Claude
+Code sessions whose caches expire together would, twice in a row, and
+counts the API requests each wave made.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from statuskit.core.models import RenderContext, StatusInput
+from statuskit.modules.usage_limits import API_URL_ENV, UsageCache, UsageData, UsageLimit, UsageLimitsModule
+
+from .fakes import FakeUsageApi, Reply
+from .git_module import _environment, _stats
+
+DEFAULT_REPEAT = 5
+DEFAULT_SESSIONS = 16
+
+SCENARIOS = {
+    "ok": Reply(),
+    "slow": Reply(latency=1.0),
+    "hang": Reply(hang=True),
+    "rate-limited": Reply(status=429, headers={"Retry-After": "120"}),
+    "server-error": Reply(status=503),
+    "malformed": Reply(body=b"{not json"),
+    "not-an-object": Reply(body=b"[]"),
+    "disconnect": Reply(disconnect=True),
+    "truncated": Reply(truncate=True),
+    "unauthorized": Reply(status=401),
+}
+
+
+def _write_credentials(home: Path) -> None:
+    """Create a credentials file for child processes using ``home``."""
+    (home / ".claude").mkdir(parents=True, exist_ok=True)
+    (home / ".claude" / ".credentials.json").write_text(json.dumps({"claudeAiOauth": {"accessToken": "bench"}}))
+
+
+def _stale_cache(cache_dir: Path) -> None:
+    """Fill ``cache_dir`` with usage data old enough to need a refresh."""
+    UsageCache(cache_dir).save(
+        UsageData(UsageLimit(10.0, None), UsageLimit(5.0, None), None, datetime.now(UTC) - timedelta(hours=1))
+    )
+
+
+def _time_renders(repeat: int, env: dict[str, str]) -> dict[str, Any]:
+    """Time render() with a stale cache, each in a fresh cache directory."""
+    data = StatusInput.from_dict({})
+    samples = []
+    saved = dict(os.environ)
+    os.environ.update(env)
+    try:
+        for _ in range(repeat):
+            with tempfile.TemporaryDirectory() as cache_dir:
+                _stale_cache(Path(cache_dir))
+                module = UsageLimitsModule(RenderContext(debug=False, data=data, cache_dir=Path(cache_dir)), {})
+                start = time.perf_counter_ns()
+                module.render()
+                samples.append((time.perf_counter_ns() - start) / 1e6)
+    finally:
+        os.environ.clear()
+        os.environ.update(saved)
+    return _stats(samples)
+
+
+def _refresh_wave(sessions: int, cache_dir: Path, env: dict[str, str]) -> float:
+    """Run ``sessions`` refresh-usage processes at once; return wall time in ms."""
+    start = time.perf_counter_ns()
+    procs = [
+        subprocess.Popen(
+            [sys.executable, "-m", "statuskit", "refresh-usage", "--cache-dir", str(cache_dir)],
+            env={**os.environ, **env},
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        for _ in range(sessions)
+    ]
+    for proc in procs:
+        proc.wait()
+    return (time.perf_counter_ns() - start) / 1e6
+
+
+def run_scenario(reply: Reply, repeat: int, sessions: int) -> dict[str, Any]:
+    """Benchmark render() and concurrent refreshes with one API behaviour.
+
+    Args:
+        reply: How the fake API answers
+        repeat: Number of timed renders
+        sessions: Number of concurrent refresh processes per wave
+
+    Returns:
+        Dict with render timings, and per-wave API request counts and
+        wall times
+    """
+    with FakeUsageApi(reply) as api, tempfile.TemporaryDirectory() as tmp:
+        home = Path(tmp) / "home"
+        _write_credentials(home)
+        env = {API_URL_ENV: api.url, "HOME": str(home)}
+
+        cache_dir = Path(tmp) / "cache"
+        _stale_cache(cache_dir)
+        waves = []
+        for _ in range(2):
+            count = api.request_count
+            wall_ms = _refresh_wave(sessions, cache_dir, env)
+            waves.append({"wall_ms": round(wall_ms, 3), "api_requests": api.request_count - count})
+
+        # Last: the refreshes these renders start in the background would
+        # otherwise be counted in the waves
+        render = _time_renders(repeat, env)
+
+        return {"render": render, "sessions": sessions, "waves": waves}
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the usage API benchmarks and write JSON results."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.usage_limits", description=__doc__.splitlines()[0])
+    parser.add_argument("--scenario", action="append", choices=list(SCENARIOS), help="scenario to run, repeatable")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="timed renders per scenario")
+    parser.add_argument("--sessions", type=int, default=DEFAULT_SESSIONS, help="concurrent refresh processes")
+    parser.add_argument("--output", type=Path, help="write JSON results here instead of stdout")
+    args = parser.parse_args(argv)
+
+    results: dict[str, Any] = {"environment": _environment(), "repeat": args.repeat, "scenarios": {}}
+    for name in args.scenario or list(SCENARIOS):
+        print(f"{name}: timing", file=sys.stderr)
+        results["scenarios"][name] = run_scenario(SCENARIOS[name], args.repeat, args.sessions)
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        args.output.write_text(output + "\n")
+    else:
+        print(output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,14 +3,17 @@
 import json
 import os
 import sys
+import time
 from argparse import Namespace
 
 from termcolor import colored
 
 from .cli import create_parser
 from .core.config import load_config
+from .core.health import DEFAULT_BUDGET_MS, ModuleHealth
 from .core.loader import load_modules
 from .core.models import RenderContext, StatusInput
+from .modules.base import BaseModule
 
 
 def _handle_setup(args: Namespace) -> None:
@@ -29,7 +32,7 @@ def _handle_setup(args: Namespace) -> None:
     if args.remove:
         _handle_remove(scope, args.force, ui)
     else:
-        _handle_install(scope, args.force, ui)
+        _handle_install(scope, args.force, ui, warm_hooks=args.hooks)
 
 
 def _handle_remove(scope, force: bool, ui) -> None:
@@ -41,25 +44,31 @@ def _handle_remove(scope, force: bool, ui) -> None:
         print(f"statuskit is not installed at {scope.value} scope.")
     elif result.success:
         print(f"\u2713 Removed statusline hook from {scope.value} scope.")
-    else:
+    if result.warm_hooks_removed:
+        print(f"\u2713 Removed cache warming hooks from {scope.value} scope.")
+    if not result.success:
         print(f"Error: {result.message}")
         sys.exit(1)
 
 
-def _handle_install(scope, force: bool, ui) -> None:
+def _handle_install(scope, force: bool, ui, warm_hooks: bool = False) -> None:
     """Handle setup install command."""
     from .setup.commands import install_hook
 
-    result = install_hook(scope, force=force, ui=ui)
+    result = install_hook(scope, force=force, ui=ui, warm_hooks=warm_hooks)
     if result.higher_scope_installed and result.higher_scope:
         print(f"statuskit is already installed at {result.higher_scope.value} scope.")
         print("The hook will work for this project too.")
         if result.config_created:
             print(f"\u2713 Created config file at {scope.value} scope.")
+        if result.warm_hooks_installed:
+            print(f"\u2713 Added cache warming hooks to {scope.value} scope.")
     elif result.already_installed:
         print(f"statuskit is already installed at {scope.value} scope.")
         if result.config_created:
             print("\u2713 Created config file.")
+        if result.warm_hooks_installed:
+            print("\u2713 Added cache warming hooks.")
     elif result.success:
         print(f"\u2713 Added statusline hook to {scope.value} scope.")
         if result.backup_created:
@@ -68,12 +77,106 @@ def _handle_install(scope, force: bool, ui) -> None:
             print("\u2713 Created config file.")
         if result.gitignore_updated:
             print("\u2713 Added .claude/*.local.* to .gitignore")
+        if result.warm_hooks_installed:
+            print("\u2713 Added cache warming hooks.")
         print("\nRun `claude` to see your new statusline!")
     else:
         print(f"Error: {result.message}")
         sys.exit(1)
 
 
+def _handle_watch(args: Namespace) -> None:
+    """Handle watch command."""
+    import signal
+    from pathlib import Path
+
+    from .core.watcher import run_watcher
+
+    # Exit through sys.exit on SIGTERM so the watcher removes its state
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    cache_dir = Path(args.cache_dir).expanduser() if args.cache_dir else load_config().cache_dir
+    sys.exit(
+        run_watcher(
+            Path(args.path),
+            cache_dir,
+            max_watches=args.max_watches,
+            backend=args.backend,
+            idle_timeout=args.idle_timeout,
+        )
+    )
+
+
+def _handle_refresh_usage(args: Namespace) -> None:
+    """Handle refresh-usage command."""
+    from pathlib import Path
+
+    from .modules.usage_limits import refresh_usage
+
+    cache_dir = Path(args.cache_dir).expanduser() if args.cache_dir else load_config().cache_dir
+    sys.exit(0 if refresh_usage(cache_dir, api_url=args.api_url) else 1)
+
+
+def _handle_run_command(args: Namespace) -> None:
+    """Handle run-command command."""
+    from pathlib import Path
+
+    from .modules.command import refresh_command
+
+    cache_dir = Path(args.cache_dir).expanduser() if args.cache_dir else load_config().cache_dir
+    cwd = args.cwd or str(Path.cwd())
+    sys.exit(0 if refresh_command(cache_dir, args.run, cwd, args.timeout) else 1)
+
+
+def _handle_warm(args: Namespace) -> None:
+    """Handle warm command.
+
+    Hooks run it with the event JSON on stdin. It starts a detached
+    ``statuskit warm --foreground`` and returns at once, printing nothing:
+    hook output would be shown to Claude. A foreground warmer that leaves
+    a request unhandled starts the next one the same way.
+    """
+    from pathlib import Path
+
+    from .core.background import spawn_statuskit
+    from .core.warm import Warmer
+
+    hook_data = {}
+    if not args.foreground and not sys.stdin.isatty():
+        try:
+            hook_data = json.load(sys.stdin)
+        except (ValueError, OSError):
+            hook_data = {}
+        if not isinstance(hook_data, dict):
+            hook_data = {}
+
+    cwd = args.cwd or hook_data.get("cwd") or str(Path.cwd())
+    session_id = args.session_id or hook_data.get("session_id")
+    transcript_path = args.transcript_path or hook_data.get("transcript_path")
+    try:
+        # Project config and git state are read relative to the project
+        os.chdir(cwd)
+    except OSError:
+        return
+
+    config = load_config()
+    warmer = Warmer(config.cache_dir, Path(cwd))
+
+    if args.foreground:
+        data = StatusInput.from_dict({"session_id": session_id, "cwd": cwd, "transcript_path": transcript_path})
+        warmer.run(config, data)
+        if not warmer.needs_rerun():
+            return
+    elif not warmer.request():
+        return
+
+    warm_args = ["warm", "--foreground", "--cwd", cwd]
+    if session_id:
+        warm_args += ["--session-id", session_id]
+    if transcript_path:
+        warm_args += ["--transcript-path", transcript_path]
+    spawn_statuskit(*warm_args)
+
+
 def _render_statusline() -> None:
     """Read from stdin and render statusline."""
     config = load_config()
@@ -92,15 +195,56 @@ def _render_statusline() -> None:
 
     ctx = RenderContext(debug=config.debug, data=data, cache_dir=config.cache_dir)
     modules = load_modules(config, ctx)
+    health = _module_health(ctx)
+    skipped = []
 
     for mod in modules:
-        try:
-            output = mod.render()
-            if output:
-                print(output)
-        except Exception as e:
-            if config.debug:
-                print(colored(f"[!] {mod.name}: {e}", "red"))
+        state = health.state(mod.name) if health else {}
+        if ModuleHealth.in_cooldown(state):
+            skipped.append(_format_skipped(mod.name, state))
+            continue
+        budget_ms = config.get_module_config(mod.name).get("budget_ms", DEFAULT_BUDGET_MS)
+        _render_module(mod, health, state, budget_ms, config.debug)
+
+    if skipped and config.debug:
+        print(colored(f"[!] skipped: {', '.join(skipped)}", "yellow"))
+
+
+def _render_module(mod: BaseModule, health: ModuleHealth | None, state: dict, budget_ms: float, debug: bool) -> None:
+    """Render one module and record whether it failed or overran its budget."""
+    start = time.perf_counter()
+    try:
+        output = mod.render()
+    except Exception as e:
+        if health:
+            health.record_failure(mod.name, state, "error")
+        if debug:
+            print(colored(f"[!] {mod.name}: {e}", "red"))
+        return
+    if output:
+        print(output)
+    if health:
+        if (time.perf_counter() - start) * 1000 > budget_ms:
+            health.record_failure(mod.name, state, "slow")
+        else:
+            health.record_success(mod.name, state)
+
+
+def _module_health(ctx: RenderContext) -> ModuleHealth | None:
+    """Get the module health tracker for the current project."""
+    from pathlib import Path
+
+    if not ctx.cache_dir:
+        return None
+    data = ctx.data
+    scope = (data.workspace.project_dir if data.workspace else None) or data.cwd or str(Path.cwd())
+    return ModuleHealth(ctx.cache_dir, scope)
+
+
+def _format_skipped(name: str, state: dict) -> str:
+    """Format a skipped module for the debug line, e.g. "git (error x3, 40s)"."""
+    remaining = max(0, round(state.get("open_until", 0) - time.time()))
+    return f"{name} ({state.get('reason', 'error')} x{state.get('failures', 0)}, {remaining}s)"
 
 
 def main() -> None:
@@ -112,6 +256,22 @@ def main() -> None:
         _handle_setup(args)
         return
 
+    if args.command == "watch":
+        _handle_watch(args)
+        return
+
+    if args.command == "refresh-usage":
+        _handle_refresh_usage(args)
+        return
+
+    if args.command == "run-command":
+        _handle_run_command(args)
+        return
+
+    if args.command == "warm":
+        _handle_warm(args)
+        return
+
     if sys.stdin.isatty():
         print("statuskit: reads JSON from stdin")
         print("Usage: echo '{...}' | statuskit")
@@ -0,0 +1,5 @@
+"""Allow running statuskit as ``python -m statuskit``."""
+
+from statuskit import main
+
+main()
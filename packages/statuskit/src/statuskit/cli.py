@@ -3,11 +3,16 @@
 import argparse
 from importlib.metadata import version
 
+from .core.constants import DEFAULT_COMMAND_TIMEOUT, DEFAULT_IDLE_TIMEOUT, DEFAULT_MAX_WATCHES, WATCH_BACKENDS
+
 MODULES_HELP = """
 Built-in modules:
   model                  Display current Claude model name
   git                    Show git branch and status
   beads                  Display active beads tasks
+  command                Show output of custom shell commands
+  transcript             Show session turns, tool calls and tokens
+  cost                   Show spend today, this week and per project
   quota                  Track token usage
 """
 
@@ -64,5 +69,105 @@ def create_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Skip confirmations, backup and overwrite",
     )
+    setup_parser.add_argument(
+        "--hooks",
+        action="store_true",
+        help="Also install hooks that warm caches between renders",
+    )
+
+    # watch subcommand (started in the background by the git module)
+    watch_parser = subparsers.add_parser(
+        "watch",
+        help="Watch a git worktree and invalidate cached status on changes",
+    )
+    watch_parser.add_argument(
+        "path",
+        nargs="?",
+        default=".",
+        help="Worktree root to watch (default: current directory)",
+    )
+    watch_parser.add_argument(
+        "--cache-dir",
+        help="Cache directory (default: from config)",
+    )
+    watch_parser.add_argument(
+        "--max-watches",
+        type=int,
+        default=DEFAULT_MAX_WATCHES,
+        help=f"Give up on trees needing more watches (default: {DEFAULT_MAX_WATCHES})",
+    )
+    watch_parser.add_argument(
+        "--backend",
+        choices=WATCH_BACKENDS,
+        default="auto",
+        help="Watch backend (default: auto)",
+    )
+    watch_parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=DEFAULT_IDLE_TIMEOUT,
+        help=f"Exit after this many seconds without changes (default: {DEFAULT_IDLE_TIMEOUT})",
+    )
+
+    # refresh-usage subcommand (started in the background by usage_limits)
+    refresh_parser = subparsers.add_parser(
+        "refresh-usage",
+        help="Fetch API usage limits into the cache",
+    )
+    refresh_parser.add_argument(
+        "--cache-dir",
+        help="Cache directory (default: from config)",
+    )
+    refresh_parser.add_argument(
+        "--api-url",
+        help="Usage API endpoint on localhost (default: $STATUSKIT_USAGE_API_URL or the Anthropic API)",
+    )
+
+    # warm subcommand (run by Claude Code hooks, see setup --hooks)
+    warm_parser = subparsers.add_parser(
+        "warm",
+        help="Refresh module caches in the background (reads hook JSON from stdin)",
+    )
+    warm_parser.add_argument(
+        "--foreground",
+        action="store_true",
+        help="Warm in this process instead of starting a background one",
+    )
+    warm_parser.add_argument(
+        "--cwd",
+        help="Project directory (default: from hook input, or current directory)",
+    )
+    warm_parser.add_argument(
+        "--session-id",
+        help="Session id (default: from hook input)",
+    )
+    warm_parser.add_argument(
+        "--transcript-path",
+        help="Session transcript (default: from hook input)",
+    )
+
+    # run-command subcommand (started in the background by the command module)
+    run_command_parser = subparsers.add_parser(
+        "run-command",
+        help="Run a command module command and cache its output",
+    )
+    run_command_parser.add_argument(
+        "run",
+        help="Shell command line",
+    )
+    run_command_parser.add_argument(
+        "--cwd",
+        help="Working directory (default: current directory)",
+    )
+    run_command_parser.add_argument(
+        "--cache-dir",
+        help="Cache directory (default: from config)",
+    )
+    run_command_parser.add_argument(
+        "--timeout",
+        type=float,
+        default=DEFAULT_COMMAND_TIMEOUT,
+        help=f"Seconds before the command is killed (default: {DEFAULT_COMMAND_TIMEOUT})",
+    )
 
     return parser
@@ -0,0 +1,51 @@
+"""Detached background processes for statuskit."""
+
+import os
+import subprocess
+import sys
+
+
+def spawn_statuskit(*args: str) -> bool:
+    """Start a detached ``statuskit`` subprocess.
+
+    The child runs in its own session with stdio closed, so it outlives
+    the statusline render that started it and never writes to its output.
+
+    Args:
+        *args: Command line arguments (without the program name)
+
+    Returns:
+        True if the process was started
+    """
+    try:
+        subprocess.Popen(  # noqa: S603
+            [sys.executable, "-m", "statuskit", *args],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+            close_fds=True,
+        )
+    except OSError:
+        return False
+    return True
+
+
+def is_process_alive(pid: int) -> bool:
+    """Check whether a process with the given pid is running.
+
+    Args:
+        pid: Process id
+
+    Returns:
+        True if the process exists (possibly owned by another user)
+    """
+    if pid <= 0:
+        return False
+    try:
+        os.kill(pid, 0)
+    except PermissionError:
+        return True
+    except OSError:
+        return False
+    return True
@@ -0,0 +1,60 @@
+"""Small file-based cache helpers shared by statuskit modules."""
+
+import hashlib
+import json
+import tempfile
+from pathlib import Path
+from typing import Any
+
+
+def read_json(path: Path) -> Any:
+    """Read a JSON cache file.
+
+    Args:
+        path: Cache file path
+
+    Returns:
+        Decoded JSON value, or None if the file is missing or corrupted
+    """
+    try:
+        return json.loads(path.read_text())
+    except (json.JSONDecodeError, OSError, UnicodeDecodeError):
+        return None
+
+
+def write_json(path: Path, data: Any) -> bool:
+    """Write a JSON cache file atomically.
+
+    Uses temp file + rename so concurrent readers never see a partial file.
+
+    Args:
+        path: Cache file path (parent directories are created)
+        data: JSON-serializable value
+
+    Returns:
+        True if the file was written, False on I/O error
+    """
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            mode="w",
+            dir=path.parent,
+            suffix=".tmp",
+            delete=False,
+        ) as f:
+            f.write(json.dumps(data))
+            temp_path = Path(f.name)
+    except OSError:
+        return False
+
+    try:
+        temp_path.replace(path)
+    except OSError:
+        temp_path.unlink(missing_ok=True)
+        return False
+    return True
+
+
+def worktree_key(worktree: Path) -> str:
+    """Get a stable cache key for a worktree path."""
+    return hashlib.sha256(str(worktree).encode()).hexdigest()[:16]
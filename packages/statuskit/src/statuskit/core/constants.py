@@ -2,3 +2,12 @@
 
 CLAUDE_DIR = ".claude"
 CONFIG_FILENAME = "statuskit.toml"
+
+# Git watcher defaults, also used by the CLI: kept here so building the
+# argument parser on every render does not import the watcher
+DEFAULT_MAX_WATCHES = 8192
+DEFAULT_IDLE_TIMEOUT = 3600  # seconds without changes before the watcher exits
+WATCH_BACKENDS = ("auto", "inotify", "polling")
+
+# Command module default, also used by the CLI's run-command subcommand
+DEFAULT_COMMAND_TIMEOUT = 1.0  # seconds
@@ -0,0 +1,13 @@
+"""Number formatting shared by modules."""
+
+_THOUSAND = 1_000
+_MILLION = 1_000_000
+
+
+def compact_number(n: int) -> str:
+    """Format a count compactly, e.g. "1.2M", "45k" or "999"."""
+    if n >= _MILLION:
+        return f"{n / _MILLION:.1f}M"
+    if n >= _THOUSAND:
+        return f"{n / _THOUSAND:.0f}k"
+    return str(n)
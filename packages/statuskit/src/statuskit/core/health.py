@@ -0,0 +1,106 @@
+"""Per-module circuit breaker for modules that keep failing or running slow."""
+
+import hashlib
+import time
+from pathlib import Path
+from typing import Any
+
+from statuskit.core.cache import read_json, write_json
+
+HEALTH_DIRNAME = "health"
+FAILURE_THRESHOLD = 3  # consecutive failures before a module is skipped
+DEFAULT_BUDGET_MS = 1000  # renders slower than this count as failures
+COOLDOWN_BASE = 30  # seconds; doubles with each further failure
+COOLDOWN_MAX = 600
+# Record files of projects without a failure for this long are removed
+HEALTH_TTL = 86400
+
+
+class ModuleHealth:
+    """Consecutive failures per module, persisted in marker files.
+
+    A render that raises or takes longer than the module's budget is a
+    failure. After ``FAILURE_THRESHOLD`` failures in a row the module is
+    skipped for a cooldown of 30s, doubling with each failed retry up to
+    10 minutes. The first render after the cooldown is a trial: success
+    clears the record, failure extends the cooldown.
+
+    Records are kept per project, since a module failing in one
+    repository (e.g. git in a broken checkout) may work in another. Each
+    project's records are one small JSON file that only a failure
+    creates, so a healthy render costs one failed open.
+    """
+
+    def __init__(self, cache_dir: Path, scope: str):
+        """Initialize tracker.
+
+        Args:
+            cache_dir: Statuskit cache directory
+            scope: Project the records apply to (e.g. project directory)
+        """
+        self.root = cache_dir / HEALTH_DIRNAME
+        self.path = self.root / f"{hashlib.sha256(scope.encode()).hexdigest()[:16]}.json"
+        self._records: dict[str, Any] | None = None
+
+    def _load(self) -> dict[str, Any]:
+        """Read the project's records once per render."""
+        if self._records is None:
+            records = read_json(self.path)
+            self._records = records if isinstance(records, dict) else {}
+        return self._records
+
+    def state(self, module: str) -> dict[str, Any]:
+        """Get a module's failure record (empty if healthy)."""
+        state = self._load().get(module)
+        return state if isinstance(state, dict) else {}
+
+    @staticmethod
+    def in_cooldown(state: dict[str, Any], now: float | None = None) -> bool:
+        """Check whether a failure record means the module is skipped."""
+        now = time.time() if now is None else now
+        return state.get("open_until", 0) > now
+
+    def record_failure(self, module: str, state: dict[str, Any], reason: str, now: float | None = None) -> None:
+        """Count a failed render.
+
+        Args:
+            module: Module name
+            state: The module's record read before the render
+            reason: "error" or "slow"
+            now: Current time (default: time.time())
+        """
+        now = time.time() if now is None else now
+        failures = state.get("failures", 0) + 1
+        record: dict[str, Any] = {"failures": failures, "reason": reason}
+        if failures >= FAILURE_THRESHOLD:
+            record["open_until"] = now + min(COOLDOWN_BASE * 2 ** (failures - FAILURE_THRESHOLD), COOLDOWN_MAX)
+        records = self._load()
+        records[module] = record
+        write_json(self.path, records)
+        self._prune()
+
+    def record_success(self, module: str, state: dict[str, Any]) -> None:
+        """Clear a module's failure record, if it had one.
+
+        Args:
+            module: Module name
+            state: The module's record read before the render
+        """
+        if not state:
+            return
+        records = self._load()
+        records.pop(module, None)
+        if records:
+            write_json(self.path, records)
+        else:
+            self.path.unlink(missing_ok=True)
+
+    def _prune(self) -> None:
+        """Remove record files of projects that have not failed for a day."""
+        cutoff = time.time() - COOLDOWN_MAX - HEALTH_TTL
+        try:
+            for path in self.root.glob("*.json"):
+                if path.stat().st_mtime < cutoff:
+                    path.unlink(missing_ok=True)
+        except OSError:
+            pass
@@ -1,18 +1,39 @@
 """Module loader for statuskit."""
 
+import importlib
+
 from statuskit.core.config import Config
 from statuskit.core.models import RenderContext
-from statuskit.modules import git, model, usage_limits
 from statuskit.modules.base import BaseModule
 
-BUILTIN_MODULES: dict[str, type[BaseModule]] = {
-    "model": model.ModelModule,
-    "usage_limits": usage_limits.UsageLimitsModule,
-    "git": git.GitModule,
-    # "beads": ...,  # v0.3
+# Module name -> (Python module, class). Classes are imported on first use,
+# so a render only loads the modules it is configured to show.
+BUILTIN_MODULES: dict[str, tuple[str, str]] = {
+    "model": ("statuskit.modules.model", "ModelModule"),
+    "usage_limits": ("statuskit.modules.usage_limits", "UsageLimitsModule"),
+    "git": ("statuskit.modules.git", "GitModule"),
+    "transcript": ("statuskit.modules.transcript", "TranscriptModule"),
+    "cost": ("statuskit.modules.cost", "CostModule"),
+    "beads": ("statuskit.modules.beads", "BeadsModule"),
+    "command": ("statuskit.modules.command", "CommandModule"),
 }
 
 
+def get_module_class(name: str) -> type[BaseModule] | None:
+    """Import a builtin module's class.
+
+    Args:
+        name: Module name as used in the config
+
+    Returns:
+        Module class, or None if there is no builtin module of that name
+    """
+    if name not in BUILTIN_MODULES:
+        return None
+    module_path, class_name = BUILTIN_MODULES[name]
+    return getattr(importlib.import_module(module_path), class_name)
+
+
 def load_modules(config: Config, ctx: RenderContext) -> list[BaseModule]:
     """Load modules based on configuration.
 
@@ -25,9 +46,10 @@ def load_modules(config: Config, ctx: RenderContext) -> list[BaseModule]:
     """
     modules = []
     for name in config.modules:
-        if name in BUILTIN_MODULES:
+        module_class = get_module_class(name)
+        if module_class is not None:
             module_config = config.get_module_config(name)
-            modules.append(BUILTIN_MODULES[name](ctx, module_config))
+            modules.append(module_class(ctx, module_config))
         elif ctx.debug:
             print(f"[!] Unknown module: {name}")
     return modules
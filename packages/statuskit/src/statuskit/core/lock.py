@@ -0,0 +1,149 @@
+"""Advisory lock files in the statuskit cache directory."""
+
+import os
+import time
+from pathlib import Path
+
+from statuskit.core.background import is_process_alive
+
+# A lock file without a pid may still be being written by its owner
+_UNWRITTEN_GRACE = 1.0  # seconds
+
+
+class CacheLock:
+    """Advisory lock backed by an exclusively created file.
+
+    The lock file contains the owner's pid. A lock whose owner is no
+    longer running, or that is older than ``max_age``, is stale and is
+    broken on the next acquire. Breaking renames the file away before
+    deleting it, so two processes breaking the same stale lock cannot
+    both end up holding a new one.
+    """
+
+    def __init__(self, path: Path, max_age: float | None = None):
+        """Initialize lock.
+
+        Args:
+            path: Lock file path
+            max_age: Seconds after which a lock is stale even if its owner
+                is alive (a hung process or a reused pid); None to keep
+                locks for the owner's lifetime
+        """
+        self.path = path
+        self.max_age = max_age
+        self.acquired = False
+
+    def owner(self) -> int | None:
+        """Get pid of the current lock owner.
+
+        Returns:
+            Pid from the lock file, or None if unlocked or unreadable
+        """
+        try:
+            return int(self.path.read_text().strip())
+        except (OSError, ValueError):
+            return None
+
+    def is_stale(self) -> bool:
+        """Check whether an existing lock was left by a dead or stuck process."""
+        pid = self.owner()
+        try:
+            age = time.time() - self.path.stat().st_mtime
+        except OSError:
+            return True
+        if self.max_age is not None and age > self.max_age:
+            return True
+        if pid is None:
+            return age > _UNWRITTEN_GRACE
+        return not is_process_alive(pid)
+
+    def is_locked(self) -> bool:
+        """Check whether a live process holds the lock."""
+        return self.path.exists() and not self.is_stale()
+
+    def acquire(self) -> bool:
+        """Try to acquire the lock without blocking.
+
+        Breaks a stale lock once and retries.
+
+        Returns:
+            True if the lock is now held by this process
+        """
+        for _ in range(2):
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                fd = os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600)
+            except FileExistsError:
+                if not self._break_stale():
+                    return False
+                continue
+            except OSError:
+                return False
+            with os.fdopen(fd, "w") as f:
+                f.write(str(os.getpid()))
+            self.acquired = True
+            return True
+        return False
+
+    def _break_stale(self) -> bool:
+        """Remove the lock file if it is stale.
+
+        The file is renamed to a name unique to this lock first, so only
+        one process claims it. If the claimed file is not the one found
+        stale (another process broke that and locked again in between),
+        it is put back.
+
+        Returns:
+            True if the stale lock is gone and acquiring may be retried
+        """
+        try:
+            found = _identity(self.path)
+            if not self.is_stale() or _identity(self.path) != found:
+                return False
+        except FileNotFoundError:
+            return True
+        except OSError:
+            return False
+
+        claimed = self.path.with_name(f"{self.path.name}.{os.getpid()}-{id(self)}.stale")
+        try:
+            self.path.rename(claimed)
+        except FileNotFoundError:
+            return True
+        except OSError:
+            return False
+        try:
+            broken = _identity(claimed) == found
+        except OSError:
+            broken = False
+        if not broken:
+            # Link back without replacing a lock created meanwhile
+            try:
+                os.link(claimed, self.path)
+            except OSError:
+                pass
+        claimed.unlink(missing_ok=True)
+        return broken
+
+    def release(self) -> None:
+        """Release the lock if held by this process."""
+        if not self.acquired:
+            return
+        self.acquired = False
+        if self.owner() == os.getpid():
+            self.path.unlink(missing_ok=True)
+
+    def __enter__(self) -> bool:
+        return self.acquire()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.release()
+
+
+def _identity(path: Path) -> tuple[int, int, int]:
+    """Get what tells one lock file from a later one at the same path.
+
+    Inode numbers are reused quickly, so the mtime is part of it.
+    """
+    stat = path.stat()
+    return (stat.st_dev, stat.st_ino, stat.st_mtime_ns)
@@ -1,7 +1,12 @@
 """Data types for statuskit."""
 
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from statuskit.core.store import CacheStore
 
 
 @dataclass
@@ -61,6 +66,7 @@ class StatusInput:
     workspace: Workspace | None
     cost: Cost | None
     context_window: ContextWindow | None
+    transcript_path: str | None = None
 
     @classmethod
     def from_dict(cls, data: dict) -> "StatusInput":
@@ -130,6 +136,7 @@ class StatusInput:
             workspace=workspace,
             cost=cost,
             context_window=context_window,
+            transcript_path=data.get("transcript_path"),
         )
 
 
@@ -140,3 +147,16 @@ class RenderContext:
     debug: bool
     data: StatusInput
     cache_dir: Path | None = None
+
+    @cached_property
+    def store(self) -> "CacheStore | None":
+        """Shared cache store in ``cache_dir`` (None without a cache directory).
+
+        Modules keep cached values here under their own namespace instead
+        of managing files. The database is opened on first use.
+        """
+        if not self.cache_dir:
+            return None
+        from statuskit.core.store import CacheStore
+
+        return CacheStore.for_dir(self.cache_dir)
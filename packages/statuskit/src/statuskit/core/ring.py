@@ -0,0 +1,141 @@
+"""Fixed-size ring buffer files of struct records."""
+
+import mmap
+import os
+import struct
+import tempfile
+from pathlib import Path
+
+_MAGIC = b"SKRB"
+_VERSION = 1
+# magic, version, record size, capacity, total records ever appended
+_HEADER = struct.Struct("<4sHHIQ")
+
+
+class RingBuffer:
+    """Ring buffer of fixed-size records in a preallocated file.
+
+    The file is a header followed by ``capacity`` record slots, so its
+    size never changes after creation. Appending writes one slot and the
+    header (O(1)); once full, the oldest record is overwritten. Readers
+    memory-map the file instead of parsing it.
+
+    Appends are not synchronized: callers with several writers must hold
+    a lock around ``append``.
+    """
+
+    def __init__(self, path: Path, record: struct.Struct, capacity: int):
+        """Initialize ring buffer.
+
+        Args:
+            path: Buffer file path
+            record: Layout of one record
+            capacity: Number of records kept
+        """
+        self.path = path
+        self.record = record
+        self.capacity = capacity
+
+    @property
+    def file_size(self) -> int:
+        """Size of a complete buffer file in bytes."""
+        return _HEADER.size + self.record.size * self.capacity
+
+    def _valid_header(self, header: bytes) -> int | None:
+        """Check a header against this buffer's layout.
+
+        Args:
+            header: First ``_HEADER.size`` bytes of the file
+
+        Returns:
+            Total records appended, or None if the layout differs
+        """
+        if len(header) < _HEADER.size:
+            return None
+        magic, version, record_size, capacity, total = _HEADER.unpack_from(header)
+        if (magic, version, record_size, capacity) != (_MAGIC, _VERSION, self.record.size, self.capacity):
+            return None
+        return total
+
+    def _create(self) -> None:
+        """Create an empty buffer file atomically."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=self.path.parent, suffix=".tmp", delete=False) as f:
+            f.write(_HEADER.pack(_MAGIC, _VERSION, self.record.size, self.capacity, 0))
+            f.truncate(self.file_size)
+            temp_path = Path(f.name)
+        try:
+            temp_path.replace(self.path)
+        except OSError:
+            temp_path.unlink(missing_ok=True)
+            raise
+
+    def _open(self) -> tuple[int, int]:
+        """Open the buffer for writing.
+
+        A missing file, or one with a different layout (e.g. after the
+        capacity changed), is replaced by an empty buffer first.
+
+        Returns:
+            Tuple of (file descriptor, total records appended)
+        """
+        try:
+            fd = os.open(self.path, os.O_RDWR)
+        except FileNotFoundError:
+            pass
+        else:
+            total = self._valid_header(os.pread(fd, _HEADER.size, 0))
+            if total is not None and os.fstat(fd).st_size == self.file_size:
+                return fd, total
+            os.close(fd)
+        self._create()
+        return os.open(self.path, os.O_RDWR), 0
+
+    def append(self, *values: float) -> bool:
+        """Append one record, overwriting the oldest when full.
+
+        Args:
+            *values: Record fields, packed with ``record``
+
+        Returns:
+            True if the record was written, False on I/O error
+        """
+        data = self.record.pack(*values)
+        try:
+            fd, total = self._open()
+        except OSError:
+            return False
+        try:
+            # Record first, header last, so the count never covers a slot
+            # that has not been written yet
+            os.pwrite(fd, data, _HEADER.size + (total % self.capacity) * self.record.size)
+            os.pwrite(fd, _HEADER.pack(_MAGIC, _VERSION, self.record.size, self.capacity, total + 1), 0)
+        except OSError:
+            return False
+        finally:
+            os.close(fd)
+        return True
+
+    def records(self) -> list[tuple]:
+        """Read all kept records, oldest first.
+
+        Returns:
+            Unpacked records; empty if the file is missing or invalid
+        """
+        try:
+            with self.path.open("rb") as f:
+                if os.fstat(f.fileno()).st_size != self.file_size:
+                    return []
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                    total = self._valid_header(view[: _HEADER.size])
+                    if not total:
+                        return []
+                    count = min(total, self.capacity)
+                    first = total - count
+                    size = self.record.size
+                    return [
+                        self.record.unpack_from(view, _HEADER.size + (index % self.capacity) * size)
+                        for index in range(first, total)
+                    ]
+        except (OSError, ValueError):
+            return []
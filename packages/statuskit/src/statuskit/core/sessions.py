@@ -0,0 +1,63 @@
+"""Per-session state kept between statusline refreshes."""
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from statuskit.core.store import CacheStore
+
+SESSIONS_NAMESPACE = "sessions"
+# State of sessions not written for this long expires
+SESSION_TTL = 7 * 86400
+
+
+class SessionStore:
+    """Key-value state per Claude Code session, in the shared cache store.
+
+    Each namespace (usually a module name) of a session is one entry of
+    the store's ``sessions`` namespace, so saving one never rewrites the
+    others. Writes are transactions and concurrent readers see either the
+    old or the new state. Entries expire ``SESSION_TTL`` after their last
+    save, and the store's size limits evict the least recently used ones
+    first, so loads keep an active session's state.
+    """
+
+    def __init__(self, store: "CacheStore"):
+        """Initialize store.
+
+        Args:
+            store: Shared cache store
+        """
+        self.store = store.namespace(SESSIONS_NAMESPACE)
+
+    @staticmethod
+    def _key(session_id: str, namespace: str) -> str:
+        return f"{session_id}:{namespace}"
+
+    def load(self, session_id: str, namespace: str) -> dict[str, Any]:
+        """Load one namespace of a session's state.
+
+        Args:
+            session_id: Claude Code session id
+            namespace: State namespace (e.g. module name)
+
+        Returns:
+            Stored dict, or an empty dict if nothing was saved
+        """
+        value = self.store.get(self._key(session_id, namespace))
+        return value if isinstance(value, dict) else {}
+
+    def save(self, session_id: str, namespace: str, value: dict[str, Any]) -> bool:
+        """Replace one namespace of a session's state.
+
+        Other namespaces in the session are kept. Concurrent writers of the
+        same session do not corrupt it; the last write wins.
+
+        Args:
+            session_id: Claude Code session id
+            namespace: State namespace (e.g. module name)
+            value: JSON-serializable state
+
+        Returns:
+            True if the state was written
+        """
+        return self.store.set(self._key(session_id, namespace), value, ttl=SESSION_TTL)
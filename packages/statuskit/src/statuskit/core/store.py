@@ -0,0 +1,294 @@
+"""Shared key-value cache for statuskit modules, backed by sqlite."""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+STORE_FILENAME = "cache.db"
+DEFAULT_MAX_ENTRIES = 10_000
+DEFAULT_MAX_BYTES = 16 << 20
+# Reads refresh an entry's access time at most this often, so most reads
+# do not write
+ACCESS_RESOLUTION = 60.0  # seconds
+BUSY_TIMEOUT = 1.0  # seconds a writer waits for another one
+# Primary result codes of a damaged database file; other errors come from
+# statuskit's own SQL or contention and must not wipe the cache
+_CORRUPTION_CODES = (sqlite3.SQLITE_CORRUPT, sqlite3.SQLITE_NOTADB)
+_PRIMARY_CODE_MASK = 0xFF
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    expires_at REAL,
+    accessed_at REAL NOT NULL,
+    PRIMARY KEY (namespace, key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed_at);
+CREATE INDEX IF NOT EXISTS entries_expires ON entries (expires_at) WHERE expires_at IS NOT NULL;
+CREATE TABLE IF NOT EXISTS totals (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    count INTEGER NOT NULL,
+    bytes INTEGER NOT NULL
+);
+CREATE TRIGGER IF NOT EXISTS entries_insert AFTER INSERT ON entries BEGIN
+    UPDATE totals SET count = count + 1, bytes = bytes + NEW.size;
+END;
+CREATE TRIGGER IF NOT EXISTS entries_delete AFTER DELETE ON entries BEGIN
+    UPDATE totals SET count = count - 1, bytes = bytes - OLD.size;
+END;
+CREATE TRIGGER IF NOT EXISTS entries_resize AFTER UPDATE OF size ON entries BEGIN
+    UPDATE totals SET bytes = bytes + NEW.size - OLD.size;
+END;
+"""
+
+
+def _is_corruption(error: sqlite3.DatabaseError) -> bool:
+    """Check whether an error means the database file itself is damaged."""
+    code = getattr(error, "sqlite_errorcode", None)
+    return code is not None and code & _PRIMARY_CODE_MASK in _CORRUPTION_CODES
+
+
+class CacheStore:
+    """Namespaced JSON values with TTLs in one sqlite database.
+
+    The database runs in WAL mode: readers never block, and writers from
+    concurrent statusline processes are serialized by sqlite. Every write
+    is a transaction, so readers see either the old or the new value.
+    Expired entries are removed on write, then the least recently used
+    ones until the store is within ``max_entries`` and ``max_bytes``.
+    Entry count and size are kept as running totals by triggers, so a
+    write does not scan the table to check the limits. One instance may be
+    shared by threads; its statements run one at a time.
+
+    Errors never propagate: a broken store reads as empty and ignores
+    writes, and a corrupted database file is replaced.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
+        """Initialize store. The database is opened on first use.
+
+        Args:
+            path: Database file path
+            max_entries: Most entries kept across all namespaces
+            max_bytes: Most bytes of values kept across all namespaces
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.RLock()
+
+    @classmethod
+    def for_dir(cls, cache_dir: Path) -> "CacheStore":
+        """Get the store of a statuskit cache directory."""
+        return cls(cache_dir / STORE_FILENAME)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database, creating it (private to the user) if needed.
+
+        Callers hold ``_lock``.
+        """
+        if self._conn is not None:
+            return self._conn
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Values may include account data: create the file owner-only
+        os.close(os.open(self.path, os.O_CREAT | os.O_RDWR, 0o600))
+        conn = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT, isolation_level=None, check_same_thread=False)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            if not conn.execute("SELECT 1 FROM totals").fetchone():
+                self._init_totals(conn)
+        except sqlite3.Error:
+            conn.close()
+            raise
+        self._conn = conn
+        return conn
+
+    def _init_totals(self, conn: sqlite3.Connection) -> None:
+        """Count the entries of a new database, or one from before the totals."""
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute("INSERT OR IGNORE INTO totals SELECT 0, count(*), coalesce(sum(size), 0) FROM entries")
+        except sqlite3.Error:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def _execute(self, sql: str, params: tuple = ()) -> list[tuple]:
+        """Run a statement, replacing a corrupted database once."""
+        with self._lock:
+            for attempt in range(2):
+                try:
+                    return self._connect().execute(sql, params).fetchall()
+                except sqlite3.DatabaseError as e:
+                    if attempt or not _is_corruption(e):
+                        raise
+                    self._reset()
+        return []
+
+    def _reset(self) -> None:
+        """Delete a corrupted database so the next use recreates it."""
+        self.close()
+        for suffix in ("", "-wal", "-shm"):
+            Path(f"{self.path}{suffix}").unlink(missing_ok=True)
+
+    def get(self, namespace: str, key: str, default: Any = None) -> Any:
+        """Get a value.
+
+        Args:
+            namespace: Owner of the key (usually a module name)
+            key: Key within the namespace
+            default: Returned when the key is missing or expired
+
+        Returns:
+            Stored value, or ``default``
+        """
+        # Reading never creates the database
+        if self._conn is None and not self.path.exists():
+            return default
+        now = time.time()
+        try:
+            rows = self._execute(
+                "SELECT value, expires_at, accessed_at FROM entries WHERE namespace = ? AND key = ?",
+                (namespace, key),
+            )
+            if not rows:
+                return default
+            value, expires_at, accessed_at = rows[0]
+            if expires_at is not None and expires_at <= now:
+                return default
+            if now - accessed_at >= ACCESS_RESOLUTION:
+                self._execute(
+                    "UPDATE entries SET accessed_at = ? WHERE namespace = ? AND key = ?",
+                    (now, namespace, key),
+                )
+            return json.loads(value)
+        except (sqlite3.Error, OSError, ValueError):
+            return default
+
+    def set(self, namespace: str, key: str, value: Any, ttl: float | None = None) -> bool:
+        """Store a value.
+
+        Args:
+            namespace: Owner of the key (usually a module name)
+            key: Key within the namespace
+            value: JSON-serializable value
+            ttl: Seconds until the value expires; None to keep it until evicted
+
+        Returns:
+            True if the value was stored
+        """
+        now = time.time()
+        try:
+            data = json.dumps(value)
+            expires_at = now + ttl if ttl is not None else None
+            self._execute(
+                "INSERT INTO entries VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT (namespace, key) DO UPDATE SET"
+                " value = excluded.value, size = excluded.size,"
+                " expires_at = excluded.expires_at, accessed_at = excluded.accessed_at",
+                (namespace, key, data, len(data), expires_at, now),
+            )
+            self._evict(now)
+        except (sqlite3.Error, OSError, TypeError, ValueError):
+            return False
+        return True
+
+    def delete(self, namespace: str, key: str) -> None:
+        """Remove a value if present."""
+        try:
+            self._execute("DELETE FROM entries WHERE namespace = ? AND key = ?", (namespace, key))
+        except (sqlite3.Error, OSError):
+            pass
+
+    def clear(self, namespace: str | None = None) -> None:
+        """Remove all values of a namespace, or of every namespace."""
+        try:
+            if namespace is None:
+                self._execute("DELETE FROM entries")
+            else:
+                self._execute("DELETE FROM entries WHERE namespace = ?", (namespace,))
+        except (sqlite3.Error, OSError):
+            pass
+
+    def _evict(self, now: float) -> None:
+        """Remove expired entries, then least recently used ones over the limits."""
+        self._execute("DELETE FROM entries WHERE expires_at IS NOT NULL AND expires_at <= ?", (now,))
+        totals = self._execute("SELECT count, bytes FROM totals")
+        if not totals:
+            # Row lost (manual edit or an interrupted init): recount
+            with self._lock:
+                self._init_totals(self._connect())
+            totals = self._execute("SELECT count, bytes FROM totals")
+        count, size = totals[0]
+        if count <= self.max_entries and size <= self.max_bytes:
+            return
+        excess_entries = max(count - self.max_entries, 0)
+        excess_bytes = size - self.max_bytes
+        removed = 0
+        freed = 0
+        victims = []
+        for namespace, key, entry_size in self._execute(
+            "SELECT namespace, key, size FROM entries ORDER BY accessed_at"
+        ):
+            if removed >= excess_entries and freed >= excess_bytes:
+                break
+            victims.append((namespace, key))
+            removed += 1
+            freed += entry_size
+        with self._lock:
+            self._connect().executemany("DELETE FROM entries WHERE namespace = ? AND key = ?", victims)
+
+    def namespace(self, name: str) -> "CacheNamespace":
+        """Get a view of one namespace."""
+        return CacheNamespace(self, name)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class CacheNamespace:
+    """The keys of one namespace in a CacheStore."""
+
+    def __init__(self, store: CacheStore, name: str):
+        """Initialize view.
+
+        Args:
+            store: Underlying store
+            name: Namespace name
+        """
+        self.store = store
+        self.name = name
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a value; see CacheStore.get."""
+        return self.store.get(self.name, key, default)
+
+    def set(self, key: str, value: Any, ttl: float | None = None) -> bool:
+        """Store a value; see CacheStore.set."""
+        return self.store.set(self.name, key, value, ttl)
+
+    def delete(self, key: str) -> None:
+        """Remove a value; see CacheStore.delete."""
+        self.store.delete(self.name, key)
+
+    def clear(self) -> None:
+        """Remove all values of this namespace."""
+        self.store.clear(self.name)
@@ -0,0 +1,111 @@
+"""Cache warming between renders, driven by Claude Code hooks."""
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from statuskit.core.cache import worktree_key
+from statuskit.core.lock import CacheLock
+
+if TYPE_CHECKING:
+    from statuskit.core.config import Config
+    from statuskit.core.models import StatusInput
+
+WARM_DIRNAME = "warm"
+# A warm pass runs git and may call the usage API; a lock older than this
+# was left by a hung warmer
+WARM_LOCK_MAX_AGE = 120.0
+# Passes one warmer runs when hooks keep firing while it works
+MAX_PASSES = 3
+
+
+class Warmer:
+    """Single-flight cache warming for one project.
+
+    Each hook event marks the project as pending and starts a warmer
+    unless one is already running. The running warmer clears the mark
+    before each pass and runs another pass if an event arrived meanwhile,
+    so a burst of tool calls costs at most a few passes. A mark still
+    set once the lock is released (an event that found the lock held
+    just before release, or a burst longer than ``MAX_PASSES``) is handed
+    to a new warmer, so the last change is always covered.
+    """
+
+    def __init__(self, cache_dir: Path, project: Path):
+        """Initialize warmer.
+
+        Args:
+            cache_dir: Statuskit cache directory
+            project: Directory the hook fired in
+        """
+        key = worktree_key(project)
+        self.lock = CacheLock(cache_dir / WARM_DIRNAME / f"{key}.lock", max_age=WARM_LOCK_MAX_AGE)
+        self.pending = cache_dir / WARM_DIRNAME / f"{key}.pending"
+
+    def request(self) -> bool:
+        """Mark the project as needing a warm pass.
+
+        Returns:
+            True if no warmer is running and the caller should start one
+        """
+        try:
+            self.pending.parent.mkdir(parents=True, exist_ok=True)
+            self.pending.touch()
+        except OSError:
+            return False
+        return not self.lock.is_locked()
+
+    def needs_rerun(self) -> bool:
+        """Check, after run(), whether a request is left with no warmer to take it.
+
+        Returns:
+            True if the caller should start another warmer
+        """
+        return self.pending.exists() and not self.lock.is_locked()
+
+    def run(self, config: "Config", data: "StatusInput") -> list[str]:
+        """Warm the configured modules until no request is pending.
+
+        Args:
+            config: Statuskit configuration
+            data: Session fields from the hook input
+
+        Returns:
+            Names of the modules warmed in the last pass; empty if another
+            warmer holds the lock
+        """
+        warmed: list[str] = []
+        with self.lock as acquired:
+            if not acquired:
+                return warmed
+            for _ in range(MAX_PASSES):
+                self.pending.unlink(missing_ok=True)
+                warmed = warm_modules(config, data)
+                if not self.pending.exists():
+                    break
+        return warmed
+
+
+def warm_modules(config: "Config", data: "StatusInput") -> list[str]:
+    """Call warm() on each configured module.
+
+    A module that raises is skipped; warming never affects rendering.
+
+    Args:
+        config: Statuskit configuration
+        data: Session fields from the hook input
+
+    Returns:
+        Names of the modules that warmed without error
+    """
+    from statuskit.core.loader import load_modules
+    from statuskit.core.models import RenderContext
+
+    ctx = RenderContext(debug=False, data=data, cache_dir=config.cache_dir)
+    warmed = []
+    for mod in load_modules(config, ctx):
+        try:
+            mod.warm()
+        except Exception:  # noqa: S112
+            continue
+        warmed.append(mod.name)
+    return warmed
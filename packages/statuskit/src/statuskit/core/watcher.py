@@ -0,0 +1,461 @@
+"""Filesystem watcher that invalidates cached git status.
+
+The watcher runs as a detached ``statuskit watch`` process, one per worktree.
+It watches the worktree's git directories and working tree and bumps a
+generation counter in ``cache_dir`` whenever anything changes. Status computed
+while the counter stays at the same generation is still valid.
+
+Linux uses inotify through ctypes; other platforms fall back to polling.
+Trees that need more than ``max_watches`` watches are marked as degraded and
+readers go back to running git on every refresh.
+"""
+
+import ctypes
+import errno
+import hashlib
+import os
+import select
+import struct
+import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from statuskit.core.background import is_process_alive
+from statuskit.core.cache import read_json, worktree_key, write_json
+from statuskit.core.constants import DEFAULT_IDLE_TIMEOUT, DEFAULT_MAX_WATCHES
+from statuskit.core.lock import CacheLock
+
+WATCH_DIRNAME = "git_watch"
+DEGRADED_RETRY = 3600  # seconds before watching a too-large tree is retried
+POLL_INTERVAL = 2.0  # seconds
+
+STATE_ACTIVE = "active"
+STATE_DEGRADED = "degraded"
+
+_GIT_TIMEOUT = 10  # seconds, startup only
+_DEBOUNCE = 0.05  # seconds to coalesce bursts of events
+_MAX_DEBOUNCE_ROUNDS = 20
+
+# inotify constants (linux/inotify.h)
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ONLYDIR = 0x01000000
+_IN_ISDIR = 0x40000000
+_IN_NONBLOCK = os.O_NONBLOCK
+_IN_CLOEXEC = 0o2000000
+_WATCH_MASK = (
+    _IN_MODIFY
+    | _IN_ATTRIB
+    | _IN_MOVED_FROM
+    | _IN_MOVED_TO
+    | _IN_CREATE
+    | _IN_DELETE
+    | _IN_DELETE_SELF
+    | _IN_MOVE_SELF
+    | _IN_ONLYDIR
+)
+_EVENT = struct.Struct("iIII")  # wd, mask, cookie, len
+_READ_SIZE = 64 * 1024
+
+
+class TreeTooLargeError(Exception):
+    """Raised when a tree needs more watches than allowed."""
+
+
+@dataclass
+class WatchState:
+    """Watcher state shared with readers through the cache directory."""
+
+    pid: int
+    generation: int
+    state: str
+    backend: str
+    updated_at: float
+
+    @property
+    def trusted(self) -> bool:
+        """Whether status computed at ``generation`` can be reused."""
+        return self.state == STATE_ACTIVE and is_process_alive(self.pid)
+
+
+def _state_path(cache_dir: Path, worktree: Path) -> Path:
+    return cache_dir / WATCH_DIRNAME / f"{worktree_key(worktree)}.json"
+
+
+def _lock_path(cache_dir: Path, worktree: Path) -> Path:
+    return cache_dir / WATCH_DIRNAME / f"{worktree_key(worktree)}.lock"
+
+
+def read_state(cache_dir: Path, worktree: Path) -> WatchState | None:
+    """Read watcher state for a worktree.
+
+    Returns:
+        WatchState, or None if no watcher has written state
+    """
+    data = read_json(_state_path(cache_dir, worktree))
+    if not isinstance(data, dict):
+        return None
+    try:
+        return WatchState(**data)
+    except TypeError:
+        return None
+
+
+def needs_watcher(cache_dir: Path, worktree: Path) -> bool:
+    """Check whether a watcher should be started for a worktree.
+
+    A live watcher, or a recent verdict that the tree is too large to
+    watch, means no new watcher is needed.
+    """
+    state = read_state(cache_dir, worktree)
+    if state is None:
+        return True
+    if state.state == STATE_DEGRADED:
+        return time.time() - state.updated_at > DEGRADED_RETRY
+    return not is_process_alive(state.pid)
+
+
+class _InotifyBackend:
+    """Linux inotify watches on individual directories."""
+
+    name = "inotify"
+
+    def __init__(self, max_watches: int):
+        if not sys.platform.startswith("linux"):
+            msg = "inotify is only available on Linux"
+            raise OSError(errno.ENOSYS, msg)
+        self._libc = ctypes.CDLL(None, use_errno=True)  # libc symbols of the running process
+        fd = self._libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        self._fd = fd
+        self._max_watches = max_watches
+        self._watches: dict[int, tuple[Path, bool]] = {}
+        self._paths: set[Path] = set()
+
+    def add(self, path: Path, recursive: bool) -> None:
+        """Watch a single directory.
+
+        Args:
+            path: Directory to watch
+            recursive: Whether subdirectories created later are watched too
+        """
+        if path in self._paths:
+            return
+        if len(self._watches) >= self._max_watches:
+            raise TreeTooLargeError
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), _WATCH_MASK)
+        if wd < 0:
+            if ctypes.get_errno() == errno.ENOSPC:
+                raise TreeTooLargeError
+            return  # directory vanished or is unreadable
+        self._watches[wd] = (path, recursive)
+        self._paths.add(path)
+
+    def start(self) -> None:
+        """Finish setup (nothing to do for inotify)."""
+
+    def wait(self, timeout: float) -> tuple[bool, list[Path]]:
+        """Wait for changes.
+
+        Returns:
+            Tuple of (changed, new directories to watch)
+        """
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return (False, [])
+        try:
+            buf = os.read(self._fd, _READ_SIZE)
+        except BlockingIOError:
+            return (False, [])
+
+        new_dirs: list[Path] = []
+        offset = 0
+        while offset + _EVENT.size <= len(buf):
+            wd, mask, _cookie, name_len = _EVENT.unpack_from(buf, offset)
+            name = buf[offset + _EVENT.size : offset + _EVENT.size + name_len].rstrip(b"\0")
+            offset += _EVENT.size + name_len
+            self._handle_event(wd, mask, name, new_dirs)
+        return (True, new_dirs)
+
+    def _handle_event(self, wd: int, mask: int, name: bytes, new_dirs: list[Path]) -> None:
+        if mask & _IN_Q_OVERFLOW:
+            # Events were dropped: rescan watched trees for missed directories
+            new_dirs.extend(path for path, recursive in self._watches.values() if recursive)
+            return
+        if mask & _IN_IGNORED:
+            path, _ = self._watches.pop(wd, (None, False))
+            self._paths.discard(path)
+            return
+        watch = self._watches.get(wd)
+        if watch is None or not name:
+            return
+        path, recursive = watch
+        if recursive and mask & _IN_ISDIR and mask & (_IN_CREATE | _IN_MOVED_TO):
+            new_dirs.append(path / os.fsdecode(name))
+
+    def close(self) -> None:
+        """Release the inotify descriptor."""
+        os.close(self._fd)
+
+
+class _PollingBackend:
+    """Portable fallback that compares stat fingerprints periodically."""
+
+    name = "polling"
+
+    def __init__(self, max_watches: int, interval: float = POLL_INTERVAL):
+        self._max_watches = max_watches
+        self._interval = interval
+        self._dirs: dict[Path, bool] = {}
+        self._fingerprint = ""
+
+    def add(self, path: Path, recursive: bool) -> None:
+        """Register a directory for polling."""
+        if path in self._dirs:
+            return
+        if len(self._dirs) >= self._max_watches:
+            raise TreeTooLargeError
+        self._dirs[path] = recursive
+
+    def start(self) -> None:
+        """Record the baseline fingerprint."""
+        self._fingerprint, _ = self._scan()
+
+    def wait(self, timeout: float) -> tuple[bool, list[Path]]:
+        """Sleep one interval and compare fingerprints.
+
+        Returns:
+            Tuple of (changed, new directories to watch)
+        """
+        time.sleep(min(self._interval, timeout))
+        fingerprint, new_dirs = self._scan()
+        if fingerprint == self._fingerprint:
+            return (False, [])
+        self._fingerprint = fingerprint
+        return (True, new_dirs)
+
+    def _scan(self) -> tuple[str, list[Path]]:
+        digest = hashlib.sha256()
+        new_dirs: list[Path] = []
+        entries = 0
+        for path, recursive in list(self._dirs.items()):
+            try:
+                with os.scandir(path) as it:
+                    for entry in it:
+                        entries += 1
+                        if entry.is_dir(follow_symlinks=False):
+                            child = Path(entry.path)
+                            if recursive and entry.name != ".git" and child not in self._dirs:
+                                new_dirs.append(child)
+                            digest.update(f"{entry.path}/\n".encode())
+                            continue
+                        st = entry.stat(follow_symlinks=False)
+                        digest.update(f"{entry.path}\0{st.st_mtime_ns}\0{st.st_size}\0{st.st_mode}\n".encode())
+            except OSError:
+                del self._dirs[path]
+                digest.update(f"-{path}\n".encode())
+                continue
+            if entries > self._max_watches:
+                raise TreeTooLargeError
+        return (digest.hexdigest(), new_dirs)
+
+    def close(self) -> None:
+        """Nothing to release."""
+
+
+def _open_backend(backend: str, max_watches: int) -> "_InotifyBackend | _PollingBackend":
+    if backend in ("auto", "inotify"):
+        try:
+            return _InotifyBackend(max_watches)
+        except (OSError, AttributeError):  # AttributeError: libc without inotify
+            if backend == "inotify":
+                raise
+    return _PollingBackend(max_watches)
+
+
+def _run_git(worktree: Path, *args: str) -> str | None:
+    try:
+        result = subprocess.run(  # noqa: S603
+            ["git", "--no-optional-locks", "-C", str(worktree), *args],  # noqa: S607
+            capture_output=True,
+            text=True,
+            timeout=_GIT_TIMEOUT,
+            check=False,
+        )
+    except (subprocess.TimeoutExpired, OSError):
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout
+
+
+def _git_dirs(worktree: Path) -> list[Path] | None:
+    """Get the worktree's git dir and common dir (deduplicated)."""
+    output = _run_git(worktree, "rev-parse", "--path-format=absolute", "--git-dir", "--git-common-dir")
+    if output is None:
+        return None
+    dirs: list[Path] = []
+    for line in output.splitlines():
+        path = Path(line).resolve()
+        if path not in dirs:
+            dirs.append(path)
+    return dirs
+
+
+def _ignored_dirs(worktree: Path) -> set[Path]:
+    """Get ignored directories, which never affect git status."""
+    output = _run_git(worktree, "ls-files", "-z", "--others", "--ignored", "--exclude-standard", "--directory")
+    if output is None:
+        return set()
+    return {worktree / entry.rstrip("/") for entry in output.split("\0") if entry.endswith("/")}
+
+
+def _add_tree(backend: "_InotifyBackend | _PollingBackend", root: Path, ignored: set[Path]) -> None:
+    """Add watches for a directory and all its subdirectories."""
+    stack = [root]
+    while stack:
+        path = stack.pop()
+        backend.add(path, recursive=True)
+        try:
+            with os.scandir(path) as it:
+                stack.extend(
+                    Path(entry.path)
+                    for entry in it
+                    if entry.name != ".git" and entry.is_dir(follow_symlinks=False) and Path(entry.path) not in ignored
+                )
+        except OSError:
+            continue
+
+
+def _add_roots(
+    backend: "_InotifyBackend | _PollingBackend",
+    worktree: Path,
+    git_dirs: list[Path],
+    ignored: set[Path],
+) -> None:
+    """Watch git directories (top level, refs, ref logs) and the working tree."""
+    for git_dir in git_dirs:
+        backend.add(git_dir, recursive=False)
+        refs = git_dir / "refs"
+        if refs.is_dir():
+            _add_tree(backend, refs, set())
+        # Dropping an older stash entry only rewrites logs/refs/stash
+        logs = git_dir / "logs"
+        if logs.is_dir():
+            backend.add(logs, recursive=True)
+            if (logs / "refs").is_dir():
+                backend.add(logs / "refs", recursive=True)
+    _add_tree(backend, worktree, ignored)
+
+
+def run_watcher(
+    worktree: Path,
+    cache_dir: Path,
+    max_watches: int = DEFAULT_MAX_WATCHES,
+    backend: str = "auto",
+    idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+) -> int:
+    """Watch a worktree and maintain its generation counter.
+
+    Exits when another watcher already owns the worktree, when the tree
+    is too large to watch, after ``idle_timeout`` seconds without changes,
+    or when the worktree is removed.
+
+    Args:
+        worktree: Worktree root directory
+        cache_dir: Statuskit cache directory
+        max_watches: Maximum number of watched directories (or polled entries)
+        backend: "auto", "inotify" or "polling"
+        idle_timeout: Seconds without changes before exiting
+
+    Returns:
+        Process exit code
+    """
+    worktree = worktree.resolve()
+    lock = CacheLock(_lock_path(cache_dir, worktree))
+    if not lock.acquire():
+        return 0  # another watcher owns this worktree
+
+    state_path = _state_path(cache_dir, worktree)
+    watcher = None
+    degraded = False
+    try:
+        git_dirs = _git_dirs(worktree)
+        if git_dirs is None:
+            return 1
+        watcher = _open_backend(backend, max_watches)
+        state = WatchState(
+            pid=os.getpid(),
+            generation=time.time_ns(),  # never reuse a previous watcher's generation
+            state=STATE_ACTIVE,
+            backend=watcher.name,
+            updated_at=time.time(),
+        )
+        try:
+            ignored = _ignored_dirs(worktree)
+            _add_roots(watcher, worktree, git_dirs, ignored)
+            watcher.start()
+            write_json(state_path, asdict(state))
+            _watch_loop(watcher, worktree, ignored, state=state, state_path=state_path, idle_timeout=idle_timeout)
+        except TreeTooLargeError:
+            degraded = True
+            state.state = STATE_DEGRADED
+            state.updated_at = time.time()
+            write_json(state_path, asdict(state))
+    finally:
+        if watcher is not None:
+            watcher.close()
+        if not degraded:
+            current = read_state(cache_dir, worktree)
+            if current is not None and current.pid == os.getpid():
+                state_path.unlink(missing_ok=True)
+        lock.release()
+    return 0
+
+
+def _watch_loop(
+    watcher: "_InotifyBackend | _PollingBackend",
+    worktree: Path,
+    ignored: set[Path],
+    *,
+    state: WatchState,
+    state_path: Path,
+    idle_timeout: float,
+) -> None:
+    last_change = time.monotonic()
+    while (remaining := idle_timeout - (time.monotonic() - last_change)) > 0:
+        changed, new_dirs = watcher.wait(remaining)
+        if not changed:
+            continue
+
+        # Coalesce bursts (checkouts, builds) into a single bump
+        for _ in range(_MAX_DEBOUNCE_ROUNDS):
+            more, more_dirs = watcher.wait(_DEBOUNCE)
+            new_dirs.extend(more_dirs)
+            if not more:
+                break
+
+        # Watch new directories before bumping so nothing slips through
+        for path in new_dirs:
+            if path not in ignored:
+                _add_tree(watcher, path, ignored)
+
+        if not worktree.is_dir():
+            return
+
+        state.generation += 1
+        state.updated_at = time.time()
+        write_json(state_path, asdict(state))
+        last_change = time.monotonic()
@@ -1,9 +1,13 @@
 """Base module class for statuskit."""
 
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
 
 from statuskit.core.models import RenderContext
 
+if TYPE_CHECKING:
+    from statuskit.core.store import CacheStore
+
 
 class BaseModule(ABC):
     """Base class for statuskit modules.
@@ -12,6 +16,8 @@ class BaseModule(ABC):
     - name: str - module identifier
     - description: str - human-readable description
     - render() -> str | None - output to display
+
+    Subclasses may override warm() to fill their caches ahead of a render.
     """
 
     name: str
@@ -26,7 +32,18 @@ class BaseModule(ABC):
         """
         self.debug = ctx.debug
         self.data = ctx.data
+        self.cache_dir = ctx.cache_dir
         self.config = config
+        self._ctx = ctx
+
+    @property
+    def store(self) -> "CacheStore | None":
+        """Shared cache store, opened when a module first uses it.
+
+        Reading it lazily keeps sqlite out of renders whose modules do not
+        cache anything there.
+        """
+        return self._ctx.store
 
     @abstractmethod
     def render(self) -> str | None:
@@ -36,3 +53,10 @@ class BaseModule(ABC):
             String to display (can be multiline) or None to skip.
         """
         ...
+
+    def warm(self) -> None:  # noqa: B027
+        """Fill the module's caches so the next render is cheap.
+
+        Called by ``statuskit warm`` from Claude Code hooks, outside of
+        any render. Nothing is printed. The default does nothing.
+        """
@@ -0,0 +1,225 @@
+"""Beads module for statuskit."""
+
+import json
+from pathlib import Path
+from typing import Any
+
+from termcolor import colored
+
+from statuskit.core.store import CacheStore
+from statuskit.modules.base import BaseModule
+
+BEADS_DIRNAME = ".beads"
+# JSONL exports of the beads database, newest name first
+DATA_FILENAMES = ("issues.jsonl", "beads.jsonl")
+INDEX_VERSION = 1
+# Statuses that do not count as open work
+_DONE_STATUSES = {"closed", "tombstone"}
+_DEFAULT_PRIORITY = 2
+_ELLIPSIS = "…"
+
+
+def find_beads_data(start: Path) -> Path | None:
+    """Find the beads JSONL data file for a directory.
+
+    Searches ``start`` and its parents for a ``.beads`` directory, like
+    ``bd`` does.
+
+    Args:
+        start: Directory to search from
+
+    Returns:
+        Data file path, or None if there is no beads project
+    """
+    for directory in (start, *start.parents):
+        beads_dir = directory / BEADS_DIRNAME
+        for name in DATA_FILENAMES:
+            path = beads_dir / name
+            if path.is_file():
+                return path
+    return None
+
+
+def _file_key(path: Path) -> list[int] | None:
+    """Get the [mtime_ns, size] pair an index is keyed by."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def build_index(path: Path) -> dict[str, Any]:
+    """Parse a beads JSONL file into the compact index the module renders.
+
+    Leaf tasks are open issues without open children (parent-child
+    dependencies); epics with open subtasks are not work items. A leaf is
+    ready when none of its "blocks" dependencies is still open.
+
+    Args:
+        path: Beads JSONL data file
+
+    Returns:
+        Dict with ``in_progress`` (leaf tasks being worked on, most
+        important first), ``ready`` (count of ready leaf tasks) and
+        ``open`` (count of open issues)
+    """
+    issues: dict[str, dict] = {}
+    with path.open("rb") as f:
+        for line in f:
+            try:
+                issue = json.loads(line)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                continue
+            if isinstance(issue, dict) and issue.get("id"):
+                issues[issue["id"]] = issue
+
+    def is_open(issue_id: str) -> bool:
+        issue = issues.get(issue_id)
+        return issue is not None and issue.get("status") not in _DONE_STATUSES
+
+    has_open_children: set[str] = set()
+    blocked: set[str] = set()
+    for issue_id, issue in issues.items():
+        if not is_open(issue_id):
+            continue
+        for dep in issue.get("dependencies") or []:
+            if not isinstance(dep, dict):
+                continue
+            target = dep.get("depends_on_id")
+            if dep.get("type") == "parent-child":
+                has_open_children.add(target)
+            elif dep.get("type") == "blocks" and is_open(target):
+                blocked.add(issue_id)
+
+    leaves = [issue for issue_id, issue in issues.items() if is_open(issue_id) and issue_id not in has_open_children]
+    in_progress = sorted(
+        (issue for issue in leaves if issue.get("status") == "in_progress"),
+        # Hand-edited exports may hold null or non-numeric values
+        key=lambda issue: (
+            p if isinstance(p := issue.get("priority"), int) else _DEFAULT_PRIORITY,
+            str(issue.get("updated_at") or ""),
+        ),
+    )
+    ready = [issue for issue in leaves if issue.get("status") == "open" and issue["id"] not in blocked]
+    return {
+        "in_progress": [
+            {"id": issue["id"], "title": issue.get("title", ""), "priority": issue.get("priority")}
+            for issue in in_progress
+        ],
+        "ready": len(ready),
+        "open": sum(1 for issue_id in issues if is_open(issue_id)),
+    }
+
+
+class BeadsIndex:
+    """Beads index persisted in the cache store, rebuilt when the data changes.
+
+    The index is stored under the data file's path with its mtime and
+    size, so while the data is unchanged reading it costs a ``stat`` and
+    one small store lookup; the JSONL is only parsed after ``bd`` writes it.
+    """
+
+    namespace = "beads"
+
+    def __init__(self, store: CacheStore, data_path: Path):
+        """Initialize index.
+
+        Args:
+            store: Shared cache store
+            data_path: Beads JSONL data file
+        """
+        self.data_path = data_path
+        self.store = store.namespace(self.namespace)
+
+    def get(self) -> dict[str, Any] | None:
+        """Get the index, rebuilding it if the data file changed.
+
+        Returns:
+            Index from build_index, or None if the data file cannot be read
+        """
+        key = _file_key(self.data_path)
+        if key is None:
+            return None
+        cached = self.store.get(str(self.data_path))
+        if (
+            isinstance(cached, dict)
+            and cached.get("version") == INDEX_VERSION
+            and cached.get("key") == key
+            and isinstance(cached.get("index"), dict)
+        ):
+            return cached["index"]
+
+        try:
+            index = build_index(self.data_path)
+        except OSError:
+            return None
+        # Keyed by the stat taken before parsing: a write during the parse
+        # changes the file's key and triggers another rebuild
+        self.store.set(str(self.data_path), {"version": INDEX_VERSION, "key": key, "index": index})
+        return index
+
+
+class BeadsModule(BaseModule):
+    """Display the beads task in progress and the number of ready tasks."""
+
+    name = "beads"
+    description = "Active beads tasks"
+
+    def __init__(self, ctx, config: dict):
+        super().__init__(ctx, config)
+        self.show_id = config.get("show_id", True)
+        self.show_ready = config.get("show_ready", True)
+        self.max_title_length = config.get("max_title_length", 40)
+
+    def render(self) -> str | None:
+        index = self._get_index()
+        if index is None:
+            return None
+
+        parts = []
+
+        # ◆ bd-a1b2 Fix login redirect (+1)
+        in_progress = index.get("in_progress") or []
+        if in_progress:
+            parts.append(self._format_task(in_progress[0], len(in_progress) - 1))
+
+        # 5 ready
+        if self.show_ready and index.get("ready"):
+            parts.append(colored(f"{index['ready']} ready", "dark_grey"))
+
+        return " | ".join(parts) if parts else None
+
+    def warm(self) -> None:
+        """Rebuild the index if the data file changed."""
+        self._get_index()
+
+    def _start_dir(self) -> Path:
+        if self.data.workspace and self.data.workspace.project_dir:
+            return Path(self.data.workspace.project_dir)
+        if self.data.cwd:
+            return Path(self.data.cwd)
+        return Path.cwd()
+
+    def _get_index(self) -> dict[str, Any] | None:
+        data_path = find_beads_data(self._start_dir())
+        if data_path is None:
+            return None
+        if not self.store:
+            try:
+                return build_index(data_path)
+            except OSError:
+                return None
+        return BeadsIndex(self.store, data_path).get()
+
+    def _format_task(self, task: dict, others: int) -> str:
+        title = task.get("title", "")
+        if self.max_title_length and len(title) > self.max_title_length:
+            title = title[: self.max_title_length - 1] + _ELLIPSIS
+        text = colored("◆", "yellow") + " "
+        if self.show_id:
+            text += colored(task["id"], "cyan") + " "
+        text += title
+        if others:
+            text += colored(f" (+{others})", "dark_grey")
+        return text
@@ -0,0 +1,295 @@
+"""Command module for statuskit."""
+
+import hashlib
+import os
+import signal
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from termcolor import colored
+
+from statuskit.core.background import spawn_statuskit
+from statuskit.core.constants import DEFAULT_COMMAND_TIMEOUT
+from statuskit.core.store import CacheNamespace, CacheStore
+from statuskit.modules.base import BaseModule
+
+CACHE_NAMESPACE = "command"
+DEFAULT_TTL = 30  # seconds
+# Commands without a cached output run during the render for at most this
+# long; slower ones are killed and finished by a background refresh
+INLINE_TIMEOUT = 0.5  # seconds
+# Outputs older than this are dropped instead of shown while refreshing
+MAX_STALE = 86400
+# A background refresh that has not finished after its timeout plus this
+# is assumed lost, and another one may start
+REFRESH_GRACE = 5.0
+# After a timeout kill, how long to wait for the output pipe to close; a
+# process that left the process group may keep it open
+_KILL_GRACE = 0.5  # seconds
+_DEFAULT_WORKERS = 4
+
+
+@dataclass
+class CommandSpec:
+    """One ``[[command.commands]]`` entry."""
+
+    name: str
+    run: str
+    timeout: float = DEFAULT_COMMAND_TIMEOUT
+    ttl: float = DEFAULT_TTL
+    prefix: str = ""
+    color: str | None = None
+
+    @classmethod
+    def from_config(cls, data: Any, timeout: float, ttl: float) -> "CommandSpec | None":
+        """Parse a config entry; None if it has no command to run.
+
+        Args:
+            data: Entry from the ``commands`` array
+            timeout: Module-wide default timeout
+            ttl: Module-wide default TTL
+        """
+        if not isinstance(data, dict) or not isinstance(data.get("run"), str) or not data["run"].strip():
+            return None
+        return cls(
+            name=str(data.get("name") or data["run"]),
+            run=data["run"],
+            timeout=float(data.get("timeout", timeout)),
+            ttl=float(data.get("ttl", ttl)),
+            prefix=str(data.get("prefix", "")),
+            color=data.get("color"),
+        )
+
+
+def command_key(run: str, cwd: str) -> str:
+    """Get the cache key of a command's output in a directory."""
+    return hashlib.sha256(f"{cwd}\0{run}".encode()).hexdigest()[:16]
+
+
+def run_command(run: str, cwd: str, timeout: float) -> dict[str, Any]:
+    """Run a shell command and capture its first line of output.
+
+    The command runs in its own process group, so a timeout kills
+    everything it started, not just the shell.
+
+    Args:
+        run: Shell command line
+        cwd: Working directory
+        timeout: Seconds before the command is killed
+
+    Returns:
+        Cache entry: ``output`` (first output line, or None on failure),
+        ``error`` (None, "timeout", "exit N" or an OS error) and ``at``
+        (Unix time the command started)
+    """
+    started = time.time()
+    try:
+        proc = subprocess.Popen(  # noqa: S602
+            run,
+            shell=True,
+            cwd=cwd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            errors="replace",
+            start_new_session=True,
+        )
+    except OSError as e:
+        return {"output": None, "error": str(e), "at": started}
+    try:
+        stdout, _ = proc.communicate(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        try:
+            os.killpg(proc.pid, signal.SIGKILL)
+        except OSError:
+            pass
+        try:
+            proc.communicate(timeout=_KILL_GRACE)
+        except subprocess.TimeoutExpired:
+            if proc.stdout:
+                proc.stdout.close()
+            proc.kill()
+            proc.wait()
+        return {"output": None, "error": "timeout", "at": started}
+    if proc.returncode != 0:
+        return {"output": None, "error": f"exit {proc.returncode}", "at": started}
+    lines = stdout.strip().splitlines()
+    return {"output": lines[0].strip() if lines else "", "error": None, "at": started}
+
+
+def store_output(cache: CacheNamespace, key: str, entry: dict[str, Any]) -> None:
+    """Cache a command's result.
+
+    A failed run keeps the previous output, so a command that times out
+    now and then does not blank its segment until the next success.
+    """
+    if entry["error"] is not None:
+        previous = cache.get(key)
+        if isinstance(previous, dict) and previous.get("output"):
+            entry = {**entry, "output": previous["output"]}
+    cache.set(key, entry, ttl=MAX_STALE)
+
+
+def refresh_command(cache_dir: Path, run: str, cwd: str, timeout: float) -> bool:
+    """Run a command and store its output for the next render.
+
+    Runs in the detached ``statuskit run-command`` process started by
+    CommandModule when a cached output is stale.
+
+    Args:
+        cache_dir: Statuskit cache directory
+        run: Shell command line
+        cwd: Working directory
+        timeout: Seconds before the command is killed
+
+    Returns:
+        True if the command succeeded
+    """
+    cache = CacheStore.for_dir(cache_dir).namespace(CACHE_NAMESPACE)
+    key = command_key(run, cwd)
+    entry = run_command(run, cwd, timeout)
+    store_output(cache, key, entry)
+    cache.delete(f"{key}:refresh")
+    return entry["error"] is None
+
+
+class CommandModule(BaseModule):
+    """Display the output of user-defined shell commands."""
+
+    name = "command"
+    description = "Output of custom shell commands"
+
+    def __init__(self, ctx, config: dict):
+        super().__init__(ctx, config)
+        timeout = config.get("timeout", DEFAULT_COMMAND_TIMEOUT)
+        ttl = config.get("ttl", DEFAULT_TTL)
+        self.workers = max(1, config.get("workers", _DEFAULT_WORKERS))
+        self.separator = config.get("separator", " | ")
+        self.commands: list[CommandSpec] = []
+        self._invalid = 0
+        for entry in config.get("commands") or []:
+            spec = CommandSpec.from_config(entry, timeout, ttl)
+            if spec is None:
+                self._invalid += 1
+            else:
+                self.commands.append(spec)
+        self.cache: CacheNamespace | None = self.store.namespace(CACHE_NAMESPACE) if self.store else None
+
+    def render(self) -> str | None:
+        self._debug_messages: list[str] = []
+        if self._invalid:
+            self._debug_messages.append(f"Skipped {self._invalid} command(s) without `run`")
+
+        parts = []
+        for spec, entry in zip(self.commands, self._get_outputs(), strict=True):
+            if entry.get("error"):
+                self._debug_messages.append(f"{spec.name}: {entry['error']}")
+            if entry.get("output"):
+                text = spec.prefix + entry["output"]
+                parts.append(colored(text, spec.color) if spec.color else text)
+
+        line = self.separator.join(parts)
+        # Debug output (appended to statusline)
+        if self.debug and self._debug_messages:
+            debug = " | ".join(colored(f"[{self.name}] {msg}", "yellow") for msg in self._debug_messages)
+            line = f"{line} | {debug}" if line else debug
+        return line or None
+
+    def warm(self) -> None:
+        """Run commands whose outputs are missing or stale, concurrently."""
+        if not self.cache:
+            return
+        cwd = self._cwd()
+        now = time.time()
+        stale = []
+        for spec in self.commands:
+            entry = self.cache.get(command_key(spec.run, cwd))
+            if not isinstance(entry, dict) or now - entry.get("at", 0) >= spec.ttl:
+                stale.append(spec)
+        self._run_all(stale, cwd)
+
+    def _cwd(self) -> str:
+        if self.data.workspace and self.data.workspace.project_dir:
+            return self.data.workspace.project_dir
+        return self.data.cwd or str(Path.cwd())
+
+    def _get_outputs(self) -> list[dict[str, Any]]:
+        """Get each command's output using stale-while-revalidate.
+
+        Logic:
+        1. A cached output younger than the command's TTL is used as is
+        2. An older one is used too, while a detached
+           ``statuskit run-command`` refreshes it for the next render
+        3. Commands without a cached output run now, concurrently, each
+           limited by its timeout and ``INLINE_TIMEOUT``; failures are
+           cached like outputs, so a broken command runs at most once per
+           TTL. A command cut short by ``INLINE_TIMEOUT`` is refreshed in
+           the background with its full timeout.
+        """
+        cwd = self._cwd()
+        if not self.cache:
+            return list(self._run_all(self.commands, cwd).values())
+
+        now = time.time()
+        entries: dict[str, dict[str, Any]] = {}
+        missing = []
+        for spec in self.commands:
+            entry = self.cache.get(command_key(spec.run, cwd))
+            if not isinstance(entry, dict):
+                missing.append(spec)
+                continue
+            entries[spec.run] = entry
+            if now - entry.get("at", 0) >= spec.ttl:
+                self._revalidate(spec, cwd)
+        results = self._run_all(missing, cwd, timeout_cap=INLINE_TIMEOUT)
+        for spec in missing:
+            if results[spec.run]["error"] == "timeout" and spec.timeout > INLINE_TIMEOUT:
+                self._revalidate(spec, cwd)
+        entries.update(results)
+        return [entries[spec.run] for spec in self.commands]
+
+    def _run_all(
+        self, specs: list[CommandSpec], cwd: str, timeout_cap: float | None = None
+    ) -> dict[str, dict[str, Any]]:
+        """Run commands concurrently and cache their outputs.
+
+        Args:
+            specs: Commands to run
+            cwd: Working directory
+            timeout_cap: Longest any command may run, below its own timeout
+
+        Returns:
+            Dict mapping command line to cache entry
+        """
+        if not specs:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(specs))) as pool:
+            futures = {
+                spec.run: pool.submit(run_command, spec.run, cwd, min(spec.timeout, timeout_cap or spec.timeout))
+                for spec in specs
+            }
+        results = {run: future.result() for run, future in futures.items()}
+        if self.cache:
+            for run, entry in results.items():
+                store_output(self.cache, command_key(run, cwd), entry)
+        return results
+
+    def _revalidate(self, spec: CommandSpec, cwd: str) -> None:
+        """Start a background refresh of a stale output unless one is running."""
+        if not self.cache or not self.cache_dir:
+            return
+        marker = f"{command_key(spec.run, cwd)}:refresh"
+        if self.cache.get(marker):
+            self._debug_messages.append(f"{spec.name}: refresh in progress")
+            return
+        self.cache.set(marker, True, ttl=spec.timeout + REFRESH_GRACE)
+        args = ["run-command", "--cache-dir", str(self.cache_dir), "--cwd", cwd, "--timeout", str(spec.timeout)]
+        if spawn_statuskit(*args, "--", spec.run):
+            self._debug_messages.append(f"{spec.name}: refreshing in background")
+        else:
+            self.cache.delete(marker)
@@ -0,0 +1,183 @@
+"""Cost module for statuskit."""
+
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any
+
+from statuskit.core.cache import read_json, write_json
+from statuskit.core.lock import CacheLock
+from statuskit.modules.base import BaseModule
+
+LEDGER_FILENAME = "cost_ledger.json"
+LEDGER_LOCK = "cost_ledger.lock"
+LEDGER_LOCK_MAX_AGE = 5.0  # seconds; an update is one small read and write
+RETENTION_DAYS = 35  # daily totals kept; enough for a rolling week or month
+SESSION_RETENTION = 30 * 86400  # seconds a finished session's last cost is kept
+SEEN_REFRESH = 86400  # seconds; how often an idle session's ``seen`` is renewed
+WEEK_DAYS = 7
+
+
+class CostLedger:
+    """Spend across sessions, kept as running totals in one small file.
+
+    Each session's last reported ``total_cost_usd`` is remembered, so an
+    update adds only the increase since the previous one to the totals of
+    the current day, overall and per project. Reading a total never scans
+    history. Days older than ``RETENTION_DAYS`` and sessions not seen for
+    ``SESSION_RETENTION`` are dropped on update; a session still running
+    renews its ``seen`` time at least every ``SEEN_REFRESH``, so it is not
+    dropped while idle and then counted again from zero.
+
+    File layout::
+
+        {"sessions": {id: {"cost": 1.2, "seen": 1760000000.0}},
+         "days": {"2026-10-19": 4.2},
+         "projects": {"/path": {"2026-10-19": 1.2}}}
+    """
+
+    def __init__(self, cache_dir: Path):
+        """Initialize ledger.
+
+        Args:
+            cache_dir: Statuskit cache directory
+        """
+        self.path = cache_dir / LEDGER_FILENAME
+        self.lock = CacheLock(cache_dir / LEDGER_LOCK, max_age=LEDGER_LOCK_MAX_AGE)
+
+    def load(self) -> dict[str, Any]:
+        """Load the ledger; a missing or corrupted one is empty."""
+        ledger = read_json(self.path)
+        if not isinstance(ledger, dict):
+            return {"sessions": {}, "days": {}, "projects": {}}
+        for key in ("sessions", "days", "projects"):
+            if not isinstance(ledger.get(key), dict):
+                ledger[key] = {}
+        return ledger
+
+    def record(self, session_id: str, total_cost: float, project: str | None, today: date | None = None) -> dict:
+        """Add a session's cost increase to the totals.
+
+        Concurrent sessions update the ledger under ``lock``, which is only
+        taken when the loaded ledger needs a change. When another session
+        holds it, nothing is written: the increase stays pending and is
+        added by this session's next update.
+
+        Args:
+            session_id: Claude Code session id
+            total_cost: Session cost so far in USD
+            project: Project directory the cost is attributed to
+            today: Local date of the update (default: today)
+
+        Returns:
+            The ledger, including this update if it was written
+        """
+        today = today or date.today()
+        ledger = self.load()
+        if not _needs_update(ledger, session_id, total_cost):
+            return ledger
+        with self.lock as acquired:
+            if not acquired:
+                return ledger
+            ledger = self.load()
+            if not _needs_update(ledger, session_id, total_cost):
+                return ledger
+            session = ledger["sessions"].get(session_id) or {}
+            previous = session.get("cost", 0.0)
+            # A lower total means the session's cost was reset; count it anew
+            delta = total_cost - previous if total_cost >= previous else total_cost
+
+            ledger["sessions"][session_id] = {"cost": total_cost, "seen": time.time()}
+            if delta > 0:
+                day = today.isoformat()
+                ledger["days"][day] = ledger["days"].get(day, 0.0) + delta
+                if project:
+                    days = ledger["projects"].setdefault(project, {})
+                    days[day] = days.get(day, 0.0) + delta
+            self._compact(ledger, today)
+            write_json(self.path, ledger)
+            return ledger
+
+    def _compact(self, ledger: dict, today: date) -> None:
+        """Drop days past retention, idle sessions and empty projects."""
+        oldest = (today - timedelta(days=RETENTION_DAYS - 1)).isoformat()
+        ledger["days"] = {day: cost for day, cost in ledger["days"].items() if day >= oldest}
+        projects = {}
+        for project, days in ledger["projects"].items():
+            kept = {day: cost for day, cost in days.items() if day >= oldest}
+            if kept:
+                projects[project] = kept
+        ledger["projects"] = projects
+        cutoff = time.time() - SESSION_RETENTION
+        ledger["sessions"] = {sid: entry for sid, entry in ledger["sessions"].items() if entry.get("seen", 0) >= cutoff}
+
+
+def _needs_update(ledger: dict, session_id: str, total_cost: float) -> bool:
+    """Check whether recording a session's total would change the ledger."""
+    session = ledger["sessions"].get(session_id)
+    if not isinstance(session, dict):
+        return True
+    return session.get("cost") != total_cost or time.time() - session.get("seen", 0) >= SEEN_REFRESH
+
+
+def period_total(days: dict[str, float], today: date, length: int) -> float:
+    """Sum daily totals over the ``length`` days ending today.
+
+    Args:
+        days: Daily totals keyed by ISO date
+        today: Last day of the period
+        length: Number of days
+
+    Returns:
+        Total in USD
+    """
+    return sum(days.get((today - timedelta(days=offset)).isoformat(), 0.0) for offset in range(length))
+
+
+class CostModule(BaseModule):
+    """Display spend across all sessions: today, this week, this project."""
+
+    name = "cost"
+    description = "Spend today and this week across sessions, and per project"
+
+    def __init__(self, ctx, config: dict):
+        super().__init__(ctx, config)
+        self.show_today = config.get("show_today", True)
+        self.show_week = config.get("show_week", True)
+        self.show_project = config.get("show_project", False)
+
+    def render(self) -> str | None:
+        if not self.cache_dir:
+            return None
+
+        today = date.today()
+        ledger = self._update_ledger(self.cache_dir, today)
+        parts = []
+
+        # Today: $4.20
+        if self.show_today:
+            parts.append(f"Today: ${period_total(ledger['days'], today, 1):.2f}")
+
+        # Week: $18.40
+        if self.show_week:
+            parts.append(f"Week: ${period_total(ledger['days'], today, WEEK_DAYS):.2f}")
+
+        # Project: $1.10 today
+        project = self._project()
+        if self.show_project and project:
+            days = ledger["projects"].get(project, {})
+            parts.append(f"Project: ${period_total(days, today, 1):.2f} today")
+
+        return " | ".join(parts) if parts else None
+
+    def _project(self) -> str | None:
+        if self.data.workspace and self.data.workspace.project_dir:
+            return self.data.workspace.project_dir
+        return self.data.cwd
+
+    def _update_ledger(self, cache_dir: Path, today: date) -> dict:
+        ledger = CostLedger(cache_dir)
+        cost = self.data.cost.total_cost_usd if self.data.cost else None
+        if not self.data.session_id or cost is None:
+            return ledger.load()
+        return ledger.record(self.data.session_id, cost, self._project(), today)
@@ -1,44 +1,78 @@
 """Git module for statuskit."""
 
 import subprocess
-from collections.abc import Mapping
+import threading
+import time
+from collections.abc import Generator, Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any
 
 from termcolor import colored
 
+from statuskit.core.background import spawn_statuskit
+from statuskit.core.watcher import DEFAULT_MAX_WATCHES, needs_watcher, read_state
 from statuskit.modules.base import BaseModule
 
 _GIT_TIMEOUT = 2  # seconds
+_CACHE_NAMESPACE = "git"
+_CACHE_TTL = 7 * 86400  # seconds a cache entry lives after its last write
+_UNTRACKED_MODES = ("no", "normal", "all")
 _EXPECTED_COUNT_PARTS = 2  # ahead\tbehind format
 _MIN_STATUS_LINE_LEN = 2  # "XY filename" format minimum
+_STREAM_CHUNK = 64 * 1024  # bytes read from git per call
+_DEFAULT_MAX_CHANGES = 9999
+_DEFAULT_AHEAD_BEHIND_LIMIT = 999
+_NON_REPO_TTL = 30  # seconds a directory stays known to be outside any repository
+_DEFAULT_WORKTREES_WORKERS = 4
+_DEFAULT_WORKTREES_TTL = 30  # seconds, for worktrees without a watcher
+_MIN_WORKTREES = 2  # the overview is only shown with linked worktrees
+_SUBMODULE_POLICIES = ("ignore", "dirty", "full")
+# --ignore-submodules value for the superproject's own status call
+_SUBMODULE_IGNORE = {"ignore": "all", "dirty": "untracked", "full": "dirty"}
+_DEFAULT_SUBMODULES_WORKERS = 4
+_DEFAULT_SUBMODULES_TTL = 30  # seconds, without a watcher on the superproject
+_DEFAULT_BRANCH_REF = "refs/remotes/origin/HEAD"
+_GITDIR_PREFIX = "gitdir:"  # .git file contents in linked worktrees and submodules
+
+# In-progress operations marked by a file in the git dir, in git's precedence order
+_OPERATION_MARKERS = (
+    ("MERGE_HEAD", "MERGING"),
+    ("CHERRY_PICK_HEAD", "CHERRY-PICKING"),
+    ("REVERT_HEAD", "REVERTING"),
+    ("BISECT_LOG", "BISECTING"),
+)
 
 # Time conversion constants
 _MINUTES_PER_HOUR = 60
 _MINUTES_PER_DAY = 1440  # 24 * 60
-_MINUTES_PER_WEEK = 10080  # 7 * 1440
-_MINUTES_PER_MONTH = 43200  # 30 * 1440
-_MINUTES_PER_YEAR = 525600  # 365 * 1440
 
 # Age format constant
 _JUST_NOW = "just now"
 
-# Git age unit to minutes mapping
-_UNIT_TO_MINUTES: dict[str, int] = {
-    "second": 0,
-    "seconds": 0,
-    "minute": 1,
-    "minutes": 1,
-    "hour": _MINUTES_PER_HOUR,
-    "hours": _MINUTES_PER_HOUR,
-    "day": _MINUTES_PER_DAY,
-    "days": _MINUTES_PER_DAY,
-    "week": _MINUTES_PER_WEEK,
-    "weeks": _MINUTES_PER_WEEK,
-    "month": _MINUTES_PER_MONTH,
-    "months": _MINUTES_PER_MONTH,
-    "year": _MINUTES_PER_YEAR,
-    "years": _MINUTES_PER_YEAR,
-}
+# Thresholds of git's relative dates (%ar), for commit_age_format = "raw".
+# Below the limit an age is shown in that unit; otherwise it is rounded
+# to the next unit.
+_RELATIVE_STEPS = (
+    # (unit, limit in units, units per next unit)
+    ("second", 90, 60),
+    ("minute", 90, 60),
+    ("hour", 36, 24),
+)
+_RELATIVE_DAY_UNITS = (
+    # (unit, limit in days, days per unit)
+    ("day", 14, 1),
+    ("week", 70, 7),
+    ("month", 365, 30),
+)
+_YEARS_AND_MONTHS_LIMIT = 1825  # days; older ages are shown in whole years
+_MONTHS_PER_YEAR = 12
+_DAYS_PER_YEAR = 365
+_HALF_YEAR_DAYS = 183  # git rounds whole years up from here
+
+
+class _GitCommandError(Exception):
+    """Raised when a streamed git command fails or times out."""
 
 
 class GitModule(BaseModule):
@@ -57,6 +91,27 @@ class GitModule(BaseModule):
         self.show_remote_status = config.get("show_remote_status", True)
         self.show_changes = config.get("show_changes", True)
         self.show_commit = config.get("show_commit", True)
+        self.show_operation = config.get("show_operation", False)
+        self.show_stash = config.get("show_stash", False)
+        self.show_worktrees = config.get("show_worktrees", False)
+        self.worktrees_workers = max(1, config.get("worktrees_workers", _DEFAULT_WORKTREES_WORKERS))
+        self.worktrees_ttl = max(1, config.get("worktrees_ttl", _DEFAULT_WORKTREES_TTL))
+        self.submodules = config.get("submodules")
+        if self.submodules not in _SUBMODULE_POLICIES:
+            self.submodules = None  # use git's diff.ignoreSubmodules
+        self.submodules_workers = max(1, config.get("submodules_workers", _DEFAULT_SUBMODULES_WORKERS))
+        self.submodules_ttl = max(1, config.get("submodules_ttl", _DEFAULT_SUBMODULES_TTL))
+        self.untracked_files = config.get("untracked_files")
+        if self.untracked_files not in _UNTRACKED_MODES:
+            self.untracked_files = None  # use git's status.showUntrackedFiles
+        self.untracked_cache = config.get("untracked_cache", False)
+        self.fsmonitor = config.get("fsmonitor", False)
+        self.untracked_interval = config.get("untracked_interval", 0)
+        self.max_changes = config.get("max_changes", _DEFAULT_MAX_CHANGES)
+        self.ahead_behind_limit = config.get("ahead_behind_limit", _DEFAULT_AHEAD_BEHIND_LIMIT)
+        self.show_default_branch = config.get("show_default_branch", False)
+        self.watch = config.get("watch", False)
+        self.watch_max_watches = config.get("watch_max_watches", DEFAULT_MAX_WATCHES)
 
     def render(self) -> str | None:
         """Render git status output.
@@ -64,36 +119,175 @@ class GitModule(BaseModule):
         Returns:
             Two-line output (location + status) or None if not a git repo
         """
-        # Check if we're in a git repo
-        branch = self._get_branch()
-        if branch is None:
+        status = self._get_status()
+        if status is None:
             return None
 
         lines = []
 
         # Line 1: Location
-        location = self._get_location()
+        location = status.get("location")
         if location:
             line1 = self._render_location_line(location)
             if line1:
                 lines.append(line1)
 
         # Line 2: Git status
-        remote_status = self._get_remote_status()
-        changes = self._get_changes()
-        commit = self._get_last_commit()
-        if commit:
-            commit = (commit[0], self._format_commit_age(commit[1]))
-
-        line2 = self._render_status_line(branch, remote_status, changes, commit)
+        # Age is computed at render time, so it stays live in cached snapshots
+        last_commit = status.get("commit")
+        commit = (last_commit[0], self._format_commit_age(last_commit[1])) if last_commit else None
+
+        line2 = self._render_status_line(
+            status["branch"],
+            status.get("remote_status", ("no_upstream", 0)),
+            status.get("changes", {"staged": 0, "modified": 0, "untracked": 0}),
+            commit,
+            default_status=status.get("default_status"),
+            operation=status.get("operation"),
+            stash=status.get("stash", 0),
+        )
         if line2:
             lines.append(line2)
 
+        # Line 3: Other worktrees
+        worktrees = status.get("worktrees")
+        if self.show_worktrees and worktrees:
+            line3 = self._render_worktrees_line(worktrees)
+            if line3:
+                lines.append(line3)
+
         if not lines:
             return None
 
         return "\n".join(lines)
 
+    def _needed_sections(self) -> list[str]:
+        """Get status sections required by the enabled display options."""
+        sections = ["branch"]
+        if self.show_project or self.show_worktree or self.show_folder:
+            sections.append("location")
+        if self.show_remote_status:
+            sections.append("remote_status")
+        if self.show_default_branch:
+            sections.append("default_status")
+        if self.show_changes:
+            sections.append("changes")
+        if self.show_commit:
+            sections.append("commit")
+        if self.show_operation:
+            sections.append("operation")
+        if self.show_stash:
+            sections.append("stash")
+        if self.show_worktrees:
+            sections.append("worktrees")
+        return sections
+
+    def _collect_status(self) -> dict[str, Any] | None:
+        """Run git for every enabled status section.
+
+        Returns:
+            Dict of section name to value, or None if not a git repo
+        """
+        # A cached negative lookup skips running git outside repositories
+        if self.cache_dir and self._resolve_location() is None:
+            return None
+
+        # Check if we're in a git repo
+        branch = self._get_branch()
+        if branch is None:
+            return None
+
+        status: dict[str, Any] = {"branch": branch}
+        sections = self._needed_sections()
+        if "location" in sections:
+            status["location"] = self._get_location()
+        if "remote_status" in sections:
+            status["remote_status"] = self._get_remote_status()
+        if "default_status" in sections:
+            status["default_status"] = self._get_default_branch_status()
+        if "changes" in sections:
+            status["changes"] = self._get_changes()
+        if "commit" in sections:
+            status["commit"] = self._get_last_commit()
+        if "operation" in sections:
+            status["operation"] = self._get_operation()
+        if "stash" in sections:
+            status["stash"] = self._get_stash_count()
+        if "worktrees" in sections:
+            status["worktrees"] = self._get_worktrees()
+        return status
+
+    def warm(self) -> None:
+        """Collect status ahead of the next render.
+
+        With ``watch`` enabled this stores the status snapshot. Without it
+        there is nowhere to keep a full status, so only the caches of other
+        worktrees and of submodules are refreshed.
+        """
+        if self.watch and self.cache_dir:
+            self._get_status()
+            return
+        if self.show_worktrees:
+            self._get_worktrees()
+        if self.submodules == "full":
+            self._get_submodule_changes()
+
+    def _get_status(self) -> dict[str, Any] | None:
+        """Get status sections, reusing a watched snapshot when still valid.
+
+        With ``watch`` enabled, a background watcher bumps a generation
+        counter whenever the worktree or its git directory changes. A
+        snapshot taken at the current generation is returned without
+        running git at all.
+
+        Returns:
+            Dict of section name to value, or None if not a git repo
+        """
+        if not self.watch or not self.cache_dir:
+            return self._collect_status()
+
+        snapshot_key = str(Path.cwd())
+        snapshot = self._cache_get("status", snapshot_key)
+        worktree = snapshot.get("worktree") if isinstance(snapshot, dict) else None
+        state = read_state(self.cache_dir, Path(worktree)) if worktree else None
+        generation = state.generation if state and state.trusted else None
+
+        if generation is not None and snapshot and snapshot.get("generation") == generation:
+            status = snapshot.get("status") or {}
+            if all(section in status for section in self._needed_sections() if section != "worktrees"):
+                for section in ("remote_status", "default_status", "commit"):
+                    if status.get(section):
+                        status[section] = tuple(status[section])
+                # Other worktrees are not covered by this worktree's watcher
+                if self.show_worktrees:
+                    status["worktrees"] = self._get_worktrees()
+                return status
+
+        # Snapshot is stale: read the generation before running git, so
+        # changes made while collecting invalidate the new snapshot
+        toplevel = self._get_toplevel()
+        if toplevel is None:
+            return self._collect_status()
+        if toplevel != worktree:
+            state = read_state(self.cache_dir, Path(toplevel))
+            generation = state.generation if state and state.trusted else None
+
+        status = self._collect_status()
+        if status is None:
+            return None
+
+        if needs_watcher(self.cache_dir, Path(toplevel)):
+            spawn_statuskit(
+                "watch",
+                toplevel,
+                "--cache-dir",
+                str(self.cache_dir),
+                "--max-watches",
+                str(self.watch_max_watches),
+            )
+        self._cache_set("status", snapshot_key, {"worktree": toplevel, "generation": generation, "status": status})
+        return status
+
     def _run_git(self, *args: str) -> str | None:
         """Run git command and return output.
 
@@ -118,6 +312,156 @@ class GitModule(BaseModule):
         except subprocess.TimeoutExpired:
             return None
 
+    def _stream_git(self, *args: str) -> Generator[str]:
+        """Run git command and yield NUL-terminated output records as they arrive.
+
+        Output is never buffered as a whole. Closing the iterator early
+        terminates git.
+
+        Args:
+            *args: Git command arguments (without 'git' prefix)
+
+        Yields:
+            Output records without the NUL terminator
+
+        Raises:
+            _GitCommandError: If git fails or exceeds the timeout
+        """
+        cmd = ["git", "--no-optional-locks", *args]
+        try:
+            # Unbuffered, so each read returns as soon as git has written anything
+            proc = subprocess.Popen(cmd, bufsize=0, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)  # noqa: S603
+        except OSError as e:
+            msg = f"failed to run git: {e}"
+            raise _GitCommandError(msg) from e
+
+        timed_out = threading.Event()
+
+        def kill_on_timeout() -> None:
+            timed_out.set()
+            proc.kill()
+
+        timer = threading.Timer(_GIT_TIMEOUT, kill_on_timeout)
+        timer.start()
+        try:
+            stdout = proc.stdout
+            if stdout is None:
+                msg = "git stdout is not available"
+                raise _GitCommandError(msg)
+            pending = b""
+            while chunk := stdout.read(_STREAM_CHUNK):
+                *records, pending = (pending + chunk).split(b"\0")
+                for record in records:
+                    yield record.decode(errors="surrogateescape")
+            if proc.wait() != 0 or timed_out.is_set():
+                msg = f"git {args[0] if args else ''} failed"
+                raise _GitCommandError(msg)
+        finally:
+            timer.cancel()
+            if proc.poll() is None:
+                proc.kill()
+            proc.wait()
+            if proc.stdout is not None:
+                proc.stdout.close()
+
+    def _get_toplevel(self) -> str | None:
+        """Get the current worktree root (memoized for this render)."""
+        if not hasattr(self, "_toplevel"):
+            location = self._resolve_location()
+            self._toplevel = location["toplevel"] if location else None
+        return self._toplevel
+
+    def _resolve_location(self) -> dict[str, str | None] | None:
+        """Get the repository location of the working directory (memoized).
+
+        Locations are cached in the store per working directory and
+        validated by the mtime of the worktree's ``.git`` entry, so a cache
+        hit costs a single stat. Directories outside any repository are
+        cached too, validated by their own mtime and a short TTL (a parent
+        directory may become a repository without touching this one).
+
+        Returns:
+            Dict with keys: toplevel, project, worktree, or None if not in a git repo
+        """
+        if hasattr(self, "_location"):
+            return self._location
+
+        cwd = Path.cwd()
+        entry = self._cache_get("locations", str(cwd))
+        if isinstance(entry, dict) and self._location_entry_valid(cwd, entry):
+            self._location = entry.get("location")
+            return self._location
+
+        self._location = self._lookup_location()
+        if self.cache_dir:
+            if self._location is None:
+                mtime = self._mtime_ns(cwd)
+                entry = {"location": None, "mtime": mtime, "checked_at": time.time()}
+            else:
+                mtime = self._mtime_ns(Path(str(self._location["toplevel"])) / ".git")
+                entry = {"location": self._location, "mtime": mtime}
+            if mtime is not None:
+                self._cache_set("locations", str(cwd), entry)
+        return self._location
+
+    def _location_entry_valid(self, cwd: Path, entry: Mapping[str, Any]) -> bool:
+        """Check a cached location against the filesystem."""
+        location = entry.get("location")
+        if location is None:
+            if time.time() - entry.get("checked_at", 0) >= _NON_REPO_TTL:
+                return False
+            return entry.get("mtime") == self._mtime_ns(cwd)
+        return entry.get("mtime") == self._mtime_ns(Path(str(location["toplevel"])) / ".git")
+
+    def _mtime_ns(self, path: Path) -> int | None:
+        """Get a path's mtime in nanoseconds, or None if it does not exist."""
+        try:
+            return path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def _lookup_location(self) -> dict[str, str | None] | None:
+        """Ask git for the worktree root and derive project and worktree names.
+
+        Returns:
+            Dict with keys: toplevel, project, worktree, or None if not in a git repo
+        """
+        # Get current worktree root
+        toplevel = self._run_git("rev-parse", "--show-toplevel")
+        if toplevel is None:
+            return None
+
+        # Extract project name from main repo path, resolved like the git
+        # dirs used for operation and stash state
+        toplevel_path = Path(toplevel)
+        git_dirs = _resolve_git_dirs(toplevel_path)
+        git_path = git_dirs[1] if git_dirs else toplevel_path / ".git"
+        if git_path.name == ".git":
+            project_name = git_path.parent.name
+        else:
+            project_name = git_path.name
+
+        # Detect worktree: .git is a file (not directory) in worktrees
+        is_worktree = (toplevel_path / ".git").is_file()
+        worktree_name = toplevel_path.name if is_worktree else None
+
+        return {"toplevel": toplevel, "project": project_name, "worktree": worktree_name}
+
+    def _get_git_dirs(self) -> tuple[Path, Path] | None:
+        """Get the worktree's git dir and the repository common dir (memoized).
+
+        Resolved from the filesystem without running git: in linked
+        worktrees and submodules ``.git`` is a file pointing at the git dir,
+        whose ``commondir`` file in turn points at the shared repository.
+
+        Returns:
+            Tuple of (git_dir, common_dir), or None if not a git repo
+        """
+        if not hasattr(self, "_git_dirs"):
+            toplevel = self._get_toplevel()
+            self._git_dirs = _resolve_git_dirs(Path(toplevel)) if toplevel else None
+        return self._git_dirs
+
     def _get_branch(self) -> str | None:
         """Get current branch name or short hash for detached HEAD.
 
@@ -132,7 +476,70 @@ class GitModule(BaseModule):
             return self._run_git("rev-parse", "--short", "HEAD")
         return branch
 
-    def _get_remote_status(self) -> tuple[str, int]:  # noqa: PLR0911
+    def _get_operation(self) -> dict[str, Any] | None:
+        """Detect an in-progress rebase, am, merge, cherry-pick, revert, or bisect.
+
+        Uses the same state files git itself checks, so no git command runs.
+
+        Returns:
+            Dict with name and, for rebases, step and total, or None
+        """
+        dirs = self._get_git_dirs()
+        if dirs is None:
+            return None
+        git_dir = dirs[0]
+
+        rebase_merge = git_dir / "rebase-merge"
+        if rebase_merge.is_dir():
+            return self._operation_with_progress("REBASE", rebase_merge / "msgnum", rebase_merge / "end")
+
+        rebase_apply = git_dir / "rebase-apply"
+        if rebase_apply.is_dir():
+            if (rebase_apply / "rebasing").exists():
+                name = "REBASE"
+            elif (rebase_apply / "applying").exists():
+                name = "AM"
+            else:
+                name = "AM/REBASE"
+            return self._operation_with_progress(name, rebase_apply / "next", rebase_apply / "last")
+
+        for marker, name in _OPERATION_MARKERS:
+            if (git_dir / marker).exists():
+                return {"name": name}
+        return None
+
+    def _operation_with_progress(self, name: str, step_file: Path, total_file: Path) -> dict[str, Any]:
+        """Build an operation entry with step/total progress when available."""
+        operation: dict[str, Any] = {"name": name}
+        try:
+            operation["step"] = int(step_file.read_text().strip())
+            operation["total"] = int(total_file.read_text().strip())
+        except (OSError, ValueError):
+            operation.pop("step", None)
+        return operation
+
+    def _get_stash_count(self) -> int:
+        """Get the number of stash entries from the stash reflog line count.
+
+        Returns:
+            Stash depth, 0 if there are no stashes
+        """
+        dirs = self._get_git_dirs()
+        if dirs is None:
+            return 0
+        try:
+            with (dirs[1] / "logs" / "refs" / "stash").open("rb") as f:
+                return f.read().count(b"\n")
+        except OSError:
+            return 0
+
+    def _get_head_oid(self) -> str | None:
+        """Get the full HEAD commit id (memoized for this render)."""
+        if not hasattr(self, "_head_oid"):
+            self._head_oid = self._run_git("rev-parse", "HEAD")
+        return self._head_oid
+
+    def _get_remote_status(self) -> tuple[str, int]:
         """Get remote tracking status.
 
         Returns:
@@ -144,22 +551,40 @@ class GitModule(BaseModule):
             - "no_upstream": no tracking branch configured
         """
         # Check if upstream exists
-        upstream = self._run_git("rev-parse", "--abbrev-ref", "@{upstream}")
+        upstream = self._run_git("rev-parse", "@{upstream}")
         if upstream is None:
             return ("no_upstream", 0)
 
-        # Get ahead/behind counts
-        counts = self._run_git("rev-list", "--left-right", "--count", "HEAD...@{upstream}")
+        head = self._get_head_oid()
+        counts = self._get_ahead_behind(head, upstream) if head else None
         if counts is None:
             return ("no_upstream", 0)
+        return self._divergence_status(*counts)
 
-        parts = counts.split("\t")
-        if len(parts) != _EXPECTED_COUNT_PARTS:
-            return ("no_upstream", 0)
+    def _get_default_branch_status(self) -> tuple[str, str, int] | None:
+        """Get ahead/behind status against the repository default branch.
+
+        The default branch is the one ``origin/HEAD`` points to.
+
+        Returns:
+            Tuple of (branch name, status, count) as in _get_remote_status,
+            or None if the default branch is unknown
+        """
+        output = self._run_git("for-each-ref", "--format=%(objectname) %(symref:lstrip=3)", _DEFAULT_BRANCH_REF)
+        if not output:
+            return None
+        default_oid, _, name = output.partition(" ")
+        head = self._get_head_oid()
+        if not name or head is None:
+            return None
 
-        ahead = int(parts[0])
-        behind = int(parts[1])
+        counts = self._get_ahead_behind(head, default_oid)
+        if counts is None:
+            return None
+        return (name, *self._divergence_status(*counts))
 
+    def _divergence_status(self, ahead: int, behind: int) -> tuple[str, int]:
+        """Classify ahead/behind counts as ahead, behind, diverged, or synced."""
         if ahead > 0 and behind > 0:
             return ("diverged", ahead + behind)
         if ahead > 0:
@@ -168,6 +593,261 @@ class GitModule(BaseModule):
             return ("behind", behind)
         return ("synced", 0)
 
+    def _get_ahead_behind(self, head: str, other: str) -> tuple[int, int] | None:
+        """Count commits HEAD is ahead of and behind another commit.
+
+        Counts only change when either commit does, so they are cached
+        per (HEAD, other) pair.
+
+        Args:
+            head: Full HEAD commit id
+            other: Full commit id to compare against
+
+        Returns:
+            Tuple of (ahead, behind), each capped at ahead_behind_limit + 1,
+            or None on failure
+        """
+        if head == other:
+            return (0, 0)
+
+        key = f"{head}:{other}:{self.ahead_behind_limit}"
+        cached = self._cache_get("ahead-behind", key)
+        if isinstance(cached, list) and len(cached) == _EXPECTED_COUNT_PARTS:
+            return (cached[0], cached[1])
+
+        ahead = self._count_commits(other, head)
+        behind = self._count_commits(head, other)
+        if ahead is None or behind is None:
+            return None
+
+        self._cache_set("ahead-behind", key, [ahead, behind])
+        return (ahead, behind)
+
+    def _get_worktrees(self) -> dict[str, Any] | None:
+        """Summarize all worktrees of the repository.
+
+        Worktrees are probed concurrently. Each result is cached per
+        worktree fingerprint: its HEAD, index mtime, and either its
+        watcher generation or, without a watcher, a ``worktrees_ttl``
+        time bucket.
+
+        Returns:
+            Dict with count, dirty (number of dirty worktrees), and
+            diverged (list of [name, status, count] for other worktrees
+            not in sync with their upstream), or None on failure
+        """
+        worktrees = self._list_worktrees()
+        if worktrees is None:
+            return None
+
+        results: dict[str, dict[str, Any]] = {}
+        pending: dict[str, tuple[dict[str, str], str | None]] = {}
+        for worktree in worktrees:
+            fingerprint = self._worktree_fingerprint(worktree)
+            cached = self._cache_get("worktrees", worktree["path"])
+            if fingerprint and isinstance(cached, dict) and cached.get("fingerprint") == fingerprint:
+                results[worktree["path"]] = cached
+            else:
+                pending[worktree["path"]] = (worktree, fingerprint)
+
+        if pending:
+            with ThreadPoolExecutor(max_workers=min(self.worktrees_workers, len(pending))) as pool:
+                futures = {path: pool.submit(self._probe_worktree, worktree) for path, (worktree, _) in pending.items()}
+            # Cache entries are written here, not from the worker threads
+            new_counts = {}
+            fresh = {}
+            for path, future in futures.items():
+                result = future.result()
+                new_counts.update(result.pop("new_counts", {}))
+                result["fingerprint"] = pending[path][1]
+                results[path] = result
+                if result["fingerprint"]:
+                    fresh[path] = result
+            self._cache_set_many("ahead-behind", new_counts)
+            self._cache_set_many("worktrees", fresh)
+
+        current = self._get_toplevel()
+        diverged = [
+            [result["name"], result["status"], result["count"]]
+            for path, result in results.items()
+            if path != current and result["status"] not in ("synced", "no_upstream")
+        ]
+        return {
+            "count": len(worktrees),
+            "dirty": sum(1 for result in results.values() if result["dirty"]),
+            "diverged": diverged,
+        }
+
+    def _list_worktrees(self) -> list[dict[str, str]] | None:
+        """List the repository's worktrees, rerunning git only when they may have changed.
+
+        The parsed ``git worktree list`` is cached per repository, keyed on
+        the mtimes of the ``worktrees/`` admin directory and every HEAD
+        file, plus the current worktree's freshness token, which covers
+        branch commits moving a worktree's HEAD.
+
+        Returns:
+            Entries from _parse_worktree_list, or None on failure
+        """
+        git_dirs = self._get_git_dirs()
+        toplevel = self._get_toplevel()
+        key = None
+        if git_dirs and toplevel and self.cache_dir:
+            key = self._worktree_list_key(git_dirs[1], Path(toplevel))
+            cached = self._cache_get("worktree-list", str(git_dirs[1]))
+            if isinstance(cached, dict) and cached.get("key") == key:
+                return cached["worktrees"]
+
+        output = self._run_git("worktree", "list", "--porcelain")
+        if output is None:
+            return None
+        worktrees = _parse_worktree_list(output)
+        if key and git_dirs:
+            self._cache_set("worktree-list", str(git_dirs[1]), {"key": key, "worktrees": worktrees})
+        return worktrees
+
+    def _worktree_list_key(self, common_dir: Path, toplevel: Path) -> str:
+        """Build the cache key of a repository's worktree list.
+
+        Adding, removing, or moving a worktree changes the ``worktrees/``
+        admin directory; checkouts and detached commits rewrite a HEAD file.
+        """
+        admin = common_dir / "worktrees"
+        try:
+            admin_dirs = sorted(admin.iterdir())
+        except OSError:
+            admin_dirs = []
+        mtimes = [self._mtime_ns(admin), self._mtime_ns(common_dir / "HEAD")]
+        mtimes.extend(self._mtime_ns(admin_dir / "HEAD") for admin_dir in admin_dirs)
+        return f"{':'.join(map(str, mtimes))}:{self._freshness_token(toplevel, self.worktrees_ttl)}"
+
+    def _worktree_fingerprint(self, worktree: Mapping[str, str]) -> str | None:
+        """Build a cache key that changes whenever the worktree's status may have.
+
+        Returns:
+            Fingerprint string, or None if the worktree's git dir is missing
+        """
+        path = Path(worktree["path"])
+        git_dir = _find_git_dir(path)
+        if git_dir is None:
+            return None
+        index_mtime = self._mtime_ns(git_dir / "index")
+        return f"{worktree.get('head')}:{index_mtime}:{self._freshness_token(path, self.worktrees_ttl)}"
+
+    def _freshness_token(self, watched: Path, ttl: int) -> str:
+        """Get a token that changes when files under a watched tree may have changed.
+
+        Args:
+            watched: Worktree whose watcher generation to use
+            ttl: Seconds per token without a trusted watcher
+
+        Returns:
+            The watcher generation, or the current ttl time bucket
+        """
+        state = read_state(self.cache_dir, watched) if self.cache_dir else None
+        if state and state.trusted:
+            return f"g{state.generation}"
+        return f"t{int(time.time() // ttl)}"
+
+    def _probe_worktree(self, worktree: Mapping[str, str]) -> dict[str, Any]:
+        """Collect dirty state and upstream divergence for one worktree.
+
+        Runs in a worker thread, so it only reads caches; new ahead/behind
+        counts are returned under ``new_counts`` for the caller to store.
+
+        Args:
+            worktree: Entry from _parse_worktree_list
+
+        Returns:
+            Dict with name, dirty, status, count, and new_counts
+        """
+        path = worktree["path"]
+        branch = worktree.get("branch")
+        name = branch.removeprefix("refs/heads/") if branch else Path(path).name
+        result: dict[str, Any] = {"name": name, "dirty": False, "status": "no_upstream", "count": 0, "new_counts": {}}
+
+        # Dirty needs only the first status record
+        records = self._stream_git("-C", path, *self._status_args(include_untracked=self.untracked_files != "no"))
+        try:
+            result["dirty"] = next(records, None) is not None
+        except _GitCommandError:
+            pass
+        finally:
+            records.close()
+
+        head = worktree.get("head")
+        upstream = self._run_git("rev-parse", "--verify", "-q", f"{name}@{{upstream}}") if branch else None
+        if not head or not upstream:
+            return result
+
+        key = f"{head}:{upstream}:{self.ahead_behind_limit}"
+        counts = self._cache_get("ahead-behind", key)
+        if not (isinstance(counts, list) and len(counts) == _EXPECTED_COUNT_PARTS):
+            ahead = self._count_commits(upstream, head)
+            behind = self._count_commits(head, upstream)
+            if ahead is None or behind is None:
+                return result
+            counts = [ahead, behind]
+            result["new_counts"] = {key: counts}
+        result["status"], result["count"] = self._divergence_status(counts[0], counts[1])
+        return result
+
+    def _cache_get(self, kind: str, key: str) -> Any:
+        """Get a cached value from the git namespace of the shared store.
+
+        Args:
+            kind: Cache kind (e.g. "locations", "commits")
+            key: Entry key within the kind
+
+        Returns:
+            Cached value, or None if missing or without a cache
+        """
+        if not self.store:
+            return None
+        return self.store.get(_CACHE_NAMESPACE, f"{kind}:{key}")
+
+    def _cache_set(self, kind: str, key: str, value: Any) -> None:
+        """Cache a value in the git namespace of the shared store.
+
+        Entries expire ``_CACHE_TTL`` after their last write, and the
+        store's size limits evict the least recently used first, so
+        caches of repositories no longer visited do not pile up.
+
+        Args:
+            kind: Cache kind (e.g. "locations", "commits")
+            key: Entry key within the kind
+            value: JSON-serializable value
+        """
+        if self.store:
+            self.store.set(_CACHE_NAMESPACE, f"{kind}:{key}", value, ttl=_CACHE_TTL)
+
+    def _cache_set_many(self, kind: str, entries: Mapping[str, Any]) -> None:
+        """Cache several values of one kind."""
+        for key, value in entries.items():
+            self._cache_set(kind, key, value)
+
+    def _count_commits(self, exclude: str, include: str) -> int | None:
+        """Count commits reachable from ``include`` but not ``exclude``.
+
+        Output stops one past ahead_behind_limit, which only bounds the
+        displayed count: rev-list still marks everything down to the merge
+        base first, so a long-diverged pair costs a full walk. That cost is
+        paid once per commit pair, since callers cache the counts.
+
+        Returns:
+            Commit count, or None on failure
+        """
+        args = ["rev-list", "--count"]
+        if self.ahead_behind_limit:
+            args.append(f"--max-count={self.ahead_behind_limit + 1}")
+        output = self._run_git(*args, f"{exclude}..{include}")
+        if output is None:
+            return None
+        try:
+            return int(output)
+        except ValueError:
+            return None
+
     def _get_changes(self) -> dict[str, int]:
         """Get working directory change counts.
 
@@ -176,16 +856,58 @@ class GitModule(BaseModule):
         """
         result = {"staged": 0, "modified": 0, "untracked": 0}
 
-        status = self._run_git("status", "--porcelain")
-        if status is None or status == "":
+        # Between untracked refreshes, skip the untracked walk and reuse the last count
+        cached_untracked = self._load_untracked_count()
+        include_untracked = cached_untracked is None and self.untracked_files != "no"
+
+        records = self._stream_git(*self._status_args(include_untracked=include_untracked))
+        try:
+            truncated = self._count_changes(records, result)
+        except _GitCommandError:
+            return {"staged": 0, "modified": 0, "untracked": 0}
+        finally:
+            # Stops git if counting ended early
+            records.close()
+        if cached_untracked is not None:
+            result["untracked"] = cached_untracked
+
+        if truncated:
+            result["truncated"] = True
             return result
+        self._save_untracked_count(result, include_untracked)
+
+        if self.submodules == "full":
+            for changes in self._get_submodule_changes():
+                for key in ("staged", "modified", "untracked"):
+                    result[key] += changes[key]
+                if changes.get("truncated"):
+                    result["truncated"] = True
+        return result
 
-        for line in status.split("\n"):
-            if not line or len(line) < _MIN_STATUS_LINE_LEN:
+    def _count_changes(self, records: Iterable[str], result: dict[str, int]) -> bool:
+        """Count ``git status --porcelain -z`` records into ``result``.
+
+        Stops reading as soon as any count exceeds ``max_changes``.
+
+        Args:
+            records: NUL-separated porcelain records
+            result: Dict with staged, modified, untracked counts to update
+
+        Returns:
+            True if counting stopped early and the counts are lower bounds
+        """
+        skip_next = False
+        for record in records:
+            # Renames and copies are followed by a record with the original path
+            if skip_next:
+                skip_next = False
+                continue
+            if len(record) < _MIN_STATUS_LINE_LEN:
                 continue
 
-            index_status = line[0]
-            worktree_status = line[1]
+            index_status = record[0]
+            worktree_status = record[1]
+            skip_next = index_status in "RC" or worktree_status in "RC"
 
             # Untracked files
             if index_status == "?" and worktree_status == "?":
@@ -200,47 +922,180 @@ class GitModule(BaseModule):
             elif worktree_status in "MD":
                 result["modified"] += 1
 
-        return result
+            if self.max_changes and max(result.values()) > self.max_changes:
+                return True
+        return False
 
-    def _get_last_commit(self) -> tuple[str, str] | None:
-        """Get last commit hash and relative age.
+    def _status_args(self, include_untracked: bool) -> list[str]:
+        """Build ``git status`` arguments for the configured untracked handling.
+
+        Args:
+            include_untracked: Whether untracked files should be listed
 
         Returns:
-            Tuple of (short_hash, relative_age) or None if no commits
+            Git arguments, including per-call ``-c`` options
         """
-        output = self._run_git("log", "-1", "--format=%h %ar")
-        if output is None:
+        args = []
+        if self.untracked_cache:
+            args += ["-c", "core.untrackedCache=true"]
+        if self.fsmonitor:
+            args += ["-c", "core.fsmonitor=true"]
+        args += ["status", "--porcelain", "-z"]
+        if self.submodules:
+            args.append(f"--ignore-submodules={_SUBMODULE_IGNORE[self.submodules]}")
+        if not include_untracked:
+            args.append("--untracked-files=no")
+        elif self.untracked_files:
+            args.append(f"--untracked-files={self.untracked_files}")
+        return args
+
+    def _get_submodule_changes(self) -> list[dict[str, Any]]:
+        """Get change counts inside each initialized submodule.
+
+        Submodules are queried concurrently. Each result is cached by the
+        submodule's HEAD and index fingerprint, plus the superproject's
+        watcher generation (which also sees submodule edits) or a
+        ``submodules_ttl`` time bucket.
+
+        Returns:
+            Change count dicts, one per submodule
+        """
+        toplevel = self._get_toplevel()
+        if toplevel is None:
+            return []
+        paths = self._list_submodules(Path(toplevel))
+
+        results: list[dict[str, Any]] = []
+        pending: dict[str, str] = {}
+        for path in paths:
+            fingerprint = self._submodule_fingerprint(path, Path(toplevel))
+            if fingerprint is None:
+                continue  # not initialized
+            cached = self._cache_get("submodules", str(path))
+            if isinstance(cached, dict) and cached.get("fingerprint") == fingerprint:
+                results.append(cached)
+            else:
+                pending[str(path)] = fingerprint
+
+        if pending:
+            with ThreadPoolExecutor(max_workers=min(self.submodules_workers, len(pending))) as pool:
+                futures = {path: pool.submit(self._probe_submodule, path) for path in pending}
+            fresh = {}
+            for path, future in futures.items():
+                changes = future.result()
+                if changes is not None:
+                    results.append(changes)
+                    fresh[path] = {**changes, "fingerprint": pending[path]}
+            # Cache entries are written here, not from the worker threads
+            self._cache_set_many("submodules", fresh)
+        return results
+
+    def _list_submodules(self, toplevel: Path) -> list[Path]:
+        """List submodule paths declared in ``.gitmodules``."""
+        if not (toplevel / ".gitmodules").is_file():
+            return []
+        output = self._run_git(
+            "-C", str(toplevel), "config", "-f", ".gitmodules", "--get-regexp", r"^submodule\..*\.path$"
+        )
+        if not output:
+            return []
+        return [toplevel / line.split(" ", 1)[1] for line in output.splitlines() if " " in line]
+
+    def _submodule_fingerprint(self, path: Path, superproject: Path) -> str | None:
+        """Build a cache key from a submodule's HEAD and index.
+
+        Returns:
+            Fingerprint string, or None if the submodule is not initialized
+        """
+        git_dir = _find_git_dir(path)
+        if git_dir is None:
+            return None
+        try:
+            head = (git_dir / "HEAD").read_text().strip()
+        except OSError:
             return None
+        # The HEAD reflog moves with every commit or checkout, even on a branch
+        head_moved = self._mtime_ns(git_dir / "logs" / "HEAD")
+        index_mtime = self._mtime_ns(git_dir / "index")
+        return f"{head}:{head_moved}:{index_mtime}:{self._freshness_token(superproject, self.submodules_ttl)}"
 
-        parts = output.split(" ", 1)
-        if len(parts) != _EXPECTED_COUNT_PARTS:
+    def _probe_submodule(self, path: str) -> dict[str, Any] | None:
+        """Count changes inside one submodule (runs in a worker thread).
+
+        Returns:
+            Dict with staged, modified, untracked (and truncated), or None on failure
+        """
+        changes = {"staged": 0, "modified": 0, "untracked": 0}
+        records = self._stream_git("-C", path, *self._status_args(include_untracked=self.untracked_files != "no"))
+        try:
+            truncated = self._count_changes(records, changes)
+        except _GitCommandError:
             return None
+        finally:
+            records.close()
+        return {**changes, "truncated": True} if truncated else changes
 
-        return (parts[0], parts[1])
+    def _untracked_cache_key(self) -> str | None:
+        """Get the untracked count cache key for this worktree."""
+        if self.untracked_interval <= 0 or not self.store:
+            return None
+        return self._get_toplevel()
 
-    def _parse_git_age(self, age_str: str) -> int | None:
-        """Parse git relative age string to total minutes.
+    def _load_untracked_count(self) -> int | None:
+        """Get the cached untracked count if it is fresher than ``untracked_interval``.
 
-        Args:
-            age_str: Relative age string from git (e.g., "2 hours ago")
+        Returns:
+            Cached count, or None if the untracked files must be counted now
+        """
+        key = self._untracked_cache_key()
+        if key is None:
+            return None
+        cached = self._cache_get("untracked", key)
+        if not isinstance(cached, dict):
+            return None
+        if time.time() - cached.get("checked_at", 0) >= self.untracked_interval:
+            return None
+        return cached.get("count")
+
+    def _save_untracked_count(self, changes: dict[str, int], counted: bool) -> None:
+        """Remember a freshly counted untracked total for the slow cadence."""
+        if not counted:
+            return
+        key = self._untracked_cache_key()
+        if key is not None:
+            self._cache_set("untracked", key, {"count": changes["untracked"], "checked_at": time.time()})
+
+    def _get_last_commit(self) -> tuple[str, int] | None:
+        """Get last commit hash and commit timestamp.
+
+        Commits are immutable, so the result is cached permanently per
+        commit id.
 
         Returns:
-            Total minutes, or None if parsing fails
+            Tuple of (short_hash, unix_timestamp) or None if no commits
         """
-        parts = age_str.split()
-        if len(parts) < _EXPECTED_COUNT_PARTS:
+        head = self._get_head_oid()
+        if head is None:
             return None
 
-        try:
-            num = int(parts[0])
-        except ValueError:
+        cached = self._cache_get("commits", head)
+        if isinstance(cached, list) and len(cached) == _EXPECTED_COUNT_PARTS:
+            return (cached[0], cached[1])
+
+        output = self._run_git("log", "-1", "--format=%h %ct", head)
+        if output is None:
             return None
 
-        unit = parts[1]
-        if unit not in _UNIT_TO_MINUTES:
+        parts = output.split(" ", 1)
+        if len(parts) != _EXPECTED_COUNT_PARTS:
+            return None
+        try:
+            commit = (parts[0], int(parts[1]))
+        except ValueError:
             return None
 
-        return num * _UNIT_TO_MINUTES[unit]
+        self._cache_set("commits", head, list(commit))
+        return commit
 
     def _decompose_minutes(self, total_minutes: int) -> tuple[int, int, int]:
         """Decompose total minutes into days, hours, minutes.
@@ -257,23 +1112,23 @@ class GitModule(BaseModule):
         minutes = remaining % _MINUTES_PER_HOUR
         return (days, hours, minutes)
 
-    def _format_commit_age(self, age_str: str) -> str:
+    def _format_commit_age(self, timestamp: int, now: float | None = None) -> str:
         """Format commit age according to config.
 
         Args:
-            age_str: Relative age string from git (e.g., "2 hours ago")
+            timestamp: Commit time as a unix timestamp
+            now: Current time (defaults to time.time())
 
         Returns:
             Formatted age string
         """
-        # Raw format: return as-is
+        age_seconds = max(0, int((time.time() if now is None else now) - timestamp))
+
+        # Raw format: same wording as git's relative dates
         if self.commit_age_format == "raw":
-            return age_str
+            return _git_relative_age(age_seconds)
 
-        # Parse git output to minutes
-        total_minutes = self._parse_git_age(age_str)
-        if total_minutes is None:
-            return age_str  # Fallback for invalid input
+        total_minutes = age_seconds // 60
 
         # Less than 1 minute
         if total_minutes == 0:
@@ -317,30 +1172,10 @@ class GitModule(BaseModule):
             Dict with keys: project, worktree, subfolder
             or None if not in git repo
         """
-        # Get main repo .git path
-        git_common_dir = self._run_git("rev-parse", "--git-common-dir")
-        if git_common_dir is None:
-            return None
-
-        # Get current worktree root
-        toplevel = self._run_git("rev-parse", "--show-toplevel")
-        if toplevel is None:
+        location = self._resolve_location()
+        if location is None or location["toplevel"] is None:
             return None
-
-        # Extract project name from main repo path
-        # resolve() converts relative paths (like ".git" or "../.git") to absolute
-        git_path = Path(git_common_dir).resolve()
-        if git_path.name == ".git":
-            project_name = git_path.parent.name
-        else:
-            project_name = git_path.name
-
-        # Detect worktree: .git is a file (not directory) in worktrees
-        toplevel_path = Path(toplevel)
-        git_file = toplevel_path / ".git"
-        is_worktree = git_file.is_file()
-
-        worktree_name = toplevel_path.name if is_worktree else None
+        toplevel_path = Path(location["toplevel"])
 
         # Get subfolder relative to worktree/repo root
         current_dir = self.data.workspace.current_dir if self.data.workspace else None
@@ -354,7 +1189,7 @@ class GitModule(BaseModule):
             except ValueError:
                 pass
 
-        return {"project": project_name, "worktree": worktree_name, "subfolder": subfolder}
+        return {"project": location["project"], "worktree": location["worktree"], "subfolder": subfolder}
 
     def _render_location_line(self, location: Mapping[str, str | None]) -> str | None:
         """Render the location line (Line 1).
@@ -403,9 +1238,25 @@ class GitModule(BaseModule):
         if status not in status_map:
             return None
         template, color = status_map[status]
-        text = template.format(count) if "{}" in template else template
+        shown = f"{self.ahead_behind_limit}+" if self.ahead_behind_limit and count > self.ahead_behind_limit else count
+        text = template.format(shown) if "{}" in template else template
         return colored(text, color)
 
+    def _render_default_status(self, default_status: tuple[str, str, int]) -> str | None:
+        """Render ahead/behind indicator against the default branch.
+
+        Args:
+            default_status: Tuple of (branch name, status, count)
+
+        Returns:
+            Branch name followed by its status indicator, or None
+        """
+        name, status, count = default_status
+        indicator = self._render_remote_status((status, count))
+        if indicator is None:
+            return None
+        return colored(name, "dark_grey") + indicator
+
     def _render_changes(self, changes: dict[str, int]) -> str | None:
         """Render working directory changes indicator.
 
@@ -420,15 +1271,64 @@ class GitModule(BaseModule):
             (changes["modified"], "~", "yellow"),
             (changes["untracked"], "?", "cyan"),
         ]
-        change_parts = [colored(f"{prefix}{count}", color) for count, prefix, color in indicators if count > 0]
+        change_parts = [
+            colored(f"{prefix}{self._format_change_count(count, bool(changes.get('truncated')))}", color)
+            for count, prefix, color in indicators
+            if count > 0
+        ]
         return "[" + " ".join(change_parts) + "]" if change_parts else None
 
+    def _format_change_count(self, count: int, truncated: bool) -> str:
+        """Format a change count, marking capped and partial counts with '+'.
+
+        Args:
+            count: Number of changed files
+            truncated: Whether counting stopped early (count is a lower bound)
+
+        Returns:
+            "9999+" above max_changes, "37+" when partial, else the exact count
+        """
+        if self.max_changes and count > self.max_changes:
+            return f"{self.max_changes}+"
+        return f"{count}+" if truncated else str(count)
+
+    def _format_operation(self, operation: Mapping[str, Any]) -> str:
+        """Format an in-progress operation (e.g., 'REBASE 2/5', 'MERGING')."""
+        if "step" in operation and "total" in operation:
+            return f"{operation['name']} {operation['step']}/{operation['total']}"
+        return operation["name"]
+
+    def _render_worktrees_line(self, worktrees: Mapping[str, Any]) -> str | None:
+        """Render the worktree overview line (Line 3).
+
+        Args:
+            worktrees: Summary from _get_worktrees
+
+        Returns:
+            Worktree count, dirty count, and diverged worktrees, or None
+            with a single worktree
+        """
+        if worktrees["count"] < _MIN_WORKTREES:
+            return None
+        parts = [f"🌲 {worktrees['count']}"]
+        if worktrees["dirty"]:
+            parts.append(colored(f"✎{worktrees['dirty']}", "yellow"))
+        for name, status, count in worktrees["diverged"]:
+            indicator = self._render_remote_status((status, count))
+            if indicator:
+                parts.append(colored(name, "dark_grey") + indicator)
+        return " ".join(parts)
+
     def _render_status_line(
         self,
         branch: str,
         remote_status: tuple[str, int],
         changes: dict[str, int],
         commit: tuple[str, str] | None,
+        *,
+        default_status: tuple[str, str, int] | None = None,
+        operation: Mapping[str, Any] | None = None,
+        stash: int = 0,
     ) -> str | None:
         """Render the status line (Line 2).
 
@@ -437,6 +1337,9 @@ class GitModule(BaseModule):
             remote_status: Tuple of (status, count)
             changes: Dict with staged, modified, untracked counts
             commit: Tuple of (hash, age) or None
+            default_status: Tuple of (default branch, status, count) or None
+            operation: In-progress operation from _get_operation, or None
+            stash: Number of stash entries
 
         Returns:
             Formatted status string or None if all disabled
@@ -446,18 +1349,140 @@ class GitModule(BaseModule):
         if self.show_branch:
             parts.append(colored(branch, "magenta"))
 
+        if self.show_operation and operation:
+            parts.append(colored(self._format_operation(operation), "red", attrs=["bold"]))
+
         if self.show_remote_status:
             remote = self._render_remote_status(remote_status)
             if remote:
                 parts.append(remote)
 
+        # Ahead/behind against the default branch is redundant while on it
+        if self.show_default_branch and default_status and default_status[0] != branch:
+            default = self._render_default_status(default_status)
+            if default:
+                parts.append(default)
+
         if self.show_changes:
             changes_str = self._render_changes(changes)
             if changes_str:
                 parts.append(changes_str)
 
+        if self.show_stash and stash > 0:
+            parts.append(colored(f"⚑{stash}", "blue"))
+
         if self.show_commit and commit:
             commit_hash, commit_age = commit
             parts.append(colored(f"{commit_hash} {commit_age}", "white", attrs=["dark"]))
 
         return " ".join(parts) if parts else None
+
+
+def _git_relative_age(seconds: int) -> str:
+    """Format an age the way git's ``%ar`` does.
+
+    Args:
+        seconds: Age in seconds
+
+    Returns:
+        Relative age string (e.g., "2 hours ago", "1 year, 3 months ago")
+    """
+
+    def plural(count: int, unit: str) -> str:
+        return f"{count} {unit}" if count == 1 else f"{count} {unit}s"
+
+    value = seconds
+    for unit, limit, per_next in _RELATIVE_STEPS:
+        if value < limit:
+            return plural(value, unit) + " ago"
+        value = (value + per_next // 2) // per_next
+
+    days = value
+    for unit, limit, per_unit in _RELATIVE_DAY_UNITS:
+        if days < limit:
+            return plural((days + per_unit // 2) // per_unit, unit) + " ago"
+
+    if days < _YEARS_AND_MONTHS_LIMIT:
+        # Rounded to the nearest month, like git
+        total_months = (days * _MONTHS_PER_YEAR * 2 + _DAYS_PER_YEAR) // (_DAYS_PER_YEAR * 2)
+        years, months = divmod(total_months, _MONTHS_PER_YEAR)
+        if months:
+            return f"{plural(years, 'year')}, {plural(months, 'month')} ago"
+        return plural(years, "year") + " ago"
+    return plural((days + _HALF_YEAR_DAYS) // _DAYS_PER_YEAR, "year") + " ago"
+
+
+def _find_git_dir(toplevel: Path) -> Path | None:
+    """Find a worktree's git dir from its ``.git`` directory or file.
+
+    Args:
+        toplevel: Worktree root
+
+    Returns:
+        Git dir path, or None if it cannot be read
+    """
+    dot_git = toplevel / ".git"
+    try:
+        if not dot_git.is_file():
+            return dot_git
+        content = dot_git.read_text().strip()
+    except (OSError, UnicodeDecodeError):
+        return None
+    if not content.startswith(_GITDIR_PREFIX):
+        return None
+    return (toplevel / content.removeprefix(_GITDIR_PREFIX).strip()).resolve()
+
+
+def _resolve_git_dirs(toplevel: Path) -> tuple[Path, Path] | None:
+    """Resolve a worktree's git dir and the repository common dir.
+
+    The one resolver for git dirs: the location (project name) and the
+    operation and stash state all use it, so they cannot disagree.
+
+    Args:
+        toplevel: Worktree root
+
+    Returns:
+        Tuple of (git_dir, common_dir), or None if ``.git`` cannot be read
+    """
+    git_dir = _find_git_dir(toplevel)
+    if git_dir is None:
+        return None
+    try:
+        commondir_file = git_dir / "commondir"
+        common_dir = git_dir
+        if commondir_file.is_file():
+            common_dir = (git_dir / commondir_file.read_text().strip()).resolve()
+    except (OSError, UnicodeDecodeError):
+        return None
+    return (git_dir, common_dir)
+
+
+def _parse_worktree_list(output: str) -> list[dict[str, str]]:
+    """Parse ``git worktree list --porcelain`` output.
+
+    Bare and prunable (missing) worktrees are skipped.
+
+    Args:
+        output: Command output
+
+    Returns:
+        List of dicts with path and, when present, head and branch
+    """
+    worktrees = []
+    for block in output.split("\n\n"):
+        worktree: dict[str, str] = {}
+        skip = False
+        for line in block.splitlines():
+            key, _, value = line.partition(" ")
+            if key == "worktree":
+                worktree["path"] = value
+            elif key == "HEAD":
+                worktree["head"] = value
+            elif key == "branch":
+                worktree["branch"] = value
+            elif key in ("bare", "prunable"):
+                skip = True
+        if "path" in worktree and not skip:
+            worktrees.append(worktree)
+    return worktrees
@@ -1,16 +1,24 @@
 """Model module for statuskit."""
 
+import time
+
 from termcolor import colored
 
+from statuskit.core.formatting import compact_number
+from statuskit.core.sessions import SessionStore
 from statuskit.modules.base import BaseModule
 
 # Time constants
 _SECONDS_PER_MINUTE = 60
 _SECONDS_PER_HOUR = 3600
+_MINUTES_PER_HOUR = 60
+_MS_PER_SECOND = 1_000
 
-# Number formatting thresholds
-_THOUSAND = 1_000
-_MILLION = 1_000_000
+# Context growth: samples kept per session, and the span they must cover
+_MAX_SAMPLES = 16
+_RATE_WINDOW = 600  # seconds of history used for the growth rate
+_MIN_RATE_SPAN = 60  # seconds between oldest sample and now
+_MIN_RATE = 1.0  # tokens/min; slower growth is not shown
 
 
 class ModelModule(BaseModule):
@@ -27,6 +35,8 @@ class ModelModule(BaseModule):
         self.context_compact = config.get("context_compact", False)
         self.threshold_green = config.get("context_threshold_green", 50)
         self.threshold_yellow = config.get("context_threshold_yellow", 25)
+        self.show_context_rate = config.get("show_context_rate", False)
+        self.compaction_threshold = config.get("compaction_threshold", 80)
 
     def render(self) -> str | None:
         parts = []
@@ -57,7 +67,7 @@ class ModelModule(BaseModule):
         if ms == 0:
             return None
 
-        total_sec = ms // _THOUSAND
+        total_sec = ms // _MS_PER_SECOND
         if total_sec < _SECONDS_PER_MINUTE:
             return f"{total_sec}s"
 
@@ -80,8 +90,66 @@ class ModelModule(BaseModule):
         pct_used = (used / total) * 100
 
         color = self._determine_color(pct_free)
-        text = self._format_context_text(free, used, total, pct_free, pct_used)
-        return colored(text, color)
+        text = colored(self._format_context_text(free, used, total, pct_free, pct_used), color)
+        if self.show_context_rate:
+            growth = self._format_growth(used, total)
+            if growth:
+                text = f"{text} {growth}"
+        return text
+
+    def _record_usage(self, used: int) -> list[list[float]]:
+        """Add a context usage sample to the session state.
+
+        Samples are only added when usage changes. A drop in usage
+        (compaction or /clear) starts a new history.
+
+        Returns:
+            Samples as [timestamp, used tokens], oldest first
+        """
+        if not self.store or not self.data.session_id:
+            return []
+        store = SessionStore(self.store)
+        samples = store.load(self.data.session_id, self.name).get("samples", [])
+        if samples and used < samples[-1][1]:
+            samples = []
+        if not samples or used != samples[-1][1]:
+            samples = [*samples, [time.time(), used]][-_MAX_SAMPLES:]
+            store.save(self.data.session_id, self.name, {"samples": samples})
+        return samples
+
+    def _growth_rate(self, samples: list[list[float]]) -> float | None:
+        """Get context growth in tokens per minute over the window ending now.
+
+        Samples are only added when usage changes, so idle time counts
+        as no growth, and a session idle for the whole window has no rate.
+        """
+        now = time.time()
+        recent = [s for s in samples if now - s[0] <= _RATE_WINDOW]
+        if not recent:
+            return None
+        first_ts, first_used = recent[0]
+        span = now - first_ts
+        if span < _MIN_RATE_SPAN:
+            return None
+        return (recent[-1][1] - first_used) / span * _SECONDS_PER_MINUTE
+
+    def _format_growth(self, used: int, total: int) -> str | None:
+        """Format context growth rate and time until auto-compaction.
+
+        Returns:
+            E.g. "+2k/min ~12m to compact", or None without enough history
+        """
+        rate = self._growth_rate(self._record_usage(used))
+        if rate is None or rate < _MIN_RATE:
+            return None
+        text = f"+{compact_number(round(rate))}/min"
+        remaining = total * self.compaction_threshold / 100 - used
+        if remaining > 0:
+            minutes = round(remaining / rate)
+            hours, minutes = divmod(minutes, _MINUTES_PER_HOUR)
+            eta = f"{hours}h {minutes}m" if hours else f"{minutes}m"
+            text = f"{text} ~{eta} to compact"
+        return colored(text, "dark_grey")
 
     def _determine_color(self, pct_free: float) -> str:
         if pct_free > self.threshold_green:
@@ -107,16 +175,9 @@ class ModelModule(BaseModule):
 
     def _get_number_formatter(self):
         if self.context_compact:
-            return self._compact_number
+            return compact_number
         return lambda n: f"{n:,}"
 
-    def _compact_number(self, n: int) -> str:
-        if n >= _MILLION:
-            return f"{n / _MILLION:.1f}M"
-        if n >= _THOUSAND:
-            return f"{n / _THOUSAND:.0f}k"
-        return str(n)
-
     def _make_bar(self, pct_free: float, width: int = 10) -> str:
         filled = int(pct_free / 100 * width)
         empty = width - filled
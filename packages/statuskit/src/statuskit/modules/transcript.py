@@ -0,0 +1,298 @@
+"""Transcript module for statuskit."""
+
+import json
+import mmap
+import os
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from termcolor import colored
+
+from statuskit.core.formatting import compact_number
+from statuskit.core.sessions import SessionStore
+from statuskit.modules.base import BaseModule
+
+# New data larger than this is memory-mapped instead of read into memory
+MMAP_THRESHOLD = 1 << 20
+# Most new data parsed per refresh; the rest is picked up by later refreshes
+MAX_BYTES_PER_UPDATE = 16 << 20
+
+
+@dataclass
+class TranscriptStats:
+    """Running aggregates over a session transcript."""
+
+    turns: int = 0  # prompts typed by the user
+    tool_calls: dict[str, int] = field(default_factory=dict)  # tool name -> calls
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_creation_tokens: int = 0
+    cache_read_tokens: int = 0
+
+    @property
+    def total_tool_calls(self) -> int:
+        """Number of tool calls of any tool."""
+        return sum(self.tool_calls.values())
+
+    @classmethod
+    def from_dict(cls, data: Any) -> "TranscriptStats":
+        """Restore stats saved with ``asdict``; invalid data gives empty stats."""
+        if not isinstance(data, dict):
+            return cls()
+        try:
+            return cls(**data)
+        except TypeError:
+            return cls()
+
+
+def _is_prompt(entry: dict) -> bool:
+    """Check whether a transcript entry is a prompt typed by the user.
+
+    Tool results and injected meta messages are also stored as user
+    entries; they are not turns.
+    """
+    if entry.get("isMeta") or entry.get("isSidechain"):
+        return False
+    content = entry.get("message", {}).get("content")
+    if isinstance(content, str):
+        return True
+    if isinstance(content, list):
+        return not any(isinstance(block, dict) and block.get("type") == "tool_result" for block in content)
+    return False
+
+
+class TranscriptIndex:
+    """Incremental aggregates over a session transcript (JSONL).
+
+    The byte offset of the last complete line parsed, and the aggregates
+    up to it, are kept in the session store. Each update parses only the
+    lines appended since; a transcript that shrank or was replaced is
+    parsed again from the start. A line longer than
+    ``MAX_BYTES_PER_UPDATE`` is skipped unparsed.
+    """
+
+    namespace = "transcript"
+
+    def __init__(self, path: Path, store: SessionStore, session_id: str):
+        """Initialize index.
+
+        Args:
+            path: Transcript JSONL file
+            store: Session store for the checkpoint
+            session_id: Session the transcript belongs to
+        """
+        self.path = path
+        self.store = store
+        self.session_id = session_id
+
+    def update(self) -> TranscriptStats | None:
+        """Parse newly appended lines and save the checkpoint.
+
+        Returns:
+            Aggregates over the transcript so far, or None if it cannot be read
+        """
+        try:
+            st = self.path.stat()
+        except OSError:
+            return None
+
+        checkpoint = self.store.load(self.session_id, self.namespace)
+        stats = TranscriptStats.from_dict(checkpoint.get("stats"))
+        offset = checkpoint.get("offset", 0)
+        last_message_id = checkpoint.get("last_message_id")
+        if checkpoint.get("path") != str(self.path) or checkpoint.get("inode") != st.st_ino or offset > st.st_size:
+            stats, offset, last_message_id = TranscriptStats(), 0, None
+
+        if offset == st.st_size:
+            return stats
+
+        try:
+            start = offset
+            end = min(st.st_size, start + MAX_BYTES_PER_UPDATE)
+            offset, last_message_id = self._parse(stats, start, end, last_message_id)
+            if offset == start and end < st.st_size:
+                # No line ends within a full window: skip the oversized line
+                offset = self._skip_line(end, st.st_size) or start
+        except (OSError, ValueError):
+            return None
+
+        self.store.save(
+            self.session_id,
+            self.namespace,
+            {
+                "path": str(self.path),
+                "inode": st.st_ino,
+                "offset": offset,
+                "last_message_id": last_message_id,
+                "stats": asdict(stats),
+            },
+        )
+        return stats
+
+    def _parse(
+        self, stats: TranscriptStats, start: int, end: int, last_message_id: str | None
+    ) -> tuple[int, str | None]:
+        """Add complete lines in ``[start, end)`` of the file to ``stats``.
+
+        A trailing line without newline is still being written and is left
+        for the next update.
+
+        Returns:
+            Tuple of (offset after the last complete line, last assistant message id)
+        """
+        with self.path.open("rb") as f:
+            if end - start > MMAP_THRESHOLD:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                    return self._parse_lines(view, start, end, stats, last_message_id)
+            data = os.pread(f.fileno(), end - start, start)
+            consumed, last_message_id = self._parse_lines(data, 0, len(data), stats, last_message_id)
+            return start + consumed, last_message_id
+
+    def _skip_line(self, start: int, size: int) -> int | None:
+        """Find where the next line begins at or after ``start``.
+
+        Returns:
+            Offset after the first newline in ``[start, size)``, or None if
+            there is none yet (the line is still being written)
+        """
+        with self.path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            newline = view.find(b"\n", start, size)
+        return None if newline == -1 else newline + 1
+
+    def _parse_lines(
+        self, buffer: bytes | mmap.mmap, pos: int, end: int, stats: TranscriptStats, last_message_id: str | None
+    ) -> tuple[int, str | None]:
+        """Add the complete lines of ``buffer[pos:end]`` to ``stats``.
+
+        Returns:
+            Tuple of (position after the last complete line, last assistant message id)
+        """
+        while pos < end:
+            newline = buffer.find(b"\n", pos, end)
+            if newline == -1:
+                break
+            line = buffer[pos:newline]
+            pos = newline + 1
+            try:
+                entry = json.loads(line)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                continue
+            if isinstance(entry, dict):
+                last_message_id = self._add_entry(stats, entry, last_message_id)
+        return pos, last_message_id
+
+    def _add_entry(self, stats: TranscriptStats, entry: dict, last_message_id: str | None) -> str | None:
+        """Add one transcript entry to ``stats``.
+
+        Claude Code writes an assistant message as one entry per content
+        block, each repeating the message's usage; usage is counted once
+        per message id.
+
+        Returns:
+            Id of the last assistant message seen
+        """
+        message = entry.get("message")
+        if not isinstance(message, dict):
+            return last_message_id
+        if entry.get("type") == "user":
+            if _is_prompt(entry):
+                stats.turns += 1
+            return last_message_id
+        if entry.get("type") != "assistant":
+            return last_message_id
+
+        content = message.get("content")
+        if isinstance(content, list):
+            tools = Counter(
+                block.get("name", "?")
+                for block in content
+                if isinstance(block, dict) and block.get("type") == "tool_use"
+            )
+            for name, count in tools.items():
+                stats.tool_calls[name] = stats.tool_calls.get(name, 0) + count
+
+        message_id = message.get("id")
+        usage = message.get("usage")
+        if isinstance(usage, dict) and (message_id is None or message_id != last_message_id):
+            stats.input_tokens += usage.get("input_tokens") or 0
+            stats.output_tokens += usage.get("output_tokens") or 0
+            stats.cache_creation_tokens += usage.get("cache_creation_input_tokens") or 0
+            stats.cache_read_tokens += usage.get("cache_read_input_tokens") or 0
+        return message_id or last_message_id
+
+
+class TranscriptModule(BaseModule):
+    """Display turn count, tool calls and token totals from the session transcript."""
+
+    name = "transcript"
+    description = "Session turns, tool calls and tokens from the transcript"
+
+    def __init__(self, ctx, config: dict):
+        super().__init__(ctx, config)
+        self.show_turns = config.get("show_turns", True)
+        self.show_tools = config.get("show_tools", True)
+        self.top_tools = config.get("top_tools", 3)
+        self.show_tokens = config.get("show_tokens", True)
+
+    def render(self) -> str | None:
+        stats = self._get_stats()
+        parts = []
+        if stats is not None:
+            parts.extend(self._format_stats(stats))
+
+        # Debug output (appended to statusline)
+        if self.debug and self._debug_messages:
+            parts.extend(colored(f"[{self.name}] {msg}", "yellow") for msg in self._debug_messages)
+
+        return " | ".join(parts) if parts else None
+
+    def warm(self) -> None:
+        """Parse the lines appended to the transcript since the last update."""
+        self._get_stats()
+
+    def _format_stats(self, stats: TranscriptStats) -> list[str]:
+        parts = []
+
+        # Turns: 12
+        if self.show_turns:
+            parts.append(f"Turns: {stats.turns}")
+
+        # Tools: 48 (Bash 20, Edit 15, Read 8)
+        if self.show_tools and stats.tool_calls:
+            parts.append(self._format_tools(stats))
+
+        # Tokens: 12k in, 45k out, 1.1M cached
+        if self.show_tokens and (stats.input_tokens or stats.output_tokens):
+            parts.append(self._format_tokens(stats))
+
+        return parts
+
+    def _get_stats(self) -> TranscriptStats | None:
+        self._debug_messages: list[str] = []
+        path = self.data.transcript_path
+        if not path:
+            self._debug_messages.append("No transcript path")
+            return None
+        if not self.store:
+            self._debug_messages.append("No cache directory")
+            return None
+        # Claude Code names transcripts after the session id
+        session_id = self.data.session_id or Path(path).stem
+        stats = TranscriptIndex(Path(path), SessionStore(self.store), session_id).update()
+        if stats is None:
+            self._debug_messages.append(f"Cannot read {path}")
+        return stats
+
+    def _format_tools(self, stats: TranscriptStats) -> str:
+        text = f"Tools: {stats.total_tool_calls}"
+        if self.top_tools:
+            top = Counter(stats.tool_calls).most_common(self.top_tools)
+            text += colored(f" ({', '.join(f'{name} {count}' for name, count in top)})", "dark_grey")
+        return text
+
+    def _format_tokens(self, stats: TranscriptStats) -> str:
+        fresh = compact_number(stats.input_tokens + stats.cache_creation_tokens)
+        cached = compact_number(stats.cache_read_tokens)
+        return f"Tokens: {fresh} in, {compact_number(stats.output_tokens)} out, {cached} cached"
@@ -2,18 +2,34 @@
 
 from __future__ import annotations
 
+import functools
+import hashlib
+import http.client
+import ipaddress
 import json
+import math
+import os
+import struct
 import subprocess
-import tempfile
+import sys
+import time
 from dataclasses import dataclass
 from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from http import HTTPStatus
 from pathlib import Path
 from typing import TYPE_CHECKING
-from urllib.error import URLError
+from urllib.error import HTTPError, URLError
+from urllib.parse import urlsplit
 from urllib.request import Request, urlopen
 
 from termcolor import colored
 
+from statuskit.core.background import spawn_statuskit
+from statuskit.core.cache import read_json, write_json
+from statuskit.core.lock import CacheLock
+from statuskit.core.ring import RingBuffer
+from statuskit.core.store import CacheStore
 from statuskit.modules.base import BaseModule
 
 if TYPE_CHECKING:
@@ -22,9 +38,31 @@ if TYPE_CHECKING:
 HOURS_PER_DAY = 24
 CREDENTIALS_PATH = Path.home() / ".claude" / ".credentials.json"
 KEYCHAIN_SERVICE = "Claude Code-credentials"
+KEYCHAIN_TOOL = "/usr/bin/security"
+KEYCHAIN_TOKEN_MAX_AGE = 300  # seconds
+TOKEN_CACHE_FILENAME = "usage_token.json"  # noqa: S105
+TOKEN_EXPIRY_MARGIN = 60  # seconds; don't send a token about to expire
 API_URL = "https://api.anthropic.com/api/oauth/usage"
+API_URL_ENV = "STATUSKIT_USAGE_API_URL"
 API_TIMEOUT = 3.0
-CACHE_FILENAME = "usage_limits.json"
+CACHE_NAMESPACE = "usage_limits"  # in the shared cache store
+REFRESH_MARKER = "usage_limits.refresh"
+REFRESH_LOCK = "usage_limits.lock"
+# Longest a refresh can take (keychain lookup + API request), with margin
+REFRESH_LOCK_MAX_AGE = 30.0
+MIN_FETCH_INTERVAL = 30  # seconds; the API is never called more often
+NEAR_LIMIT_PERCENT = 80
+BREAKER_FILENAME = "usage_breaker.json"
+BACKOFF_BASE = 30  # seconds; doubles with each consecutive failure
+BACKOFF_MAX = 900
+AUTH_BACKOFF = 3600  # a rejected token is retried at most hourly
+RETRY_AFTER_MAX = 3600
+HISTORY_FILENAME = "usage_history.bin"
+HISTORY_CAPACITY = 4096  # samples; about two weeks at one per five minutes
+# fetched_at (Unix time), session, weekly, sonnet utilization (NaN if missing)
+HISTORY_RECORD = struct.Struct("<dfff")
+MIN_BURN_SPAN = 300  # seconds of history needed for a burn rate
+BURN_RATE_MIN = 0.05  # %/hour; slower growth is shown as flat
 
 
 @dataclass
@@ -33,6 +71,7 @@ class UsageLimit:
 
     utilization: float  # 0-100
     resets_at: datetime | None  # None when limit not yet used or API issue
+    burn_rate: float | None = None  # %/hour from usage history; set at render, not cached
 
 
 @dataclass
@@ -43,6 +82,7 @@ class UsageData:
     weekly: UsageLimit | None  # seven_day
     sonnet: UsageLimit | None  # seven_day_sonnet
     fetched_at: datetime
+    rate: float | None = None  # session utilization change, %/hour since the previous fetch
 
 
 def parse_api_response(response: dict) -> UsageData:
@@ -56,7 +96,7 @@ def parse_api_response(response: dict) -> UsageData:
     """
 
     def parse_limit(data: dict | None) -> UsageLimit | None:
-        if data is None:
+        if not isinstance(data, dict):
             return None
         utilization = data.get("utilization")
         if utilization is None:
@@ -148,15 +188,52 @@ def format_progress_bar(utilization: float, width: int = 10) -> str:
     return f"[{'█' * filled}{'░' * empty}]"
 
 
-def _get_keychain_token() -> str | None:
-    """Get token from macOS Keychain.
+@dataclass
+class Credentials:
+    """OAuth access token and its expiry."""
+
+    token: str
+    expires_at: float | None  # Unix time; None when the credentials don't say
+
+
+def _parse_credentials(text: str) -> Credentials | None:
+    """Parse Claude Code credentials JSON.
+
+    Args:
+        text: Credentials JSON (from the Keychain or the credentials file)
+
+    Returns:
+        Credentials, or None if there is no access token
+    """
+    try:
+        oauth = json.loads(text).get("claudeAiOauth", {})
+    except (json.JSONDecodeError, AttributeError):
+        return None
+    if not isinstance(oauth, dict) or not oauth.get("accessToken"):
+        return None
+    expires_at = oauth.get("expiresAt")
+    # expiresAt is in milliseconds
+    return Credentials(
+        token=oauth["accessToken"],
+        expires_at=expires_at / 1000 if isinstance(expires_at, int | float) else None,
+    )
+
+
+@functools.cache
+def _keychain_available() -> bool:
+    """Check once whether this platform stores credentials in the Keychain."""
+    return sys.platform == "darwin" and Path(KEYCHAIN_TOOL).exists()
+
+
+def _get_keychain_credentials() -> Credentials | None:
+    """Get credentials from macOS Keychain.
 
     Returns:
-        Token string or None if not found
+        Credentials or None if not found
     """
     try:
         result = subprocess.run(  # noqa: S603
-            ["/usr/bin/security", "find-generic-password", "-s", KEYCHAIN_SERVICE, "-w"],
+            [KEYCHAIN_TOOL, "find-generic-password", "-s", KEYCHAIN_SERVICE, "-w"],
             capture_output=True,
             text=True,
             timeout=5,
@@ -164,79 +241,500 @@ def _get_keychain_token() -> str | None:
         )
         if result.returncode == 0:
             # Keychain returns JSON with the token
-            data = json.loads(result.stdout.strip())
-            return data.get("claudeAiOauth", {}).get("accessToken")
-    except (subprocess.TimeoutExpired, json.JSONDecodeError, FileNotFoundError):
+            return _parse_credentials(result.stdout.strip())
+    except (subprocess.TimeoutExpired, FileNotFoundError):
         pass
     return None
 
 
-def _get_file_token() -> str | None:
-    """Get token from credentials file.
+def _get_file_credentials() -> Credentials | None:
+    """Get credentials from credentials file.
+
+    Returns:
+        Credentials or None if not found
+    """
+    try:
+        return _parse_credentials(CREDENTIALS_PATH.read_text())
+    except OSError:
+        return None
+
+
+def _credentials_mtime() -> int | None:
+    """Get the credentials file mtime in nanoseconds, or None if missing."""
+    try:
+        return CREDENTIALS_PATH.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _is_expired(expires_at: float | None, now: float) -> bool:
+    """Check whether a token expires within ``TOKEN_EXPIRY_MARGIN`` seconds."""
+    return expires_at is not None and expires_at - TOKEN_EXPIRY_MARGIN <= now
+
+
+def _token_entry_valid(entry: dict, now: float) -> bool:
+    """Check whether a cached token lookup still matches its source.
+
+    Args:
+        entry: Cached lookup (source, token, expires_at, mtime_ns, cached_at)
+        now: Current Unix time
+
+    Returns:
+        True if the token can be used without looking it up again
+    """
+    if entry.get("source") == "keychain":
+        # The Keychain has no cheap change marker, so entries just age out
+        return _keychain_available() and now - entry.get("cached_at", 0) < KEYCHAIN_TOKEN_MAX_AGE
+    return entry.get("source") == "file" and entry.get("mtime_ns") == _credentials_mtime()
+
+
+def _lookup_token() -> dict | None:
+    """Read the token from the platform's credential sources.
+
+    Returns:
+        Token cache entry, or None if no source has a token
+    """
+    if _keychain_available():
+        credentials = _get_keychain_credentials()
+        if credentials:
+            return {"source": "keychain", "token": credentials.token, "expires_at": credentials.expires_at}
+    mtime = _credentials_mtime()
+    if mtime is None:
+        return None
+    credentials = _get_file_credentials()
+    if credentials is None:
+        return None
+    return {"source": "file", "token": credentials.token, "expires_at": credentials.expires_at, "mtime_ns": mtime}
+
+
+def _load_token_entry(cache_file: Path) -> dict | None:
+    """Load the on-disk token lookup and read its token from the credentials file.
+
+    Only credentials file lookups are stored on disk, and without the
+    token; they let a new process skip the Keychain probe.
+
+    Returns:
+        Token cache entry, or None if there is no usable stored lookup
+    """
+    entry = read_json(cache_file)
+    if not isinstance(entry, dict) or entry.get("source") != "file" or "token" in entry:
+        return None
+    if entry.get("mtime_ns") != _credentials_mtime():
+        return None
+    credentials = _get_file_credentials()
+    if credentials is None:
+        return None
+    return {**entry, "token": credentials.token, "expires_at": credentials.expires_at}
+
+
+def _save_token_entry(cache_file: Path, entry: dict) -> None:
+    """Store a token lookup on disk, leaving out the token itself.
+
+    Keychain lookups are not stored, so their tokens stay in this
+    process; any older stored lookup is removed.
+    """
+    if entry.get("source") != "file":
+        cache_file.unlink(missing_ok=True)
+        return
+    write_json(cache_file, {key: value for key, value in entry.items() if key != "token"})
+
+
+# Last token lookup in this process (the on-disk entry plus the token)
+_token_memo: dict = {}
+
+
+def get_token(cache_dir: Path | None = None) -> str | None:
+    """Get OAuth token from Keychain (macOS) or credentials file.
+
+    Lookups are cached in memory, keyed by the credentials file mtime
+    (Keychain entries age out after a few minutes). With ``cache_dir``,
+    where a credentials file lookup came from is also stored on disk,
+    without the token. A token that has expired is never returned.
+
+    Args:
+        cache_dir: Directory for the on-disk token cache
+
+    Returns:
+        Token string or None if not found or expired
+    """
+    now = time.time()
+    cache_file = cache_dir / TOKEN_CACHE_FILENAME if cache_dir else None
+
+    entry = dict(_token_memo) or None
+    if entry is None and cache_file:
+        entry = _load_token_entry(cache_file)
+    if not isinstance(entry, dict) or not _token_entry_valid(entry, now) or _is_expired(entry.get("expires_at"), now):
+        entry = _lookup_token()
+        _token_memo.clear()
+        if entry is None:
+            return None
+        entry["cached_at"] = now
+        if cache_file:
+            _save_token_entry(cache_file, entry)
+    _token_memo.update(entry)
+
+    if _is_expired(entry.get("expires_at"), now):
+        return None
+    return entry.get("token")
+
+
+def forget_token(cache_dir: Path | None = None) -> None:
+    """Drop cached token lookups, so the next get_token() reads the source.
+
+    Args:
+        cache_dir: Directory holding the on-disk token cache
+    """
+    _token_memo.clear()
+    if cache_dir:
+        (cache_dir / TOKEN_CACHE_FILENAME).unlink(missing_ok=True)
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header (delay in seconds or HTTP date).
+
+    Args:
+        value: Header value
 
     Returns:
-        Token string or None if not found
+        Seconds to wait, or None if missing or malformed
     """
+    if not value:
+        return None
     try:
-        if CREDENTIALS_PATH.exists():
-            data = json.loads(CREDENTIALS_PATH.read_text())
-            return data.get("claudeAiOauth", {}).get("accessToken")
-    except (json.JSONDecodeError, OSError):
+        return max(0.0, float(value))
+    except ValueError:
         pass
-    return None
+    try:
+        return max(0.0, (parsedate_to_datetime(value) - datetime.now(UTC)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+def _classify_http_error(error: HTTPError) -> tuple[str, float | None]:
+    """Map an HTTP error to a circuit breaker failure reason.
+
+    Args:
+        error: Error raised by urlopen
+
+    Returns:
+        Tuple of (reason, retry_after seconds or None)
+    """
+    if error.code in (HTTPStatus.UNAUTHORIZED, HTTPStatus.FORBIDDEN):
+        return "auth", None
+    if error.code == HTTPStatus.TOO_MANY_REQUESTS:
+        return "rate_limited", _parse_retry_after(error.headers.get("Retry-After") if error.headers else None)
+    return "server", None
+
+
+def _is_loopback_url(url: str) -> bool:
+    """Check whether a URL points at this machine over HTTP(S)."""
+    parts = urlsplit(url)
+    if parts.scheme not in ("http", "https") or not parts.hostname:
+        return False
+    if parts.hostname == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(parts.hostname).is_loopback
+    except ValueError:
+        return False
+
+
+def _is_allowed_api_url(url: str) -> bool:
+    """Check whether the OAuth token may be sent to a URL.
+
+    Only HTTPS is allowed, except plain HTTP to a loopback host (a local
+    stand-in server).
+    """
+    parts = urlsplit(url)
+    return (parts.scheme == "https" and bool(parts.hostname)) or _is_loopback_url(url)
+
 
+def get_api_url(configured: str | None = None) -> str:
+    """Get the usage API endpoint.
 
-def get_token() -> str | None:
-    """Get OAuth token from Keychain or credentials file.
+    The ``STATUSKIT_USAGE_API_URL`` environment variable takes precedence
+    over the configured URL, so tests and benchmarks can point any
+    statuskit process at a local stand-in server; it may name any HTTPS
+    host, or a loopback one over HTTP. The ``api_url`` setting can come
+    from a project's ``.claude/statuskit.toml``, so opening a cloned repo
+    must not redirect the token: it is only honoured for loopback hosts.
+
+    Args:
+        configured: URL from the ``api_url`` module setting
 
     Returns:
-        Token string or None if not found
+        Endpoint URL
     """
-    return _get_keychain_token() or _get_file_token()
+    env_url = os.environ.get(API_URL_ENV)
+    if env_url and _is_allowed_api_url(env_url):
+        return env_url
+    if configured and _is_loopback_url(configured):
+        return configured
+    return API_URL
 
 
-def fetch_usage_api(token: str) -> UsageData | None:
+def fetch_usage_api(token: str, breaker: CircuitBreaker | None = None, api_url: str | None = None) -> UsageData | None:
     """Fetch usage data from Anthropic API.
 
     Args:
         token: OAuth access token
+        breaker: Circuit breaker to record the outcome in
+        api_url: Configured endpoint (see get_api_url)
 
     Returns:
         UsageData or None on error
     """
     try:
         request = Request(  # noqa: S310
-            API_URL,
+            get_api_url(api_url),
             headers={
                 "Authorization": f"Bearer {token}",
                 "anthropic-beta": "oauth-2025-04-20",
             },
         )
         with urlopen(request, timeout=API_TIMEOUT) as response:  # noqa: S310
-            data = json.loads(response.read())
-            return parse_api_response(data)
-    except (TimeoutError, URLError, json.JSONDecodeError):
-        pass
+            payload = json.loads(response.read())
+    except HTTPError as e:
+        reason, retry_after = _classify_http_error(e)
+    except (TimeoutError, URLError, OSError, http.client.HTTPException):
+        # HTTPException: connection dropped mid-reply (RemoteDisconnected, IncompleteRead)
+        reason, retry_after = "network", None
+    except ValueError:
+        # Invalid JSON or UTF-8
+        reason, retry_after = "malformed", None
+    else:
+        if isinstance(payload, dict):
+            if breaker:
+                breaker.record_success()
+            return parse_api_response(payload)
+        reason, retry_after = "malformed", None
+    if breaker:
+        breaker.record_failure(reason, retry_after=retry_after, token=token)
     return None
 
 
+def _token_id(token: str) -> str:
+    """Identify a token in persisted state without storing it."""
+    return hashlib.sha256(token.encode()).hexdigest()[:16]
+
+
+class CircuitBreaker:
+    """Persisted failure state for the usage API.
+
+    After a failure the breaker stays open for a backoff window, during
+    which no process calls the API, so an outage costs one timeout per
+    window instead of one per refresh:
+
+    - network, server and malformed-reply errors back off exponentially from
+      ``BACKOFF_BASE`` up to ``BACKOFF_MAX`` seconds
+    - 429 responses wait for ``Retry-After`` (capped at
+      ``RETRY_AFTER_MAX``), or back off exponentially without it
+    - auth errors (401/403) block only the rejected token for
+      ``AUTH_BACKOFF``; a new token (after a new login) is tried at once
+    """
+
+    def __init__(self, path: Path):
+        """Initialize breaker.
+
+        Args:
+            path: State file path
+        """
+        self.path = path
+
+    def state(self) -> dict:
+        """Load the persisted state.
+
+        Returns:
+            Dict with reason, failures, open_until (and token_id for auth
+            failures); empty when closed
+        """
+        state = read_json(self.path)
+        return state if isinstance(state, dict) else {}
+
+    def is_open(self, token: str | None = None, now: float | None = None) -> bool:
+        """Check whether API calls should be skipped.
+
+        Args:
+            token: Token about to be sent; auth failures only block the
+                token that was rejected, so without one they never do
+            now: Current Unix time (default: now)
+
+        Returns:
+            True while the backoff window for the last failure lasts
+        """
+        state = self.state()
+        if state.get("reason") == "auth" and (token is None or state.get("token_id") != _token_id(token)):
+            return False
+        return state.get("open_until", 0) > (time.time() if now is None else now)
+
+    def record_failure(self, reason: str, retry_after: float | None = None, token: str | None = None) -> None:
+        """Open the breaker after a failed API call.
+
+        Args:
+            reason: "network", "server", "malformed", "rate_limited", or "auth"
+            retry_after: Server-requested delay in seconds (429 responses)
+            token: Token that was sent (identifies rejected tokens)
+        """
+        state = self.state()
+        failures = state.get("failures", 0) + 1
+        if reason == "auth":
+            delay = AUTH_BACKOFF
+        elif reason == "rate_limited" and retry_after is not None:
+            delay = min(retry_after, RETRY_AFTER_MAX)
+        else:
+            delay = min(BACKOFF_BASE * 2 ** (failures - 1), BACKOFF_MAX)
+        new_state = {"reason": reason, "failures": failures, "open_until": time.time() + delay}
+        if reason == "auth" and token:
+            new_state["token_id"] = _token_id(token)
+        write_json(self.path, new_state)
+
+    def record_success(self) -> None:
+        """Close the breaker after a successful API call."""
+        self.path.unlink(missing_ok=True)
+
+
+class UsageHistory:
+    """Utilization samples of every fetch, in a ring buffer file.
+
+    The file has a fixed size (``HISTORY_CAPACITY`` records of 20 bytes),
+    appends are O(1), and reads memory-map it, so keeping history costs
+    neither disk growth nor render time.
+    """
+
+    def __init__(self, path: Path):
+        """Initialize history.
+
+        Args:
+            path: Ring buffer file path
+        """
+        self.buffer = RingBuffer(path, HISTORY_RECORD, HISTORY_CAPACITY)
+
+    def append(self, data: UsageData) -> bool:
+        """Record the utilization of one fetch.
+
+        Args:
+            data: Fetched usage data
+
+        Returns:
+            True if the sample was written
+        """
+
+        def utilization(limit: UsageLimit | None) -> float:
+            return math.nan if limit is None else limit.utilization
+
+        return self.buffer.append(
+            data.fetched_at.timestamp(),
+            utilization(data.session),
+            utilization(data.weekly),
+            utilization(data.sonnet),
+        )
+
+    def series(self) -> dict[str, list[tuple[float, float]]]:
+        """Get the samples of each limit, oldest first.
+
+        Returns:
+            Dict mapping "session", "weekly", and "sonnet" to lists of
+            (Unix time, utilization), skipping fetches without that limit
+        """
+        result: dict[str, list[tuple[float, float]]] = {"session": [], "weekly": [], "sonnet": []}
+        for timestamp, *values in self.buffer.records():
+            for field, utilization in zip(result, values, strict=True):
+                if not math.isnan(utilization):
+                    result[field].append((timestamp, utilization))
+        return result
+
+
+def burn_rate(series: list[tuple[float, float]], lookback: float) -> float | None:
+    """Calculate how fast utilization is growing from recent samples.
+
+    Only samples since the last reset (a drop in utilization) and within
+    ``lookback`` seconds of the newest one are used.
+
+    Args:
+        series: (Unix time, utilization) samples, oldest first
+        lookback: Seconds of history to consider
+
+    Returns:
+        Percentage points per hour, or None with less than
+        ``MIN_BURN_SPAN`` seconds of usable history
+    """
+    if not series:
+        return None
+    newest_time, newest = series[-1]
+    first_time, first = newest_time, newest
+    for timestamp, utilization in reversed(series[:-1]):
+        if timestamp < newest_time - lookback or utilization > first:
+            break
+        first_time, first = timestamp, utilization
+    span = newest_time - first_time
+    if span < MIN_BURN_SPAN:
+        return None
+    return (newest - first) / (span / 3600)
+
+
 class UsageCache:
     """Cache for usage data with rate limiting."""
 
     def __init__(
         self,
         cache_dir: Path,
-        rate_limit: int = 30,
+        rate_limit: int = MIN_FETCH_INTERVAL,
+        store: CacheStore | None = None,
     ):
         """Initialize cache.
 
         Args:
             cache_dir: Directory for cache files
             rate_limit: Minimum seconds between API fetches
+            store: Shared cache store for the usage data (default: the
+                store of ``cache_dir``)
         """
         self.cache_dir = cache_dir
         self.rate_limit = rate_limit
-        self.cache_file = cache_dir / CACHE_FILENAME
+        self.store = (store or CacheStore.for_dir(cache_dir)).namespace(CACHE_NAMESPACE)
+        self.refresh_marker = cache_dir / REFRESH_MARKER
+        self.refresh_lock = CacheLock(cache_dir / REFRESH_LOCK, max_age=REFRESH_LOCK_MAX_AGE)
+        self.breaker = CircuitBreaker(cache_dir / BREAKER_FILENAME)
+        self.history = UsageHistory(cache_dir / HISTORY_FILENAME)
+
+    def is_stale(self, data: UsageData, ttl: float | None = None) -> bool:
+        """Check whether cached data is old enough to fetch again.
+
+        Args:
+            data: Cached usage data
+            ttl: Cache lifetime in seconds (default: ``rate_limit``)
+
+        Returns:
+            True if at least ``ttl`` seconds passed since the fetch
+        """
+        ttl = self.rate_limit if ttl is None else ttl
+        return (datetime.now(UTC) - data.fetched_at).total_seconds() >= ttl
+
+    def claim_refresh(self) -> bool:
+        """Record a refresh attempt unless one started recently.
+
+        The marker's mtime is the time of the last attempt, so a failing
+        API is retried at most once per ``rate_limit`` seconds. Renders
+        racing past it are serialized by ``refresh_lock`` in the refresh
+        process itself.
+
+        Returns:
+            True if the caller should start a refresh
+        """
+        try:
+            started = self.refresh_marker.stat().st_mtime
+            if datetime.now(UTC).timestamp() - started < self.rate_limit:
+                return False
+        except FileNotFoundError:
+            pass
+        except OSError:
+            return False
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self.refresh_marker.touch()
+        except OSError:
+            return False
+        return True
 
     def load(self) -> UsageData | None:
         """Load cached data.
@@ -244,11 +742,10 @@ class UsageCache:
         Returns:
             UsageData or None if cache doesn't exist or is corrupted
         """
+        data = self.store.get("data")
+        if not isinstance(data, dict):
+            return None
         try:
-            if not self.cache_file.exists():
-                return None
-
-            data = json.loads(self.cache_file.read_text())
             fetched_at = datetime.fromisoformat(data["fetched_at"])
 
             def parse_limit(d: dict | None) -> UsageLimit | None:
@@ -271,55 +768,135 @@ class UsageCache:
                 weekly=parse_limit(data["data"].get("weekly")),
                 sonnet=parse_limit(data["data"].get("sonnet")),
                 fetched_at=fetched_at,
+                rate=data.get("rate"),
             )
-        except (json.JSONDecodeError, KeyError, OSError):
+        except (AttributeError, KeyError, TypeError, ValueError):
             return None
 
     def save(self, data: UsageData) -> None:
-        """Save data to cache atomically.
+        """Save data to cache.
 
-        Uses temp file + rename for atomic writes to prevent
-        race conditions with concurrent reads.
+        The store writes atomically, so concurrent reads never see a
+        partial entry.
 
         Args:
             data: UsageData to cache
         """
-        try:
-            self.cache_dir.mkdir(parents=True, exist_ok=True)
 
-            def serialize_limit(limit: UsageLimit | None) -> dict | None:
-                if limit is None:
-                    return None
-                return {
-                    "utilization": limit.utilization,
-                    "resets_at": limit.resets_at.isoformat() if limit.resets_at else None,
-                }
+        def serialize_limit(limit: UsageLimit | None) -> dict | None:
+            if limit is None:
+                return None
+            return {
+                "utilization": limit.utilization,
+                "resets_at": limit.resets_at.isoformat() if limit.resets_at else None,
+            }
 
-            cache_data = {
+        self.store.set(
+            "data",
+            {
                 "data": {
                     "session": serialize_limit(data.session),
                     "weekly": serialize_limit(data.weekly),
                     "sonnet": serialize_limit(data.sonnet),
                 },
                 "fetched_at": data.fetched_at.isoformat(),
-            }
+                "rate": data.rate,
+            },
+        )
 
-            # Atomic write: temp file + rename
-            with tempfile.NamedTemporaryFile(
-                mode="w",
-                dir=self.cache_dir,
-                suffix=".tmp",
-                delete=False,
-            ) as f:
-                f.write(json.dumps(cache_data))
-                temp_path = Path(f.name)
 
-            try:
-                temp_path.replace(self.cache_file)
-            except OSError:
-                temp_path.unlink(missing_ok=True)
-        except OSError:
-            pass
+def utilization_rate(previous: UsageData | None, current: UsageData) -> float | None:
+    """Calculate how fast session utilization grew between two fetches.
+
+    Args:
+        previous: Data from the earlier fetch
+        current: Data from the later fetch
+
+    Returns:
+        Percentage points per hour, or None if unknown (no earlier data,
+        or the session window reset in between)
+    """
+    if previous is None or previous.session is None or current.session is None:
+        return None
+    hours = (current.fetched_at - previous.fetched_at).total_seconds() / 3600
+    change = current.session.utilization - previous.session.utilization
+    if hours <= 0 or change < 0:
+        return None
+    return change / hours
+
+
+def adaptive_ttl(data: UsageData, min_ttl: float, max_ttl: float, now: datetime | None = None) -> float:
+    """Choose how long usage data stays fresh from how it is changing.
+
+    Flat usage far from the limits is refreshed every ``max_ttl`` seconds.
+    The TTL shrinks as utilization grows faster, drops to ``min_ttl`` near
+    a limit, and never runs past the next reset, so the display catches
+    up soon after a window rolls over.
+
+    Args:
+        data: Cached usage data
+        min_ttl: Shortest TTL in seconds
+        max_ttl: Longest TTL in seconds
+        now: Current time (default: now)
+
+    Returns:
+        TTL in seconds, between ``min_ttl`` and ``max_ttl``
+    """
+    now = now or datetime.now(UTC)
+    limits = [limit for limit in (data.session, data.weekly, data.sonnet) if limit is not None]
+
+    if any(limit.utilization >= NEAR_LIMIT_PERCENT for limit in limits):
+        return min_ttl
+
+    # A rate of 1%/hour halves the TTL, 10%/hour takes it to about a tenth
+    ttl = max_ttl / (1 + data.rate) if data.rate else max_ttl
+
+    for limit in limits:
+        if limit.resets_at is not None:
+            resets_at = limit.resets_at if limit.resets_at.tzinfo else limit.resets_at.replace(tzinfo=UTC)
+            elapsed = (now - data.fetched_at).total_seconds()
+            ttl = min(ttl, elapsed + (resets_at - now).total_seconds())
+
+    return max(min_ttl, min(ttl, max_ttl))
+
+
+def refresh_usage(cache_dir: Path, api_url: str | None = None) -> bool:
+    """Fetch usage data from the API and store it in the cache.
+
+    Runs in the detached ``statuskit refresh-usage`` process started by
+    UsageLimitsModule, so the API round trip never delays a render. The
+    cache's refresh lock makes it single-flight across sessions: while one
+    process fetches, others return without calling the API. While the
+    circuit breaker is open after a failure, the API is not called at all.
+
+    Args:
+        cache_dir: Directory holding the usage cache
+        api_url: Configured endpoint (see get_api_url)
+
+    Returns:
+        True if the cache holds fresh data afterwards
+    """
+    cache = UsageCache(cache_dir=cache_dir)
+    with cache.refresh_lock as acquired:
+        if not acquired:
+            return False
+        # Another process may have finished a fetch while we were starting
+        cached = cache.load()
+        if cached and not cache.is_stale(cached):
+            return True
+        token = get_token(cache_dir)
+        if not token or cache.breaker.is_open(token):
+            return False
+        data = fetch_usage_api(token, cache.breaker, api_url)
+        if data is None:
+            if cache.breaker.state().get("reason") == "auth":
+                # The token may have been renewed without a new credentials mtime
+                forget_token(cache_dir)
+            return False
+        data.rate = utilization_rate(cached, data)
+        cache.save(data)
+        cache.history.append(data)
+        return True
 
 
 # Window sizes in hours
@@ -346,15 +923,23 @@ class UsageLimitsModule(BaseModule):
         self.session_time_format = config.get("session_time_format", "remaining")
         self.weekly_time_format = config.get("weekly_time_format", "reset_at")
         self.sonnet_time_format = config.get("sonnet_time_format", "reset_at")
+        self.cache_ttl = config.get("cache_ttl", 60)
+        self.adaptive_ttl = config.get("adaptive_ttl", False)
+        self.max_cache_ttl = config.get("max_cache_ttl", 300)
+        self.api_url = config.get("api_url")
+        self.show_burn_rate = config.get("show_burn_rate", False)
+        self.burn_rate_window = config.get("burn_rate_window", 60)  # minutes
 
         # Initialize cache if cache_dir available
         self.cache = None
         if ctx.cache_dir:
-            self.cache = UsageCache(cache_dir=ctx.cache_dir)
+            self.cache = UsageCache(cache_dir=ctx.cache_dir, store=ctx.store)
 
     def render(self) -> str | None:
         """Render usage limits display."""
         data = self._get_usage_data()
+        if data and self.show_burn_rate and self.cache:
+            self._add_burn_rates(data, self.cache.history)
 
         parts: list[str] = []
 
@@ -372,48 +957,68 @@ class UsageLimitsModule(BaseModule):
         return "\n".join(parts) if parts else None
 
     def _get_usage_data(self) -> UsageData | None:
-        """Get usage data using refresh-first pattern.
+        """Get usage data using stale-while-revalidate.
 
         Logic:
-        1. Load existing cache (for fallback)
-        2. If can fetch: try API, save result, return data
-        3. Otherwise: return cached data
+        1. Load cached data and return it as is
+        2. If it is missing or older than the cache TTL, start a
+           detached ``statuskit refresh-usage`` that updates the cache
+           for the next render
         """
         self._debug_messages: list[str] = []
 
-        # Load cache for potential fallback
-        cached = self.cache.load() if self.cache else None
+        if not self.cache:
+            self._debug_messages.append("No cache directory")
+            return None
 
-        # Check if we can fetch
-        token = get_token()
-        if not token:
-            self._debug_messages.append("No token, using cache")
+        cached = self.cache.load()
+        if cached and not self.cache.is_stale(cached, self._ttl(cached)):
             return cached
 
-        # Check rate limit using cached data (avoids second file read)
-        if cached and self.cache:
-            age = (datetime.now(UTC) - cached.fetched_at).total_seconds()
-            if age < self.cache.rate_limit:
-                self._debug_messages.append("Rate limited, using cache")
-                return cached
-
-        # Try to fetch fresh data
-        new_data = fetch_usage_api(token)
-
-        if not new_data:
-            self._debug_messages.append("API failed, using cache")
-
-        # Determine what to save and return
-        data = new_data if new_data else cached
-
-        # Save (updates fetched_at even on failure)
-        if self.cache and data:
-            self.cache.save(data)
+        if self.cache.breaker.is_open():
+            self._debug_messages.append(f"API backing off ({self.cache.breaker.state().get('reason')}), using cache")
+        elif self.cache.refresh_lock.is_locked() or not self.cache.claim_refresh():
+            self._debug_messages.append("Refresh in progress, using cache")
+        elif spawn_statuskit(*self._refresh_args(self.cache.cache_dir)):
+            self._debug_messages.append("Refreshing in background, using cache")
+        else:
+            self._debug_messages.append("Failed to start refresh, using cache")
 
-        if not data:
+        if not cached:
             self._debug_messages.append("No data available")
 
-        return data
+        return cached
+
+    def warm(self) -> None:
+        """Fetch usage data in this process if the cached data is stale."""
+        if not self.cache:
+            return
+        cached = self.cache.load()
+        if cached and not self.cache.is_stale(cached, self._ttl(cached)):
+            return
+        if not self.cache.breaker.is_open():
+            refresh_usage(self.cache.cache_dir, api_url=self.api_url)
+
+    def _add_burn_rates(self, data: UsageData, history: UsageHistory) -> None:
+        """Set each limit's burn rate from the usage history."""
+        lookback = self.burn_rate_window * 60
+        for field, series in history.series().items():
+            limit = getattr(data, field)
+            if limit is not None:
+                limit.burn_rate = burn_rate(series, lookback)
+
+    def _refresh_args(self, cache_dir: Path) -> list[str]:
+        """Build the command line of the background refresh."""
+        args = ["refresh-usage", "--cache-dir", str(cache_dir)]
+        if self.api_url:
+            args += ["--api-url", self.api_url]
+        return args
+
+    def _ttl(self, data: UsageData) -> float:
+        """Get the cache lifetime for data, fixed or adaptive."""
+        if self.adaptive_ttl:
+            return adaptive_ttl(data, MIN_FETCH_INTERVAL, self.max_cache_ttl)
+        return self.cache_ttl
 
     def _render_multiline(self, data: UsageData) -> str:
         """Render multiline format."""
@@ -475,6 +1080,7 @@ class UsageLimitsModule(BaseModule):
             bar_width: Width for progress bar
         """
         # Calculate color and time based on resets_at availability
+        remaining = None
         if limit.resets_at is None:
             # No reset time: dim color, placeholder for time
             color = None  # Will use attrs=["dark"]
@@ -506,7 +1112,27 @@ class UsageLimitsModule(BaseModule):
         if self.show_progress_bar:
             bar = f" {format_progress_bar(limit.utilization, bar_width)}"
 
-        return f"{label_str}{bar} {util_str}{time_str}"
+        return f"{label_str}{bar} {util_str}{time_str}{self._format_burn(limit, remaining)}"
+
+    def _format_burn(self, limit: UsageLimit, remaining: float | None) -> str:
+        """Format burn rate and, if it comes before the reset, time to the limit.
+
+        Args:
+            limit: Usage limit with burn_rate set
+            remaining: Hours until reset, or None if unknown
+
+        Returns:
+            Formatted string: " ↗4.2%/h", " ↗12%/h limit in 1h 30m", or ""
+        """
+        rate = limit.burn_rate
+        if not self.show_burn_rate or rate is None or rate < BURN_RATE_MIN:
+            return ""
+        rate_str = f"{rate:.1f}" if rate < 10 else f"{rate:.0f}"  # noqa: PLR2004
+        result = colored(f" ↗{rate_str}%/h", attrs=["dark"])
+        to_limit = max(0.0, 100 - limit.utilization) / rate
+        if remaining is None or to_limit < remaining:
+            result += colored(f" limit in {format_remaining_time(to_limit)}", "red")
+        return result
 
     def _format_line(self, label: str, limit: UsageLimit, window: float, time_fmt: str) -> str:
         """Format a single line for multiline output."""
@@ -1,11 +1,20 @@
 """Setup command implementations."""
 
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Protocol
 
 from .config import create_config
 from .gitignore import ensure_local_files_ignored
-from .hooks import create_backup, is_our_hook, read_settings, write_settings
+from .hooks import (
+    create_backup,
+    has_warm_hooks,
+    install_warm_hooks,
+    is_our_hook,
+    read_settings,
+    remove_warm_hooks,
+    write_settings,
+)
 from .paths import Scope, get_config_path, get_settings_path
 
 
@@ -32,6 +41,7 @@ class InstallResult:
     gitignore_updated: bool = False
     higher_scope_installed: bool = False
     higher_scope: Scope | None = None
+    warm_hooks_installed: bool = False
     message: str = ""
 
 
@@ -58,17 +68,44 @@ def _check_higher_scope_installation(scope: Scope) -> Scope | None:
     return None
 
 
-def install_hook(scope: Scope, force: bool, ui: UI | None) -> InstallResult:
+def _add_warm_hooks(settings_path: Path) -> bool:
+    """Add cache warming hooks to a settings file.
+
+    Returns True if the file was changed.
+    Raises ValueError if the file or its hooks section is invalid.
+    """
+    settings = read_settings(settings_path)
+    if not install_warm_hooks(settings):
+        return False
+    write_settings(settings_path, settings)
+    return True
+
+
+def install_hook(scope: Scope, force: bool, ui: UI | None, warm_hooks: bool = False) -> InstallResult:
     """Install statuskit hook to settings.json.
 
     Args:
         scope: Installation scope (user/project/local)
         force: Skip confirmations, create backup
         ui: User interaction handler (None for non-interactive)
+        warm_hooks: Also add hooks running `statuskit warm` to the same
+            settings file, even if the statusline is installed at a
+            higher scope
 
     Returns:
         InstallResult with operation details
     """
+    result = _install_statusline(scope, force, ui)
+    if warm_hooks and result.success:
+        try:
+            result.warm_hooks_installed = _add_warm_hooks(get_settings_path(scope))
+        except ValueError as e:
+            return InstallResult(success=False, message=str(e))
+    return result
+
+
+def _install_statusline(scope: Scope, force: bool, ui: UI | None) -> InstallResult:
+    """Install the statusLine entry and config file; see install_hook."""
     settings_path = get_settings_path(scope)
     config_path = get_config_path(scope)
 
@@ -149,12 +186,15 @@ class RemoveResult:
 
     success: bool = False
     not_installed: bool = False
+    warm_hooks_removed: bool = False
     message: str = ""
 
 
 def remove_hook(scope: Scope, force: bool, ui: UI | None) -> RemoveResult:
     """Remove statuskit hook from settings.json.
 
+    Cache warming hooks are removed along with it.
+
     Args:
         scope: Installation scope to remove from
         force: Skip confirmation for foreign hooks
@@ -175,9 +215,13 @@ def remove_hook(scope: Scope, force: bool, ui: UI | None) -> RemoveResult:
 
     # Check if anything to remove
     if not current_hook.get("command"):
+        warm_hooks_removed = remove_warm_hooks(settings)
+        if warm_hooks_removed:
+            write_settings(settings_path, settings)
         return RemoveResult(
             success=True,
             not_installed=True,
+            warm_hooks_removed=warm_hooks_removed,
             message="Not installed",
         )
 
@@ -197,9 +241,10 @@ def remove_hook(scope: Scope, force: bool, ui: UI | None) -> RemoveResult:
 
     # Remove hook
     del settings["statusLine"]
+    warm_hooks_removed = remove_warm_hooks(settings)
     write_settings(settings_path, settings)
 
-    return RemoveResult(success=True, message="Removed successfully")
+    return RemoveResult(success=True, warm_hooks_removed=warm_hooks_removed, message="Removed successfully")
 
 
 def check_installation() -> str:
@@ -214,6 +259,8 @@ def check_installation() -> str:
         hook = settings.get("statusLine", {})
 
         status = "\u2713 Installed" if is_our_hook(hook) else "\u2717 Not installed"
+        if has_warm_hooks(settings):
+            status += " (+ warm hooks)"
 
         # Capitalize scope name
         scope_name = scope.value.capitalize()
@@ -22,6 +22,9 @@ DEFAULT_CONFIG = """\
 # Cache directory
 # cache_dir = "~/.cache/statuskit"
 
+# Every module section accepts budget_ms (default 1000): a module that
+# fails or renders slower than this 3 times in a row is paused for a while
+
 # ─────────────────────────────────────────────────────────────
 # Model module: model name, session duration, context usage
 # ─────────────────────────────────────────────────────────────
@@ -33,6 +36,8 @@ DEFAULT_CONFIG = """\
 # context_compact = false
 # context_threshold_green = 50
 # context_threshold_yellow = 25
+# show_context_rate = false  # context growth and time to auto-compaction
+# compaction_threshold = 80  # % of context used when auto-compaction starts
 
 # ─────────────────────────────────────────────────────────────
 # Git module: branch, status, location
@@ -44,9 +49,26 @@ DEFAULT_CONFIG = """\
 # show_folder = true
 # show_branch = true
 # show_remote_status = true
+# show_default_branch = false
 # show_changes = true
 # show_commit = true
+# show_operation = false
+# show_stash = false
+# show_worktrees = false
+# worktrees_workers = 4
+# worktrees_ttl = 30
 # commit_age_format = "relative"  # "relative", "compact"
+# untracked_files = "normal"  # "no", "normal", "all" (default: git config)
+# untracked_cache = false
+# fsmonitor = false
+# untracked_interval = 0  # seconds between untracked counts, 0 = every refresh
+# max_changes = 9999  # stop counting above this, 0 = unlimited
+# submodules = "dirty"  # "ignore", "dirty", "full" (default: git config)
+# submodules_workers = 4
+# submodules_ttl = 30
+# ahead_behind_limit = 999  # 0 = unlimited
+# watch = false  # background watcher, reuse status until files change
+# watch_max_watches = 8192
 
 # ─────────────────────────────────────────────────────────────
 # Usage limits module: API quota tracking (5h session, 7d weekly)
@@ -64,6 +86,55 @@ DEFAULT_CONFIG = """\
 # weekly_time_format = "reset_at"    # "remaining", "reset_at"
 # sonnet_time_format = "reset_at"    # "remaining", "reset_at"
 # cache_ttl = 60
+# adaptive_ttl = false  # vary cache_ttl with how fast usage changes
+# max_cache_ttl = 300   # longest TTL in adaptive mode
+# show_burn_rate = false
+# burn_rate_window = 60  # minutes of history for the burn rate
+
+# ─────────────────────────────────────────────────────────────
+# Transcript module: turns, tool calls, tokens of the session
+# ─────────────────────────────────────────────────────────────
+
+# [transcript]
+# show_turns = true
+# show_tools = true
+# top_tools = 3  # most used tools listed, 0 to hide
+# show_tokens = true
+
+# ─────────────────────────────────────────────────────────────
+# Cost module: spend across sessions
+# ─────────────────────────────────────────────────────────────
+
+# [cost]
+# show_today = true
+# show_week = true
+# show_project = false  # today's spend in this project
+
+# ─────────────────────────────────────────────────────────────
+# Beads module: task in progress, ready tasks
+# ─────────────────────────────────────────────────────────────
+
+# [beads]
+# show_id = true
+# show_ready = true
+# max_title_length = 40  # 0 for no limit
+
+# ─────────────────────────────────────────────────────────────
+# Command module: output of your own shell commands
+# ─────────────────────────────────────────────────────────────
+
+# [command]
+# timeout = 1.0  # seconds, default for each command
+# ttl = 30  # seconds an output is reused, default for each command
+# workers = 4  # commands run at the same time
+# separator = " | "
+#
+# [[command.commands]]
+# name = "kube"
+# run = "kubectl config current-context"
+# prefix = "⎈ "
+# color = "cyan"
+# ttl = 60
 """
 
 
@@ -58,3 +58,96 @@ def create_backup(path: Path) -> Path:
     backup_path = path.with_suffix(path.suffix + ".bak")
     shutil.copy2(path, backup_path)
     return backup_path
+
+
+WARM_COMMAND = "statuskit warm"
+# Tools whose runs can change files or git state shown in the statusline
+WARM_TOOLS_MATCHER = "Edit|MultiEdit|Write|NotebookEdit|Bash"
+# Hook events that run `statuskit warm`, with their tool matcher
+WARM_EVENTS = {
+    "SessionStart": None,
+    "PostToolUse": WARM_TOOLS_MATCHER,
+    "Stop": None,
+}
+
+
+def is_warm_hook(hook: dict) -> bool:
+    """Check if the hook runs `statuskit warm`."""
+    if not isinstance(hook, dict) or not is_our_hook(hook):
+        return False
+    return shlex.split(hook["command"])[1:2] == ["warm"]
+
+
+def _event_groups(settings: dict, event: str) -> list:
+    hooks = settings.get("hooks")
+    groups = hooks.get(event) if isinstance(hooks, dict) else None
+    return groups if isinstance(groups, list) else []
+
+
+def _has_warm_hook(groups: list) -> bool:
+    return any(is_warm_hook(hook) for group in groups if isinstance(group, dict) for hook in group.get("hooks") or [])
+
+
+def has_warm_hooks(settings: dict) -> bool:
+    """Check if settings run `statuskit warm` on every event in WARM_EVENTS."""
+    return all(_has_warm_hook(_event_groups(settings, event)) for event in WARM_EVENTS)
+
+
+def install_warm_hooks(settings: dict) -> bool:
+    """Add `statuskit warm` hooks for the events in WARM_EVENTS.
+
+    Events that already run it are left alone, as are other hooks.
+
+    Returns True if settings were changed.
+    Raises ValueError if the hooks section is not a JSON object.
+    """
+    hooks = settings.setdefault("hooks", {})
+    if not isinstance(hooks, dict):
+        msg = "Invalid hooks section in settings: expected an object"
+        raise ValueError(msg)
+
+    changed = False
+    for event, matcher in WARM_EVENTS.items():
+        groups = hooks.setdefault(event, [])
+        if not isinstance(groups, list) or _has_warm_hook(groups):
+            continue
+        group: dict = {"hooks": [{"type": "command", "command": WARM_COMMAND}]}
+        if matcher:
+            group = {"matcher": matcher, **group}
+        groups.append(group)
+        changed = True
+    return changed
+
+
+def remove_warm_hooks(settings: dict) -> bool:
+    """Remove `statuskit warm` hooks from all events.
+
+    Groups and events left empty are removed, and so is an empty hooks
+    section.
+
+    Returns True if settings were changed.
+    """
+    hooks = settings.get("hooks")
+    if not isinstance(hooks, dict):
+        return False
+
+    changed = False
+    for event in list(hooks):
+        groups = hooks[event]
+        if not isinstance(groups, list) or not _has_warm_hook(groups):
+            continue
+        kept = []
+        for group in groups:
+            if isinstance(group, dict) and isinstance(group.get("hooks"), list):
+                group["hooks"] = [hook for hook in group["hooks"] if not is_warm_hook(hook)]
+                if not group["hooks"]:
+                    continue
+            kept.append(group)
+        if kept:
+            hooks[event] = kept
+        else:
+            del hooks[event]
+        changed = True
+    if changed and not hooks:
+        del settings["hooks"]
+    return changed
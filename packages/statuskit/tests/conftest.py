@@ -7,6 +7,7 @@ Keep this file lean - only pytest-specific code.
 from pathlib import Path
 
 import pytest
+from benchmarks.fakes import FakeUsageApi
 from statuskit.core.models import RenderContext, StatusInput
 
 from .factories import (
@@ -33,6 +34,7 @@ def full_input_data() -> dict:
     return make_input_data(
         session_id="abc123",
         cwd="/home/user",
+        transcript_path="/home/user/.claude/projects/-home-user/abc123.jsonl",
         model=make_model_data(display_name="Opus", model_id="claude-opus-4-1"),
         workspace={"current_dir": "/home/user", "project_dir": "/home/user/project"},
         cost=make_cost_data(
@@ -93,3 +95,11 @@ def make_render_context(make_status_input):
         return RenderContext(debug=debug, data=make_status_input(data), cache_dir=cache_dir)
 
     return _make
+
+
+@pytest.fixture
+def fake_usage_api(monkeypatch):
+    """Local usage API stand-in; statuskit processes started by the test use it."""
+    with FakeUsageApi() as api:
+        monkeypatch.setenv("STATUSKIT_USAGE_API_URL", api.url)
+        yield api
@@ -0,0 +1,40 @@
+"""Test data factories for beads module."""
+
+import json
+from pathlib import Path
+
+
+def make_issue(
+    issue_id: str,
+    *,
+    title: str = "Task",
+    status: str = "open",
+    priority: int = 2,
+    parent: str | None = None,
+    blocked_by: tuple[str, ...] = (),
+) -> dict:
+    """Create a beads issue as exported to issues.jsonl.
+
+    Args:
+        issue_id: Issue id (e.g. "bd-1")
+        title: Issue title
+        status: open, in_progress, blocked or closed
+        priority: 0 (highest) to 4
+        parent: Parent issue id (parent-child dependency)
+        blocked_by: Ids of issues blocking this one
+    """
+    dependencies = [{"issue_id": issue_id, "depends_on_id": b, "type": "blocks"} for b in blocked_by]
+    if parent:
+        dependencies.append({"issue_id": issue_id, "depends_on_id": parent, "type": "parent-child"})
+    issue = {"id": issue_id, "title": title, "status": status, "priority": priority, "issue_type": "task"}
+    if dependencies:
+        issue["dependencies"] = dependencies
+    return issue
+
+
+def write_issues(project: Path, *issues: dict) -> Path:
+    """Write issues to ``project/.beads/issues.jsonl`` and return its path."""
+    path = project / ".beads" / "issues.jsonl"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("".join(json.dumps(issue) + "\n" for issue in issues))
+    return path
@@ -63,7 +63,9 @@ def make_input_data(
     context_window: dict | None = None,
     session_id: str | None = None,
     cwd: str | None = None,
+    *,
     workspace: dict | None = None,
+    transcript_path: str | None = None,
 ) -> dict:
     """Create full input data dict."""
     data = {}
@@ -79,4 +81,6 @@ def make_input_data(
         data["cwd"] = cwd
     if workspace is not None:
         data["workspace"] = workspace
+    if transcript_path is not None:
+        data["transcript_path"] = transcript_path
     return data
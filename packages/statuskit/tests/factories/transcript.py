@@ -0,0 +1,62 @@
+"""Test data factories for transcript module."""
+
+import json
+from pathlib import Path
+
+
+def make_prompt_entry(text: str = "hello") -> dict:
+    """Create a user prompt transcript entry."""
+    return {"type": "user", "message": {"role": "user", "content": text}}
+
+
+def make_tool_result_entry(tool_use_id: str = "toolu_1") -> dict:
+    """Create a tool result transcript entry (stored as a user message)."""
+    return {
+        "type": "user",
+        "message": {
+            "role": "user",
+            "content": [{"type": "tool_result", "tool_use_id": tool_use_id, "content": "ok"}],
+        },
+    }
+
+
+def make_assistant_entry(
+    message_id: str = "msg_1",
+    *,
+    tools: tuple[str, ...] = (),
+    input_tokens: int = 10,
+    output_tokens: int = 100,
+    cache_creation: int = 0,
+    cache_read: int = 0,
+) -> dict:
+    """Create an assistant transcript entry.
+
+    Args:
+        message_id: API message id (shared by entries of one message)
+        tools: Names of tools called in this entry
+        input_tokens: Usage input tokens
+        output_tokens: Usage output tokens
+        cache_creation: Usage cache creation tokens
+        cache_read: Usage cache read tokens
+    """
+    content = [{"type": "tool_use", "id": f"toolu_{name}", "name": name, "input": {}} for name in tools]
+    return {
+        "type": "assistant",
+        "message": {
+            "id": message_id,
+            "role": "assistant",
+            "content": content or [{"type": "text", "text": "done"}],
+            "usage": {
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+                "cache_creation_input_tokens": cache_creation,
+                "cache_read_input_tokens": cache_read,
+            },
+        },
+    }
+
+
+def append_entries(path: Path, *entries: dict) -> None:
+    """Append entries to a transcript JSONL file."""
+    with path.open("a") as f:
+        f.writelines(json.dumps(entry) + "\n" for entry in entries)
@@ -0,0 +1,226 @@
+"""Tests for statuskit.modules.beads."""
+
+import os
+from unittest.mock import patch
+
+from statuskit.core.store import CacheStore
+from statuskit.modules.beads import BeadsIndex, BeadsModule, build_index, find_beads_data
+
+from .factories import make_input_data
+from .factories.beads import make_issue, write_issues
+
+
+class TestFindBeadsData:
+    """Tests for find_beads_data."""
+
+    def test_in_parent(self, tmp_path):
+        """The .beads directory is found from a subdirectory."""
+        path = write_issues(tmp_path, make_issue("bd-1"))
+        (tmp_path / "src" / "pkg").mkdir(parents=True)
+
+        assert find_beads_data(tmp_path / "src" / "pkg") == path
+
+    def test_legacy_file_name(self, tmp_path):
+        """The older beads.jsonl name is also read."""
+        path = tmp_path / ".beads" / "beads.jsonl"
+        path.parent.mkdir()
+        path.write_text("")
+
+        assert find_beads_data(tmp_path) == path
+
+    def test_not_found(self, tmp_path):
+        """Directories outside beads projects have no data."""
+        assert find_beads_data(tmp_path) is None
+
+
+class TestBuildIndex:
+    """Tests for build_index."""
+
+    def test_in_progress_leaves(self, tmp_path):
+        """Epics with open subtasks are not shown as in progress."""
+        path = write_issues(
+            tmp_path,
+            make_issue("bd-1", title="Epic", status="in_progress"),
+            make_issue("bd-2", title="Subtask", status="in_progress", parent="bd-1"),
+        )
+
+        index = build_index(path)
+
+        assert [task["id"] for task in index["in_progress"]] == ["bd-2"]
+
+    def test_epic_with_closed_children_is_leaf(self, tmp_path):
+        """An epic whose subtasks are all closed is a task again."""
+        path = write_issues(
+            tmp_path,
+            make_issue("bd-1", title="Epic", status="in_progress"),
+            make_issue("bd-2", status="closed", parent="bd-1"),
+        )
+
+        assert [task["id"] for task in build_index(path)["in_progress"]] == ["bd-1"]
+
+    def test_in_progress_by_priority(self, tmp_path):
+        """The most important task comes first."""
+        path = write_issues(
+            tmp_path,
+            make_issue("bd-1", status="in_progress", priority=3),
+            make_issue("bd-2", status="in_progress", priority=1),
+        )
+
+        assert [task["id"] for task in build_index(path)["in_progress"]] == ["bd-2", "bd-1"]
+
+    def test_null_priority_sorted_as_default(self, tmp_path):
+        """An issue with a null priority sorts as medium priority instead of failing."""
+        unset = make_issue("bd-2", status="in_progress")
+        unset["priority"] = None
+        path = write_issues(
+            tmp_path,
+            make_issue("bd-1", status="in_progress", priority=3),
+            unset,
+            make_issue("bd-3", status="in_progress", priority=1),
+        )
+
+        assert [task["id"] for task in build_index(path)["in_progress"]] == ["bd-3", "bd-2", "bd-1"]
+
+    def test_ready_excludes_blocked(self, tmp_path):
+        """Tasks with an open blocker are not ready."""
+        path = write_issues(
+            tmp_path,
+            make_issue("bd-1"),
+            make_issue("bd-2", blocked_by=("bd-1",)),
+            make_issue("bd-3", blocked_by=("bd-4",)),
+            make_issue("bd-4", status="closed"),
+        )
+
+        index = build_index(path)
+
+        assert index["ready"] == 2  # bd-1 and bd-3
+        assert index["open"] == 3
+
+    def test_malformed_lines_skipped(self, tmp_path):
+        """Invalid lines are ignored."""
+        path = write_issues(tmp_path, make_issue("bd-1"))
+        with path.open("a") as f:
+            f.write("{not json\n")
+
+        assert build_index(path)["open"] == 1
+
+
+class TestBeadsIndex:
+    """Tests for BeadsIndex."""
+
+    def test_unchanged_data_not_parsed(self, tmp_path):
+        """While the data file is unchanged the cached index is used."""
+        path = write_issues(tmp_path / "project", make_issue("bd-1"))
+        BeadsIndex(CacheStore.for_dir(tmp_path / "cache"), path).get()
+
+        with patch("statuskit.modules.beads.build_index") as mock_build:
+            index = BeadsIndex(CacheStore.for_dir(tmp_path / "cache"), path).get()
+
+        mock_build.assert_not_called()
+        assert index is not None
+        assert index["ready"] == 1
+
+    def test_changed_data_rebuilt(self, tmp_path):
+        """A new mtime or size rebuilds the index."""
+        project = tmp_path / "project"
+        path = write_issues(project, make_issue("bd-1"))
+        BeadsIndex(CacheStore.for_dir(tmp_path / "cache"), path).get()
+
+        write_issues(project, make_issue("bd-1"), make_issue("bd-2"))
+        index = BeadsIndex(CacheStore.for_dir(tmp_path / "cache"), path).get()
+
+        assert index is not None
+        assert index["ready"] == 2
+
+    def test_same_size_rewrite_rebuilt(self, tmp_path):
+        """A rewrite with the same size is caught by the mtime."""
+        project = tmp_path / "project"
+        path = write_issues(project, make_issue("bd-1", status="open"))
+        BeadsIndex(CacheStore.for_dir(tmp_path / "cache"), path).get()
+
+        write_issues(project, make_issue("bd-1", status="done"))
+        os.utime(path, ns=(1, 1))
+        index = BeadsIndex(CacheStore.for_dir(tmp_path / "cache"), path).get()
+
+        assert index is not None
+        assert index["open"] == 1  # "done" is not a closed status
+        assert index["ready"] == 0
+
+    def test_missing_data(self, tmp_path):
+        """A missing data file gives no index."""
+        assert BeadsIndex(CacheStore.for_dir(tmp_path), tmp_path / "missing.jsonl").get() is None
+
+
+class TestBeadsModule:
+    """Tests for BeadsModule."""
+
+    def _render(self, make_render_context, project, cache_dir, config=None):
+        ctx = make_render_context(make_input_data(cwd=str(project)), cache_dir=cache_dir)
+        return BeadsModule(ctx, config or {}).render()
+
+    def test_render(self, make_render_context, tmp_path):
+        """Task in progress, other tasks in progress and ready count are shown."""
+        write_issues(
+            tmp_path,
+            make_issue("bd-1", title="Fix login redirect", status="in_progress", priority=0),
+            make_issue("bd-2", title="Other", status="in_progress"),
+            make_issue("bd-3"),
+        )
+
+        result = self._render(make_render_context, tmp_path, tmp_path / "cache")
+
+        assert result is not None
+        assert "bd-1" in result
+        assert "Fix login redirect" in result
+        assert "(+1)" in result
+        assert "1 ready" in result
+
+    def test_render_options(self, make_render_context, tmp_path):
+        """Id and ready count can be hidden, long titles are truncated."""
+        write_issues(
+            tmp_path, make_issue("bd-1", title="A very long task title", status="in_progress"), make_issue("bd-2")
+        )
+
+        result = self._render(
+            make_render_context,
+            tmp_path,
+            tmp_path / "cache",
+            {"show_id": False, "show_ready": False, "max_title_length": 10},
+        )
+
+        assert result is not None
+        assert "bd-1" not in result
+        assert "A very lo…" in result
+        assert "ready" not in result
+
+    def test_no_beads_project(self, make_render_context, tmp_path):
+        """Outside a beads project nothing is shown."""
+        assert self._render(make_render_context, tmp_path, tmp_path / "cache") is None
+
+    def test_nothing_open(self, make_render_context, tmp_path):
+        """A project with no open work shows nothing."""
+        write_issues(tmp_path, make_issue("bd-1", status="closed"))
+
+        assert self._render(make_render_context, tmp_path, tmp_path / "cache") is None
+
+    def test_without_cache_dir(self, make_render_context, tmp_path):
+        """Without a cache directory the data is parsed directly."""
+        write_issues(tmp_path, make_issue("bd-1", title="Task", status="in_progress"))
+
+        result = self._render(make_render_context, tmp_path, None)
+
+        assert result is not None
+        assert "bd-1" in result
+
+    def test_project_dir_preferred(self, make_render_context, tmp_path):
+        """The workspace project directory is searched, not cwd."""
+        write_issues(tmp_path / "project", make_issue("bd-1", title="Task", status="in_progress"))
+        data = make_input_data(
+            cwd=str(tmp_path),
+            workspace={"current_dir": str(tmp_path), "project_dir": str(tmp_path / "project")},
+        )
+
+        result = BeadsModule(make_render_context(data, cache_dir=tmp_path / "cache"), {}).render()
+
+        assert result is not None
+        assert "bd-1" in result
@@ -0,0 +1,64 @@
+"""Tests for the GitModule benchmark harness."""
+
+import json
+
+import pytest
+from benchmarks.fakes import Reply
+from benchmarks.fixtures import Scenario, build_diverged, build_tracked, ensure_fixture, git
+from benchmarks.git_module import HELPERS, run_scenario
+from benchmarks.usage_limits import run_scenario as run_usage_scenario
+
+
+@pytest.mark.integration
+class TestBenchmarkHarness:
+    """Smoke tests with tiny fixtures."""
+
+    def test_tracked_fixture(self, tmp_path):
+        """Tracked fixtures contain the requested number of clean files."""
+        repo = tmp_path / "repo"
+
+        build_tracked(repo, 250)
+
+        assert len(git(repo, "ls-files").splitlines()) == 250
+        assert git(repo, "status", "--porcelain") == ""
+
+    def test_diverged_fixture(self, tmp_path):
+        """Diverged fixtures have an upstream ahead and behind."""
+        repo = tmp_path / "repo"
+
+        build_diverged(repo, 10, shared=3, diverged=4)
+
+        assert git(repo, "rev-list", "--left-right", "--count", "HEAD...@{upstream}") == "4\t4"
+        assert git(repo, "rev-parse", "--abbrev-ref", "origin/HEAD") == "origin/main"
+
+    def test_fixture_reused(self, tmp_path):
+        """A completed fixture is not rebuilt."""
+        builds = []
+        scenario = Scenario("tiny", "tiny", lambda repo: builds.append(build_tracked(repo, 5)), {})
+
+        first = ensure_fixture(scenario, tmp_path)
+        second = ensure_fixture(scenario, tmp_path)
+
+        assert first == second
+        assert len(builds) == 1
+
+    def test_run_scenario_reports_json(self, tmp_path):
+        """Results cover render and every helper, cold and warm, and serialize to JSON."""
+        scenario = Scenario("tiny", "tiny", lambda repo: build_tracked(repo, 20), {"show_worktrees": True})
+        repo = ensure_fixture(scenario, tmp_path)
+
+        results = run_scenario(scenario, repo, repeat=1)
+
+        assert set(results["helpers"]) == set(HELPERS)
+        for timings in [results["render"], *results["helpers"].values()]:
+            assert timings["cold"]["runs"] == 1
+            assert timings["warm"]["min_ms"] >= 0
+        json.dumps(results)
+
+    def test_usage_scenario_single_flight(self):
+        """Concurrent refreshes make one API request, then none while fresh."""
+        results = run_usage_scenario(Reply(), repeat=1, sessions=3)
+
+        assert [wave["api_requests"] for wave in results["waves"]] == [1, 0]
+        assert results["render"]["runs"] == 1
+        json.dumps(results)
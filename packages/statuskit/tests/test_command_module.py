@@ -0,0 +1,208 @@
+"""Tests for the command module."""
+
+import time
+from unittest.mock import patch
+
+from statuskit.core.store import CacheStore
+from statuskit.modules.command import (
+    CACHE_NAMESPACE,
+    CommandModule,
+    CommandSpec,
+    command_key,
+    refresh_command,
+    run_command,
+)
+
+from .factories import make_input_data
+
+
+def _module(make_render_context, tmp_path, *commands, cache=True, debug=False, **config):
+    data = make_input_data(cwd=str(tmp_path))
+    ctx = make_render_context(data, debug=debug, cache_dir=tmp_path / "cache" if cache else None)
+    return CommandModule(ctx, {"commands": list(commands), **config})
+
+
+def _cache(tmp_path):
+    return CacheStore.for_dir(tmp_path / "cache").namespace(CACHE_NAMESPACE)
+
+
+class TestRunCommand:
+    """Tests for run_command."""
+
+    def test_first_line(self, tmp_path):
+        """Output is the first line, stripped."""
+        entry = run_command("printf '  main  \\nmore\\n'", str(tmp_path), 1.0)
+
+        assert entry["output"] == "main"
+        assert entry["error"] is None
+
+    def test_runs_in_cwd(self, tmp_path):
+        """Commands run in the given directory."""
+        assert run_command("pwd", str(tmp_path), 1.0)["output"] == str(tmp_path)
+
+    def test_exit_code(self, tmp_path):
+        """A non-zero exit is an error without output."""
+        entry = run_command("echo partial; exit 3", str(tmp_path), 1.0)
+
+        assert entry["output"] is None
+        assert entry["error"] == "exit 3"
+
+    def test_timeout_kills_children(self, tmp_path):
+        """A timeout returns promptly even if the command started children."""
+        start = time.monotonic()
+        entry = run_command("sleep 5 & sleep 5", str(tmp_path), 0.2)
+
+        assert entry["error"] == "timeout"
+        assert time.monotonic() - start < 2
+
+    def test_timeout_with_escaped_child(self, tmp_path):
+        """A child in its own session holding the output pipe does not block the timeout."""
+        start = time.monotonic()
+        entry = run_command("setsid sleep 5 & sleep 5", str(tmp_path), 0.2)
+
+        assert entry["error"] == "timeout"
+        assert time.monotonic() - start < 2
+
+
+class TestCommandSpec:
+    """Tests for CommandSpec.from_config."""
+
+    def test_defaults(self):
+        """Missing fields take the module defaults; name defaults to the command."""
+        spec = CommandSpec.from_config({"run": "date"}, timeout=2.0, ttl=10)
+
+        assert spec == CommandSpec(name="date", run="date", timeout=2.0, ttl=10)
+
+    def test_invalid_entries(self):
+        """Entries without a command are rejected."""
+        assert CommandSpec.from_config({"name": "x"}, 1.0, 30) is None
+        assert CommandSpec.from_config({"run": "  "}, 1.0, 30) is None
+        assert CommandSpec.from_config("date", 1.0, 30) is None
+
+
+class TestCommandModule:
+    """Tests for CommandModule rendering."""
+
+    def test_renders_outputs(self, make_render_context, tmp_path):
+        """Outputs are joined with prefixes."""
+        mod = _module(
+            make_render_context,
+            tmp_path,
+            {"run": "echo prod", "prefix": "k8s: "},
+            {"run": "echo passing", "prefix": "CI: "},
+        )
+
+        assert mod.render() == "k8s: prod | CI: passing"
+
+    def test_no_commands(self, make_render_context, tmp_path):
+        """Without commands nothing is rendered."""
+        assert _module(make_render_context, tmp_path).render() is None
+
+    def test_runs_concurrently(self, make_render_context, tmp_path):
+        """Commands without cached output run at the same time."""
+        mod = _module(
+            make_render_context,
+            tmp_path,
+            {"run": "sleep 0.3; echo a"},
+            {"run": "sleep 0.3; echo b"},
+            {"run": "sleep 0.3; echo c"},
+        )
+
+        start = time.monotonic()
+        assert mod.render() == "a | b | c"
+        assert time.monotonic() - start < 0.8
+
+    def test_cached_within_ttl(self, make_render_context, tmp_path):
+        """A fresh output is reused without running the command."""
+        counter = tmp_path / "runs"
+        command = {"run": f"echo x >> {counter}; echo out", "ttl": 60}
+
+        for _ in range(3):
+            assert _module(make_render_context, tmp_path, command).render() == "out"
+
+        assert counter.read_text().count("x") == 1
+
+    def test_stale_output_revalidated_in_background(self, make_render_context, tmp_path):
+        """A stale output is shown while a background refresh is started once."""
+        key = command_key("echo new", str(tmp_path))
+        _cache(tmp_path).set(key, {"output": "old", "error": None, "at": time.time() - 120})
+
+        with patch("statuskit.modules.command.spawn_statuskit", return_value=True) as mock_spawn:
+            assert _module(make_render_context, tmp_path, {"run": "echo new", "ttl": 60}).render() == "old"
+            assert _module(make_render_context, tmp_path, {"run": "echo new", "ttl": 60}).render() == "old"
+
+        mock_spawn.assert_called_once()
+        args = mock_spawn.call_args.args
+        assert args[0] == "run-command"
+        assert args[-2:] == ("--", "echo new")
+        assert "--cwd" in args
+
+    def test_slow_missing_output_finished_in_background(self, make_render_context, tmp_path):
+        """A command without output does not hold the render past INLINE_TIMEOUT."""
+        with patch("statuskit.modules.command.spawn_statuskit", return_value=True) as mock_spawn:
+            start = time.monotonic()
+            result = _module(make_render_context, tmp_path, {"run": "sleep 3; echo late", "timeout": 5}).render()
+
+        assert time.monotonic() - start < 2
+        assert result is None
+        mock_spawn.assert_called_once()
+        assert mock_spawn.call_args.args[-1] == "sleep 3; echo late"
+        assert "5.0" in mock_spawn.call_args.args
+
+    def test_failure_cached(self, make_render_context, tmp_path):
+        """A failing command is not retried before its TTL."""
+        counter = tmp_path / "runs"
+        command = {"run": f"echo x >> {counter}; exit 1", "ttl": 60}
+
+        for _ in range(2):
+            assert _module(make_render_context, tmp_path, command).render() is None
+
+        assert counter.read_text().count("x") == 1
+
+    def test_failure_shown_in_debug(self, make_render_context, tmp_path):
+        """Errors are listed in debug mode."""
+        mod = _module(make_render_context, tmp_path, {"name": "ci", "run": "exit 2"}, debug=True)
+
+        assert "[command] ci: exit 2" in mod.render()
+
+    def test_without_cache_dir(self, make_render_context, tmp_path):
+        """Without a cache directory, commands run on every render."""
+        mod = _module(make_render_context, tmp_path, {"run": "echo hi"}, cache=False)
+
+        assert mod.render() == "hi"
+
+    def test_warm_refreshes_stale(self, make_render_context, tmp_path):
+        """warm() runs stale commands in the warming process."""
+        key = command_key("echo new", str(tmp_path))
+        _cache(tmp_path).set(key, {"output": "old", "error": None, "at": time.time() - 120})
+
+        _module(make_render_context, tmp_path, {"run": "echo new", "ttl": 60}).warm()
+
+        assert _cache(tmp_path).get(key)["output"] == "new"
+
+
+class TestRefreshCommand:
+    """Tests for refresh_command (the run-command process)."""
+
+    def test_stores_output(self, tmp_path):
+        """The new output replaces the cached one and the refresh marker is cleared."""
+        cache = _cache(tmp_path)
+        key = command_key("echo new", str(tmp_path))
+        cache.set(f"{key}:refresh", True)
+
+        assert refresh_command(tmp_path / "cache", "echo new", str(tmp_path), 1.0) is True
+
+        assert cache.get(key)["output"] == "new"
+        assert cache.get(f"{key}:refresh") is None
+
+    def test_failure_keeps_previous_output(self, tmp_path):
+        """A failed refresh keeps showing the last output."""
+        cache = _cache(tmp_path)
+        key = command_key("exit 1", str(tmp_path))
+        cache.set(key, {"output": "old", "error": None, "at": 0})
+
+        assert refresh_command(tmp_path / "cache", "exit 1", str(tmp_path), 1.0) is False
+
+        entry = cache.get(key)
+        assert entry["output"] == "old"
+        assert entry["error"] == "exit 1"
@@ -0,0 +1,182 @@
+"""Tests for statuskit.modules.cost."""
+
+import json
+import time
+from datetime import date
+from unittest.mock import patch
+
+from statuskit.modules.cost import CostLedger, CostModule, period_total
+
+from .factories import make_cost_data, make_input_data
+
+TODAY = date(2026, 10, 19)
+
+
+class TestCostLedger:
+    """Tests for CostLedger."""
+
+    def test_records_increase_only(self, tmp_path):
+        """Repeated totals of a session add only their increase."""
+        ledger = CostLedger(tmp_path)
+        ledger.record("a", 1.0, "/p", TODAY)
+        ledger.record("a", 1.5, "/p", TODAY)
+        data = ledger.record("a", 1.5, "/p", TODAY)
+
+        assert data["days"] == {"2026-10-19": 1.5}
+        assert data["projects"] == {"/p": {"2026-10-19": 1.5}}
+
+    def test_sessions_add_up(self, tmp_path):
+        """Costs of different sessions are summed."""
+        ledger = CostLedger(tmp_path)
+        ledger.record("a", 1.0, "/p", TODAY)
+        data = ledger.record("b", 2.0, "/q", TODAY)
+
+        assert data["days"] == {"2026-10-19": 3.0}
+        assert data["projects"] == {"/p": {"2026-10-19": 1.0}, "/q": {"2026-10-19": 2.0}}
+
+    def test_increase_goes_to_current_day(self, tmp_path):
+        """A session spanning midnight splits its cost between days."""
+        ledger = CostLedger(tmp_path)
+        ledger.record("a", 1.0, None, date(2026, 10, 18))
+        data = ledger.record("a", 1.25, None, TODAY)
+
+        assert data["days"] == {"2026-10-18": 1.0, "2026-10-19": 0.25}
+
+    def test_reset_total_counted_anew(self, tmp_path):
+        """A total lower than before is counted as new spend."""
+        ledger = CostLedger(tmp_path)
+        ledger.record("a", 2.0, None, TODAY)
+        data = ledger.record("a", 0.5, None, TODAY)
+
+        assert data["days"] == {"2026-10-19": 2.5}
+
+    def test_unchanged_total_not_written(self, tmp_path):
+        """Refreshes without new spend only read the ledger."""
+        ledger = CostLedger(tmp_path)
+        ledger.record("a", 1.0, None, TODAY)
+
+        with patch("statuskit.modules.cost.write_json") as mock_write:
+            ledger.record("a", 1.0, None, TODAY)
+
+        mock_write.assert_not_called()
+
+    def test_unchanged_total_takes_no_lock(self, tmp_path):
+        """Refreshes without new spend do not create the lock file."""
+        ledger = CostLedger(tmp_path)
+        ledger.record("a", 1.0, None, TODAY)
+
+        with patch.object(ledger.lock, "acquire") as mock_acquire:
+            ledger.record("a", 1.0, None, TODAY)
+
+        mock_acquire.assert_not_called()
+
+    def test_idle_session_renews_seen(self, tmp_path):
+        """A session without new spend is kept, so it is not counted again later."""
+        ledger = CostLedger(tmp_path)
+        ledger.record("a", 1.0, None, TODAY)
+
+        with patch("statuskit.modules.cost.time.time", return_value=time.time() + 29 * 86400):
+            ledger.record("a", 1.0, None, TODAY)
+        with patch("statuskit.modules.cost.time.time", return_value=time.time() + 40 * 86400):
+            data = ledger.record("a", 1.0, None, TODAY)
+
+        assert list(data["sessions"]) == ["a"]
+        assert data["days"] == {"2026-10-19": 1.0}
+
+    def test_locked_ledger_not_written(self, tmp_path):
+        """While another session updates the ledger the increase stays pending."""
+        ledger = CostLedger(tmp_path)
+        ledger.record("a", 1.0, None, TODAY)
+
+        other = CostLedger(tmp_path).lock
+        assert other.acquire()
+        try:
+            data = ledger.record("a", 2.0, None, TODAY)
+        finally:
+            other.release()
+        assert data["days"] == {"2026-10-19": 1.0}
+
+        data = ledger.record("a", 2.0, None, TODAY)
+        assert data["days"] == {"2026-10-19": 2.0}
+
+    def test_compaction(self, tmp_path):
+        """Old days, empty projects and idle sessions are dropped."""
+        ledger = CostLedger(tmp_path)
+        ledger.path.write_text(
+            json.dumps(
+                {
+                    "sessions": {"old": {"cost": 1.0, "seen": time.time() - 40 * 86400}},
+                    "days": {"2026-08-01": 9.0, "2026-10-01": 2.0},
+                    "projects": {"/old": {"2026-08-01": 9.0}},
+                }
+            )
+        )
+
+        data = ledger.record("a", 1.0, "/p", TODAY)
+
+        assert data["days"] == {"2026-10-01": 2.0, "2026-10-19": 1.0}
+        assert data["projects"] == {"/p": {"2026-10-19": 1.0}}
+        assert list(data["sessions"]) == ["a"]
+
+    def test_corrupted_ledger(self, tmp_path):
+        """A corrupted ledger starts empty."""
+        ledger = CostLedger(tmp_path)
+        ledger.path.write_text("{not json")
+
+        data = ledger.record("a", 1.0, None, TODAY)
+
+        assert data["days"] == {"2026-10-19": 1.0}
+
+
+class TestPeriodTotal:
+    """Tests for period_total."""
+
+    def test_rolling_window(self):
+        """Only days inside the window count."""
+        days = {"2026-10-19": 1.0, "2026-10-13": 2.0, "2026-10-12": 4.0}
+
+        assert period_total(days, TODAY, 1) == 1.0
+        assert period_total(days, TODAY, 7) == 3.0
+
+
+class TestCostModule:
+    """Tests for CostModule."""
+
+    def _data(self, session_id="a", cost=1.5, cwd="/p"):
+        return make_input_data(session_id=session_id, cost=make_cost_data(cost_usd=cost), cwd=cwd)
+
+    def test_render_across_sessions(self, make_render_context, tmp_path):
+        """Totals include other sessions."""
+        CostModule(make_render_context(self._data("a", 1.5), cache_dir=tmp_path), {}).render()
+        result = CostModule(make_render_context(self._data("b", 2.0), cache_dir=tmp_path), {}).render()
+
+        assert result == "Today: $3.50 | Week: $3.50"
+
+    def test_render_project(self, make_render_context, tmp_path):
+        """show_project adds the current project's spend today."""
+        CostModule(make_render_context(self._data("a", 1.5, "/other"), cache_dir=tmp_path), {}).render()
+        ctx = make_render_context(self._data("b", 2.0, "/p"), cache_dir=tmp_path)
+
+        result = CostModule(ctx, {"show_today": False, "show_week": False, "show_project": True}).render()
+
+        assert result == "Project: $2.00 today"
+
+    def test_project_from_workspace(self, make_render_context, tmp_path):
+        """The workspace project directory is preferred over cwd."""
+        data = self._data(cwd="/p/sub")
+        data["workspace"] = {"current_dir": "/p/sub", "project_dir": "/p"}
+
+        CostModule(make_render_context(data, cache_dir=tmp_path), {}).render()
+
+        assert "/p" in CostLedger(tmp_path).load()["projects"]
+
+    def test_without_cost(self, make_render_context, tmp_path):
+        """Payloads without cost show existing totals."""
+        CostModule(make_render_context(self._data("a", 1.5), cache_dir=tmp_path), {}).render()
+        ctx = make_render_context(make_input_data(session_id="b"), cache_dir=tmp_path)
+
+        assert CostModule(ctx, {}).render() == "Today: $1.50 | Week: $1.50"
+
+    def test_without_cache_dir(self, make_render_context):
+        """Without a cache directory nothing is shown."""
+        assert CostModule(make_render_context(self._data()), {}).render() is None
@@ -1,12 +1,61 @@
 """Tests for statuskit.modules.git."""
 
+import os
 import subprocess
+from pathlib import Path
 from unittest.mock import patch
 
-from statuskit.modules.git import GitModule
+import pytest
+from statuskit.modules.git import _CACHE_TTL, GitModule, _GitCommandError, _parse_worktree_list
 
 from .factories import make_input_data, make_model_data
 
+NOW = 1_700_000_000
+MINUTE = 60
+HOUR = 60 * MINUTE
+DAY = 24 * HOUR
+
+
+def _records(*records):
+    """Stand-in for _stream_git output."""
+    yield from records
+
+
+def _remote_git(ahead, behind):
+    """Stand-in for _run_git with HEAD "aaa" tracking upstream "bbb"."""
+
+    def run_git(*args):
+        if args[0] == "rev-parse":
+            return {"HEAD": "aaa", "@{upstream}": "bbb"}.get(args[-1])
+        if "rev-list" in args:
+            return str(ahead if args[-1] == "bbb..aaa" else behind)
+        return None
+
+    return run_git
+
+
+def _failing_records():
+    """Stand-in for _stream_git when git fails."""
+    msg = "git status failed"
+    raise _GitCommandError(msg)
+    yield
+
+
+def _make_worktree(tmp_path):
+    """Create a main repository and a linked worktree of it on disk.
+
+    Returns:
+        Worktree root (myproject/.worktrees/feature-branch)
+    """
+    project = tmp_path / "myproject"
+    admin = project / ".git" / "worktrees" / "feature-branch"
+    admin.mkdir(parents=True)
+    (admin / "commondir").write_text("../..\n")
+    worktree = project / ".worktrees" / "feature-branch"
+    worktree.mkdir(parents=True)
+    (worktree / ".git").write_text(f"gitdir: {admin}\n")
+    return worktree
+
 
 class TestGitModule:
     """Tests for GitModule."""
@@ -96,7 +145,7 @@ class TestGitModule:
         mod = GitModule(ctx, {})
 
         with patch.object(mod, "_run_git") as mock_git:
-            mock_git.side_effect = lambda *args: "origin/main" if "abbrev-ref" in args else "2\t0"
+            mock_git.side_effect = _remote_git(ahead=2, behind=0)
             result = mod._get_remote_status()
 
         assert result == ("ahead", 2)
@@ -108,7 +157,7 @@ class TestGitModule:
         mod = GitModule(ctx, {})
 
         with patch.object(mod, "_run_git") as mock_git:
-            mock_git.side_effect = lambda *args: "origin/main" if "abbrev-ref" in args else "0\t3"
+            mock_git.side_effect = _remote_git(ahead=0, behind=3)
             result = mod._get_remote_status()
 
         assert result == ("behind", 3)
@@ -120,7 +169,7 @@ class TestGitModule:
         mod = GitModule(ctx, {})
 
         with patch.object(mod, "_run_git") as mock_git:
-            mock_git.side_effect = lambda *args: "origin/main" if "abbrev-ref" in args else "2\t3"
+            mock_git.side_effect = _remote_git(ahead=2, behind=3)
             result = mod._get_remote_status()
 
         assert result == ("diverged", 5)
@@ -132,7 +181,7 @@ class TestGitModule:
         mod = GitModule(ctx, {})
 
         with patch.object(mod, "_run_git") as mock_git:
-            mock_git.side_effect = lambda *args: "origin/main" if "abbrev-ref" in args else "0\t0"
+            mock_git.side_effect = _remote_git(ahead=0, behind=0)
             result = mod._get_remote_status()
 
         assert result == ("synced", 0)
@@ -155,15 +204,17 @@ class TestGitModule:
         ctx = make_render_context(data)
         mod = GitModule(ctx, {})
 
-        porcelain_output = """A  staged_new.py
-M  staged_modified.py
- M unstaged.py
- M another_unstaged.py
-?? untracked1.txt
-?? untracked2.txt
-?? untracked3.txt"""
+        porcelain_output = _records(
+            "A  staged_new.py",
+            "M  staged_modified.py",
+            " M unstaged.py",
+            " M another_unstaged.py",
+            "?? untracked1.txt",
+            "?? untracked2.txt",
+            "?? untracked3.txt",
+        )
 
-        with patch.object(mod, "_run_git") as mock_git:
+        with patch.object(mod, "_stream_git") as mock_git:
             mock_git.return_value = porcelain_output
             result = mod._get_changes()
 
@@ -175,8 +226,8 @@ M  staged_modified.py
         ctx = make_render_context(data)
         mod = GitModule(ctx, {})
 
-        with patch.object(mod, "_run_git") as mock_git:
-            mock_git.return_value = "A  new.py\nM  modified.py\nD  deleted.py"
+        with patch.object(mod, "_stream_git") as mock_git:
+            mock_git.return_value = _records("A  new.py", "M  modified.py", "D  deleted.py")
             result = mod._get_changes()
 
         assert result == {"staged": 3, "modified": 0, "untracked": 0}
@@ -187,8 +238,8 @@ M  staged_modified.py
         ctx = make_render_context(data)
         mod = GitModule(ctx, {})
 
-        with patch.object(mod, "_run_git") as mock_git:
-            mock_git.return_value = " M file1.py\n M file2.py"
+        with patch.object(mod, "_stream_git") as mock_git:
+            mock_git.return_value = _records(" M file1.py", " M file2.py")
             result = mod._get_changes()
 
         assert result == {"staged": 0, "modified": 2, "untracked": 0}
@@ -199,8 +250,8 @@ M  staged_modified.py
         ctx = make_render_context(data)
         mod = GitModule(ctx, {})
 
-        with patch.object(mod, "_run_git") as mock_git:
-            mock_git.return_value = "?? file1.txt\n?? file2.txt"
+        with patch.object(mod, "_stream_git") as mock_git:
+            mock_git.return_value = _records("?? file1.txt", "?? file2.txt")
             result = mod._get_changes()
 
         assert result == {"staged": 0, "modified": 0, "untracked": 2}
@@ -211,8 +262,8 @@ M  staged_modified.py
         ctx = make_render_context(data)
         mod = GitModule(ctx, {})
 
-        with patch.object(mod, "_run_git") as mock_git:
-            mock_git.return_value = ""
+        with patch.object(mod, "_stream_git") as mock_git:
+            mock_git.return_value = _records()
             result = mod._get_changes()
 
         assert result == {"staged": 0, "modified": 0, "untracked": 0}
@@ -223,23 +274,23 @@ M  staged_modified.py
         ctx = make_render_context(data)
         mod = GitModule(ctx, {})
 
-        with patch.object(mod, "_run_git") as mock_git:
-            mock_git.return_value = None
+        with patch.object(mod, "_stream_git") as mock_git:
+            mock_git.return_value = _failing_records()
             result = mod._get_changes()
 
         assert result == {"staged": 0, "modified": 0, "untracked": 0}
 
     def test_get_last_commit(self, make_render_context):
-        """_get_last_commit returns hash and age."""
+        """_get_last_commit returns hash and commit timestamp."""
         data = make_input_data(model=make_model_data())
         ctx = make_render_context(data)
         mod = GitModule(ctx, {})
 
         with patch.object(mod, "_run_git") as mock_git:
-            mock_git.return_value = "abc1234 2 hours ago"
+            mock_git.side_effect = lambda *args: "aaa" if args[0] == "rev-parse" else "abc1234 1700000000"
             result = mod._get_last_commit()
 
-        assert result == ("abc1234", "2 hours ago")
+        assert result == ("abc1234", 1700000000)
 
     def test_get_last_commit_no_commits(self, make_render_context):
         """_get_last_commit returns None for empty repo."""
@@ -253,14 +304,35 @@ M  staged_modified.py
 
         assert result is None
 
+    def test_get_last_commit_cached_per_commit(self, make_render_context, tmp_path):
+        """Commit metadata is fetched once per HEAD commit id."""
+        data = make_input_data(model=make_model_data())
+        first = GitModule(make_render_context(data, cache_dir=tmp_path), {})
+        with patch.object(first, "_run_git") as mock_git:
+            mock_git.side_effect = lambda *args: "aaa" if args[0] == "rev-parse" else "abc1234 1700000000"
+            first._get_last_commit()
+
+        second = GitModule(make_render_context(data, cache_dir=tmp_path), {})
+        with patch.object(second, "_run_git", return_value="aaa") as mock_git:
+            result = second._get_last_commit()
+
+        assert result == ("abc1234", 1700000000)
+        mock_git.assert_called_once_with("rev-parse", "HEAD")
+
     def test_format_commit_age_raw(self, make_render_context):
-        """_format_commit_age returns git output as-is for raw format."""
+        """_format_commit_age matches git's relative dates for raw format."""
         data = make_input_data(model=make_model_data())
         ctx = make_render_context(data)
         mod = GitModule(ctx, {"commit_age_format": "raw"})
 
-        assert mod._format_commit_age("2 hours ago") == "2 hours ago"
-        assert mod._format_commit_age("69 minutes ago") == "69 minutes ago"
+        assert mod._format_commit_age(NOW - 30, now=NOW) == "30 seconds ago"
+        assert mod._format_commit_age(NOW - 2 * HOUR, now=NOW) == "2 hours ago"
+        assert mod._format_commit_age(NOW - 69 * MINUTE, now=NOW) == "69 minutes ago"
+        assert mod._format_commit_age(NOW - 3 * DAY, now=NOW) == "3 days ago"
+        assert mod._format_commit_age(NOW - 20 * DAY, now=NOW) == "3 weeks ago"
+        assert mod._format_commit_age(NOW - 100 * DAY, now=NOW) == "3 months ago"
+        assert mod._format_commit_age(NOW - 500 * DAY, now=NOW) == "1 year, 4 months ago"
+        assert mod._format_commit_age(NOW - 2000 * DAY, now=NOW) == "5 years ago"
 
     def test_format_commit_age_relative_decomposed(self, make_render_context):
         """_format_commit_age decomposes and uses full names for relative format."""
@@ -268,11 +340,11 @@ M  staged_modified.py
         ctx = make_render_context(data)
         mod = GitModule(ctx, {"commit_age_format": "relative"})
 
-        assert mod._format_commit_age("5 minutes ago") == "5 minutes ago"
-        assert mod._format_commit_age("69 minutes ago") == "1 hour 9 minutes ago"
-        assert mod._format_commit_age("120 minutes ago") == "2 hours ago"
-        assert mod._format_commit_age("26 hours ago") == "1 day 2 hours ago"
-        assert mod._format_commit_age("3 days ago") == "3 days ago"
+        assert mod._format_commit_age(NOW - 5 * MINUTE, now=NOW) == "5 minutes ago"
+        assert mod._format_commit_age(NOW - 69 * MINUTE, now=NOW) == "1 hour 9 minutes ago"
+        assert mod._format_commit_age(NOW - 120 * MINUTE, now=NOW) == "2 hours ago"
+        assert mod._format_commit_age(NOW - 26 * HOUR, now=NOW) == "1 day 2 hours ago"
+        assert mod._format_commit_age(NOW - 3 * DAY, now=NOW) == "3 days ago"
 
     def test_format_commit_age_relative_singular(self, make_render_context):
         """_format_commit_age uses singular forms correctly."""
@@ -280,8 +352,8 @@ M  staged_modified.py
         ctx = make_render_context(data)
         mod = GitModule(ctx, {"commit_age_format": "relative"})
 
-        assert mod._format_commit_age("60 minutes ago") == "1 hour ago"
-        assert mod._format_commit_age("1 day ago") == "1 day ago"
+        assert mod._format_commit_age(NOW - 60 * MINUTE, now=NOW) == "1 hour ago"
+        assert mod._format_commit_age(NOW - DAY, now=NOW) == "1 day ago"
 
     def test_format_commit_age_compact_decomposed(self, make_render_context):
         """_format_commit_age decomposes and uses short names for compact format."""
@@ -289,110 +361,56 @@ M  staged_modified.py
         ctx = make_render_context(data)
         mod = GitModule(ctx, {"commit_age_format": "compact"})
 
-        assert mod._format_commit_age("5 minutes ago") == "5m"
-        assert mod._format_commit_age("69 minutes ago") == "1h 9m"
-        assert mod._format_commit_age("120 minutes ago") == "2h"
-        assert mod._format_commit_age("26 hours ago") == "1d 2h"
-        assert mod._format_commit_age("3 days ago") == "3d"
-        assert mod._format_commit_age("1501 minutes ago") == "1d 1h 1m"
-
-    def test_format_commit_age_just_now(self, make_render_context):
-        """_format_commit_age returns 'just now' for < 1 minute."""
-        data = make_input_data(model=make_model_data())
-        ctx = make_render_context(data)
-
-        mod_relative = GitModule(ctx, {"commit_age_format": "relative"})
-        mod_compact = GitModule(ctx, {"commit_age_format": "compact"})
-
-        assert mod_relative._format_commit_age("30 seconds ago") == "just now"
-        assert mod_compact._format_commit_age("30 seconds ago") == "just now"
+        assert mod._format_commit_age(NOW - 5 * MINUTE, now=NOW) == "5m"
+        assert mod._format_commit_age(NOW - 69 * MINUTE, now=NOW) == "1h 9m"
+        assert mod._format_commit_age(NOW - 120 * MINUTE, now=NOW) == "2h"
+        assert mod._format_commit_age(NOW - 26 * HOUR, now=NOW) == "1d 2h"
+        assert mod._format_commit_age(NOW - 3 * DAY, now=NOW) == "3d"
+        assert mod._format_commit_age(NOW - 1501 * MINUTE, now=NOW) == "1d 1h 1m"
 
-    def test_format_commit_age_default_is_relative(self, make_render_context):
-        """_format_commit_age defaults to relative format."""
-        data = make_input_data(model=make_model_data())
-        ctx = make_render_context(data)
-        mod = GitModule(ctx, {})  # No format specified
-
-        assert mod._format_commit_age("69 minutes ago") == "1 hour 9 minutes ago"
-
-    def test_format_commit_age_invalid_fallback(self, make_render_context):
-        """_format_commit_age returns input as-is for invalid strings."""
+    def test_format_commit_age_exact_months(self, make_render_context):
+        """Old commits keep their exact age instead of 30-day months."""
         data = make_input_data(model=make_model_data())
         ctx = make_render_context(data)
         mod = GitModule(ctx, {"commit_age_format": "compact"})
 
-        assert mod._format_commit_age("invalid") == "invalid"
-        assert mod._format_commit_age("") == ""
-
-    def test_parse_git_age_seconds(self, make_render_context):
-        """_parse_git_age returns 0 for seconds."""
-        data = make_input_data(model=make_model_data())
-        ctx = make_render_context(data)
-        mod = GitModule(ctx, {})
+        assert mod._format_commit_age(NOW - 45 * DAY - 3 * HOUR, now=NOW) == "45d 3h"
 
-        assert mod._parse_git_age("30 seconds ago") == 0
-        assert mod._parse_git_age("1 second ago") == 0
-
-    def test_parse_git_age_minutes(self, make_render_context):
-        """_parse_git_age converts minutes."""
-        data = make_input_data(model=make_model_data())
-        ctx = make_render_context(data)
-        mod = GitModule(ctx, {})
-
-        assert mod._parse_git_age("5 minutes ago") == 5
-        assert mod._parse_git_age("1 minute ago") == 1
-        assert mod._parse_git_age("69 minutes ago") == 69
-
-    def test_parse_git_age_hours(self, make_render_context):
-        """_parse_git_age converts hours to minutes."""
-        data = make_input_data(model=make_model_data())
-        ctx = make_render_context(data)
-        mod = GitModule(ctx, {})
-
-        assert mod._parse_git_age("2 hours ago") == 120
-        assert mod._parse_git_age("1 hour ago") == 60
-
-    def test_parse_git_age_days(self, make_render_context):
-        """_parse_git_age converts days to minutes."""
+    def test_format_commit_age_just_now(self, make_render_context):
+        """_format_commit_age returns 'just now' for < 1 minute."""
         data = make_input_data(model=make_model_data())
         ctx = make_render_context(data)
-        mod = GitModule(ctx, {})
 
-        assert mod._parse_git_age("3 days ago") == 4320  # 3 * 1440
-        assert mod._parse_git_age("1 day ago") == 1440
-
-    def test_parse_git_age_weeks(self, make_render_context):
-        """_parse_git_age converts weeks to minutes."""
-        data = make_input_data(model=make_model_data())
-        ctx = make_render_context(data)
-        mod = GitModule(ctx, {})
+        mod_relative = GitModule(ctx, {"commit_age_format": "relative"})
+        mod_compact = GitModule(ctx, {"commit_age_format": "compact"})
 
-        assert mod._parse_git_age("2 weeks ago") == 20160  # 2 * 7 * 1440
+        assert mod_relative._format_commit_age(NOW - 30, now=NOW) == "just now"
+        assert mod_compact._format_commit_age(NOW - 30, now=NOW) == "just now"
 
-    def test_parse_git_age_months(self, make_render_context):
-        """_parse_git_age converts months to minutes (30 days)."""
+    def test_format_commit_age_future_is_just_now(self, make_render_context):
+        """Commits dated in the future (clock skew) show as 'just now'."""
         data = make_input_data(model=make_model_data())
         ctx = make_render_context(data)
         mod = GitModule(ctx, {})
 
-        assert mod._parse_git_age("2 months ago") == 86400  # 2 * 30 * 1440
+        assert mod._format_commit_age(NOW + HOUR, now=NOW) == "just now"
 
-    def test_parse_git_age_years(self, make_render_context):
-        """_parse_git_age converts years to minutes (365 days)."""
+    def test_format_commit_age_default_is_relative(self, make_render_context):
+        """_format_commit_age defaults to relative format."""
         data = make_input_data(model=make_model_data())
         ctx = make_render_context(data)
-        mod = GitModule(ctx, {})
+        mod = GitModule(ctx, {})  # No format specified
 
-        assert mod._parse_git_age("1 year ago") == 525600  # 365 * 1440
+        assert mod._format_commit_age(NOW - 69 * MINUTE, now=NOW) == "1 hour 9 minutes ago"
 
-    def test_parse_git_age_invalid(self, make_render_context):
-        """_parse_git_age returns None for invalid input."""
+    def test_format_commit_age_uses_current_time(self, make_render_context):
+        """_format_commit_age measures age from the current time by default."""
         data = make_input_data(model=make_model_data())
         ctx = make_render_context(data)
-        mod = GitModule(ctx, {})
+        mod = GitModule(ctx, {"commit_age_format": "compact"})
 
-        assert mod._parse_git_age("invalid") is None
-        assert mod._parse_git_age("") is None
+        with patch("statuskit.modules.git.time.time", return_value=NOW):
+            assert mod._format_commit_age(NOW - 2 * HOUR) == "2h"
 
     def test_decompose_minutes_only_minutes(self, make_render_context):
         """_decompose_minutes returns only minutes for small values."""
@@ -469,47 +487,39 @@ M  staged_modified.py
 
         assert result == {"project": "myproject", "worktree": None, "subfolder": "src/utils"}
 
-    def test_get_location_worktree_root(self, make_render_context):
+    def test_get_location_worktree_root(self, make_render_context, tmp_path):
         """_get_location returns project and worktree name for worktree at root."""
+        worktree = _make_worktree(tmp_path)
         data = make_input_data(
             model=make_model_data(),
-            workspace={
-                "current_dir": "/home/user/myproject/.worktrees/feature-branch",
-                "project_dir": "/home/user/myproject/.worktrees/feature-branch",
-            },
+            workspace={"current_dir": f"{worktree}", "project_dir": str(worktree)},
         )
         ctx = make_render_context(data)
         mod = GitModule(ctx, {})
 
         with patch.object(mod, "_run_git") as mock_git:
             mock_git.side_effect = lambda *args: {
-                ("rev-parse", "--git-common-dir"): "/home/user/myproject/.git",
-                ("rev-parse", "--show-toplevel"): "/home/user/myproject/.worktrees/feature-branch",
+                ("rev-parse", "--show-toplevel"): str(worktree),
             }.get(tuple(args))
-            with patch("pathlib.Path.is_file", return_value=True):
-                result = mod._get_location()
+            result = mod._get_location()
 
         assert result == {"project": "myproject", "worktree": "feature-branch", "subfolder": None}
 
-    def test_get_location_worktree_subfolder(self, make_render_context):
+    def test_get_location_worktree_subfolder(self, make_render_context, tmp_path):
         """_get_location returns all components for worktree with subfolder."""
+        worktree = _make_worktree(tmp_path)
         data = make_input_data(
             model=make_model_data(),
-            workspace={
-                "current_dir": "/home/user/myproject/.worktrees/feature-branch/src",
-                "project_dir": "/home/user/myproject/.worktrees/feature-branch",
-            },
+            workspace={"current_dir": f"{worktree}/src", "project_dir": str(worktree)},
         )
         ctx = make_render_context(data)
         mod = GitModule(ctx, {})
 
         with patch.object(mod, "_run_git") as mock_git:
             mock_git.side_effect = lambda *args: {
-                ("rev-parse", "--git-common-dir"): "/home/user/myproject/.git",
-                ("rev-parse", "--show-toplevel"): "/home/user/myproject/.worktrees/feature-branch",
+                ("rev-parse", "--show-toplevel"): str(worktree),
             }.get(tuple(args))
-            with patch("pathlib.Path.is_file", return_value=True):
-                result = mod._get_location()
+            result = mod._get_location()
 
         assert result == {"project": "myproject", "worktree": "feature-branch", "subfolder": "src"}
 
@@ -918,7 +928,7 @@ M  staged_modified.py
             mock_branch.return_value = "main"
             mock_remote.return_value = ("synced", 0)
             mock_changes.return_value = {"staged": 1, "modified": 0, "untracked": 0}
-            mock_commit.return_value = ("abc1234", "2 hours ago")
+            mock_commit.return_value = ("abc1234", NOW)
 
             result = mod.render()
 
@@ -970,7 +980,7 @@ M  staged_modified.py
             mock_branch.return_value = "main"
             mock_remote.return_value = ("synced", 0)
             mock_changes.return_value = {"staged": 0, "modified": 0, "untracked": 0}
-            mock_commit.return_value = ("abc1234", "2h")
+            mock_commit.return_value = ("abc1234", NOW)
 
             result = mod.render()
 
@@ -1005,3 +1015,753 @@ M  staged_modified.py
             result = mod.render()
 
         assert result is None
+
+
+class TestGitModuleWatch:
+    """Tests for GitModule status reuse with the background watcher."""
+
+    def _write_watch_state(self, cache_dir, worktree, generation):
+        from dataclasses import asdict
+
+        from statuskit.core.cache import write_json
+        from statuskit.core.watcher import STATE_ACTIVE, WatchState, _state_path
+
+        state = WatchState(
+            pid=os.getpid(),
+            generation=generation,
+            state=STATE_ACTIVE,
+            backend="inotify",
+            updated_at=0,
+        )
+        write_json(_state_path(cache_dir, worktree), asdict(state))
+
+    def _make_module(self, make_render_context, cache_dir):
+        data = make_input_data(model=make_model_data())
+        ctx = make_render_context(data, cache_dir=cache_dir)
+        return GitModule(ctx, {"watch": True, "show_commit": False})
+
+    def _collected(self):
+        return {
+            "branch": "main",
+            "location": {"project": "repo", "worktree": None, "subfolder": None},
+            "remote_status": ("ahead", 2),
+            "changes": {"staged": 1, "modified": 0, "untracked": 0},
+            "operation": None,
+            "stash": 0,
+        }
+
+    def test_first_render_spawns_watcher(self, make_render_context, tmp_path):
+        """Without a watcher, status is collected and a watcher is started."""
+        mod = self._make_module(make_render_context, tmp_path)
+
+        with (
+            patch.object(mod, "_collect_status", return_value=self._collected()) as mock_collect,
+            patch.object(mod, "_get_toplevel", return_value="/work/repo"),
+            patch("statuskit.modules.git.spawn_statuskit") as mock_spawn,
+        ):
+            result = mod.render()
+
+        assert result is not None
+        mock_collect.assert_called_once()
+        mock_spawn.assert_called_once()
+        assert mock_spawn.call_args[0][:2] == ("watch", "/work/repo")
+
+    def test_snapshot_reused_at_same_generation(self, make_render_context, tmp_path):
+        """Status is served from the snapshot while the generation is unchanged."""
+        worktree = "/work/repo"
+        self._write_watch_state(tmp_path, Path(worktree), generation=7)
+        first = self._make_module(make_render_context, tmp_path)
+        with (
+            patch.object(first, "_collect_status", return_value=self._collected()),
+            patch.object(first, "_get_toplevel", return_value=worktree),
+            patch("statuskit.modules.git.spawn_statuskit") as mock_spawn,
+        ):
+            first_output = first.render()
+        mock_spawn.assert_not_called()
+
+        second = self._make_module(make_render_context, tmp_path)
+        with patch.object(second, "_collect_status") as mock_collect:
+            second_output = second.render()
+
+        mock_collect.assert_not_called()
+        assert second_output == first_output
+
+    def test_snapshot_invalidated_by_generation_bump(self, make_render_context, tmp_path):
+        """A generation bump forces status to be collected again."""
+        worktree = "/work/repo"
+        self._write_watch_state(tmp_path, Path(worktree), generation=7)
+        first = self._make_module(make_render_context, tmp_path)
+        with (
+            patch.object(first, "_collect_status", return_value=self._collected()),
+            patch.object(first, "_get_toplevel", return_value=worktree),
+        ):
+            first.render()
+
+        self._write_watch_state(tmp_path, Path(worktree), generation=8)
+        second = self._make_module(make_render_context, tmp_path)
+        with (
+            patch.object(second, "_collect_status", return_value=self._collected()) as mock_collect,
+            patch.object(second, "_get_toplevel", return_value=worktree),
+        ):
+            second.render()
+
+        mock_collect.assert_called_once()
+
+    def test_watch_disabled_by_default(self, make_render_context, tmp_path):
+        """Without watch, status is always collected and no watcher is started."""
+        data = make_input_data(model=make_model_data())
+        ctx = make_render_context(data, cache_dir=tmp_path)
+        mod = GitModule(ctx, {"show_commit": False})
+
+        with (
+            patch.object(mod, "_collect_status", return_value=self._collected()) as mock_collect,
+            patch("statuskit.modules.git.spawn_statuskit") as mock_spawn,
+        ):
+            mod.render()
+
+        mock_collect.assert_called_once()
+        mock_spawn.assert_not_called()
+
+
+class TestGitModuleUntracked:
+    """Tests for configurable untracked-file handling in _get_changes."""
+
+    def _make_module(self, make_render_context, config, cache_dir=None):
+        data = make_input_data(model=make_model_data())
+        ctx = make_render_context(data, cache_dir=cache_dir)
+        return GitModule(ctx, config)
+
+    def test_default_args(self, make_render_context):
+        """By default git's own untracked setting is used."""
+        mod = self._make_module(make_render_context, {})
+
+        assert mod._status_args(include_untracked=True) == ["status", "--porcelain", "-z"]
+
+    def test_untracked_files_mode(self, make_render_context):
+        """untracked_files is passed to git status."""
+        mod = self._make_module(make_render_context, {"untracked_files": "normal"})
+
+        assert mod._status_args(include_untracked=True) == ["status", "--porcelain", "-z", "--untracked-files=normal"]
+
+    def test_invalid_untracked_files_ignored(self, make_render_context):
+        """Unknown untracked_files values fall back to git's default."""
+        mod = self._make_module(make_render_context, {"untracked_files": "bogus"})
+
+        assert mod._status_args(include_untracked=True) == ["status", "--porcelain", "-z"]
+
+    def test_untracked_cache_and_fsmonitor_flags(self, make_render_context):
+        """untracked_cache and fsmonitor add per-call -c options."""
+        mod = self._make_module(make_render_context, {"untracked_cache": True, "fsmonitor": True})
+
+        assert mod._status_args(include_untracked=True) == [
+            "-c",
+            "core.untrackedCache=true",
+            "-c",
+            "core.fsmonitor=true",
+            "status",
+            "--porcelain",
+            "-z",
+        ]
+
+    def test_untracked_files_no_skips_walk(self, make_render_context):
+        """untracked_files = "no" runs status without untracked files."""
+        mod = self._make_module(make_render_context, {"untracked_files": "no"})
+
+        with patch.object(mod, "_stream_git", return_value=_records(" M a.py")) as mock_git:
+            result = mod._get_changes()
+
+        assert "--untracked-files=no" in mock_git.call_args[0]
+        assert result == {"staged": 0, "modified": 1, "untracked": 0}
+
+    def test_untracked_interval_reuses_count(self, make_render_context, tmp_path):
+        """With untracked_interval, untracked files are counted once per interval."""
+        config = {"untracked_interval": 60}
+        first = self._make_module(make_render_context, config, cache_dir=tmp_path)
+        with (
+            patch.object(first, "_get_toplevel", return_value="/work/repo"),
+            patch.object(first, "_stream_git", return_value=_records(" M a.py", "?? b.txt", "?? c.txt")) as mock_git,
+        ):
+            assert first._get_changes() == {"staged": 0, "modified": 1, "untracked": 2}
+        assert "--untracked-files=no" not in mock_git.call_args[0]
+
+        second = self._make_module(make_render_context, config, cache_dir=tmp_path)
+        with (
+            patch.object(second, "_get_toplevel", return_value="/work/repo"),
+            patch.object(second, "_stream_git", return_value=_records("M  a.py")) as mock_git,
+        ):
+            assert second._get_changes() == {"staged": 1, "modified": 0, "untracked": 2}
+        assert "--untracked-files=no" in mock_git.call_args[0]
+
+    def test_untracked_interval_expires(self, make_render_context, tmp_path):
+        """The untracked count is refreshed after the interval."""
+        config = {"untracked_interval": 60}
+        first = self._make_module(make_render_context, config, cache_dir=tmp_path)
+        with (
+            patch.object(first, "_get_toplevel", return_value="/work/repo"),
+            patch.object(first, "_stream_git", return_value=_records("?? b.txt")),
+        ):
+            first._get_changes()
+
+        second = self._make_module(make_render_context, config, cache_dir=tmp_path)
+        with (
+            patch.object(second, "_get_toplevel", return_value="/work/repo"),
+            patch.object(second, "_stream_git", return_value=_records()) as mock_git,
+            patch("statuskit.modules.git.time.time", return_value=10**10),
+        ):
+            assert second._get_changes() == {"staged": 0, "modified": 0, "untracked": 0}
+        assert "--untracked-files=no" not in mock_git.call_args[0]
+
+
+class TestGitModuleStreaming:
+    """Tests for streamed porcelain parsing and capped counts."""
+
+    def _make_module(self, make_render_context, config):
+        data = make_input_data(model=make_model_data())
+        ctx = make_render_context(data)
+        return GitModule(ctx, config)
+
+    def test_rename_source_record_skipped(self, make_render_context):
+        """The original path following a rename record is not counted."""
+        mod = self._make_module(make_render_context, {})
+
+        with patch.object(mod, "_stream_git", return_value=_records("R  new.py", "old.py", " M other.py")):
+            result = mod._get_changes()
+
+        assert result == {"staged": 1, "modified": 1, "untracked": 0}
+
+    def test_stops_after_max_changes(self, make_render_context):
+        """Counting stops once a count exceeds max_changes."""
+        mod = self._make_module(make_render_context, {"max_changes": 2})
+        consumed = []
+
+        def records():
+            for i in range(100):
+                consumed.append(i)
+                yield f"?? file{i}.txt"
+
+        with patch.object(mod, "_stream_git", return_value=records()):
+            result = mod._get_changes()
+
+        assert result == {"staged": 0, "modified": 0, "untracked": 3, "truncated": True}
+        assert len(consumed) == 3
+
+    def test_max_changes_zero_is_unlimited(self, make_render_context):
+        """max_changes = 0 disables the cap."""
+        mod = self._make_module(make_render_context, {"max_changes": 0})
+
+        with patch.object(mod, "_stream_git", return_value=_records(*[" M f.py"] * 50)):
+            result = mod._get_changes()
+
+        assert result == {"staged": 0, "modified": 50, "untracked": 0}
+
+    def test_render_truncated_counts(self, make_render_context):
+        """Capped counts render as 'N+' and partial counts with a '+' suffix."""
+        mod = self._make_module(make_render_context, {"max_changes": 2})
+
+        result = mod._render_changes({"staged": 1, "modified": 0, "untracked": 3, "truncated": True})
+
+        assert result is not None
+        assert "+1+" in result
+        assert "?2+" in result
+
+    @pytest.mark.integration
+    def test_stream_git_real_repo(self, make_render_context, tmp_path, monkeypatch):
+        """_stream_git yields NUL-separated records from a real git status."""
+        subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+        (tmp_path / "a b.txt").write_text("a")
+        (tmp_path / "c.txt").write_text("c")
+        monkeypatch.chdir(tmp_path)
+        mod = self._make_module(make_render_context, {})
+
+        records = list(mod._stream_git("status", "--porcelain", "-z"))
+
+        assert sorted(records) == ["?? a b.txt", "?? c.txt"]
+
+    @pytest.mark.integration
+    def test_stream_git_failure_raises(self, make_render_context, tmp_path, monkeypatch):
+        """_stream_git raises _GitCommandError outside a repository."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("GIT_CEILING_DIRECTORIES", str(tmp_path))
+        mod = self._make_module(make_render_context, {})
+
+        with pytest.raises(_GitCommandError):
+            list(mod._stream_git("status", "--porcelain", "-z"))
+
+
+class TestGitModuleAheadBehind:
+    """Tests for bounded, cached ahead/behind counts."""
+
+    def _make_module(self, make_render_context, config, cache_dir=None):
+        data = make_input_data(model=make_model_data())
+        ctx = make_render_context(data, cache_dir=cache_dir)
+        return GitModule(ctx, config)
+
+    def test_counts_are_capped(self, make_render_context):
+        """rev-list output stops one past the limit."""
+        mod = self._make_module(make_render_context, {"ahead_behind_limit": 50})
+
+        with patch.object(mod, "_run_git", side_effect=_remote_git(ahead=1, behind=0)) as mock_git:
+            mod._get_remote_status()
+
+        rev_list_calls = [call[0] for call in mock_git.call_args_list if "rev-list" in call[0]]
+        assert len(rev_list_calls) == 2
+        for args in rev_list_calls:
+            assert "--max-count=51" in args
+
+    def test_capped_count_renders_plus(self, make_render_context):
+        """Counts past the limit render as 'limit+'."""
+        mod = self._make_module(make_render_context, {"ahead_behind_limit": 999})
+
+        result = mod._render_remote_status(("ahead", 1000))
+
+        assert result is not None
+        assert "↑999+" in result
+
+    def test_counts_cached_per_commit_pair(self, make_render_context, tmp_path):
+        """Counts are computed once per (HEAD, upstream) pair."""
+        first = self._make_module(make_render_context, {}, cache_dir=tmp_path)
+        with patch.object(first, "_run_git", side_effect=_remote_git(ahead=2, behind=1)):
+            assert first._get_remote_status() == ("diverged", 3)
+
+        second = self._make_module(make_render_context, {}, cache_dir=tmp_path)
+        with patch.object(second, "_run_git", side_effect=_remote_git(ahead=0, behind=0)) as mock_git:
+            assert second._get_remote_status() == ("diverged", 3)
+
+        assert not any("rev-list" in call[0] for call in mock_git.call_args_list)
+
+    def test_cache_entries_expire(self, make_render_context, tmp_path):
+        """Cached counts live in the shared store and expire after _CACHE_TTL."""
+        mod = self._make_module(make_render_context, {}, cache_dir=tmp_path)
+
+        with patch.object(mod, "_count_commits", return_value=1) as mock_count:
+            with patch("statuskit.core.store.time.time", return_value=1000.0):
+                mod._get_ahead_behind("h1", "up")
+                mod._get_ahead_behind("h1", "up")
+            assert mock_count.call_count == 2
+
+            with patch("statuskit.core.store.time.time", return_value=1000.0 + _CACHE_TTL + 1):
+                mod._get_ahead_behind("h1", "up")
+            assert mock_count.call_count == 4
+
+        assert not (tmp_path / "git").exists()
+
+    def test_default_branch_status(self, make_render_context):
+        """Ahead/behind is reported against the branch origin/HEAD points to."""
+        mod = self._make_module(make_render_context, {"show_default_branch": True})
+
+        def run_git(*args):
+            if args[0] == "for-each-ref":
+                return "ccc main"
+            if args[0] == "rev-parse":
+                return "aaa"
+            return str(4 if args[-1] == "ccc..aaa" else 0)
+
+        with patch.object(mod, "_run_git", side_effect=run_git):
+            result = mod._get_default_branch_status()
+
+        assert result == ("main", "ahead", 4)
+
+    def test_default_branch_hidden_on_default_branch(self, make_render_context):
+        """The default-branch indicator is omitted while on that branch."""
+        mod = self._make_module(make_render_context, {"show_default_branch": True, "show_commit": False})
+
+        on_feature = mod._render_status_line(
+            "feature",
+            ("synced", 0),
+            {"staged": 0, "modified": 0, "untracked": 0},
+            None,
+            default_status=("main", "ahead", 4),
+        )
+        on_main = mod._render_status_line(
+            "main",
+            ("synced", 0),
+            {"staged": 0, "modified": 0, "untracked": 0},
+            None,
+            default_status=("main", "synced", 0),
+        )
+
+        assert on_feature is not None
+        assert "main" in on_feature
+        assert "↑4" in on_feature
+        assert on_main is not None
+        assert on_main.count("main") == 1
+
+
+class TestGitModuleOperation:
+    """Tests for filesystem detection of in-progress operations and stashes."""
+
+    def _make_module(self, make_render_context, toplevel, config=None):
+        data = make_input_data(model=make_model_data())
+        mod = GitModule(make_render_context(data), config or {})
+        mod._toplevel = str(toplevel)
+        return mod
+
+    def _make_repo(self, tmp_path):
+        git_dir = tmp_path / "repo" / ".git"
+        git_dir.mkdir(parents=True)
+        return git_dir
+
+    def test_no_operation(self, make_render_context, tmp_path):
+        """A quiet repository reports no operation and no stashes."""
+        git_dir = self._make_repo(tmp_path)
+        mod = self._make_module(make_render_context, git_dir.parent)
+
+        assert mod._get_operation() is None
+        assert mod._get_stash_count() == 0
+
+    def test_interactive_rebase_progress(self, make_render_context, tmp_path):
+        """rebase-merge reports the current step and total."""
+        git_dir = self._make_repo(tmp_path)
+        (git_dir / "rebase-merge").mkdir()
+        (git_dir / "rebase-merge" / "msgnum").write_text("2\n")
+        (git_dir / "rebase-merge" / "end").write_text("5\n")
+        mod = self._make_module(make_render_context, git_dir.parent)
+
+        assert mod._get_operation() == {"name": "REBASE", "step": 2, "total": 5}
+
+    def test_am(self, make_render_context, tmp_path):
+        """rebase-apply with an 'applying' marker is reported as am."""
+        git_dir = self._make_repo(tmp_path)
+        (git_dir / "rebase-apply").mkdir()
+        (git_dir / "rebase-apply" / "applying").touch()
+        mod = self._make_module(make_render_context, git_dir.parent)
+
+        assert mod._get_operation() == {"name": "AM"}
+
+    def test_marker_files(self, make_render_context, tmp_path):
+        """Merge, cherry-pick, revert, and bisect are detected from marker files."""
+        git_dir = self._make_repo(tmp_path)
+        for marker, name in [
+            ("MERGE_HEAD", "MERGING"),
+            ("CHERRY_PICK_HEAD", "CHERRY-PICKING"),
+            ("REVERT_HEAD", "REVERTING"),
+            ("BISECT_LOG", "BISECTING"),
+        ]:
+            (git_dir / marker).touch()
+            mod = self._make_module(make_render_context, git_dir.parent)
+
+            assert mod._get_operation() == {"name": name}
+            (git_dir / marker).unlink()
+
+    def test_linked_worktree_uses_own_state_and_shared_stash(self, make_render_context, tmp_path):
+        """Linked worktrees read state from their git dir and stashes from the common dir."""
+        common_dir = self._make_repo(tmp_path)
+        worktree_git_dir = common_dir / "worktrees" / "feature"
+        worktree_git_dir.mkdir(parents=True)
+        (worktree_git_dir / "commondir").write_text("../..\n")
+        (worktree_git_dir / "MERGE_HEAD").touch()
+        (common_dir / "logs" / "refs").mkdir(parents=True)
+        (common_dir / "logs" / "refs" / "stash").write_text("a\nb\nc\n")
+        worktree = tmp_path / "feature"
+        worktree.mkdir()
+        (worktree / ".git").write_text(f"gitdir: {worktree_git_dir}\n")
+        mod = self._make_module(make_render_context, worktree)
+
+        assert mod._get_git_dirs() == (worktree_git_dir.resolve(), common_dir.resolve())
+        assert mod._get_operation() == {"name": "MERGING"}
+        assert mod._get_stash_count() == 3
+
+    def test_render_operation_and_stash(self, make_render_context, tmp_path):
+        """The status line shows the operation after the branch and the stash depth."""
+        mod = self._make_module(make_render_context, tmp_path, {"show_operation": True, "show_stash": True})
+
+        result = mod._render_status_line(
+            "main",
+            ("synced", 0),
+            {"staged": 0, "modified": 0, "untracked": 0},
+            None,
+            operation={"name": "REBASE", "step": 2, "total": 5},
+            stash=3,
+        )
+
+        assert result is not None
+        assert "REBASE 2/5" in result
+        assert "⚑3" in result
+        assert result.index("main") < result.index("REBASE")
+
+    def test_operation_and_stash_hidden_by_default(self, make_render_context, tmp_path):
+        """Operation and stash display are opt-in, so existing output is unchanged."""
+        mod = self._make_module(make_render_context, tmp_path)
+
+        assert mod.show_operation is False
+        assert mod.show_stash is False
+
+
+class TestGitModuleLocationCache:
+    """Tests for the per-directory repository location cache."""
+
+    def _make_module(self, make_render_context, cache_dir):
+        data = make_input_data(model=make_model_data())
+        return GitModule(make_render_context(data, cache_dir=cache_dir), {})
+
+    def _make_repo(self, tmp_path, monkeypatch):
+        repo = tmp_path / "myproject"
+        (repo / ".git").mkdir(parents=True)
+        monkeypatch.chdir(repo)
+        return repo
+
+    def _repo_git(self, repo):
+        return lambda *args: {
+            ("rev-parse", "--git-common-dir"): ".git",
+            ("rev-parse", "--show-toplevel"): str(repo),
+        }.get(tuple(args))
+
+    def test_location_cached_per_directory(self, make_render_context, tmp_path, monkeypatch):
+        """A second lookup from the same directory runs no git commands."""
+        repo = self._make_repo(tmp_path, monkeypatch)
+        cache_dir = tmp_path / "cache"
+        first = self._make_module(make_render_context, cache_dir)
+        with patch.object(first, "_run_git", side_effect=self._repo_git(repo)):
+            expected = first._resolve_location()
+
+        second = self._make_module(make_render_context, cache_dir)
+        with patch.object(second, "_run_git") as mock_git:
+            result = second._resolve_location()
+
+        mock_git.assert_not_called()
+        assert result == expected
+        assert result == {"toplevel": str(repo), "project": "myproject", "worktree": None}
+
+    def test_git_mtime_change_invalidates(self, make_render_context, tmp_path, monkeypatch):
+        """A changed .git entry forces a fresh lookup."""
+        repo = self._make_repo(tmp_path, monkeypatch)
+        cache_dir = tmp_path / "cache"
+        first = self._make_module(make_render_context, cache_dir)
+        with patch.object(first, "_run_git", side_effect=self._repo_git(repo)):
+            first._resolve_location()
+
+        os.utime(repo / ".git", ns=(0, 0))
+        second = self._make_module(make_render_context, cache_dir)
+        with patch.object(second, "_run_git", side_effect=self._repo_git(repo)) as mock_git:
+            second._resolve_location()
+
+        assert mock_git.called
+
+    def test_non_repo_cached(self, make_render_context, tmp_path, monkeypatch):
+        """Directories outside a repository are negatively cached."""
+        work = tmp_path / "work"
+        work.mkdir()
+        monkeypatch.chdir(work)
+        cache_dir = tmp_path / "cache"
+        first = self._make_module(make_render_context, cache_dir)
+        with patch.object(first, "_run_git", return_value=None):
+            assert first.render() is None
+
+        second = self._make_module(make_render_context, cache_dir)
+        with patch.object(second, "_run_git") as mock_git:
+            assert second.render() is None
+
+        mock_git.assert_not_called()
+
+    def test_non_repo_cache_expires(self, make_render_context, tmp_path, monkeypatch):
+        """Negative entries expire so a newly created parent repository is found."""
+        work = tmp_path / "work"
+        work.mkdir()
+        monkeypatch.chdir(work)
+        cache_dir = tmp_path / "cache"
+        first = self._make_module(make_render_context, cache_dir)
+        with patch.object(first, "_run_git", return_value=None):
+            first._resolve_location()
+
+        second = self._make_module(make_render_context, cache_dir)
+        with (
+            patch.object(second, "_run_git", return_value=None) as mock_git,
+            patch("statuskit.modules.git.time.time", return_value=10**10),
+        ):
+            second._resolve_location()
+
+        assert mock_git.called
+
+
+class TestGitModuleWorktrees:
+    """Tests for the multi-worktree overview."""
+
+    def _make_module(self, make_render_context, config, cache_dir=None):
+        data = make_input_data(model=make_model_data())
+        return GitModule(make_render_context(data, cache_dir=cache_dir), config)
+
+    def test_parse_worktree_list(self):
+        """Porcelain output is parsed and bare/prunable entries are skipped."""
+        output = (
+            "worktree /repo\nHEAD aaa\nbranch refs/heads/main\n\n"
+            "worktree /repo/.worktrees/fix\nHEAD bbb\ndetached\n\n"
+            "worktree /gone\nHEAD ccc\nbranch refs/heads/old\nprunable gitdir file points to non-existent location\n\n"
+            "worktree /bare.git\nbare"
+        )
+
+        assert _parse_worktree_list(output) == [
+            {"path": "/repo", "head": "aaa", "branch": "refs/heads/main"},
+            {"path": "/repo/.worktrees/fix", "head": "bbb"},
+        ]
+
+    def test_cached_worktrees_not_probed(self, make_render_context, tmp_path):
+        """Worktrees with an unchanged fingerprint are served from the cache."""
+        listing = (
+            "worktree /repo\nHEAD aaa\nbranch refs/heads/main\n\nworktree /repo/wt\nHEAD bbb\nbranch refs/heads/wt"
+        )
+        probe = {"name": "wt", "dirty": True, "status": "ahead", "count": 2}
+        first = self._make_module(make_render_context, {"show_worktrees": True}, cache_dir=tmp_path)
+        with (
+            patch.object(first, "_run_git", return_value=listing),
+            patch.object(first, "_worktree_fingerprint", return_value="fp"),
+            patch.object(first, "_probe_worktree", return_value=dict(probe)) as mock_probe,
+            patch.object(first, "_get_toplevel", return_value="/repo"),
+        ):
+            expected = first._get_worktrees()
+        assert mock_probe.call_count == 2
+
+        second = self._make_module(make_render_context, {"show_worktrees": True}, cache_dir=tmp_path)
+        with (
+            patch.object(second, "_run_git", return_value=listing),
+            patch.object(second, "_worktree_fingerprint", return_value="fp"),
+            patch.object(second, "_probe_worktree") as mock_probe,
+            patch.object(second, "_get_toplevel", return_value="/repo"),
+        ):
+            result = second._get_worktrees()
+
+        mock_probe.assert_not_called()
+        assert result == expected
+        assert result == {"count": 2, "dirty": 2, "diverged": [["wt", "ahead", 2]]}
+
+    def test_render_worktrees_line(self, make_render_context):
+        """The overview shows count, dirty count, and diverged worktrees."""
+        mod = self._make_module(make_render_context, {"show_worktrees": True})
+
+        result = mod._render_worktrees_line({"count": 3, "dirty": 1, "diverged": [["feature", "behind", 4]]})
+
+        assert result is not None
+        assert "🌲 3" in result
+        assert "✎1" in result
+        assert "feature" in result
+        assert "↓4" in result
+
+    def test_single_worktree_hidden(self, make_render_context):
+        """No overview is shown for a repository without linked worktrees."""
+        mod = self._make_module(make_render_context, {"show_worktrees": True})
+
+        assert mod._render_worktrees_line({"count": 1, "dirty": 0, "diverged": []}) is None
+
+    @pytest.mark.integration
+    def test_real_worktrees(self, make_render_context, tmp_path, monkeypatch):
+        """Dirty state and divergence are collected from real linked worktrees."""
+        for var in ("GIT_AUTHOR_NAME", "GIT_COMMITTER_NAME"):
+            monkeypatch.setenv(var, "Test")
+        for var in ("GIT_AUTHOR_EMAIL", "GIT_COMMITTER_EMAIL"):
+            monkeypatch.setenv(var, "test@example.com")
+        repo = tmp_path / "repo"
+
+        def git(*args):
+            subprocess.run(["git", "-C", str(repo), *args], check=True, capture_output=True)
+
+        subprocess.run(["git", "init", "-q", "-b", "main", str(repo)], check=True)
+        git("commit", "-q", "--allow-empty", "-m", "init")
+        git("worktree", "add", "-q", "-b", "feature", str(tmp_path / "feature"))
+        git("branch", "--set-upstream-to=main", "feature")
+        git("-C", str(tmp_path / "feature"), "commit", "-q", "--allow-empty", "-m", "work")
+        (tmp_path / "feature" / "a.txt").write_text("a")
+        monkeypatch.chdir(repo)
+        mod = self._make_module(make_render_context, {"show_worktrees": True}, cache_dir=tmp_path / "cache")
+
+        result = mod._get_worktrees()
+
+        assert result == {"count": 2, "dirty": 1, "diverged": [["feature", "ahead", 1]]}
+
+    @pytest.mark.integration
+    def test_worktree_list_cached(self, make_render_context, tmp_path, monkeypatch):
+        """git worktree list is rerun only after a worktree is added or removed."""
+        for var in ("GIT_AUTHOR_NAME", "GIT_COMMITTER_NAME"):
+            monkeypatch.setenv(var, "Test")
+        for var in ("GIT_AUTHOR_EMAIL", "GIT_COMMITTER_EMAIL"):
+            monkeypatch.setenv(var, "test@example.com")
+        repo = tmp_path / "repo"
+        subprocess.run(["git", "init", "-q", "-b", "main", str(repo)], check=True)
+        subprocess.run(["git", "-C", str(repo), "commit", "-q", "--allow-empty", "-m", "init"], check=True)
+        monkeypatch.chdir(repo)
+        cache_dir = tmp_path / "cache"
+        monkeypatch.setattr("statuskit.modules.git.time.time", lambda: 1000.0)
+
+        first = self._make_module(make_render_context, {"show_worktrees": True}, cache_dir=cache_dir)
+        expected = first._list_worktrees()
+
+        second = self._make_module(make_render_context, {"show_worktrees": True}, cache_dir=cache_dir)
+        with patch.object(second, "_run_git", wraps=second._run_git) as mock_git:
+            assert second._list_worktrees() == expected
+        assert all(call.args[0] != "worktree" for call in mock_git.call_args_list)
+
+        subprocess.run(["git", "-C", str(repo), "worktree", "add", "-q", "--detach", str(tmp_path / "wt")], check=True)
+        third = self._make_module(make_render_context, {"show_worktrees": True}, cache_dir=cache_dir)
+        result = third._list_worktrees()
+
+        assert result is not None
+        assert len(result) == 2
+
+
+class TestGitModuleSubmodules:
+    """Tests for the submodules status policy."""
+
+    def _make_module(self, make_render_context, config, cache_dir=None):
+        data = make_input_data(model=make_model_data())
+        return GitModule(make_render_context(data, cache_dir=cache_dir), config)
+
+    def test_policy_status_args(self, make_render_context):
+        """Each policy limits how far the superproject status recurses."""
+        expected = {"ignore": "all", "dirty": "untracked", "full": "dirty"}
+        for policy, ignore in expected.items():
+            mod = self._make_module(make_render_context, {"submodules": policy})
+
+            assert f"--ignore-submodules={ignore}" in mod._status_args(include_untracked=True)
+
+    def test_default_uses_git_setting(self, make_render_context):
+        """Without a policy, git's own submodule handling is used."""
+        mod = self._make_module(make_render_context, {"submodules": "bogus"})
+
+        assert not any(arg.startswith("--ignore-submodules") for arg in mod._status_args(include_untracked=True))
+
+    def test_full_aggregates_submodule_changes(self, make_render_context):
+        """With the full policy, changes inside submodules are added to the totals."""
+        mod = self._make_module(make_render_context, {"submodules": "full"})
+        submodule_changes = [
+            {"staged": 0, "modified": 2, "untracked": 1},
+            {"staged": 1, "modified": 0, "untracked": 0},
+        ]
+
+        with (
+            patch.object(mod, "_stream_git", return_value=_records(" M a.py")),
+            patch.object(mod, "_get_submodule_changes", return_value=submodule_changes),
+        ):
+            result = mod._get_changes()
+
+        assert result == {"staged": 1, "modified": 3, "untracked": 1}
+
+    @pytest.mark.integration
+    def test_real_submodules_cached(self, make_render_context, tmp_path, monkeypatch):
+        """Submodule status is collected once per fingerprint."""
+        for var in ("GIT_AUTHOR_NAME", "GIT_COMMITTER_NAME"):
+            monkeypatch.setenv(var, "Test")
+        for var in ("GIT_AUTHOR_EMAIL", "GIT_COMMITTER_EMAIL"):
+            monkeypatch.setenv(var, "test@example.com")
+
+        def git(repo, *args):
+            subprocess.run(["git", "-C", str(repo), *args], check=True, capture_output=True)
+
+        lib = tmp_path / "lib"
+        subprocess.run(["git", "init", "-q", str(lib)], check=True)
+        (lib / "lib.py").write_text("x = 1\n")
+        git(lib, "add", ".")
+        git(lib, "commit", "-q", "-m", "lib")
+        repo = tmp_path / "repo"
+        subprocess.run(["git", "init", "-q", str(repo)], check=True)
+        git(repo, "-c", "protocol.file.allow=always", "submodule", "add", "-q", str(lib), "lib")
+        git(repo, "commit", "-q", "-m", "add lib")
+        (repo / "lib" / "lib.py").write_text("x = 2\n")
+        (repo / "lib" / "new.py").write_text("")
+        monkeypatch.chdir(repo)
+        config = {"submodules": "full"}
+
+        first = self._make_module(make_render_context, config, cache_dir=tmp_path / "cache")
+        assert first._get_changes() == {"staged": 0, "modified": 1, "untracked": 1}
+
+        second = self._make_module(make_render_context, config, cache_dir=tmp_path / "cache")
+        with patch.object(second, "_probe_submodule") as mock_probe:
+            assert second._get_changes() == {"staged": 0, "modified": 1, "untracked": 1}
+        mock_probe.assert_not_called()
@@ -0,0 +1,81 @@
+"""Tests for statuskit.core.health."""
+
+from statuskit.core.health import FAILURE_THRESHOLD, ModuleHealth
+
+
+def _fail(health, times, reason="error", now=1000.0):
+    for _ in range(times):
+        health.record_failure("git", health.state("git"), reason, now=now)
+
+
+class TestModuleHealth:
+    """Tests for ModuleHealth."""
+
+    def test_healthy_by_default(self, tmp_path):
+        """Modules without failures are not skipped."""
+        health = ModuleHealth(tmp_path, "/p")
+
+        assert health.state("git") == {}
+        assert not ModuleHealth.in_cooldown(health.state("git"))
+
+    def test_skipped_after_threshold(self, tmp_path):
+        """Consecutive failures below the threshold do not skip the module."""
+        health = ModuleHealth(tmp_path, "/p")
+
+        _fail(health, FAILURE_THRESHOLD - 1)
+        assert not ModuleHealth.in_cooldown(health.state("git"), now=1000.0)
+
+        _fail(health, 1, reason="slow")
+        state = health.state("git")
+        assert ModuleHealth.in_cooldown(state, now=1000.0)
+        assert state["reason"] == "slow"
+        assert state["open_until"] == 1030.0
+
+    def test_cooldown_grows(self, tmp_path):
+        """Each further failure doubles the cooldown, up to the maximum."""
+        health = ModuleHealth(tmp_path, "/p")
+
+        _fail(health, FAILURE_THRESHOLD + 1)
+        assert health.state("git")["open_until"] == 1060.0
+
+        _fail(health, 10)
+        assert health.state("git")["open_until"] == 1600.0
+
+    def test_success_clears(self, tmp_path):
+        """A successful render forgets earlier failures."""
+        health = ModuleHealth(tmp_path, "/p")
+        _fail(health, FAILURE_THRESHOLD)
+
+        health.record_success("git", health.state("git"))
+
+        assert health.state("git") == {}
+
+    def test_per_project(self, tmp_path):
+        """Failures in one project do not skip the module in another."""
+        _fail(ModuleHealth(tmp_path, "/broken"), FAILURE_THRESHOLD)
+
+        assert ModuleHealth(tmp_path, "/other").state("git") == {}
+
+    def test_healthy_render_writes_nothing(self, tmp_path):
+        """Tracking healthy modules only reads."""
+        health = ModuleHealth(tmp_path, "/p")
+
+        health.record_success("git", health.state("git"))
+
+        assert not (tmp_path / "health").exists()
+
+    def test_recovered_project_file_removed(self, tmp_path):
+        """Clearing the last failure removes the project's record file."""
+        health = ModuleHealth(tmp_path, "/p")
+        _fail(health, 1)
+        assert health.path.exists()
+
+        health.record_success("git", health.state("git"))
+
+        assert not health.path.exists()
+
+    def test_records_persist(self, tmp_path):
+        """Failures are seen by later renders."""
+        _fail(ModuleHealth(tmp_path, "/p"), FAILURE_THRESHOLD)
+
+        assert ModuleHealth(tmp_path, "/p").state("git")["failures"] == FAILURE_THRESHOLD
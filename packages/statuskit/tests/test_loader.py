@@ -1,7 +1,7 @@
 """Tests for statuskit.core.loader."""
 
 from statuskit.core.config import Config
-from statuskit.core.loader import BUILTIN_MODULES, load_modules
+from statuskit.core.loader import BUILTIN_MODULES, get_module_class, load_modules
 from statuskit.modules.git import GitModule
 from statuskit.modules.model import ModelModule
 from statuskit.modules.usage_limits import UsageLimitsModule
@@ -10,7 +10,12 @@ from statuskit.modules.usage_limits import UsageLimitsModule
 def test_git_module_registered():
     """Git module is registered in BUILTIN_MODULES."""
     assert "git" in BUILTIN_MODULES
-    assert BUILTIN_MODULES["git"] is GitModule
+    assert get_module_class("git") is GitModule
+
+
+def test_unknown_module_class():
+    """Unknown names have no class."""
+    assert get_module_class("unknown") is None
 
 
 def test_load_modules_builtin(make_render_context, minimal_input_data):
@@ -1,6 +1,8 @@
 """Tests for statuskit entry point."""
 
 import json
+import os
+import subprocess
 import sys
 from unittest.mock import MagicMock, patch
 
@@ -120,6 +122,110 @@ def test_main_setup_check(capsys, monkeypatch, tmp_path):
     assert "Not installed" in captured.out
 
 
+def test_main_refresh_usage(monkeypatch, tmp_path):
+    """main() handles 'refresh-usage' and exits non-zero when nothing was fetched."""
+    monkeypatch.setattr(sys, "argv", ["statuskit", "refresh-usage", "--cache-dir", str(tmp_path)])
+
+    with patch("statuskit.modules.usage_limits.refresh_usage", return_value=False) as mock_refresh:
+        with pytest.raises(SystemExit) as exc_info:
+            main()
+
+    mock_refresh.assert_called_once_with(tmp_path, api_url=None)
+    assert exc_info.value.code == 1
+
+
+def test_main_run_command(monkeypatch, tmp_path):
+    """main() handles 'run-command' and exits with the command's success."""
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        ["statuskit", "run-command", "--cache-dir", str(tmp_path), "--cwd", "/p", "--timeout", "2", "--", "echo hi"],
+    )
+
+    with patch("statuskit.modules.command.refresh_command", return_value=True) as mock_refresh:
+        with pytest.raises(SystemExit) as exc_info:
+            main()
+
+    mock_refresh.assert_called_once_with(tmp_path, "echo hi", "/p", 2.0)
+    assert exc_info.value.code == 0
+
+
+def test_main_warm_starts_background_warmer(capsys, monkeypatch, tmp_path):
+    """main() handles 'warm' from a hook: starts a detached warmer and prints nothing."""
+    from statuskit.core.config import Config
+
+    # warm changes into the project directory
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(sys, "argv", ["statuskit", "warm"])
+    mock_stdin = MagicMock()
+    mock_stdin.isatty.return_value = False
+    hook_data = {"session_id": "s1", "cwd": str(tmp_path), "transcript_path": "/t/s1.jsonl"}
+
+    with (
+        patch("sys.stdin", mock_stdin),
+        patch("json.load", return_value=hook_data),
+        patch("statuskit.load_config", return_value=Config(cache_dir=tmp_path / "cache")),
+        patch("statuskit.core.background.spawn_statuskit", return_value=True) as mock_spawn,
+    ):
+        main()
+
+    mock_spawn.assert_called_once_with(
+        "warm",
+        "--foreground",
+        "--cwd",
+        str(tmp_path),
+        "--session-id",
+        "s1",
+        "--transcript-path",
+        "/t/s1.jsonl",
+    )
+    assert capsys.readouterr().out == ""
+
+
+def test_main_warm_foreground(monkeypatch, tmp_path):
+    """main() handles 'warm --foreground' by warming the configured modules."""
+    from statuskit.core.config import Config
+
+    # warm changes into the project directory
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(sys, "argv", ["statuskit", "warm", "--foreground", "--cwd", str(tmp_path)])
+    config = Config(cache_dir=tmp_path / "cache")
+
+    with (
+        patch("statuskit.load_config", return_value=config),
+        patch("statuskit.core.warm.warm_modules", return_value=[]) as mock_warm,
+    ):
+        main()
+
+    mock_warm.assert_called_once()
+    assert mock_warm.call_args.args[1].cwd == str(tmp_path)
+
+
+def test_main_warm_foreground_hands_over_late_request(monkeypatch, tmp_path):
+    """A request left when the foreground warmer finishes starts another warmer."""
+    from statuskit.core.config import Config
+    from statuskit.core.warm import Warmer
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(sys, "argv", ["statuskit", "warm", "--foreground", "--cwd", str(tmp_path)])
+    config = Config(cache_dir=tmp_path / "cache")
+
+    def late_request(config, data):
+        # A hook fires while the lock is held; it does not start a warmer
+        assert Warmer(config.cache_dir, tmp_path).request() is False
+        return []
+
+    with (
+        patch("statuskit.load_config", return_value=config),
+        patch("statuskit.core.warm.MAX_PASSES", 1),
+        patch("statuskit.core.warm.warm_modules", side_effect=late_request),
+        patch("statuskit.core.background.spawn_statuskit", return_value=True) as mock_spawn,
+    ):
+        main()
+
+    mock_spawn.assert_called_once_with("warm", "--foreground", "--cwd", str(tmp_path))
+
+
 def test_render_statusline_sets_force_color(monkeypatch):
     """_render_statusline sets FORCE_COLOR=1 when colors enabled."""
     import os
@@ -211,3 +317,98 @@ def test_main_outputs_ansi_codes_when_colors_enabled(capsys, monkeypatch):
     captured = capsys.readouterr()
     # ANSI escape sequence starts with \x1b[
     assert "\x1b[" in captured.out, f"Expected ANSI codes in output, got: {captured.out!r}"
+
+
+class TestModuleCircuitBreaker:
+    """Tests for skipping failing modules in _render_statusline."""
+
+    def _render(self, config, capsys):
+        from statuskit import _render_statusline
+
+        mock_stdin = MagicMock()
+        mock_stdin.isatty.return_value = False
+        with (
+            patch("sys.stdin", mock_stdin),
+            patch("json.load", return_value={"model": {"display_name": "Opus"}, "cwd": "/p"}),
+            patch("statuskit.load_config", return_value=config),
+        ):
+            _render_statusline()
+        return capsys.readouterr().out
+
+    def test_failing_module_skipped(self, capsys, tmp_path):
+        """After repeated errors the module is not rendered until the cooldown ends."""
+        from statuskit.core.config import Config
+
+        config = Config(modules=["model"], cache_dir=tmp_path, debug=True)
+        with patch("statuskit.modules.model.ModelModule.render", side_effect=RuntimeError("boom")) as mock_render:
+            for _ in range(3):
+                assert "boom" in self._render(config, capsys)
+            output = self._render(config, capsys)
+
+        assert mock_render.call_count == 3
+        assert "skipped: model (error x3, 30s)" in output
+
+    def test_slow_module_skipped(self, capsys, tmp_path):
+        """Renders over the module's budget count as failures."""
+        from statuskit.core.config import Config
+
+        config = Config(modules=["model"], cache_dir=tmp_path, module_configs={"model": {"budget_ms": -1}})
+        for _ in range(3):
+            assert "[Opus]" in self._render(config, capsys)
+
+        assert self._render(config, capsys) == ""
+
+    def test_recovery_resets(self, capsys, tmp_path):
+        """A success before the threshold clears the failure count."""
+        from statuskit.core.config import Config
+
+        config = Config(modules=["model"], cache_dir=tmp_path)
+        with patch("statuskit.modules.model.ModelModule.render", side_effect=RuntimeError("boom")):
+            self._render(config, capsys)
+            self._render(config, capsys)
+        self._render(config, capsys)
+        with patch("statuskit.modules.model.ModelModule.render", side_effect=RuntimeError("boom")):
+            self._render(config, capsys)
+            self._render(config, capsys)
+
+        assert "[Opus]" in self._render(config, capsys)
+
+    def test_other_modules_still_render(self, capsys, tmp_path):
+        """A skipped module does not affect the others."""
+        from statuskit.core.config import Config
+
+        config = Config(modules=["model", "cost"], cache_dir=tmp_path)
+        with patch("statuskit.modules.cost.CostModule.render", side_effect=RuntimeError("boom")):
+            for _ in range(4):
+                output = self._render(config, capsys)
+
+        assert "[Opus]" in output
+
+
+class TestRenderImports:
+    """Tests for what a render loads."""
+
+    def test_model_only_render_skips_sqlite(self, tmp_path):
+        """Modules that do not use the cache store do not load sqlite."""
+        home = tmp_path / "home"
+        (home / ".claude").mkdir(parents=True)
+        (home / ".claude" / "statuskit.toml").write_text(f'modules = ["model"]\ncache_dir = "{tmp_path / "cache"}"\n')
+        script = (
+            "import sys\n"
+            "from statuskit import _render_statusline\n"
+            "_render_statusline()\n"
+            "print(sorted(m for m in ('sqlite3', 'statuskit.core.store') if m in sys.modules))\n"
+        )
+
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            input=json.dumps({"model": {"display_name": "Opus"}, "cwd": str(tmp_path)}),
+            capture_output=True,
+            text=True,
+            cwd=tmp_path,
+            env={**os.environ, "HOME": str(home)},
+            check=True,
+        )
+
+        assert "[Opus]" in result.stdout
+        assert result.stdout.splitlines()[-1] == "[]"
@@ -1,5 +1,9 @@
 """Tests for statuskit.modules.model."""
 
+from unittest.mock import patch
+
+from statuskit.core.sessions import SessionStore
+from statuskit.core.store import CacheStore
 from statuskit.modules.model import ModelModule
 
 from .factories import (
@@ -204,3 +208,141 @@ class TestModelModule:
         assert "2h 15m" in result
         assert "Context:" in result
         assert " | " in result
+
+
+class TestModelContextRate:
+    """Tests for context growth rate and time to compaction."""
+
+    def _render(self, make_render_context, tmp_path, used, now, config=None, *, session_id="abc"):
+        data = make_input_data(
+            model=make_model_data(),
+            context_window=make_context_window_data(size=200000, input_tokens=used),
+            session_id=session_id,
+        )
+        ctx = make_render_context(data, cache_dir=tmp_path)
+        with patch("statuskit.modules.model.time.time", return_value=now):
+            return ModelModule(ctx, {"show_context_rate": True, **(config or {})}).render()
+
+    def test_disabled_by_default(self, make_render_context, tmp_path):
+        """No session state is written unless enabled."""
+        data = make_input_data(
+            context_window=make_context_window_data(input_tokens=1000),
+            session_id="abc",
+        )
+        ModelModule(make_render_context(data, cache_dir=tmp_path), {}).render()
+
+        assert not (tmp_path / "cache.db").exists()
+
+    def test_needs_history(self, make_render_context, tmp_path):
+        """The first sample shows no rate."""
+        result = self._render(make_render_context, tmp_path, 10000, 1000.0)
+
+        assert result is not None
+        assert "/min" not in result
+
+    def test_rate_and_time_to_compact(self, make_render_context, tmp_path):
+        """Growth since earlier samples gives tokens/min and time left."""
+        self._render(make_render_context, tmp_path, 40000, 1000.0)
+        result = self._render(make_render_context, tmp_path, 60000, 1300.0)
+
+        # 20k tokens in 5 minutes; 100k left until 80% of 200k
+        assert result is not None
+        assert "+4k/min" in result
+        assert "~25m to compact" in result
+
+    def test_long_time_to_compact(self, make_render_context, tmp_path):
+        """Times over an hour include hours."""
+        self._render(make_render_context, tmp_path, 10000, 1000.0)
+        result = self._render(make_render_context, tmp_path, 11000, 1600.0)
+
+        # 100 tokens/min, 149k left
+        assert result is not None
+        assert "~24h 50m to compact" in result
+
+    def test_compaction_threshold(self, make_render_context, tmp_path):
+        """compaction_threshold sets where auto-compaction is expected."""
+        config = {"compaction_threshold": 50}
+        self._render(make_render_context, tmp_path, 40000, 1000.0, config)
+        result = self._render(make_render_context, tmp_path, 60000, 1300.0, config)
+
+        assert result is not None
+        assert "~10m to compact" in result
+
+    def test_past_threshold(self, make_render_context, tmp_path):
+        """Past the threshold only the rate is shown."""
+        self._render(make_render_context, tmp_path, 160000, 1000.0)
+        result = self._render(make_render_context, tmp_path, 170000, 1300.0)
+
+        assert result is not None
+        assert "+2k/min" in result
+        assert "to compact" not in result
+
+    def test_negligible_rate_hidden(self, make_render_context, tmp_path):
+        """Growth below one token per minute is not shown as "+0/min"."""
+        self._render(make_render_context, tmp_path, 40000, 1000.0)
+        result = self._render(make_render_context, tmp_path, 40002, 1300.0)
+
+        assert result is not None
+        assert "/min" not in result
+
+    def test_idle_session_rate_decays(self, make_render_context, tmp_path):
+        """Time without new usage slows the rate, and a whole idle window hides it."""
+        self._render(make_render_context, tmp_path, 40000, 1000.0)
+        self._render(make_render_context, tmp_path, 60000, 1300.0)
+
+        # 20k tokens over the 10 minutes since the first sample
+        result = self._render(make_render_context, tmp_path, 60000, 1600.0)
+        assert result is not None
+        assert "+2k/min" in result
+
+        result = self._render(make_render_context, tmp_path, 60000, 1300.0 + 601)
+        assert result is not None
+        assert "/min" not in result
+
+    def test_drop_resets_history(self, make_render_context, tmp_path):
+        """Compaction (usage dropping) starts a new history."""
+        self._render(make_render_context, tmp_path, 40000, 1000.0)
+        self._render(make_render_context, tmp_path, 150000, 1300.0)
+        result = self._render(make_render_context, tmp_path, 20000, 1600.0)
+
+        assert result is not None
+        assert "/min" not in result
+
+    def test_unchanged_usage_not_recorded(self, make_render_context, tmp_path):
+        """Refreshes without a new turn do not add samples."""
+        self._render(make_render_context, tmp_path, 40000, 1000.0)
+        self._render(make_render_context, tmp_path, 40000, 1300.0)
+
+        # Samples expire relative to the patched clock
+        with patch("statuskit.modules.model.time.time", return_value=1300.0):
+            state = SessionStore(CacheStore.for_dir(tmp_path)).load("abc", "model")
+        assert state["samples"] == [[1000.0, 40000]]
+
+    def test_old_samples_outside_window(self, make_render_context, tmp_path):
+        """The rate only uses the recent window."""
+        self._render(make_render_context, tmp_path, 10000, 0.0)
+        self._render(make_render_context, tmp_path, 40000, 3000.0)
+        result = self._render(make_render_context, tmp_path, 60000, 3300.0)
+
+        assert result is not None
+        assert "+4k/min" in result
+
+    def test_per_session(self, make_render_context, tmp_path):
+        """Each session has its own history."""
+        self._render(make_render_context, tmp_path, 40000, 1000.0, session_id="one")
+        result = self._render(make_render_context, tmp_path, 60000, 1300.0, session_id="two")
+
+        assert result is not None
+        assert "/min" not in result
+
+    def test_without_cache_dir(self, make_render_context):
+        """Without a cache directory only the context is shown."""
+        data = make_input_data(
+            context_window=make_context_window_data(input_tokens=1000),
+            session_id="abc",
+        )
+        result = ModelModule(make_render_context(data), {"show_context_rate": True}).render()
+
+        assert result is not None
+        assert "Context:" in result
+        assert "/min" not in result
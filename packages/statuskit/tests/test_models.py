@@ -11,6 +11,7 @@ def test_status_input_from_dict_minimal(minimal_input_data):
     assert result.model.display_name == "Opus"
     assert result.model.id is None
     assert result.session_id is None
+    assert result.transcript_path is None
     assert result.workspace is None
     assert result.cost is None
     assert result.context_window is None
@@ -22,6 +23,7 @@ def test_status_input_from_dict_full(full_input_data):
 
     assert result.session_id == "abc123"
     assert result.cwd == "/home/user"
+    assert result.transcript_path == "/home/user/.claude/projects/-home-user/abc123.jsonl"
     assert result.model is not None
     assert result.model.id == "claude-opus-4-1"
     assert result.model.display_name == "Opus"
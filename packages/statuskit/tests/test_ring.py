@@ -0,0 +1,59 @@
+"""Tests for ring buffer files."""
+
+import struct
+
+from statuskit.core.ring import RingBuffer
+
+RECORD = struct.Struct("<df")
+
+
+class TestRingBuffer:
+    """Tests for RingBuffer."""
+
+    def test_empty_when_missing(self, tmp_path):
+        """A missing file reads as empty."""
+        assert RingBuffer(tmp_path / "ring.bin", RECORD, 4).records() == []
+
+    def test_append_and_read_in_order(self, tmp_path):
+        """Records are read back oldest first."""
+        ring = RingBuffer(tmp_path / "ring.bin", RECORD, 4)
+        for i in range(3):
+            assert ring.append(float(i), i * 1.5)
+
+        assert ring.records() == [(0.0, 0.0), (1.0, 1.5), (2.0, 3.0)]
+
+    def test_wraps_and_keeps_newest(self, tmp_path):
+        """Once full, the oldest records are overwritten."""
+        ring = RingBuffer(tmp_path / "ring.bin", RECORD, 4)
+        for i in range(10):
+            ring.append(float(i), 0.0)
+
+        assert [record[0] for record in ring.records()] == [6.0, 7.0, 8.0, 9.0]
+
+    def test_file_size_is_fixed(self, tmp_path):
+        """The file is preallocated and never grows."""
+        path = tmp_path / "ring.bin"
+        ring = RingBuffer(path, RECORD, 4)
+        ring.append(1.0, 1.0)
+        size = path.stat().st_size
+        for i in range(10):
+            ring.append(float(i), 0.0)
+
+        assert path.stat().st_size == size == ring.file_size
+
+    def test_layout_change_resets(self, tmp_path):
+        """A buffer written with another capacity is replaced, not misread."""
+        path = tmp_path / "ring.bin"
+        RingBuffer(path, RECORD, 4).append(1.0, 1.0)
+        ring = RingBuffer(path, RECORD, 8)
+
+        assert ring.records() == []
+        assert ring.append(2.0, 2.0)
+        assert ring.records() == [(2.0, 2.0)]
+
+    def test_corrupted_file_reads_empty(self, tmp_path):
+        """A file that is not a ring buffer reads as empty."""
+        path = tmp_path / "ring.bin"
+        path.write_bytes(b"garbage")
+
+        assert RingBuffer(path, RECORD, 4).records() == []
@@ -0,0 +1,69 @@
+"""Tests for statuskit.core.sessions."""
+
+from unittest.mock import patch
+
+from statuskit.core.sessions import SESSION_TTL, SessionStore
+from statuskit.core.store import CacheStore
+
+
+def _sessions(tmp_path):
+    return SessionStore(CacheStore.for_dir(tmp_path))
+
+
+class TestSessionStore:
+    """Tests for SessionStore."""
+
+    def test_load_missing(self, tmp_path):
+        """Unknown sessions load as empty state."""
+        assert _sessions(tmp_path).load("abc", "model") == {}
+
+    def test_save_and_load(self, tmp_path):
+        """Saved state is returned by load, also from another process's store."""
+        assert _sessions(tmp_path).save("abc", "model", {"samples": [[1.0, 100]]})
+
+        assert _sessions(tmp_path).load("abc", "model") == {"samples": [[1.0, 100]]}
+
+    def test_namespaces_independent(self, tmp_path):
+        """Saving one namespace keeps the others."""
+        store = _sessions(tmp_path)
+        store.save("abc", "model", {"a": 1})
+        store.save("abc", "git", {"b": 2})
+
+        assert store.load("abc", "model") == {"a": 1}
+        assert store.load("abc", "git") == {"b": 2}
+
+    def test_sessions_independent(self, tmp_path):
+        """State is kept per session."""
+        store = _sessions(tmp_path)
+        store.save("one", "model", {"a": 1})
+
+        assert store.load("two", "model") == {}
+
+    def test_any_session_id(self, tmp_path):
+        """Session ids are keys, not file names, so any string works."""
+        store = _sessions(tmp_path)
+        store.save("../../etc/passwd", "model", {"a": 1})
+
+        assert store.load("../../etc/passwd", "model") == {"a": 1}
+        assert not (tmp_path / "etc").exists()
+
+    def test_expires_after_ttl(self, tmp_path):
+        """State not saved again within SESSION_TTL is forgotten."""
+        store = _sessions(tmp_path)
+        with patch("statuskit.core.store.time.time", return_value=1000.0):
+            store.save("abc", "model", {"a": 1})
+
+        with patch("statuskit.core.store.time.time", return_value=1000.0 + SESSION_TTL + 1):
+            assert store.load("abc", "model") == {}
+
+    def test_shares_store_limits(self, tmp_path):
+        """Sessions count towards the shared store's entry limit."""
+        store = SessionStore(CacheStore(tmp_path / "cache.db", max_entries=2))
+        for n, session_id in enumerate(("one", "two", "three")):
+            with patch("statuskit.core.store.time.time", return_value=1000.0 + n):
+                store.save(session_id, "model", {"n": n})
+
+        with patch("statuskit.core.store.time.time", return_value=1010.0):
+            assert store.load("one", "model") == {}
+            assert store.load("two", "model") == {"n": 1}
+            assert store.load("three", "model") == {"n": 2}
@@ -228,6 +228,81 @@ class TestRemoveHook:
         assert "other-script" in result.message
 
 
+class TestWarmHooks:
+    """Tests for the cache warming hooks in install_hook and remove_hook."""
+
+    def test_install_with_warm_hooks(self, tmp_path, monkeypatch):
+        """warm_hooks=True adds the hooks next to the statusLine entry."""
+        from statuskit.setup.commands import install_hook
+        from statuskit.setup.paths import Scope
+
+        home = tmp_path / "home"
+        monkeypatch.setattr(Path, "home", lambda: home)
+
+        result = install_hook(Scope.USER, force=False, ui=None, warm_hooks=True)
+
+        assert result.success is True
+        assert result.warm_hooks_installed is True
+        settings = json.loads((home / ".claude" / "settings.json").read_text())
+        assert settings["statusLine"]["command"] == "statuskit"
+        assert settings["hooks"]["Stop"][0]["hooks"][0]["command"] == "statuskit warm"
+
+    def test_install_without_warm_hooks(self, tmp_path, monkeypatch):
+        """Hooks are only added when asked for."""
+        from statuskit.setup.commands import install_hook
+        from statuskit.setup.paths import Scope
+
+        home = tmp_path / "home"
+        monkeypatch.setattr(Path, "home", lambda: home)
+
+        result = install_hook(Scope.USER, force=False, ui=None)
+
+        assert result.warm_hooks_installed is False
+        assert "hooks" not in json.loads((home / ".claude" / "settings.json").read_text())
+
+    def test_already_installed_adds_warm_hooks(self, tmp_path, monkeypatch):
+        """Running setup --hooks on an existing installation adds the hooks."""
+        from statuskit.setup.commands import install_hook
+        from statuskit.setup.paths import Scope
+
+        home = tmp_path / "home"
+        (home / ".claude").mkdir(parents=True)
+        (home / ".claude" / "settings.json").write_text(json.dumps({"statusLine": {"command": "statuskit"}}))
+        monkeypatch.setattr(Path, "home", lambda: home)
+
+        result = install_hook(Scope.USER, force=False, ui=None, warm_hooks=True)
+
+        assert result.already_installed is True
+        assert result.warm_hooks_installed is True
+
+    def test_remove_also_removes_warm_hooks(self, tmp_path, monkeypatch):
+        """Removing the statusline removes the warm hooks too."""
+        from statuskit.setup.commands import install_hook, remove_hook
+        from statuskit.setup.paths import Scope
+
+        home = tmp_path / "home"
+        monkeypatch.setattr(Path, "home", lambda: home)
+        install_hook(Scope.USER, force=False, ui=None, warm_hooks=True)
+
+        result = remove_hook(Scope.USER, force=False, ui=None)
+
+        assert result.success is True
+        assert result.warm_hooks_removed is True
+        assert json.loads((home / ".claude" / "settings.json").read_text()) == {}
+
+    def test_check_shows_warm_hooks(self, tmp_path, monkeypatch):
+        """check_installation notes installed warm hooks."""
+        from statuskit.setup.commands import check_installation, install_hook
+        from statuskit.setup.paths import Scope
+
+        home = tmp_path / "home"
+        monkeypatch.setattr(Path, "home", lambda: home)
+        monkeypatch.chdir(tmp_path)
+        install_hook(Scope.USER, force=False, ui=None, warm_hooks=True)
+
+        assert "User:    \u2713 Installed (+ warm hooks)" in check_installation()
+
+
 class TestInstallHookHigherScope:
     """Tests for install_hook with higher-scope detection."""
 
@@ -149,3 +149,82 @@ class TestCreateBackup:
         result = create_backup(original)
 
         assert result == tmp_path / "settings.json.bak"
+
+
+class TestWarmHooks:
+    """Tests for installing and removing `statuskit warm` hooks."""
+
+    def test_install_adds_each_event(self):
+        """Adds a warm hook for every event, with a matcher for tool events."""
+        from statuskit.setup.hooks import WARM_EVENTS, WARM_TOOLS_MATCHER, has_warm_hooks, install_warm_hooks
+
+        settings: dict = {}
+
+        assert install_warm_hooks(settings) is True
+        assert set(settings["hooks"]) == set(WARM_EVENTS)
+        assert settings["hooks"]["PostToolUse"] == [
+            {"matcher": WARM_TOOLS_MATCHER, "hooks": [{"type": "command", "command": "statuskit warm"}]}
+        ]
+        assert "matcher" not in settings["hooks"]["Stop"][0]
+        assert has_warm_hooks(settings) is True
+
+    def test_install_is_idempotent(self):
+        """A second install changes nothing."""
+        from statuskit.setup.hooks import install_warm_hooks
+
+        settings: dict = {}
+        install_warm_hooks(settings)
+        before = json.dumps(settings)
+
+        assert install_warm_hooks(settings) is False
+        assert json.dumps(settings) == before
+
+    def test_install_keeps_other_hooks(self):
+        """Hooks of other tools are left in place."""
+        from statuskit.setup.hooks import install_warm_hooks
+
+        other = {"matcher": "Bash", "hooks": [{"type": "command", "command": "lint.sh"}]}
+        settings = {"hooks": {"PostToolUse": [other]}}
+
+        install_warm_hooks(settings)
+
+        assert settings["hooks"]["PostToolUse"][0] == other
+        assert len(settings["hooks"]["PostToolUse"]) == 2
+
+    def test_install_rejects_invalid_section(self):
+        """A hooks section that is not an object is an error."""
+        from statuskit.setup.hooks import install_warm_hooks
+
+        with pytest.raises(ValueError, match="hooks"):
+            install_warm_hooks({"hooks": []})
+
+    def test_statusline_command_is_not_warm_hook(self):
+        """Only `statuskit warm` counts as a warm hook."""
+        from statuskit.setup.hooks import is_warm_hook
+
+        assert is_warm_hook({"command": "statuskit warm"}) is True
+        assert is_warm_hook({"command": "~/.local/bin/statuskit warm"}) is True
+        assert is_warm_hook({"command": "statuskit"}) is False
+        assert is_warm_hook({"command": "other warm"}) is False
+
+    def test_remove_only_ours(self):
+        """Removes warm hooks, leaving other hooks and dropping empty sections."""
+        from statuskit.setup.hooks import install_warm_hooks, remove_warm_hooks
+
+        other = {"matcher": "Bash", "hooks": [{"type": "command", "command": "lint.sh"}]}
+        settings = {"hooks": {"PostToolUse": [other]}}
+        install_warm_hooks(settings)
+
+        assert remove_warm_hooks(settings) is True
+        assert settings == {"hooks": {"PostToolUse": [other]}}
+
+    def test_remove_drops_empty_hooks_section(self):
+        """The hooks section is removed when nothing else is in it."""
+        from statuskit.setup.hooks import install_warm_hooks, remove_warm_hooks
+
+        settings: dict = {"other": 1}
+        install_warm_hooks(settings)
+
+        assert remove_warm_hooks(settings) is True
+        assert settings == {"other": 1}
+        assert remove_warm_hooks(settings) is False
@@ -0,0 +1,230 @@
+"""Tests for statuskit.core.store."""
+
+import sqlite3
+import stat
+import threading
+from unittest.mock import patch
+
+from statuskit.core.models import RenderContext, StatusInput
+from statuskit.core.store import CacheStore
+
+
+class TestCacheStore:
+    """Tests for CacheStore."""
+
+    def test_set_and_get(self, tmp_path):
+        """Values round-trip as JSON."""
+        store = CacheStore.for_dir(tmp_path)
+        assert store.set("mod", "key", {"a": [1, 2]})
+
+        assert store.get("mod", "key") == {"a": [1, 2]}
+        assert CacheStore.for_dir(tmp_path).get("mod", "key") == {"a": [1, 2]}
+
+    def test_missing_key(self, tmp_path):
+        """Missing keys return the default."""
+        store = CacheStore.for_dir(tmp_path)
+
+        assert store.get("mod", "key") is None
+        assert store.get("mod", "key", 5) == 5
+
+    def test_namespaces_separate(self, tmp_path):
+        """The same key in different namespaces holds different values."""
+        store = CacheStore.for_dir(tmp_path)
+        store.set("one", "key", 1)
+        store.set("two", "key", 2)
+
+        assert store.namespace("one").get("key") == 1
+        assert store.namespace("two").get("key") == 2
+
+    def test_ttl(self, tmp_path):
+        """Expired values are not returned."""
+        store = CacheStore.for_dir(tmp_path)
+        with patch("statuskit.core.store.time.time", return_value=1000.0):
+            store.set("mod", "key", "value", ttl=10)
+        with patch("statuskit.core.store.time.time", return_value=1009.0):
+            assert store.get("mod", "key") == "value"
+        with patch("statuskit.core.store.time.time", return_value=1010.0):
+            assert store.get("mod", "key") is None
+
+    def test_delete_and_clear(self, tmp_path):
+        """Values can be removed by key or namespace."""
+        store = CacheStore.for_dir(tmp_path)
+        store.set("one", "a", 1)
+        store.set("one", "b", 2)
+        store.set("two", "a", 3)
+
+        store.delete("one", "a")
+        assert store.get("one", "a") is None
+        store.namespace("one").clear()
+        assert store.get("one", "b") is None
+        assert store.get("two", "a") == 3
+        store.clear()
+        assert store.get("two", "a") is None
+
+    def test_evicts_least_recently_used_entries(self, tmp_path):
+        """Beyond max_entries the least recently used entries are dropped."""
+        store = CacheStore(tmp_path / "cache.db", max_entries=2)
+        with patch("statuskit.core.store.time.time", return_value=1000.0):
+            store.set("mod", "a", 1)
+            store.set("mod", "b", 2)
+        with patch("statuskit.core.store.time.time", return_value=2000.0):
+            assert store.get("mod", "a") == 1  # refreshes a's access time
+            store.set("mod", "c", 3)
+
+        assert store.get("mod", "a") == 1
+        assert store.get("mod", "b") is None
+        assert store.get("mod", "c") == 3
+
+    def test_evicts_by_size(self, tmp_path):
+        """Beyond max_bytes the oldest values are dropped."""
+        store = CacheStore(tmp_path / "cache.db", max_bytes=250)
+        with patch("statuskit.core.store.time.time", return_value=1000.0):
+            store.set("mod", "a", "x" * 100)
+        with patch("statuskit.core.store.time.time", return_value=1001.0):
+            store.set("mod", "b", "x" * 100)
+            store.set("mod", "c", "x" * 100)
+
+        assert store.get("mod", "a") is None
+        assert store.get("mod", "b") is not None
+        assert store.get("mod", "c") is not None
+
+    def test_expired_entries_removed_on_write(self, tmp_path):
+        """Writes clear expired entries before evicting live ones."""
+        store = CacheStore(tmp_path / "cache.db", max_entries=1)
+        with patch("statuskit.core.store.time.time", return_value=1000.0):
+            store.set("mod", "a", 1, ttl=1)
+        with patch("statuskit.core.store.time.time", return_value=1002.0):
+            store.set("mod", "b", 2)
+            assert store.get("mod", "b") == 2
+
+    def test_running_totals(self, tmp_path):
+        """Entry count and size totals follow inserts, updates and deletes."""
+        store = CacheStore.for_dir(tmp_path)
+        store.set("mod", "a", "x" * 10)
+        store.set("mod", "b", "x" * 20)
+        store.set("mod", "a", "x" * 5)
+        store.delete("mod", "b")
+        store.set("other", "c", 1)
+
+        totals = store._execute("SELECT count, bytes FROM totals")
+        actual = store._execute("SELECT count(*), sum(size) FROM entries")
+        assert totals == actual == [(2, 8)]
+
+    def test_totals_added_to_existing_database(self, tmp_path):
+        """A database from before the running totals is counted on open."""
+        CacheStore.for_dir(tmp_path).set("mod", "a", "x" * 10)
+        with sqlite3.connect(tmp_path / "cache.db") as conn:
+            conn.executescript(
+                "DROP TRIGGER entries_insert; DROP TRIGGER entries_delete;"
+                " DROP TRIGGER entries_resize; DROP TABLE totals;"
+            )
+        conn.close()
+
+        store = CacheStore.for_dir(tmp_path)
+        store.set("mod", "b", 1)
+
+        assert store._execute("SELECT count, bytes FROM totals") == [(2, 13)]
+
+    def test_unserializable_value(self, tmp_path):
+        """Values that are not JSON are rejected."""
+        assert not CacheStore.for_dir(tmp_path).set("mod", "key", object())
+
+    def test_corrupted_database_replaced(self, tmp_path):
+        """A file that is not a database is replaced."""
+        (tmp_path / "cache.db").write_bytes(b"not a database" * 100)
+        store = CacheStore.for_dir(tmp_path)
+
+        assert store.get("mod", "key") is None
+        assert store.set("mod", "key", 1)
+        assert store.get("mod", "key") == 1
+
+    def test_statement_errors_keep_database(self, tmp_path):
+        """Errors from statuskit's own SQL do not wipe the cache."""
+        store = CacheStore.for_dir(tmp_path)
+        store.set("mod", "key", 1)
+
+        for sql in ("INSERT INTO totals VALUES (0, 0, 0)", "SELECT missing FROM entries"):
+            try:
+                store._execute(sql)
+            except sqlite3.DatabaseError:
+                pass
+
+        assert store.get("mod", "key") == 1
+
+    def test_missing_totals_row_recounted(self, tmp_path):
+        """A write after the totals row was deleted recounts instead of failing."""
+        store = CacheStore.for_dir(tmp_path)
+        store.set("mod", "a", "x" * 10)
+        store._execute("DELETE FROM totals")
+
+        assert store.set("mod", "b", 1)
+        assert store._execute("SELECT count, bytes FROM totals") == [(2, 13)]
+
+    def test_unwritable_directory(self, tmp_path):
+        """An unusable location reads as empty and ignores writes."""
+        (tmp_path / "file").write_text("")
+        store = CacheStore.for_dir(tmp_path / "file")
+
+        assert store.get("mod", "key") is None
+        assert not store.set("mod", "key", 1)
+
+    def test_private_file(self, tmp_path):
+        """The database is only readable by its owner."""
+        CacheStore.for_dir(tmp_path).set("mod", "key", 1)
+
+        assert stat.S_IMODE((tmp_path / "cache.db").stat().st_mode) == 0o600
+
+    def test_concurrent_writers(self, tmp_path):
+        """Writers in several connections do not lose or corrupt entries."""
+        barrier = threading.Barrier(8)
+
+        def write(n: int) -> None:
+            store = CacheStore.for_dir(tmp_path)
+            barrier.wait()
+            for i in range(20):
+                store.set("mod", f"{n}-{i}", i)
+            store.close()
+
+        threads = [threading.Thread(target=write, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        store = CacheStore.for_dir(tmp_path)
+        assert all(store.get("mod", f"{n}-19") == 19 for n in range(8))
+
+    def test_shared_between_threads(self, tmp_path):
+        """One instance serves worker threads as well as the thread that opened it."""
+        store = CacheStore.for_dir(tmp_path)
+        store.set("mod", "key", 1)
+        results = []
+
+        def read() -> None:
+            results.extend(store.get("mod", "key") for _ in range(20))
+            store.set("mod", threading.current_thread().name, 2)
+
+        threads = [threading.Thread(target=read) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == [1] * 80
+        assert all(store.get("mod", thread.name) == 2 for thread in threads)
+
+
+class TestRenderContextStore:
+    """Tests for RenderContext.store."""
+
+    def test_store_in_cache_dir(self, tmp_path):
+        """The context's store lives in the cache directory and is reused."""
+        ctx = RenderContext(debug=False, data=StatusInput.from_dict({}), cache_dir=tmp_path)
+
+        assert ctx.store is not None
+        assert ctx.store is ctx.store
+        assert ctx.store.path == tmp_path / "cache.db"
+
+    def test_no_cache_dir(self):
+        """Without a cache directory there is no store."""
+        assert RenderContext(debug=False, data=StatusInput.from_dict({})).store is None
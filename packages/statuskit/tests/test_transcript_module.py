@@ -0,0 +1,290 @@
+"""Tests for statuskit.modules.transcript."""
+
+import json
+import mmap
+from unittest.mock import patch
+
+from statuskit.core.sessions import SessionStore
+from statuskit.core.store import CacheStore
+from statuskit.modules.transcript import TranscriptIndex, TranscriptModule
+
+from .factories import make_input_data
+from .factories.transcript import (
+    append_entries,
+    make_assistant_entry,
+    make_prompt_entry,
+    make_tool_result_entry,
+)
+
+
+def _index(tmp_path, transcript):
+    return TranscriptIndex(transcript, SessionStore(CacheStore.for_dir(tmp_path / "cache")), "abc")
+
+
+class TestTranscriptIndex:
+    """Tests for TranscriptIndex."""
+
+    def test_missing_file(self, tmp_path):
+        """A missing transcript gives no stats."""
+        assert _index(tmp_path, tmp_path / "missing.jsonl").update() is None
+
+    def test_aggregates(self, tmp_path):
+        """Turns, tool calls and tokens are counted."""
+        transcript = tmp_path / "abc.jsonl"
+        append_entries(
+            transcript,
+            make_prompt_entry(),
+            make_assistant_entry("msg_1", tools=("Bash",), input_tokens=10, output_tokens=20, cache_read=500),
+            make_tool_result_entry(),
+            make_assistant_entry("msg_2", tools=("Edit", "Bash"), input_tokens=5, output_tokens=30, cache_creation=7),
+            make_prompt_entry("again"),
+        )
+
+        stats = _index(tmp_path, transcript).update()
+
+        assert stats is not None
+        assert stats.turns == 2
+        assert stats.tool_calls == {"Bash": 2, "Edit": 1}
+        assert stats.total_tool_calls == 3
+        assert stats.input_tokens == 15
+        assert stats.output_tokens == 50
+        assert stats.cache_creation_tokens == 7
+        assert stats.cache_read_tokens == 500
+
+    def test_split_message_usage_counted_once(self, tmp_path):
+        """Entries of one assistant message repeat its usage; it is counted once."""
+        transcript = tmp_path / "abc.jsonl"
+        append_entries(
+            transcript,
+            make_assistant_entry("msg_1", output_tokens=100),
+            make_assistant_entry("msg_1", tools=("Read",), output_tokens=100),
+        )
+
+        stats = _index(tmp_path, transcript).update()
+
+        assert stats is not None
+        assert stats.output_tokens == 100
+        assert stats.tool_calls == {"Read": 1}
+
+    def test_split_message_across_updates(self, tmp_path):
+        """The last message id is checkpointed with the offset."""
+        transcript = tmp_path / "abc.jsonl"
+        index = _index(tmp_path, transcript)
+        append_entries(transcript, make_assistant_entry("msg_1", output_tokens=100))
+        index.update()
+        append_entries(transcript, make_assistant_entry("msg_1", tools=("Read",), output_tokens=100))
+
+        stats = index.update()
+
+        assert stats is not None
+        assert stats.output_tokens == 100
+
+    def test_only_new_lines_parsed(self, tmp_path):
+        """Later updates start at the checkpointed offset."""
+        transcript = tmp_path / "abc.jsonl"
+        index = _index(tmp_path, transcript)
+        append_entries(transcript, make_prompt_entry())
+        index.update()
+        append_entries(transcript, make_prompt_entry())
+
+        add_entry = TranscriptIndex._add_entry
+        with patch.object(TranscriptIndex, "_add_entry", autospec=True, side_effect=add_entry) as mock_add:
+            stats = index.update()
+
+        assert stats is not None
+        assert stats.turns == 2
+        assert mock_add.call_count == 1
+
+    def test_unchanged_file_not_read(self, tmp_path):
+        """Nothing is parsed when the transcript did not grow."""
+        transcript = tmp_path / "abc.jsonl"
+        index = _index(tmp_path, transcript)
+        append_entries(transcript, make_prompt_entry())
+        index.update()
+
+        with patch.object(TranscriptIndex, "_parse") as mock_parse:
+            stats = index.update()
+
+        mock_parse.assert_not_called()
+        assert stats is not None
+        assert stats.turns == 1
+
+    def test_partial_line_left_for_later(self, tmp_path):
+        """A line still being written is parsed once complete."""
+        transcript = tmp_path / "abc.jsonl"
+        index = _index(tmp_path, transcript)
+        line = json.dumps(make_prompt_entry())
+        transcript.write_text(line[:10])
+
+        stats = index.update()
+        assert stats is not None
+        assert stats.turns == 0
+
+        with transcript.open("a") as f:
+            f.write(line[10:] + "\n")
+        stats = index.update()
+        assert stats is not None
+        assert stats.turns == 1
+
+    def test_truncated_file_reparsed(self, tmp_path):
+        """A transcript that shrank is parsed from the start."""
+        transcript = tmp_path / "abc.jsonl"
+        index = _index(tmp_path, transcript)
+        append_entries(transcript, make_prompt_entry(), make_prompt_entry())
+        index.update()
+        transcript.write_text("")
+        append_entries(transcript, make_prompt_entry())
+
+        stats = index.update()
+
+        assert stats is not None
+        assert stats.turns == 1
+
+    def test_other_transcript_reparsed(self, tmp_path):
+        """A different transcript path for the session starts over."""
+        first = tmp_path / "first.jsonl"
+        second = tmp_path / "second.jsonl"
+        append_entries(first, make_prompt_entry(), make_prompt_entry())
+        append_entries(second, make_prompt_entry())
+        _index(tmp_path, first).update()
+
+        stats = _index(tmp_path, second).update()
+
+        assert stats is not None
+        assert stats.turns == 1
+
+    def test_malformed_lines_skipped(self, tmp_path):
+        """Invalid JSON lines are ignored."""
+        transcript = tmp_path / "abc.jsonl"
+        transcript.write_text("{not json\n[1, 2]\n")
+        append_entries(transcript, make_prompt_entry())
+
+        stats = _index(tmp_path, transcript).update()
+
+        assert stats is not None
+        assert stats.turns == 1
+
+    def test_meta_messages_not_turns(self, tmp_path):
+        """Injected meta messages are not counted as prompts."""
+        transcript = tmp_path / "abc.jsonl"
+        append_entries(transcript, {**make_prompt_entry(), "isMeta": True})
+
+        stats = _index(tmp_path, transcript).update()
+
+        assert stats is not None
+        assert stats.turns == 0
+
+    def test_large_append_memory_mapped(self, tmp_path):
+        """Appends above the threshold are parsed through mmap."""
+        transcript = tmp_path / "abc.jsonl"
+        append_entries(transcript, *[make_prompt_entry()] * 50)
+
+        with (
+            patch("statuskit.modules.transcript.MMAP_THRESHOLD", 100),
+            patch("statuskit.modules.transcript.mmap.mmap", wraps=mmap.mmap) as mock_mmap,
+        ):
+            stats = _index(tmp_path, transcript).update()
+
+        assert mock_mmap.called
+        assert stats is not None
+        assert stats.turns == 50
+
+    def test_bytes_per_update_bounded(self, tmp_path):
+        """Large backlogs are parsed over several updates."""
+        transcript = tmp_path / "abc.jsonl"
+        append_entries(transcript, *[make_prompt_entry()] * 10)
+        line_size = transcript.stat().st_size // 10
+        index = _index(tmp_path, transcript)
+
+        with patch("statuskit.modules.transcript.MAX_BYTES_PER_UPDATE", line_size * 4):
+            first = index.update()
+            second = index.update()
+            third = index.update()
+
+        assert first is not None
+        assert second is not None
+        assert third is not None
+        assert (first.turns, second.turns, third.turns) == (4, 8, 10)
+
+    def test_oversized_line_skipped(self, tmp_path):
+        """A line longer than the per-update limit is skipped, not retried forever."""
+        transcript = tmp_path / "abc.jsonl"
+        append_entries(transcript, make_prompt_entry("x" * 1000), make_prompt_entry())
+        index = _index(tmp_path, transcript)
+
+        with patch("statuskit.modules.transcript.MAX_BYTES_PER_UPDATE", 100):
+            first = index.update()
+            second = index.update()
+
+        assert first is not None
+        assert second is not None
+        assert (first.turns, second.turns) == (0, 1)
+
+
+class TestTranscriptModule:
+    """Tests for TranscriptModule."""
+
+    def _render(self, make_render_context, tmp_path, config=None, **kwargs):
+        transcript = tmp_path / "abc.jsonl"
+        data = make_input_data(session_id="abc", transcript_path=str(transcript))
+        ctx = make_render_context(data, cache_dir=tmp_path / "cache", **kwargs)
+        return TranscriptModule(ctx, config or {}).render()
+
+    def test_render(self, make_render_context, tmp_path):
+        """Turns, top tools and tokens are shown."""
+        append_entries(
+            tmp_path / "abc.jsonl",
+            make_prompt_entry(),
+            make_assistant_entry("msg_1", tools=("Bash", "Bash", "Edit", "Read", "Grep"), cache_read=1_200_000),
+            make_assistant_entry("msg_2", input_tokens=12_000, output_tokens=45_000),
+        )
+
+        result = self._render(make_render_context, tmp_path)
+
+        assert result is not None
+        assert "Turns: 1" in result
+        assert "Tools: 5" in result
+        assert "Bash 2" in result
+        assert "Grep" not in result
+        assert "Tokens: 12k in, 45k out, 1.2M cached" in result
+
+    def test_options(self, make_render_context, tmp_path):
+        """Parts can be turned off."""
+        append_entries(tmp_path / "abc.jsonl", make_prompt_entry(), make_assistant_entry(tools=("Bash",)))
+
+        result = self._render(
+            make_render_context, tmp_path, {"show_turns": False, "top_tools": 0, "show_tokens": False}
+        )
+
+        assert result == "Tools: 1"
+
+    def test_no_transcript_path(self, make_render_context, tmp_path):
+        """Without transcript_path nothing is shown."""
+        ctx = make_render_context(make_input_data(session_id="abc"), cache_dir=tmp_path)
+        assert TranscriptModule(ctx, {}).render() is None
+
+    def test_no_cache_dir(self, make_render_context, tmp_path):
+        """Without a cache directory nothing is shown."""
+        append_entries(tmp_path / "abc.jsonl", make_prompt_entry())
+        data = make_input_data(transcript_path=str(tmp_path / "abc.jsonl"))
+        assert TranscriptModule(make_render_context(data), {}).render() is None
+
+    def test_debug_missing_transcript(self, make_render_context, tmp_path):
+        """Debug mode explains why nothing is shown."""
+        result = self._render(make_render_context, tmp_path, debug=True)
+
+        assert result is not None
+        assert "Cannot read" in result
+
+    def test_session_id_from_file_name(self, make_render_context, tmp_path):
+        """Without session_id the transcript name identifies the session."""
+        transcript = tmp_path / "abc.jsonl"
+        append_entries(transcript, make_prompt_entry())
+        ctx = make_render_context(make_input_data(transcript_path=str(transcript)), cache_dir=tmp_path / "cache")
+
+        TranscriptModule(ctx, {}).render()
+
+        assert (
+            SessionStore(CacheStore.for_dir(tmp_path / "cache")).load("abc", "transcript")["offset"]
+            == transcript.stat().st_size
+        )
@@ -0,0 +1,237 @@
+"""Usage API behaviour against a local stand-in server."""
+
+import json
+import threading
+import time
+from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+from benchmarks.fakes import FakeUsageApi, Reply
+from statuskit.modules.usage_limits import (
+    UsageCache,
+    UsageData,
+    UsageLimit,
+    UsageLimitsModule,
+    _token_memo,
+    fetch_usage_api,
+    get_api_url,
+    refresh_usage,
+)
+
+from tests.factories.usage_limits import make_api_response
+
+
+@pytest.fixture
+def credentials(tmp_path, monkeypatch):
+    """A credentials file in a temporary home, for this and child processes."""
+    home = tmp_path / "home"
+    (home / ".claude").mkdir(parents=True)
+    path = home / ".claude" / ".credentials.json"
+    path.write_text(json.dumps({"claudeAiOauth": {"accessToken": "fake-token"}}))
+    monkeypatch.setenv("HOME", str(home))
+    _token_memo.clear()
+    with (
+        patch("statuskit.modules.usage_limits.CREDENTIALS_PATH", path),
+        patch("statuskit.modules.usage_limits._keychain_available", return_value=False),
+    ):
+        yield path
+    _token_memo.clear()
+
+
+class TestApiUrl:
+    """Tests for overriding the API endpoint."""
+
+    def test_default(self, monkeypatch):
+        """Without overrides the Anthropic API is used."""
+        monkeypatch.delenv("STATUSKIT_USAGE_API_URL", raising=False)
+        assert get_api_url() == "https://api.anthropic.com/api/oauth/usage"
+
+    def test_config(self, monkeypatch):
+        """The api_url setting replaces the default."""
+        monkeypatch.delenv("STATUSKIT_USAGE_API_URL", raising=False)
+        assert get_api_url("http://localhost:1/usage") == "http://localhost:1/usage"
+
+    def test_environment_wins(self, monkeypatch):
+        """The environment variable takes precedence over config."""
+        monkeypatch.setenv("STATUSKIT_USAGE_API_URL", "http://localhost:2/usage")
+        assert get_api_url("http://localhost:1/usage") == "http://localhost:2/usage"
+
+    def test_plain_http_only_to_loopback(self, monkeypatch):
+        """Overrides sending the token unencrypted off the machine are ignored."""
+        monkeypatch.setenv("STATUSKIT_USAGE_API_URL", "http://example.com/usage")
+        assert get_api_url("http://127.0.0.1:1/usage") == "http://127.0.0.1:1/usage"
+        assert get_api_url("http://[::1]:1/usage") == "http://[::1]:1/usage"
+        assert get_api_url("ftp://localhost/usage") == "https://api.anthropic.com/api/oauth/usage"
+        assert get_api_url() == "https://api.anthropic.com/api/oauth/usage"
+
+    def test_config_limited_to_loopback(self, monkeypatch):
+        """Project config cannot send the token to another host, even over HTTPS."""
+        monkeypatch.delenv("STATUSKIT_USAGE_API_URL", raising=False)
+        assert get_api_url("https://attacker.example.com/usage") == "https://api.anthropic.com/api/oauth/usage"
+        assert get_api_url("https://localhost:8443/usage") == "https://localhost:8443/usage"
+
+    def test_environment_allows_https_hosts(self, monkeypatch):
+        """The environment variable may name any HTTPS host."""
+        monkeypatch.setenv("STATUSKIT_USAGE_API_URL", "https://proxy.example.com/usage")
+        assert get_api_url() == "https://proxy.example.com/usage"
+
+    def test_config_passed_to_refresh(self, make_render_context, minimal_input_data, tmp_path):
+        """A configured api_url is handed to the background refresh."""
+        ctx = make_render_context(minimal_input_data, cache_dir=tmp_path)
+        module = UsageLimitsModule(ctx, {"api_url": "http://localhost:1/usage"})
+
+        with patch("statuskit.modules.usage_limits.spawn_statuskit", return_value=True) as mock_spawn:
+            module.render()
+
+        assert mock_spawn.call_args[0][-2:] == ("--api-url", "http://localhost:1/usage")
+
+
+@pytest.mark.integration
+class TestFakeUsageApi:
+    """Fetching and refreshing against the stand-in server."""
+
+    def test_fetch(self, fake_usage_api):
+        """A normal reply is parsed and the token is sent."""
+        data = fetch_usage_api("fake-token")
+
+        assert data is not None
+        assert data.session is not None
+        assert data.session.utilization == 45.0
+        assert fake_usage_api.requests[0]["Authorization"] == "Bearer fake-token"
+
+    def test_latency_within_timeout(self, fake_usage_api):
+        """Slow replies inside the timeout still succeed."""
+        fake_usage_api.set_reply(Reply(latency=0.2))
+        assert fetch_usage_api("fake-token") is not None
+
+    def test_hang_times_out_once_per_window(self, fake_usage_api, credentials, tmp_path):
+        """A hung API costs one timeout, then the breaker skips it."""
+        fake_usage_api.set_reply(Reply(hang=True))
+
+        with patch("statuskit.modules.usage_limits.API_TIMEOUT", 0.3):
+            start = time.monotonic()
+            assert not refresh_usage(tmp_path)
+            elapsed = time.monotonic() - start
+            assert not refresh_usage(tmp_path)
+
+        assert elapsed < 2
+        assert fake_usage_api.request_count == 1
+        assert UsageCache(tmp_path).breaker.state()["reason"] == "network"
+
+    def test_rate_limited(self, fake_usage_api, credentials, tmp_path):
+        """429 with Retry-After keeps the breaker open that long."""
+        fake_usage_api.set_reply(Reply(status=429, headers={"Retry-After": "120"}))
+
+        assert not refresh_usage(tmp_path)
+        assert not refresh_usage(tmp_path)
+
+        state = UsageCache(tmp_path).breaker.state()
+        assert state["reason"] == "rate_limited"
+        assert 110 < state["open_until"] - time.time() <= 120
+        assert fake_usage_api.request_count == 1
+
+    @pytest.mark.parametrize("body", [b"{not json", b"[]", b"null"])
+    def test_malformed_body(self, fake_usage_api, credentials, tmp_path, body):
+        """A body that is not a JSON object is recorded and leaves the cache alone."""
+        fake_usage_api.set_reply(Reply(body=body))
+
+        assert not refresh_usage(tmp_path)
+
+        assert UsageCache(tmp_path).breaker.state()["reason"] == "malformed"
+        assert UsageCache(tmp_path).load() is None
+
+    @pytest.mark.parametrize("reply", [Reply(disconnect=True), Reply(truncate=True)], ids=["disconnect", "truncate"])
+    def test_dropped_connection(self, fake_usage_api, credentials, tmp_path, reply):
+        """A connection lost mid-reply is a network failure, not a crash."""
+        fake_usage_api.set_reply(reply)
+
+        assert not refresh_usage(tmp_path)
+
+        assert UsageCache(tmp_path).breaker.state()["reason"] == "network"
+        assert UsageCache(tmp_path).load() is None
+
+    def test_auth_failure(self, fake_usage_api, credentials, tmp_path):
+        """A rejected token is not retried; a new one is."""
+        fake_usage_api.queue(Reply(status=401))
+
+        assert not refresh_usage(tmp_path)
+        assert not refresh_usage(tmp_path)
+        assert fake_usage_api.request_count == 1
+
+        credentials.write_text(json.dumps({"claudeAiOauth": {"accessToken": "new-token"}}))
+        assert refresh_usage(tmp_path)
+        assert fake_usage_api.requests[-1]["Authorization"] == "Bearer new-token"
+
+    def test_recovers_after_outage(self, fake_usage_api, credentials, tmp_path):
+        """Once the backoff window passes, a successful call closes the breaker."""
+        fake_usage_api.queue(Reply(status=503))
+        assert not refresh_usage(tmp_path)
+
+        breaker = UsageCache(tmp_path).breaker
+        state = breaker.state()
+        state["open_until"] = 0
+        breaker.path.write_text(json.dumps(state))
+
+        assert refresh_usage(tmp_path)
+        assert breaker.state() == {}
+
+    def test_concurrent_refreshes_single_flight(self, fake_usage_api, credentials, tmp_path):
+        """Many sessions refreshing at once make a single API call."""
+        fake_usage_api.set_reply(Reply(latency=0.3))
+        barrier = threading.Barrier(8)
+
+        def refresh() -> None:
+            barrier.wait()
+            refresh_usage(tmp_path)
+
+        threads = [threading.Thread(target=refresh) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert fake_usage_api.request_count == 1
+        assert UsageCache(tmp_path).load() is not None
+
+    def test_render_never_waits_for_api(
+        self, fake_usage_api, credentials, make_render_context, minimal_input_data, tmp_path
+    ):
+        """Render returns stale data at once; the detached refresh updates the cache."""
+        fake_usage_api.set_reply(Reply(latency=1.0, body=make_api_response(five_hour_util=80.0)))
+        cache_dir = tmp_path / "cache"
+        UsageCache(cache_dir).save(
+            UsageData(UsageLimit(10.0, None), None, None, datetime.now(UTC) - timedelta(minutes=5))
+        )
+        ctx = make_render_context(minimal_input_data, cache_dir=cache_dir)
+
+        start = time.monotonic()
+        output = UsageLimitsModule(ctx, {}).render()
+        elapsed = time.monotonic() - start
+
+        assert output is not None
+        assert "10%" in output
+        assert elapsed < 0.5
+
+        deadline = time.monotonic() + 15
+        cached = None
+        while time.monotonic() < deadline:
+            cached = UsageCache(cache_dir).load()
+            if cached and cached.session and cached.session.utilization == 80.0:
+                break
+            time.sleep(0.1)
+        assert cached is not None
+        assert cached.session is not None
+        assert cached.session.utilization == 80.0
+
+
+class TestFakeServerItself:
+    """Tests for the stand-in's own bookkeeping."""
+
+    def test_queue_then_default(self):
+        """Queued replies are used once, then the default applies."""
+        with FakeUsageApi() as api:
+            api.queue(Reply(status=500))
+            assert fetch_usage_api("t", api_url=api.url) is None
+            assert fetch_usage_api("t", api_url=api.url) is not None
+            assert api.request_count == 2
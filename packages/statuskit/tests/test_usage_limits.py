@@ -1,17 +1,27 @@
 """Tests for usage_limits module."""
 
 import json
-import tempfile
+import os
+import time
 from datetime import UTC, datetime, timedelta
+from email.message import Message
 from pathlib import Path
 from unittest.mock import patch
-from urllib.error import URLError
+from urllib.error import HTTPError, URLError
 
+import pytest
+from statuskit.core.store import CacheStore
 from statuskit.modules.usage_limits import (
+    CircuitBreaker,
+    Credentials,
     UsageCache,
     UsageData,
+    UsageHistory,
     UsageLimit,
     UsageLimitsModule,
+    _token_memo,
+    adaptive_ttl,
+    burn_rate,
     calculate_color,
     fetch_usage_api,
     format_progress_bar,
@@ -19,6 +29,8 @@ from statuskit.modules.usage_limits import (
     format_reset_at,
     get_token,
     parse_api_response,
+    refresh_usage,
+    utilization_rate,
 )
 
 from tests.factories.usage_limits import make_api_response, make_api_response_with_null_reset
@@ -287,31 +299,149 @@ class TestFormatProgressBar:
 class TestGetToken:
     """Tests for OAuth token retrieval."""
 
+    @pytest.fixture(autouse=True)
+    def _isolate(self, tmp_path):
+        """Start each test with no cached lookup and no credentials file."""
+        _token_memo.clear()
+        with patch("statuskit.modules.usage_limits.CREDENTIALS_PATH", tmp_path / "nonexistent"):
+            yield
+        _token_memo.clear()
+
+    def _write_credentials(self, path: Path, token: str, expires_at: float | None = None) -> Path:
+        oauth: dict = {"accessToken": token}
+        if expires_at is not None:
+            oauth["expiresAt"] = int(expires_at * 1000)
+        path.write_text(json.dumps({"claudeAiOauth": oauth}))
+        return path
+
     def test_get_token_from_keychain(self):
         """Gets token from macOS Keychain first."""
-        with patch("statuskit.modules.usage_limits._get_keychain_token") as mock_keychain:
-            mock_keychain.return_value = "keychain-token"
+        with (
+            patch("statuskit.modules.usage_limits._keychain_available", return_value=True),
+            patch("statuskit.modules.usage_limits._get_keychain_credentials") as mock_keychain,
+        ):
+            mock_keychain.return_value = Credentials("keychain-token", None)
             token = get_token()
             assert token == "keychain-token"  # noqa: S105
 
+    def test_keychain_skipped_off_macos(self, tmp_path):
+        """The Keychain is not queried where it is unavailable."""
+        creds_file = self._write_credentials(tmp_path / ".credentials.json", "file-token")
+
+        with (
+            patch("statuskit.modules.usage_limits._keychain_available", return_value=False),
+            patch("statuskit.modules.usage_limits._get_keychain_credentials") as mock_keychain,
+            patch("statuskit.modules.usage_limits.CREDENTIALS_PATH", creds_file),
+        ):
+            assert get_token() == "file-token"
+
+        mock_keychain.assert_not_called()
+
     def test_fallback_to_credentials_file(self, tmp_path):
         """Falls back to credentials file if Keychain fails."""
-        creds_file = tmp_path / ".credentials.json"
-        creds_file.write_text(json.dumps({"claudeAiOauth": {"accessToken": "file-token"}}))
+        creds_file = self._write_credentials(tmp_path / ".credentials.json", "file-token")
 
-        with patch("statuskit.modules.usage_limits._get_keychain_token") as mock_keychain:
-            mock_keychain.return_value = None
-            with patch("statuskit.modules.usage_limits.CREDENTIALS_PATH", creds_file):
-                token = get_token()
-                assert token == "file-token"  # noqa: S105
+        with (
+            patch("statuskit.modules.usage_limits._keychain_available", return_value=True),
+            patch("statuskit.modules.usage_limits._get_keychain_credentials", return_value=None),
+            patch("statuskit.modules.usage_limits.CREDENTIALS_PATH", creds_file),
+        ):
+            token = get_token()
+            assert token == "file-token"  # noqa: S105
 
     def test_returns_none_when_no_token(self, tmp_path):
         """Returns None when token not found anywhere."""
-        with patch("statuskit.modules.usage_limits._get_keychain_token") as mock_keychain:
-            mock_keychain.return_value = None
-            with patch("statuskit.modules.usage_limits.CREDENTIALS_PATH", tmp_path / "nonexistent"):
-                token = get_token()
-                assert token is None
+        with (
+            patch("statuskit.modules.usage_limits._keychain_available", return_value=True),
+            patch("statuskit.modules.usage_limits._get_keychain_credentials", return_value=None),
+        ):
+            token = get_token()
+            assert token is None
+
+    def test_cached_until_credentials_change(self, tmp_path):
+        """The credentials file is re-read only when its mtime changes."""
+        creds_file = self._write_credentials(tmp_path / ".credentials.json", "old-token")
+        cache_dir = tmp_path / "cache"
+
+        with (
+            patch("statuskit.modules.usage_limits._keychain_available", return_value=False),
+            patch("statuskit.modules.usage_limits.CREDENTIALS_PATH", creds_file),
+        ):
+            assert get_token(cache_dir) == "old-token"
+            with patch("statuskit.modules.usage_limits._get_file_credentials") as mock_read:
+                assert get_token(cache_dir) == "old-token"
+            mock_read.assert_not_called()
+
+            self._write_credentials(creds_file, "new-token")
+            os.utime(creds_file, ns=(0, creds_file.stat().st_mtime_ns + 10**9))
+            assert get_token(cache_dir) == "new-token"
+
+    def test_disk_cache_survives_process(self, tmp_path):
+        """A new process reuses the on-disk lookup to skip the Keychain probe."""
+        creds_file = self._write_credentials(tmp_path / ".credentials.json", "file-token")
+        cache_dir = tmp_path / "cache"
+
+        with (
+            patch("statuskit.modules.usage_limits._keychain_available", return_value=True),
+            patch("statuskit.modules.usage_limits._get_keychain_credentials", return_value=None) as mock_keychain,
+            patch("statuskit.modules.usage_limits.CREDENTIALS_PATH", creds_file),
+        ):
+            get_token(cache_dir)
+            _token_memo.clear()  # as in a fresh process
+            mock_keychain.reset_mock()
+            assert get_token(cache_dir) == "file-token"
+
+        mock_keychain.assert_not_called()
+        assert "file-token" not in (cache_dir / "usage_token.json").read_text()
+
+    def test_keychain_token_not_stored_on_disk(self, tmp_path):
+        """Keychain tokens stay in memory; a new process asks the Keychain again."""
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir()
+        (cache_dir / "usage_token.json").write_text(json.dumps({"source": "file", "token": "old-token"}))
+
+        with (
+            patch("statuskit.modules.usage_limits._keychain_available", return_value=True),
+            patch("statuskit.modules.usage_limits._get_keychain_credentials") as mock_keychain,
+        ):
+            mock_keychain.return_value = Credentials("keychain-token", None)
+            assert get_token(cache_dir) == "keychain-token"
+            _token_memo.clear()  # as in a fresh process
+            assert get_token(cache_dir) == "keychain-token"
+
+        assert mock_keychain.call_count == 2
+        assert not (cache_dir / "usage_token.json").exists()
+
+    def test_expired_token_not_returned(self, tmp_path):
+        """A token past its expiresAt is never returned."""
+        creds_file = self._write_credentials(tmp_path / ".credentials.json", "file-token", time.time() - 10)
+
+        with (
+            patch("statuskit.modules.usage_limits._keychain_available", return_value=False),
+            patch("statuskit.modules.usage_limits.CREDENTIALS_PATH", creds_file),
+        ):
+            assert get_token(tmp_path / "cache") is None
+
+    def test_cached_token_expiring_is_looked_up_again(self, tmp_path):
+        """A cached token that has expired is replaced by a fresh lookup."""
+        cache_dir = tmp_path / "cache"
+
+        with (
+            patch("statuskit.modules.usage_limits._keychain_available", return_value=True),
+            patch("statuskit.modules.usage_limits._get_keychain_credentials") as mock_keychain,
+        ):
+            mock_keychain.return_value = Credentials("old-token", time.time() + 30)
+            assert get_token(cache_dir) is None  # Within the expiry margin
+            mock_keychain.return_value = Credentials("new-token", time.time() + 3600)
+            assert get_token(cache_dir) == "new-token"
+
+
+def _headers(values: dict) -> Message:
+    """Build HTTP headers for an HTTPError."""
+    message = Message()
+    for key, value in values.items():
+        message[key] = value
+    return message
 
 
 class TestFetchUsageApi:
@@ -346,6 +476,103 @@ class TestFetchUsageApi:
             data = fetch_usage_api("test-token")
             assert data is None
 
+    def _http_error(self, code: int, headers: dict | None = None) -> HTTPError:
+        return HTTPError(
+            "https://example.invalid", code, "error", Message() if headers is None else _headers(headers), None
+        )
+
+    def test_network_failure_opens_breaker(self, tmp_path):
+        """Network errors are recorded with exponential backoff."""
+        breaker = CircuitBreaker(tmp_path / "breaker.json")
+        with patch("statuskit.modules.usage_limits.urlopen", side_effect=URLError("down")):
+            assert fetch_usage_api("test-token", breaker) is None
+
+        assert breaker.state()["reason"] == "network"
+        assert breaker.is_open()
+
+    def test_rate_limited_honours_retry_after(self, tmp_path):
+        """429 responses keep the breaker open for Retry-After seconds."""
+        breaker = CircuitBreaker(tmp_path / "breaker.json")
+        error = self._http_error(429, {"Retry-After": "600"})
+        with patch("statuskit.modules.usage_limits.urlopen", side_effect=error):
+            fetch_usage_api("test-token", breaker)
+
+        state = breaker.state()
+        assert state["reason"] == "rate_limited"
+        assert 590 < state["open_until"] - time.time() <= 600
+
+    def test_auth_failure(self, tmp_path):
+        """401 responses are recorded as auth failures of that token."""
+        breaker = CircuitBreaker(tmp_path / "breaker.json")
+        with patch("statuskit.modules.usage_limits.urlopen", side_effect=self._http_error(401)):
+            fetch_usage_api("test-token", breaker)
+
+        assert breaker.state()["reason"] == "auth"
+        assert "test-token" not in (tmp_path / "breaker.json").read_text()
+
+    def test_success_closes_breaker(self, tmp_path):
+        """A successful call resets the breaker."""
+        breaker = CircuitBreaker(tmp_path / "breaker.json")
+        breaker.record_failure("network")
+        with patch("statuskit.modules.usage_limits.urlopen") as mock_urlopen:
+            mock_urlopen.return_value.__enter__.return_value.read.return_value = json.dumps(
+                make_api_response()
+            ).encode()
+            assert fetch_usage_api("test-token", breaker) is not None
+
+        assert breaker.state() == {}
+
+
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker."""
+
+    def test_closed_without_state(self, tmp_path):
+        """A breaker without recorded failures is closed."""
+        assert not CircuitBreaker(tmp_path / "breaker.json").is_open()
+
+    def test_backoff_doubles(self, tmp_path):
+        """Consecutive failures double the backoff window up to the maximum."""
+        breaker = CircuitBreaker(tmp_path / "breaker.json")
+        windows = []
+        for _ in range(7):
+            breaker.record_failure("server")
+            windows.append(round(breaker.state()["open_until"] - time.time()))
+
+        assert windows == [30, 60, 120, 240, 480, 900, 900]
+
+    def test_closes_after_window(self, tmp_path):
+        """The breaker closes once the backoff window has passed."""
+        breaker = CircuitBreaker(tmp_path / "breaker.json")
+        breaker.record_failure("network")
+
+        assert breaker.is_open()
+        assert not breaker.is_open(now=time.time() + 31)
+
+    def test_auth_blocks_only_rejected_token(self, tmp_path):
+        """An auth failure blocks the rejected token, not a new one."""
+        breaker = CircuitBreaker(tmp_path / "breaker.json")
+        breaker.record_failure("auth", token="old-token")  # noqa: S106
+
+        assert breaker.is_open("old-token")
+        assert not breaker.is_open("new-token")
+        assert not breaker.is_open()
+
+    def test_parses_http_date_retry_after(self, tmp_path):
+        """Retry-After may also be an HTTP date."""
+        breaker = CircuitBreaker(tmp_path / "breaker.json")
+        retry_at = datetime.now(UTC) + timedelta(minutes=10)
+        error = HTTPError(
+            "https://example.invalid",
+            429,
+            "error",
+            _headers({"Retry-After": retry_at.strftime("%a, %d %b %Y %H:%M:%S GMT")}),
+            None,
+        )
+        with patch("statuskit.modules.usage_limits.urlopen", side_effect=error):
+            fetch_usage_api("test-token", breaker)
+
+        assert 590 < breaker.state()["open_until"] - time.time() <= 600
+
 
 class TestUsageCache:
     """Tests for usage data caching."""
@@ -390,8 +617,8 @@ class TestUsageCache:
         loaded = cache.load()
         assert loaded is None
 
-    def test_save_is_atomic(self, tmp_path):
-        """Save uses atomic write (temp file + rename)."""
+    def test_save_uses_shared_store(self, tmp_path):
+        """Data is kept in the cache directory's shared store."""
         cache = UsageCache(cache_dir=tmp_path)
         data = UsageData(
             session=UsageLimit(45.0, datetime.now(UTC)),
@@ -400,22 +627,16 @@ class TestUsageCache:
             fetched_at=datetime.now(UTC),
         )
 
-        with patch.object(tempfile, "NamedTemporaryFile") as mock_tmp:
-            # Setup mock temp file
-            mock_file = mock_tmp.return_value.__enter__.return_value
-            mock_file.name = str(tmp_path / "temp_file.tmp")
+        cache.save(data)
 
-            with patch.object(Path, "replace") as mock_replace:
-                cache.save(data)
+        stored = CacheStore.for_dir(tmp_path).get("usage_limits", "data")
+        assert stored["data"]["session"]["utilization"] == 45.0
 
-                # Verify temp file was used
-                mock_tmp.assert_called_once()
-                call_kwargs = mock_tmp.call_args[1]
-                assert call_kwargs["dir"] == tmp_path
-                assert call_kwargs["delete"] is False
+    def test_load_corrupted_entry(self, tmp_path):
+        """An entry without the expected fields loads as no data."""
+        CacheStore.for_dir(tmp_path).set("usage_limits", "data", {"fetched_at": "yesterday"})
 
-                # Verify atomic rename was called
-                mock_replace.assert_called_once()
+        assert UsageCache(cache_dir=tmp_path).load() is None
 
     def test_save_and_load_with_null_resets_at(self, tmp_path):
         """Cache saves and loads data with null resets_at."""
@@ -441,9 +662,8 @@ class TestUsageCache:
     def test_load_cached_data_with_null_resets_at(self, tmp_path):
         """Cache loads correctly when cached file has null resets_at."""
         cache = UsageCache(cache_dir=tmp_path)
-        cache_file = tmp_path / "usage_limits.json"
 
-        # Manually create cache file with null resets_at
+        # Manually create cache entry with null resets_at
         cache_data = {
             "data": {
                 "session": {"utilization": 45.0, "resets_at": "2026-01-27T18:00:00+00:00"},
@@ -452,7 +672,7 @@ class TestUsageCache:
             },
             "fetched_at": "2026-01-27T12:00:00+00:00",
         }
-        cache_file.write_text(json.dumps(cache_data))
+        CacheStore.for_dir(tmp_path).set("usage_limits", "data", cache_data)
 
         loaded = cache.load()
 
@@ -610,138 +830,482 @@ class TestUsageLimitsModule:
             assert "(—)" in output
 
 
-class TestUsageLimitsIntegration:
-    """Integration tests for usage_limits module."""
+class TestUsageLimitsBurnRate:
+    """Tests for rendering burn rate and time to limit."""
 
-    def test_full_flow_with_mock_api(self, make_render_context, minimal_input_data, tmp_path):
-        """Full flow: API fetch -> cache -> render."""
+    def _render(self, make_render_context, minimal_input_data, tmp_path, samples, resets_in):
+        now = datetime.now(UTC)
+        cache = UsageCache(tmp_path)
+        for minutes_ago, utilization in samples:
+            cache.history.append(
+                UsageData(UsageLimit(utilization, None), None, None, now - timedelta(minutes=minutes_ago))
+            )
+        cache.save(UsageData(UsageLimit(samples[-1][1], now + resets_in), None, None, now))
         ctx = make_render_context(minimal_input_data, cache_dir=tmp_path)
-        config = {}
+        return UsageLimitsModule(ctx, {"show_burn_rate": True, "show_weekly": False}).render()
 
-        # Mock token and API
-        with patch("statuskit.modules.usage_limits.get_token") as mock_token:
-            mock_token.return_value = "test-token"
+    def test_shows_rate_and_time_to_limit(self, make_render_context, minimal_input_data, tmp_path):
+        """A limit hit before the reset is projected."""
+        output = self._render(
+            make_render_context, minimal_input_data, tmp_path, [(30, 70.0), (0, 80.0)], timedelta(hours=4)
+        )
 
-            with patch("statuskit.modules.usage_limits.fetch_usage_api") as mock_fetch:
-                mock_fetch.return_value = UsageData(
-                    session=UsageLimit(45.0, datetime.now(UTC) + timedelta(hours=2.5)),
-                    weekly=UsageLimit(32.0, datetime.now(UTC) + timedelta(days=3)),
-                    sonnet=None,
-                    fetched_at=datetime.now(UTC),
-                )
+        assert output is not None
+        assert "↗20%/h" in output
+        assert "limit in 1h 0m" in output
 
-                module = UsageLimitsModule(ctx, config)
-                output = module.render()
+    def test_no_projection_past_reset(self, make_render_context, minimal_input_data, tmp_path):
+        """No time to limit is shown when the window resets first."""
+        output = self._render(
+            make_render_context, minimal_input_data, tmp_path, [(30, 10.0), (0, 11.0)], timedelta(hours=2)
+        )
 
-                assert output is not None
-                assert "Session:" in output
-                assert "Weekly:" in output
+        assert output is not None
+        assert "↗2.0%/h" in output
+        assert "limit in" not in output
 
-                # Verify cache was saved
-                cache_file = tmp_path / "usage_limits.json"
-                assert cache_file.exists()
+    def test_hidden_by_default(self, make_render_context, minimal_input_data, tmp_path):
+        """Burn rate is only shown when enabled."""
+        cache = UsageCache(tmp_path)
+        now = datetime.now(UTC)
+        cache.history.append(UsageData(UsageLimit(70.0, None), None, None, now - timedelta(minutes=30)))
+        cache.history.append(UsageData(UsageLimit(80.0, None), None, None, now))
+        cache.save(UsageData(UsageLimit(80.0, None), None, None, now))
+        output = UsageLimitsModule(make_render_context(minimal_input_data, cache_dir=tmp_path), {}).render()
 
-                # Second render uses cache
-                mock_fetch.reset_mock()
-                output2 = module.render()
-                mock_fetch.assert_not_called()  # Used cache
-                assert output2 is not None
+        assert output is not None
+        assert "%/h" not in output
 
 
-class TestGetUsageDataRateLimited:
-    """Tests for _get_usage_data when rate limited."""
+class TestUsageLimitsIntegration:
+    """Integration tests for usage_limits module."""
 
-    def test_returns_cached_data_when_rate_limited(self, make_render_context, minimal_input_data, tmp_path):
-        """Returns cached data when rate limited."""
+    def test_full_flow_with_mock_api(self, make_render_context, minimal_input_data, tmp_path):
+        """Full flow: render starts refresh -> refresh fills cache -> render from cache."""
         ctx = make_render_context(minimal_input_data, cache_dir=tmp_path)
         config = {}
 
-        module = UsageLimitsModule(ctx, config)
-        assert module.cache is not None
+        with patch("statuskit.modules.usage_limits.spawn_statuskit", return_value=True) as mock_spawn:
+            module = UsageLimitsModule(ctx, config)
+            assert module.render() is None  # Nothing cached yet
 
-        # Prepare cache with rate limit active
-        cached_data = UsageData(
-            session=UsageLimit(45.0, datetime.now(UTC) + timedelta(hours=2.5)),
+        mock_spawn.assert_called_once_with("refresh-usage", "--cache-dir", str(tmp_path))
+
+        # What the detached refresh-usage process does
+        with (
+            patch("statuskit.modules.usage_limits.get_token", return_value="test-token"),
+            patch("statuskit.modules.usage_limits.fetch_usage_api") as mock_fetch,
+        ):
+            mock_fetch.return_value = UsageData(
+                session=UsageLimit(45.0, datetime.now(UTC) + timedelta(hours=2.5)),
+                weekly=UsageLimit(32.0, datetime.now(UTC) + timedelta(days=3)),
+                sonnet=None,
+                fetched_at=datetime.now(UTC),
+            )
+            assert refresh_usage(tmp_path)
+
+        assert UsageCache(tmp_path).load() is not None
+
+        with patch("statuskit.modules.usage_limits.spawn_statuskit") as mock_spawn:
+            output = UsageLimitsModule(ctx, config).render()
+
+        mock_spawn.assert_not_called()  # Fresh cache
+        assert output is not None
+        assert "Session:" in output
+        assert "Weekly:" in output
+
+
+class TestRefreshUsage:
+    """Tests for refresh_usage (the refresh-usage command)."""
+
+    def test_saves_fetched_data(self, tmp_path):
+        """Fetched data is written to the cache."""
+        data = UsageData(
+            session=UsageLimit(50.0, datetime.now(UTC) + timedelta(hours=2)),
             weekly=None,
             sonnet=None,
             fetched_at=datetime.now(UTC),
         )
-        module.cache.save(cached_data)
-        # fetched_at=now means rate limit is active (< 30 sec passed)
+        with (
+            patch("statuskit.modules.usage_limits.get_token", return_value="test-token"),
+            patch("statuskit.modules.usage_limits.fetch_usage_api", return_value=data),
+        ):
+            assert refresh_usage(tmp_path)
+
+        cached = UsageCache(tmp_path).load()
+        assert cached is not None
+        assert cached.session is not None
+        assert cached.session.utilization == 50.0
+
+    def test_no_token_leaves_cache(self, tmp_path):
+        """Without a token nothing is fetched or written."""
+        with (
+            patch("statuskit.modules.usage_limits.get_token", return_value=None),
+            patch("statuskit.modules.usage_limits.fetch_usage_api") as mock_fetch,
+        ):
+            assert not refresh_usage(tmp_path)
+
+        mock_fetch.assert_not_called()
+        assert UsageCache(tmp_path).load() is None
+
+    def test_failed_fetch_keeps_old_data(self, tmp_path):
+        """A failed fetch does not overwrite cached data."""
+        old = UsageData(
+            session=UsageLimit(45.0, datetime.now(UTC) + timedelta(hours=2)),
+            weekly=None,
+            sonnet=None,
+            fetched_at=datetime.now(UTC) - timedelta(minutes=5),
+        )
+        UsageCache(tmp_path).save(old)
+        with (
+            patch("statuskit.modules.usage_limits.get_token", return_value="test-token"),
+            patch("statuskit.modules.usage_limits.fetch_usage_api", return_value=None),
+        ):
+            assert not refresh_usage(tmp_path)
+
+        cached = UsageCache(tmp_path).load()
+        assert cached is not None
+        assert cached.session is not None
+        assert cached.session.utilization == 45.0
+
+    def test_skips_fetch_while_locked(self, tmp_path):
+        """Only the lock holder calls the API; others return immediately."""
+        holder = UsageCache(tmp_path).refresh_lock
+        assert holder.acquire()
+        try:
+            with (
+                patch("statuskit.modules.usage_limits.get_token", return_value="test-token"),
+                patch("statuskit.modules.usage_limits.fetch_usage_api") as mock_fetch,
+            ):
+                assert not refresh_usage(tmp_path)
+        finally:
+            holder.release()
+
+        mock_fetch.assert_not_called()
+
+    def test_skips_fetch_when_refreshed_meanwhile(self, tmp_path):
+        """A refresh that finds fresh data (from another process) does not fetch again."""
+        UsageCache(tmp_path).save(
+            UsageData(session=UsageLimit(45.0, None), weekly=None, sonnet=None, fetched_at=datetime.now(UTC))
+        )
+        with patch("statuskit.modules.usage_limits.fetch_usage_api") as mock_fetch:
+            assert refresh_usage(tmp_path)
 
-        # _get_usage_data should return cached data
-        with patch("statuskit.modules.usage_limits.get_token") as mock_token:
-            mock_token.return_value = "test-token"
-            result = module._get_usage_data()
+        mock_fetch.assert_not_called()
 
-        assert result is not None
-        assert result.session is not None
-        assert result.session.utilization == 45.0
+    def test_records_utilization_rate(self, tmp_path):
+        """The saved data carries the growth rate since the previous fetch."""
+        now = datetime.now(UTC)
+        UsageCache(tmp_path).save(
+            UsageData(session=UsageLimit(10.0, None), weekly=None, sonnet=None, fetched_at=now - timedelta(minutes=30))
+        )
+        new = UsageData(session=UsageLimit(15.0, None), weekly=None, sonnet=None, fetched_at=now)
+        with (
+            patch("statuskit.modules.usage_limits.get_token", return_value="test-token"),
+            patch("statuskit.modules.usage_limits.fetch_usage_api", return_value=new),
+        ):
+            assert refresh_usage(tmp_path)
+
+        cached = UsageCache(tmp_path).load()
+        assert cached is not None
+        assert cached.rate is not None
+        assert abs(cached.rate - 10.0) < 0.01
+
+    def test_skips_fetch_while_breaker_open(self, tmp_path):
+        """No API call is made during a backoff window."""
+        UsageCache(tmp_path).breaker.record_failure("network")
+        with (
+            patch("statuskit.modules.usage_limits.get_token", return_value="test-token"),
+            patch("statuskit.modules.usage_limits.urlopen") as mock_urlopen,
+        ):
+            assert not refresh_usage(tmp_path)
+
+        mock_urlopen.assert_not_called()
+
+    def test_auth_failure_forgets_token(self, tmp_path):
+        """A rejected token is dropped from the token cache."""
+        (tmp_path / "usage_token.json").write_text("{}")
+        error = HTTPError("https://example.invalid", 401, "error", Message(), None)
+        with (
+            patch("statuskit.modules.usage_limits.get_token", return_value="test-token"),
+            patch("statuskit.modules.usage_limits.urlopen", side_effect=error),
+        ):
+            assert not refresh_usage(tmp_path)
+
+        assert not (tmp_path / "usage_token.json").exists()
+
+    def test_releases_lock(self, tmp_path):
+        """The lock is released after a refresh, even a failed one."""
+        with patch("statuskit.modules.usage_limits.get_token", return_value=None):
+            refresh_usage(tmp_path)
+
+        assert not (tmp_path / "usage_limits.lock").exists()
+
+
+class TestUtilizationRate:
+    """Tests for utilization_rate."""
+
+    def _data(self, utilization: float, fetched_at: datetime) -> UsageData:
+        return UsageData(session=UsageLimit(utilization, None), weekly=None, sonnet=None, fetched_at=fetched_at)
+
+    def test_rate_per_hour(self):
+        """Growth is expressed in percentage points per hour."""
+        now = datetime.now(UTC)
+        rate = utilization_rate(self._data(10.0, now - timedelta(minutes=30)), self._data(15.0, now))
+        assert rate == 10.0
 
-    def test_fetches_first_when_allowed(self, make_render_context, minimal_input_data, tmp_path):
-        """Fetches from API first when rate limit allows, even if cache exists."""
-        ctx = make_render_context(minimal_input_data, cache_dir=tmp_path)
-        config = {}
+    def test_unknown_without_previous(self):
+        """No earlier fetch means no rate."""
+        assert utilization_rate(None, self._data(15.0, datetime.now(UTC))) is None
+
+    def test_unknown_across_reset(self):
+        """A drop in utilization (window reset) gives no rate."""
+        now = datetime.now(UTC)
+        assert utilization_rate(self._data(90.0, now - timedelta(minutes=5)), self._data(2.0, now)) is None
 
-        module = UsageLimitsModule(ctx, config)
-        assert module.cache is not None
 
-        # Prepare old cache (will be overwritten)
-        old_data = UsageData(
-            session=UsageLimit(10.0, datetime.now(UTC) + timedelta(hours=2)),
+class TestAdaptiveTtl:
+    """Tests for adaptive_ttl."""
+
+    NOW = datetime(2026, 1, 27, 12, 0, 0, tzinfo=UTC)
+
+    def _data(self, utilization: float, rate: float | None = None, resets_in: timedelta | None = None) -> UsageData:
+        resets_at = self.NOW + resets_in if resets_in else None
+        return UsageData(
+            session=UsageLimit(utilization, resets_at),
             weekly=None,
             sonnet=None,
-            fetched_at=datetime.now(UTC) - timedelta(minutes=5),  # Old enough to allow fetch
+            fetched_at=self.NOW,
+            rate=rate,
         )
-        module.cache.save(old_data)
 
-        # Mock API to return new data
-        new_data = UsageData(
-            session=UsageLimit(50.0, datetime.now(UTC) + timedelta(hours=2)),
-            weekly=None,
-            sonnet=None,
-            fetched_at=datetime.now(UTC),
+    def test_flat_usage_backs_off(self):
+        """Flat usage far from limits uses the longest TTL."""
+        assert adaptive_ttl(self._data(20.0, rate=0.0), 30, 300, now=self.NOW) == 300
+
+    def test_unknown_rate_backs_off(self):
+        """Without a known rate the longest TTL is used."""
+        assert adaptive_ttl(self._data(20.0), 30, 300, now=self.NOW) == 300
+
+    def test_growing_usage_refreshes_sooner(self):
+        """The TTL shrinks as utilization grows faster."""
+        slow = adaptive_ttl(self._data(20.0, rate=1.0), 30, 300, now=self.NOW)
+        fast = adaptive_ttl(self._data(20.0, rate=20.0), 30, 300, now=self.NOW)
+        assert slow == 150
+        assert fast == 30
+
+    def test_near_limit_uses_min(self):
+        """Utilization close to a limit uses the shortest TTL."""
+        assert adaptive_ttl(self._data(85.0, rate=0.0), 30, 300, now=self.NOW) == 30
+
+    def test_refresh_due_at_reset(self):
+        """The TTL never runs past the next reset."""
+        data = self._data(20.0, rate=0.0, resets_in=timedelta(minutes=2))
+        assert adaptive_ttl(data, 30, 300, now=self.NOW) == 120
+
+    def test_past_reset_uses_min(self):
+        """Data from before a reset that already happened is refreshed at once."""
+        data = self._data(20.0, rate=0.0, resets_in=timedelta(minutes=-5))
+        assert adaptive_ttl(data, 30, 300, now=self.NOW) == 30
+
+
+class TestUsageHistory:
+    """Tests for UsageHistory."""
+
+    def test_series_per_limit(self, tmp_path):
+        """Each limit's samples are returned separately, skipping missing ones."""
+        history = UsageHistory(tmp_path / "history.bin")
+        now = datetime.now(UTC)
+        history.append(UsageData(UsageLimit(10.0, None), UsageLimit(20.0, None), None, now - timedelta(minutes=5)))
+        history.append(UsageData(UsageLimit(12.0, None), None, None, now))
+
+        series = history.series()
+
+        assert [u for _, u in series["session"]] == [10.0, 12.0]
+        assert [u for _, u in series["weekly"]] == [20.0]
+        assert series["sonnet"] == []
+        assert series["session"][-1][0] == now.timestamp()
+
+    def test_refresh_appends_sample(self, tmp_path):
+        """Every successful refresh adds a history sample."""
+        data = UsageData(UsageLimit(30.0, None), None, None, datetime.now(UTC))
+        with (
+            patch("statuskit.modules.usage_limits.get_token", return_value="test-token"),
+            patch("statuskit.modules.usage_limits.fetch_usage_api", return_value=data),
+        ):
+            refresh_usage(tmp_path)
+
+        assert [u for _, u in UsageCache(tmp_path).history.series()["session"]] == [30.0]
+
+
+class TestBurnRate:
+    """Tests for burn_rate."""
+
+    def test_rate_per_hour(self):
+        """Growth over the lookback is expressed in %/hour."""
+        series = [(0.0, 10.0), (900.0, 12.0), (1800.0, 15.0)]
+        assert burn_rate(series, 3600) == 10.0
+
+    def test_lookback_limits_history(self):
+        """Samples older than the lookback are ignored."""
+        series = [(0.0, 0.0), (3600.0, 10.0), (5400.0, 12.0), (7200.0, 14.0)]
+        assert burn_rate(series, 1800) == 4.0
+
+    def test_stops_at_reset(self):
+        """Samples from before a reset are ignored."""
+        series = [(0.0, 90.0), (600.0, 2.0), (1200.0, 4.0)]
+        assert burn_rate(series, 3600) == 12.0
+
+    def test_needs_enough_history(self):
+        """Too short a span gives no rate."""
+        assert burn_rate([(0.0, 10.0), (60.0, 11.0)], 3600) is None
+        assert burn_rate([], 3600) is None
+
+
+class TestGetUsageDataStaleWhileRevalidate:
+    """Tests for _get_usage_data serving the cache and refreshing in the background."""
+
+    def _save(self, cache: UsageCache, age: timedelta) -> None:
+        cache.save(
+            UsageData(
+                session=UsageLimit(45.0, datetime.now(UTC) + timedelta(hours=2.5)),
+                weekly=None,
+                sonnet=None,
+                fetched_at=datetime.now(UTC) - age,
+            )
         )
 
-        with patch("statuskit.modules.usage_limits.get_token") as mock_token:
-            mock_token.return_value = "test-token"
-            with patch("statuskit.modules.usage_limits.fetch_usage_api") as mock_fetch:
-                mock_fetch.return_value = new_data
-                result = module._get_usage_data()
+    def test_fresh_cache_does_not_refresh(self, make_render_context, minimal_input_data, tmp_path):
+        """Fresh cached data is returned without starting a refresh."""
+        ctx = make_render_context(minimal_input_data, cache_dir=tmp_path)
+        module = UsageLimitsModule(ctx, {})
+        assert module.cache is not None
+        self._save(module.cache, timedelta(0))
+
+        with (
+            patch("statuskit.modules.usage_limits.spawn_statuskit") as mock_spawn,
+            patch("statuskit.modules.usage_limits.fetch_usage_api") as mock_fetch,
+        ):
+            result = module._get_usage_data()
 
-        # Should return NEW data, not cached
+        mock_spawn.assert_not_called()
+        mock_fetch.assert_not_called()
         assert result is not None
         assert result.session is not None
-        assert result.session.utilization == 50.0  # New value, not 10.0
+        assert result.session.utilization == 45.0
 
-    def test_returns_cached_on_failed_fetch(self, make_render_context, minimal_input_data, tmp_path):
-        """Returns cached data when API fetch fails."""
+    def test_stale_cache_returned_and_refreshed(self, make_render_context, minimal_input_data, tmp_path):
+        """Stale data is returned immediately while a refresh starts in the background."""
         ctx = make_render_context(minimal_input_data, cache_dir=tmp_path)
-        config = {}
-
-        module = UsageLimitsModule(ctx, config)
+        module = UsageLimitsModule(ctx, {})
         assert module.cache is not None
+        self._save(module.cache, timedelta(minutes=5))
 
-        # Prepare cache
-        cached_data = UsageData(
-            session=UsageLimit(45.0, datetime.now(UTC) + timedelta(hours=2)),
-            weekly=None,
-            sonnet=None,
-            fetched_at=datetime.now(UTC) - timedelta(minutes=5),  # Old enough to allow fetch
-        )
-        module.cache.save(cached_data)
-
-        with patch("statuskit.modules.usage_limits.get_token") as mock_token:
-            mock_token.return_value = "test-token"
-            with patch("statuskit.modules.usage_limits.fetch_usage_api") as mock_fetch:
-                mock_fetch.return_value = None  # API fails
-                result = module._get_usage_data()
+        with (
+            patch("statuskit.modules.usage_limits.spawn_statuskit", return_value=True) as mock_spawn,
+            patch("statuskit.modules.usage_limits.fetch_usage_api") as mock_fetch,
+        ):
+            result = module._get_usage_data()
 
-        # Should return cached data
+        mock_spawn.assert_called_once_with("refresh-usage", "--cache-dir", str(tmp_path))
+        mock_fetch.assert_not_called()  # Never on the render path
         assert result is not None
         assert result.session is not None
         assert result.session.utilization == 45.0
 
+    def test_recent_attempt_not_repeated(self, make_render_context, minimal_input_data, tmp_path):
+        """A refresh is started at most once per rate-limit window."""
+        ctx = make_render_context(minimal_input_data, cache_dir=tmp_path)
+        first = UsageLimitsModule(ctx, {})
+        assert first.cache is not None
+        self._save(first.cache, timedelta(minutes=5))
+
+        with patch("statuskit.modules.usage_limits.spawn_statuskit", return_value=True) as mock_spawn:
+            first._get_usage_data()
+            result = UsageLimitsModule(ctx, {})._get_usage_data()
+
+        mock_spawn.assert_called_once()
+        assert result is not None
+
+    def test_cache_ttl_config(self, make_render_context, minimal_input_data, tmp_path):
+        """cache_ttl sets how long cached data is served without a refresh."""
+        ctx = make_render_context(minimal_input_data, cache_dir=tmp_path)
+        cache = UsageCache(tmp_path)
+        self._save(cache, timedelta(minutes=5))
+
+        with patch("statuskit.modules.usage_limits.spawn_statuskit", return_value=True) as mock_spawn:
+            UsageLimitsModule(ctx, {"cache_ttl": 600})._get_usage_data()
+        mock_spawn.assert_not_called()
+
+        with patch("statuskit.modules.usage_limits.spawn_statuskit", return_value=True) as mock_spawn:
+            UsageLimitsModule(ctx, {"cache_ttl": 60})._get_usage_data()
+        mock_spawn.assert_called_once()
+
+    def test_adaptive_ttl_config(self, make_render_context, minimal_input_data, tmp_path):
+        """adaptive_ttl keeps flat usage fresh for up to max_cache_ttl."""
+        ctx = make_render_context(minimal_input_data, cache_dir=tmp_path)
+        self._save(UsageCache(tmp_path), timedelta(minutes=2))
+
+        with patch("statuskit.modules.usage_limits.spawn_statuskit", return_value=True) as mock_spawn:
+            UsageLimitsModule(ctx, {"adaptive_ttl": True, "max_cache_ttl": 300})._get_usage_data()
+
+        mock_spawn.assert_not_called()
+
+    def test_no_spawn_while_refresh_locked(self, make_render_context, minimal_input_data, tmp_path):
+        """No refresh is started while another process holds the refresh lock."""
+        ctx = make_render_context(minimal_input_data, cache_dir=tmp_path)
+        module = UsageLimitsModule(ctx, {})
+        assert module.cache is not None
+        self._save(module.cache, timedelta(minutes=5))
+        (tmp_path / "usage_limits.lock").write_text(str(os.getpid()))
+
+        with patch("statuskit.modules.usage_limits.spawn_statuskit") as mock_spawn:
+            result = module._get_usage_data()
+
+        mock_spawn.assert_not_called()
+        assert result is not None
+
+    def test_no_spawn_while_breaker_open(self, make_render_context, minimal_input_data, tmp_path):
+        """No refresh is started while the API is backing off."""
+        ctx = make_render_context(minimal_input_data, cache_dir=tmp_path, debug=True)
+        module = UsageLimitsModule(ctx, {})
+        assert module.cache is not None
+        self._save(module.cache, timedelta(minutes=5))
+        module.cache.breaker.record_failure("network")
+
+        with patch("statuskit.modules.usage_limits.spawn_statuskit") as mock_spawn:
+            output = module.render()
+
+        mock_spawn.assert_not_called()
+        assert output is not None
+        assert "API backing off (network)" in output
+
+    def test_old_attempt_retried(self, make_render_context, minimal_input_data, tmp_path):
+        """An attempt older than the rate limit (e.g. a failed fetch) is retried."""
+        ctx = make_render_context(minimal_input_data, cache_dir=tmp_path)
+        module = UsageLimitsModule(ctx, {})
+        assert module.cache is not None
+        self._save(module.cache, timedelta(minutes=5))
+        module.cache.refresh_marker.touch()
+        old = datetime.now(UTC).timestamp() - 60
+        os.utime(module.cache.refresh_marker, (old, old))
+
+        with patch("statuskit.modules.usage_limits.spawn_statuskit", return_value=True) as mock_spawn:
+            module._get_usage_data()
+
+        mock_spawn.assert_called_once()
+
+    def test_no_cache_dir(self, make_render_context, minimal_input_data):
+        """Without a cache directory there is nothing to render or refresh into."""
+        ctx = make_render_context(minimal_input_data)
+        module = UsageLimitsModule(ctx, {})
+
+        with patch("statuskit.modules.usage_limits.spawn_statuskit") as mock_spawn:
+            result = module._get_usage_data()
+
+        assert result is None
+        mock_spawn.assert_not_called()
+
     def test_debug_output_in_render(self, make_render_context, minimal_input_data, tmp_path):
         """Debug messages appear in render output."""
         ctx = make_render_context(minimal_input_data, cache_dir=tmp_path, debug=True)
@@ -749,10 +1313,9 @@ class TestGetUsageDataRateLimited:
 
         module = UsageLimitsModule(ctx, config)
 
-        with patch("statuskit.modules.usage_limits.get_token") as mock_token:
-            mock_token.return_value = None
+        with patch("statuskit.modules.usage_limits.spawn_statuskit", return_value=True):
             output = module.render()
 
         # Debug message should be in render output, not stdout
         assert output is not None
-        assert "[usage_limits] No token" in output
+        assert "[usage_limits] Refreshing in background" in output
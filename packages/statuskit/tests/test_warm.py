@@ -0,0 +1,161 @@
+"""Tests for statuskit.core.warm and the modules' warm hooks."""
+
+import os
+from datetime import UTC, datetime
+from unittest.mock import patch
+
+from statuskit.core.config import Config
+from statuskit.core.models import StatusInput
+from statuskit.core.sessions import SessionStore
+from statuskit.core.store import CacheStore
+from statuskit.core.warm import MAX_PASSES, Warmer, warm_modules
+from statuskit.modules.git import GitModule
+from statuskit.modules.usage_limits import UsageCache, UsageData, UsageLimit, UsageLimitsModule
+
+from .factories import make_input_data
+from .factories.transcript import append_entries, make_prompt_entry
+
+
+class TestWarmer:
+    """Tests for Warmer."""
+
+    def test_request_starts_warmer_when_idle(self, tmp_path):
+        """A request marks the project and asks for a warmer."""
+        warmer = Warmer(tmp_path, tmp_path / "project")
+
+        assert warmer.request() is True
+        assert warmer.pending.exists()
+
+    def test_request_while_running(self, tmp_path):
+        """A running warmer picks the request up; no second one is started."""
+        warmer = Warmer(tmp_path, tmp_path / "project")
+        warmer.lock.path.parent.mkdir(parents=True)
+        warmer.lock.path.write_text(str(os.getpid()))
+
+        assert warmer.request() is False
+        assert warmer.pending.exists()
+
+    def test_run_clears_request(self, tmp_path):
+        """A pass consumes the pending request and releases the lock."""
+        warmer = Warmer(tmp_path, tmp_path / "project")
+        warmer.request()
+
+        with patch("statuskit.core.warm.warm_modules", return_value=["git"]) as mock_warm:
+            assert warmer.run(Config(cache_dir=tmp_path), StatusInput.from_dict({})) == ["git"]
+
+        mock_warm.assert_called_once()
+        assert not warmer.pending.exists()
+        assert not warmer.lock.path.exists()
+
+    def test_run_repeats_for_requests_during_pass(self, tmp_path):
+        """Requests made during a pass trigger another, up to MAX_PASSES."""
+        warmer = Warmer(tmp_path, tmp_path / "project")
+
+        def request_again(config, data):
+            warmer.request()
+            return []
+
+        with patch("statuskit.core.warm.warm_modules", side_effect=request_again) as mock_warm:
+            warmer.run(Config(cache_dir=tmp_path), StatusInput.from_dict({}))
+
+        assert mock_warm.call_count == MAX_PASSES
+        assert warmer.needs_rerun()
+
+    def test_no_rerun_when_requests_handled(self, tmp_path):
+        """A run that consumed every request leaves nothing for another warmer."""
+        warmer = Warmer(tmp_path, tmp_path / "project")
+        warmer.request()
+
+        with patch("statuskit.core.warm.warm_modules", return_value=[]):
+            warmer.run(Config(cache_dir=tmp_path), StatusInput.from_dict({}))
+
+        assert not warmer.needs_rerun()
+
+    def test_run_skips_when_locked(self, tmp_path):
+        """Only one warmer runs per project."""
+        warmer = Warmer(tmp_path, tmp_path / "project")
+        warmer.lock.path.parent.mkdir(parents=True)
+        warmer.lock.path.write_text(str(os.getpid()))
+
+        with patch("statuskit.core.warm.warm_modules") as mock_warm:
+            assert warmer.run(Config(cache_dir=tmp_path), StatusInput.from_dict({})) == []
+
+        mock_warm.assert_not_called()
+
+
+class TestWarmModules:
+    """Tests for warm_modules."""
+
+    def test_failing_module_is_skipped(self, tmp_path):
+        """A module raising in warm() does not stop the others."""
+        config = Config(modules=["model", "git"], cache_dir=tmp_path)
+
+        with patch("statuskit.modules.git.GitModule.warm", side_effect=RuntimeError("boom")):
+            assert warm_modules(config, StatusInput.from_dict({})) == ["model"]
+
+    def test_transcript_checkpoint_saved(self, tmp_path):
+        """Warming the transcript module parses it ahead of the render."""
+        transcript = tmp_path / "s1.jsonl"
+        append_entries(transcript, make_prompt_entry())
+        config = Config(modules=["transcript"], cache_dir=tmp_path)
+
+        warm_modules(config, StatusInput.from_dict({"session_id": "s1", "transcript_path": str(transcript)}))
+
+        checkpoint = SessionStore(CacheStore.for_dir(tmp_path)).load("s1", "transcript")
+        assert checkpoint["offset"] == transcript.stat().st_size
+        assert checkpoint["stats"]["turns"] == 1
+
+
+class TestGitWarm:
+    """Tests for GitModule.warm."""
+
+    def test_without_watch_refreshes_caches_only(self, make_render_context, tmp_path):
+        """Without a snapshot to store, no full status is collected."""
+        config = {"show_worktrees": True, "submodules": "full"}
+        module = GitModule(make_render_context(make_input_data(), cache_dir=tmp_path), config)
+        with (
+            patch.object(module, "_collect_status") as mock_status,
+            patch.object(module, "_get_worktrees") as mock_worktrees,
+            patch.object(module, "_get_submodule_changes") as mock_submodules,
+        ):
+            module.warm()
+
+        mock_status.assert_not_called()
+        mock_worktrees.assert_called_once()
+        mock_submodules.assert_called_once()
+
+    def test_with_watch_stores_snapshot(self, make_render_context, tmp_path):
+        """With watch enabled the status snapshot is collected."""
+        module = GitModule(make_render_context(make_input_data(), cache_dir=tmp_path), {"watch": True})
+        with patch.object(module, "_get_status") as mock_status:
+            module.warm()
+
+        mock_status.assert_called_once()
+
+
+class TestUsageLimitsWarm:
+    """Tests for UsageLimitsModule.warm."""
+
+    def test_fetches_when_stale(self, make_render_context, tmp_path):
+        """Missing data is fetched in the warming process."""
+        module = UsageLimitsModule(make_render_context(make_input_data(), cache_dir=tmp_path), {})
+        with patch("statuskit.modules.usage_limits.refresh_usage") as mock_refresh:
+            module.warm()
+
+        mock_refresh.assert_called_once_with(tmp_path, api_url=None)
+
+    def test_skips_fresh_data(self, make_render_context, tmp_path):
+        """Fresh data is not fetched again."""
+        UsageCache(tmp_path).save(
+            UsageData(
+                session=UsageLimit(utilization=10.0, resets_at=None),
+                weekly=None,
+                sonnet=None,
+                fetched_at=datetime.now(UTC),
+            )
+        )
+        module = UsageLimitsModule(make_render_context(make_input_data(), cache_dir=tmp_path), {})
+        with patch("statuskit.modules.usage_limits.refresh_usage") as mock_refresh:
+            module.warm()
+
+        mock_refresh.assert_not_called()
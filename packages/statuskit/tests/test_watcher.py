@@ -0,0 +1,256 @@
+"""Tests for statuskit.core.watcher and its helpers."""
+
+import os
+import subprocess
+import sys
+import time
+from dataclasses import asdict
+
+import pytest
+from statuskit.core.cache import write_json
+from statuskit.core.lock import CacheLock
+from statuskit.core.watcher import (
+    STATE_ACTIVE,
+    STATE_DEGRADED,
+    WatchState,
+    _add_roots,
+    _InotifyBackend,
+    _PollingBackend,
+    _state_path,
+    needs_watcher,
+    read_state,
+    run_watcher,
+)
+
+
+def _make_state(state: str = STATE_ACTIVE, pid: int | None = None, updated_at: float | None = None) -> WatchState:
+    return WatchState(
+        pid=os.getpid() if pid is None else pid,
+        generation=42,
+        state=state,
+        backend="polling",
+        updated_at=time.time() if updated_at is None else updated_at,
+    )
+
+
+def _init_repo(path):
+    subprocess.run(["git", "init", "-q", str(path)], check=True)
+
+
+class TestWatchState:
+    """Tests for reading watcher state."""
+
+    def test_read_state_missing(self, tmp_path):
+        """read_state returns None without a watcher."""
+        assert read_state(tmp_path, tmp_path / "repo") is None
+
+    def test_read_state_roundtrip(self, tmp_path):
+        """read_state returns the state written by the watcher."""
+        worktree = tmp_path / "repo"
+        write_json(_state_path(tmp_path, worktree), asdict(_make_state()))
+
+        state = read_state(tmp_path, worktree)
+
+        assert state is not None
+        assert state.generation == 42
+        assert state.trusted
+
+    def test_dead_watcher_not_trusted(self, tmp_path):
+        """State left by a dead process is not trusted and needs a new watcher."""
+        worktree = tmp_path / "repo"
+        write_json(_state_path(tmp_path, worktree), asdict(_make_state(pid=2**22 + 12345)))
+
+        state = read_state(tmp_path, worktree)
+
+        assert state is not None
+        assert not state.trusted
+        assert needs_watcher(tmp_path, worktree)
+
+    def test_live_watcher_not_respawned(self, tmp_path):
+        """needs_watcher is False while the watcher is alive."""
+        worktree = tmp_path / "repo"
+        write_json(_state_path(tmp_path, worktree), asdict(_make_state()))
+
+        assert not needs_watcher(tmp_path, worktree)
+
+    def test_recent_degraded_not_respawned(self, tmp_path):
+        """A tree recently found too large is not watched again."""
+        worktree = tmp_path / "repo"
+        write_json(_state_path(tmp_path, worktree), asdict(_make_state(state=STATE_DEGRADED, pid=2**22 + 12345)))
+
+        assert not needs_watcher(tmp_path, worktree)
+        state = read_state(tmp_path, worktree)
+        assert state is not None
+        assert not state.trusted
+
+    def test_old_degraded_retried(self, tmp_path):
+        """A degraded verdict expires."""
+        worktree = tmp_path / "repo"
+        old = _make_state(state=STATE_DEGRADED, updated_at=time.time() - 10 * 3600)
+        write_json(_state_path(tmp_path, worktree), asdict(old))
+
+        assert needs_watcher(tmp_path, worktree)
+
+
+class TestCacheLock:
+    """Tests for CacheLock."""
+
+    def test_acquire_and_release(self, tmp_path):
+        """Lock can be acquired once and released."""
+        lock = CacheLock(tmp_path / "x.lock")
+        other = CacheLock(tmp_path / "x.lock")
+
+        assert lock.acquire()
+        assert lock.is_locked()
+        assert not other.acquire()
+
+        lock.release()
+        assert not (tmp_path / "x.lock").exists()
+        assert other.acquire()
+
+    def test_stale_lock_is_broken(self, tmp_path):
+        """Lock left by a dead process is taken over."""
+        path = tmp_path / "x.lock"
+        path.write_text(str(2**22 + 12345))
+
+        lock = CacheLock(path)
+
+        assert not lock.is_locked()
+        assert lock.acquire()
+        assert lock.owner() == os.getpid()
+
+    def test_concurrent_break_keeps_new_lock(self, tmp_path, monkeypatch):
+        """A lock taken while another process was breaking the stale one survives."""
+        path = tmp_path / "x.lock"
+        path.write_text(str(2**22 + 12345))
+        winner = CacheLock(path)
+        loser = CacheLock(path)
+        is_stale = loser.is_stale
+
+        def stale_then_raced():
+            result = is_stale()
+            # The winner breaks the same stale lock and locks again first
+            assert winner.acquire()
+            return result
+
+        monkeypatch.setattr(loser, "is_stale", stale_then_raced)
+
+        assert not loser.acquire()
+        assert winner.acquired
+        assert winner.owner() == os.getpid()
+        assert [p.name for p in tmp_path.iterdir()] == ["x.lock"]
+
+    def test_old_lock_is_broken_with_max_age(self, tmp_path):
+        """Lock older than max_age is taken over even if its owner is alive."""
+        path = tmp_path / "x.lock"
+        path.write_text(str(os.getpid()))
+        old = time.time() - 60
+        os.utime(path, (old, old))
+
+        assert CacheLock(path).is_locked()
+        assert not CacheLock(path, max_age=30).is_locked()
+        assert CacheLock(path, max_age=30).acquire()
+
+
+class TestPollingBackend:
+    """Tests for the polling fallback."""
+
+    def test_detects_file_change(self, tmp_path):
+        """Modified files change the fingerprint."""
+        (tmp_path / "a.txt").write_text("a")
+        backend = _PollingBackend(max_watches=100, interval=0)
+        backend.add(tmp_path, recursive=True)
+        backend.start()
+
+        assert backend.wait(0) == (False, [])
+
+        (tmp_path / "a.txt").write_text("changed")
+        changed, _ = backend.wait(0)
+
+        assert changed
+
+    def test_reports_new_directories(self, tmp_path):
+        """New subdirectories of recursive roots are reported."""
+        backend = _PollingBackend(max_watches=100, interval=0)
+        backend.add(tmp_path, recursive=True)
+        backend.start()
+
+        (tmp_path / "new").mkdir()
+        changed, new_dirs = backend.wait(0)
+
+        assert changed
+        assert new_dirs == [tmp_path / "new"]
+
+
+class TestAddRoots:
+    """Tests for the set of watched paths."""
+
+    def test_stash_reflog_is_watched(self, tmp_path):
+        """Dropping an older stash entry (a stash reflog rewrite) is a change."""
+        git_dir = tmp_path / ".git"
+        (git_dir / "refs").mkdir(parents=True)
+        (git_dir / "logs" / "refs").mkdir(parents=True)
+        stash_log = git_dir / "logs" / "refs" / "stash"
+        stash_log.write_text("a\nb\n")
+        backend = _PollingBackend(max_watches=100, interval=0)
+        _add_roots(backend, tmp_path, [git_dir], {git_dir})
+        backend.start()
+
+        assert backend.wait(0) == (False, [])
+
+        stash_log.write_text("a\n")
+        changed, _ = backend.wait(0)
+
+        assert changed
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux-only")
+class TestInotifyBackend:
+    """Tests for the inotify backend."""
+
+    def test_detects_change_and_new_directory(self, tmp_path):
+        """File writes and new directories are reported."""
+        backend = _InotifyBackend(max_watches=100)
+        try:
+            backend.add(tmp_path, recursive=True)
+
+            assert backend.wait(0) == (False, [])
+
+            (tmp_path / "a.txt").write_text("a")
+            (tmp_path / "sub").mkdir()
+            changed, new_dirs = backend.wait(1)
+
+            assert changed
+            assert new_dirs == [tmp_path / "sub"]
+        finally:
+            backend.close()
+
+
+@pytest.mark.integration
+class TestRunWatcher:
+    """Integration tests for run_watcher with a real repository."""
+
+    def test_too_large_tree_degrades(self, tmp_path):
+        """Trees needing more watches than allowed are marked degraded."""
+        repo = tmp_path / "repo"
+        _init_repo(repo)
+        for i in range(5):
+            (repo / f"dir{i}").mkdir()
+        cache_dir = tmp_path / "cache"
+
+        assert run_watcher(repo, cache_dir, max_watches=3, backend="polling") == 0
+
+        state = read_state(cache_dir, repo.resolve())
+        assert state is not None
+        assert state.state == STATE_DEGRADED
+        assert not needs_watcher(cache_dir, repo.resolve())
+
+    def test_idle_watcher_cleans_up(self, tmp_path):
+        """Watcher exits after idle timeout and removes its state."""
+        repo = tmp_path / "repo"
+        _init_repo(repo)
+        cache_dir = tmp_path / "cache"
+
+        assert run_watcher(repo, cache_dir, backend="polling", idle_timeout=0.01) == 0
+
+        assert read_state(cache_dir, repo.resolve()) is None